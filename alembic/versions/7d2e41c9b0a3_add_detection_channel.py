@@ -0,0 +1,30 @@
+"""Add capture channel to detections
+
+Revision ID: 7d2e41c9b0a3
+Revises: 3afaf6ab75f4
+Create Date: 2026-10-16 09:12:41.503218
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d2e41c9b0a3"
+down_revision: str | Sequence[str] | None = "3afaf6ab75f4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("detections", sa.Column("channel", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("detections") as batch_op:
+        batch_op.drop_column("channel")
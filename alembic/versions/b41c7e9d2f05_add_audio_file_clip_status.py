@@ -0,0 +1,30 @@
+"""Add clip write status to audio files
+
+Revision ID: b41c7e9d2f05
+Revises: 7d2e41c9b0a3
+Create Date: 2026-10-16 22:41:07.318264
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b41c7e9d2f05"
+down_revision: str | Sequence[str] | None = "7d2e41c9b0a3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("audio_files", sa.Column("clip_status", sa.String(length=10), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("audio_files") as batch_op:
+        batch_op.drop_column("clip_status")
@@ -0,0 +1,140 @@
+"""Acoustic activity gate that skips inference on windows with nothing to hear.
+
+BirdNET is the most expensive stage of the pipeline and runs on every window,
+including long stretches of night-time silence or steady rain. The gate scores
+each window with two cheap numpy features over the 1-10 kHz band where almost
+all bird vocalisations sit:
+
+- band level: energy of the loudest short frame, in dB, so a brief call in an
+  otherwise quiet 3-second window still stands out
+- spectral flux: the largest frame-to-frame rise of the band spectrum, relative
+  to its level, which picks out call onsets in stationary noise of similar loudness
+
+Each feature is compared with an adaptive noise floor. Floors fall quickly when
+the scene gets quieter and rise slowly when it gets louder, so steady rain or
+wind is absorbed into the floor within minutes while transient calls are not.
+"""
+
+import logging
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FRAME_SIZE = 1024  # Samples per analysis frame (~21 ms at 48kHz)
+BAND_HZ = (1000.0, 10000.0)  # Band the features are computed over
+FLOOR_FALL_RATE = 0.3  # Floor tracking rate when a window is quieter than the floor
+FLOOR_RISE_RATE = 0.05  # Floor tracking rate for louder windows the gate skipped
+ACTIVE_FLOOR_RISE_RATE = 0.005  # Rise rate for active windows; lets sustained noise adapt
+FLUX_THRESHOLD_RATIO = 0.25  # Flux this far above its floor counts as activity
+HANGOVER_WINDOWS = 1  # Windows analysed after an active one, for overlapping calls
+EPSILON = 1e-12
+
+
+class ActivityGate:
+    """Decide per window whether there is enough acoustic activity to run inference."""
+
+    def __init__(self, sample_rate: int, threshold_db: float = 6.0) -> None:
+        """Initialize the gate.
+
+        Args:
+            sample_rate: Sample rate of the analysed windows in Hz
+            threshold_db: Band level above the noise floor that counts as activity
+        """
+        self.sample_rate = sample_rate
+        self.threshold_db = threshold_db
+        self._taper = np.hanning(FRAME_SIZE).astype(np.float32)
+        bin_hz = np.fft.rfftfreq(FRAME_SIZE, d=1.0 / sample_rate)
+        self._band = slice(
+            int(np.searchsorted(bin_hz, BAND_HZ[0])),
+            int(np.searchsorted(bin_hz, min(BAND_HZ[1], sample_rate / 2), side="right")),
+        )
+
+        self.level_floor_db: float | None = None  # None until the first window is seen
+        self.flux_floor = 0.0
+        self.last_level_db = 0.0
+        self.last_flux = 0.0
+        self._hangover = 0
+
+        self.windows = 0
+        self.skipped = 0
+        self.missed_windows = 0  # Skipped windows that held detections (validation mode)
+
+    def measure(self, window: np.ndarray) -> tuple[float, float]:
+        """Compute the band level and spectral flux of one window.
+
+        Args:
+            window: Normalized float32 samples
+
+        Returns:
+            (band level in dB, spectral flux)
+        """
+        usable = len(window) - len(window) % FRAME_SIZE
+        frames = window[:usable].reshape(-1, FRAME_SIZE) * self._taper
+        band_magnitude = np.abs(np.fft.rfft(frames, axis=1)[:, self._band])
+
+        frame_energy = np.square(band_magnitude).sum(axis=1)
+        level_db = 10.0 * np.log10(frame_energy.max() + EPSILON)
+
+        # Magnitude increase from each frame to the next, relative to the earlier frame
+        rise = np.maximum(np.diff(band_magnitude, axis=0), 0.0).sum(axis=1)
+        frame_flux = rise / (band_magnitude[:-1].sum(axis=1) + EPSILON)
+        flux = float(frame_flux.max()) if len(frame_flux) else 0.0
+        return float(level_db), flux
+
+    def admit(self, window: np.ndarray) -> bool:
+        """Score a window, update the noise floors and decide whether to analyse it.
+
+        Args:
+            window: Normalized float32 samples
+
+        Returns:
+            True if the window should go through inference
+        """
+        level_db, flux = self.measure(window)
+        self.last_level_db, self.last_flux = level_db, flux
+        self.windows += 1
+
+        if self.level_floor_db is None:
+            # Nothing to compare the first window against; analyse it and start from it
+            self.level_floor_db, self.flux_floor = level_db, flux
+            return True
+
+        active = (
+            level_db - self.level_floor_db >= self.threshold_db
+            or flux - self.flux_floor >= FLUX_THRESHOLD_RATIO * max(self.flux_floor, EPSILON)
+        )
+        rise_rate = ACTIVE_FLOOR_RISE_RATE if active else FLOOR_RISE_RATE
+        self.level_floor_db += self._tracking_rate(level_db, self.level_floor_db, rise_rate) * (
+            level_db - self.level_floor_db
+        )
+        self.flux_floor += self._tracking_rate(flux, self.flux_floor, rise_rate) * (
+            flux - self.flux_floor
+        )
+
+        if active:
+            self._hangover = HANGOVER_WINDOWS
+            return True
+        if self._hangover > 0:
+            self._hangover -= 1
+            return True
+        self.skipped += 1
+        return False
+
+    @staticmethod
+    def _tracking_rate(value: float, floor: float, rise_rate: float) -> float:
+        return FLOOR_FALL_RATE if value < floor else rise_rate
+
+    def stats(self) -> dict[str, Any]:
+        """Return gate counters and the current noise floor."""
+        return {
+            "windows": self.windows,
+            "skipped": self.skipped,
+            "skipped_fraction": round(self.skipped / self.windows, 3) if self.windows else 0.0,
+            "missed_windows": self.missed_windows,
+            "level_floor_db": round(self.level_floor_db or 0.0, 1),
+            "last_level_db": round(self.last_level_db, 1),
+            "flux_floor": round(self.flux_floor, 4),
+            "last_flux": round(self.last_flux, 4),
+        }
@@ -1,27 +1,64 @@
 import asyncio
+import contextlib
 import datetime
+import functools
 import logging
+import operator
 import threading
 import time
-from collections import deque
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC
+from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
 import httpx
 import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from birdnetpi.audio.activity_gate import ActivityGate
+from birdnetpi.audio.analysis_pool import AnalysisWorkerPool
+from birdnetpi.audio.audio_history import AudioHistory
+from birdnetpi.audio.detection_merger import DetectionMerger, MergedDetection
+from birdnetpi.audio.detection_sender import DetectionSender
+from birdnetpi.audio.detection_spool import DetectionSpool, SpooledDetection
+from birdnetpi.audio.ring_buffer import SampleRingBuffer, WindowStamp
 from birdnetpi.config import BirdNETConfig
 from birdnetpi.detections.birdnet import BirdDetectionService
+from birdnetpi.detections.thread_calibration import InferenceThreadCalibrator
 from birdnetpi.species.parser import SpeciesComponents, SpeciesParser
 from birdnetpi.system.file_manager import FileManager
 from birdnetpi.system.path_resolver import PathResolver
+from birdnetpi.system.pipeline_stats import PipelineStatsStore, StageLatencies
 
 if TYPE_CHECKING:
     from birdnetpi.database.species import SpeciesDatabaseService
 
 logger = logging.getLogger(__name__)
 
+STATS_INTERVAL_SECONDS = 5.0  # How often analysis counters are published for the health API
+GATE_VALIDATION_BACKLOG = 256  # Gated windows awaiting results in validation mode
+MAX_PENDING_SENDS = 64  # Detection sends queued behind the in-flight ones before analysis waits
+SEND_DRAIN_TIMEOUT = 10.0  # Seconds to wait for queued sends on shutdown
+REPLAY_BATCH_SIZE = 32  # Spooled detections read and sent together during replay
+REPLAY_RATE = 64.0  # Max spooled detections replayed per second, so a backlog can't swamp the API
+MAX_REPLAY_ATTEMPTS = 5  # Server errors a batch may get before it is searched for a bad detection
+# Client errors that say nothing about the detections sent: a missing endpoint (e.g. an older
+# web app) or "try again later"; replay waits these out instead of dead-lettering
+RETRYABLE_CLIENT_STATUSES = frozenset({404, 405, 408, 429})
+INFERENCE_DRAIN_TIMEOUT = 10.0  # Seconds allowed at shutdown to analyze windows still queued
+POOL_WAIT_SECONDS = 0.05  # Poll interval while the block policy waits on a full worker pool
+
+
+class ReplayOutcome(StrEnum):
+    """How the web API answered a batch of replayed detections."""
+
+    DELIVERED = "delivered"
+    UNREACHABLE = "unreachable"  # No answer, a retryable status or an unexpected error
+    FAILED = "failed"  # Server error; may be caused by one of the detections
+    REJECTED = "rejected"  # Client error; the batch will never be accepted as it is
+
 
 class AudioAnalysisManager:
     """Manager for orchestrating audio data analysis workflows."""
@@ -33,151 +70,430 @@ class AudioAnalysisManager:
         config: BirdNETConfig,
         species_database: "SpeciesDatabaseService",
         session: "AsyncSession",
-        detection_buffer_max_size: int = 1000,
+        spool_max_detections: int = 5000,
         buffer_flush_interval: float = 5.0,
     ) -> None:
         logger.info("AudioAnalysisManager initialized.")
         self.file_manager = file_manager
         self.path_resolver = path_resolver
         self.config = config
-        self.analysis_client = BirdDetectionService(config)
+        # Each channel of a multi-microphone capture is analyzed as its own stream
+        self.channels = max(config.audio_channels, 1)
+        # Windows are analyzed in this process unless a worker pool owns the interpreters
+        self.worker_pool: AnalysisWorkerPool | None = None
+        self.analysis_client: BirdDetectionService | None = None
+        if config.audio_pipeline.analysis_workers > 0:
+            self.worker_pool = AnalysisWorkerPool(config, config.audio_pipeline.analysis_workers)
+            self.worker_pool.start()
+        else:
+            num_threads = config.audio_pipeline.inference_threads
+            if num_threads <= 0:
+                num_threads = InferenceThreadCalibrator(config, path_resolver).num_threads()
+            # Sized for the largest batch the inference loop takes, so live batches
+            # of any length are padded into the same tensor instead of resizing it
+            self.analysis_client = BirdDetectionService(
+                config,
+                num_threads=num_threads,
+                batch_size=max(config.audio_pipeline.inference_batch_size, self.channels),
+            )
+        # In-process inference runs on its own thread so an interpreter invoke never
+        # stalls audio reads or detection delivery on the event loop. Windows wait for
+        # it in a bounded queue; when it is full the oldest is dropped or reading blocks.
+        self._inference_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="birdnetpi-inference"
+        )
+        # Items are (window, capture time, channel, stamp, time.monotonic() when queued)
+        self._window_queue: asyncio.Queue[
+            tuple[np.ndarray, datetime.datetime, int, WindowStamp, float]
+        ] = asyncio.Queue(max(config.audio_pipeline.analysis_queue_windows, 1) * self.channels)
+        self.block_when_queue_full = config.audio_pipeline.analysis_queue_policy == "block"
+        self._inference_task: asyncio.Task[None] | None = None
+        self.windows_dropped = 0
+        self._queue_depth_max = 0
+        self._analysis_lag = 0.0  # Seconds the newest analyzed window ended before now
+        self._analysis_lag_max = 0.0
         self.analysis_count = 0
         self.last_analysis_log_time = time.time()
+        self.windows_seen = 0
+
+        # Optional pre-inference gate, one per channel so each microphone keeps its own
+        # noise floor; validation mode analyzes every window regardless
+        gate_mode = config.audio_pipeline.activity_gate
+        self.activity_gates: list[ActivityGate] = []
+        if gate_mode in ("on", "validate"):
+            self.activity_gates = [
+                ActivityGate(config.sample_rate, config.audio_pipeline.activity_gate_threshold_db)
+                for _ in range(self.channels)
+            ]
+        self.validate_activity_gate = gate_mode == "validate"
+        # Windows the gate would have skipped, keyed by capture time and channel, awaiting
+        # their results; values are the level above the noise floor (dB) and spectral flux
+        self._gated_windows: dict[tuple[datetime.datetime, int], tuple[float, float]] = {}
+
+        self.stats_store = PipelineStatsStore(path_resolver)
+        self._stats_published = time.monotonic()
+        self.stage_latencies = StageLatencies()
+        # Set by the daemon to publish its transport's read counters alongside ours
+        self.transport_stats: Callable[[], dict[str, Any]] | None = None
 
         # Initialize SpeciesParser with species database service for canonical name lookups
         self.species_parser = SpeciesParser(species_database)
         # Set the session for database queries
         SpeciesParser.set_session(session)
 
-        # Buffer for accumulating audio chunks for analysis
-        self.audio_buffer = np.array([], dtype=np.int16)
         # BirdNET requires exactly 48kHz sample rate (144000 samples for 3 seconds)
         self.buffer_size_samples = int(3.0 * self.config.sample_rate)  # 3 seconds at 48kHz
+        # In float32 mode capture hands over normalized samples that need no conversion
+        self.sample_dtype: type[np.generic] = (
+            np.float32 if config.audio_pipeline.sample_format == "float32" else np.int16
+        )
+        self._partial_sample = b""  # Trailing bytes of a sample split across FIFO reads
+        # Trailing samples of an interleaved frame split across reads
+        self._partial_frame = np.empty(0, dtype=self.sample_dtype)
+        # Preallocated circular buffers, one per channel, that assemble overlapping
+        # analysis windows in place; audio_buffer is channel 0's
+        self.audio_buffers = [
+            SampleRingBuffer(
+                window_size=self.buffer_size_samples,
+                hop_size=self.buffer_size_samples - self._get_overlap_samples(),
+                dtype=self.sample_dtype,
+            )
+            for _ in range(self.channels)
+        ]
+        self.audio_buffer = self.audio_buffers[0]
+        # (samples written per channel, time.monotonic_ns() at which the newest was
+        # captured), from which every window is stamped with its capture time
+        self._capture_clock = (0, time.monotonic_ns())
+
+        # Optional shared-memory history of the raw audio read, from which clips with
+        # pre- and post-roll are cut instead of re-encoding the analysis window
+        pipeline = config.audio_pipeline
+        self.audio_history: AudioHistory | None = None
+        if pipeline.audio_history_seconds > 0:
+            self.audio_history = AudioHistory(
+                pipeline.audio_history_seconds,
+                config.sample_rate,
+                self.channels,
+                self.sample_dtype,
+                path_resolver.get_fifo_base_path(),
+            )
+        self.clip_pre_roll = int(pipeline.clip_pre_roll * config.sample_rate)
+        self.clip_post_roll = int(pipeline.clip_post_roll * config.sample_rate)
+        # Detections waiting for their post-roll to be captured; items are
+        # (species, confidence, timestamp, channel, stamp, first frame, end frame)
+        self._pending_clips: list[
+            tuple[SpeciesComponents, float, datetime.datetime, int, WindowStamp, int, int]
+        ] = []
 
-        # In-memory buffer for detection events when FastAPI is unavailable
-        self.detection_buffer: deque[dict[str, Any]] = deque(maxlen=detection_buffer_max_size)
-        self.buffer_lock = threading.Lock()
+        # Optional merging of same-species hits in nearby windows into one detection
+        merge_gap = config.audio_pipeline.detection_merge_gap
+        self.detection_merger: DetectionMerger | None = None
+        if merge_gap > 0:
+            self.detection_merger = DetectionMerger(
+                config.sample_rate, self.buffer_size_samples, merge_gap
+            )
+
+        # On-disk spool for detection events when FastAPI is unavailable
+        self.detection_spool = DetectionSpool(
+            path_resolver.get_detection_spool_path(), spool_max_detections
+        )
         self.flush_interval = buffer_flush_interval
 
+        # One keep-alive client for all deliveries; live sends run as background tasks
+        self.detection_sender = DetectionSender(
+            config.detections_endpoint,
+            config.audio_pipeline.delivery_concurrency,
+            binary=config.audio_pipeline.detection_format == "binary",
+        )
+        self._send_tasks: set[asyncio.Task[None]] = set()
+
         # Initialize background buffer flush task (but don't start it yet)
         self._stop_flush_task = False
         self._flush_task = None
         # Thread will be started by calling start_buffer_flush_task()
 
     def start_buffer_flush_task(self) -> None:
-        """Start the background task to flush detection buffer."""
+        """Start the background task that replays the detection spool."""
         if self._flush_task and self._flush_task.is_alive():
             logger.warning("Buffer flush task already running")
             return
         self._start_buffer_flush_task()
 
     def _start_buffer_flush_task(self) -> None:
-        """Start the background task to flush detection buffer."""
+        """Start the background task that replays the detection spool."""
 
         def flush_loop() -> None:
-            while not self._stop_flush_task:
-                try:
-                    asyncio.run(self._flush_detection_buffer())
-                except Exception:
-                    logger.exception("Error in buffer flush loop")
-                time.sleep(self.flush_interval)
+            # One loop for the thread's lifetime so its pooled connections are reused
+            loop = asyncio.new_event_loop()
+            try:
+                while not self._stop_flush_task:
+                    try:
+                        loop.run_until_complete(self._flush_detection_buffer())
+                    except Exception:
+                        logger.exception("Error in buffer flush loop")
+                    time.sleep(self.flush_interval)
+                loop.run_until_complete(self.detection_sender.aclose())
+            finally:
+                loop.close()
 
         flush_thread = threading.Thread(target=flush_loop, daemon=True)
         flush_thread.start()
         self._flush_task = flush_thread
 
     async def _flush_detection_buffer(self) -> None:
-        """Attempt to flush buffered detection events to FastAPI."""
-        if not self.detection_buffer:
-            return
+        """Replay spooled detection events to FastAPI in order, a batch at a time.
+
+        Each batch goes to the batch endpoint as one request, which the API commits
+        in one transaction. Replay stops at the first batch the API cannot take
+        right now, leaving it and the rest spooled for the next flush, and is paced
+        to REPLAY_RATE detections per second. A batch the API rejects, or keeps
+        failing on after MAX_REPLAY_ATTEMPTS, is split to find the detections it
+        will not accept, which are dead-lettered so they cannot block the spool.
+        """
+        replayed = 0
+        while not self._stop_flush_task:
+            batch = self.detection_spool.peek(REPLAY_BATCH_SIZE)
+            if not batch:
+                break
+            started = time.monotonic()
+            outcome = await self._flush_batch(batch)
+            if outcome is not ReplayOutcome.DELIVERED:
+                self.detection_spool.record_attempt([spooled.detection_id for spooled in batch])
+                attempts = max(spooled.attempts for spooled in batch) + 1
+                poisoned = outcome is ReplayOutcome.REJECTED or (
+                    outcome is ReplayOutcome.FAILED and attempts >= MAX_REPLAY_ATTEMPTS
+                )
+                if poisoned and await self._isolate_rejected(batch, outcome):
+                    continue
+                failed_summary = [
+                    {
+                        "species": spooled.metadata.get("species_tensor", "Unknown"),
+                        "confidence": spooled.metadata.get("confidence", 0.0),
+                    }
+                    for spooled in batch
+                ]
+                logger.warning(
+                    "Spooled detections still undeliverable",
+                    extra={
+                        "count": len(batch),
+                        "spooled": len(self.detection_spool),
+                        "failed_detections": failed_summary,
+                    },
+                )
+                break
+            # Duplicates and eBird-filtered events are settled too, so ack the whole batch
+            self.detection_spool.ack([spooled.detection_id for spooled in batch])
+            replayed += len(batch)
+            await asyncio.sleep(max(len(batch) / REPLAY_RATE - (time.monotonic() - started), 0.0))
 
-        # Copy and clear buffer atomically
-        with self.buffer_lock:
-            buffered_detections = list(self.detection_buffer)
-            self.detection_buffer.clear()
+        if replayed > 0:
+            logger.info("Successfully flushed spooled detections", extra={"count": replayed})
 
-        if not buffered_detections:
-            return
+    async def _isolate_rejected(
+        self, batch: list[SpooledDetection], outcome: ReplayOutcome
+    ) -> bool:
+        """Replay a batch the API will not accept in halves, dead-lettering bad detections.
 
-        logger.info(
-            "Attempting to flush buffered detections", extra={"count": len(buffered_detections)}
-        )
+        Halves the API accepts are acknowledged and halves it refuses are split
+        again, so a single bad detection costs about log2(len(batch)) requests and
+        the detections around it are still delivered, in order.
 
-        # Try to send each buffered detection
-        successful_sends = 0
-        failed_detections = []
+        Args:
+            batch: Detections the API refused together
+            outcome: How the API answered the batch, recorded with dead letters
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            for detection_data in buffered_detections:
-                try:
-                    response = await client.post(
-                        self.config.detections_endpoint, json=detection_data
-                    )
-                    response.raise_for_status()
-                    successful_sends += 1
-                    species_name = detection_data.get("species_tensor", "Unknown")
-                    logger.debug(
-                        "Successfully flushed buffered detection", extra={"species": species_name}
-                    )
-                except (httpx.RequestError, httpx.HTTPStatusError) as e:
-                    species_name = detection_data.get("species_tensor", "Unknown")
-                    confidence = detection_data.get("confidence", 0.0)
-                    logger.debug(
-                        "Failed to flush detection (will re-buffer)",
-                        extra={"error": str(e), "species": species_name, "confidence": confidence},
-                    )
-                    failed_detections.append(detection_data)
-                except Exception:
-                    species_name = detection_data.get("species_tensor", "Unknown")
-                    confidence = detection_data.get("confidence", 0.0)
-                    logger.exception(
-                        "Unexpected error flushing detection",
-                        extra={"species": species_name, "confidence": confidence},
-                    )
-                    failed_detections.append(detection_data)
-
-        # Re-add failed detections to buffer
-        if failed_detections:
-            with self.buffer_lock:
-                for detection in failed_detections:
-                    self.detection_buffer.append(detection)
-            # Log just the species and confidence of failed detections
-            failed_summary = [
-                {
-                    "species": d.get("species_tensor", "Unknown"),
-                    "confidence": d.get("confidence", 0.0),
-                }
-                for d in failed_detections
-            ]
-            logger.warning(
-                "Re-buffered failed detections",
-                extra={"count": len(failed_detections), "failed_detections": failed_summary},
+        Returns:
+            False if the API stopped answering before the batch was settled
+        """
+        if len(batch) == 1:
+            (spooled,) = batch
+            self.detection_spool.dead_letter(spooled.detection_id, outcome.value)
+            logger.error(
+                "Dead-lettered spooled detection the web API will not accept",
+                extra={
+                    "detection_id": spooled.detection_id,
+                    "species": spooled.metadata.get("species_tensor", "Unknown"),
+                    "attempts": spooled.attempts + 1,
+                    "outcome": outcome.value,
+                },
             )
+            return True
 
-        if successful_sends > 0:
-            logger.info(
-                "Successfully flushed buffered detections", extra={"count": successful_sends}
+        middle = len(batch) // 2
+        for half in (batch[:middle], batch[middle:]):
+            half_outcome = await self._flush_batch(half)
+            if half_outcome is ReplayOutcome.DELIVERED:
+                self.detection_spool.ack([spooled.detection_id for spooled in half])
+            elif half_outcome is ReplayOutcome.UNREACHABLE:
+                return False
+            elif not await self._isolate_rejected(half, half_outcome):
+                return False
+        return True
+
+    async def _flush_batch(self, batch: list[SpooledDetection]) -> ReplayOutcome:
+        """Send a batch of spooled detections and classify the API's answer.
+
+        Events the API reports as invalid are dead-lettered here; the caller acks
+        the rest of a delivered batch.
+        """
+        try:
+            response = await self.detection_sender.post_batch(
+                [(spooled.metadata, spooled.audio) for spooled in batch]
+            )
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            logger.debug(
+                "Failed to flush detection batch",
+                extra={"error": str(e), "status": status, "count": len(batch)},
+            )
+            if status in RETRYABLE_CLIENT_STATUSES:
+                return ReplayOutcome.UNREACHABLE
+            return ReplayOutcome.REJECTED if status < 500 else ReplayOutcome.FAILED
+        except httpx.RequestError as e:
+            logger.debug(
+                "Failed to flush detection batch (will retry)",
+                extra={"error": str(e), "count": len(batch)},
+            )
+            return ReplayOutcome.UNREACHABLE
+        except Exception:
+            logger.exception(
+                "Unexpected error flushing detection batch", extra={"count": len(batch)}
+            )
+            return ReplayOutcome.UNREACHABLE
+        logger.debug("Successfully flushed spooled detection batch", extra={"count": len(batch)})
+        self._dead_letter_invalid(batch, response)
+        return ReplayOutcome.DELIVERED
+
+    def _dead_letter_invalid(self, batch: list[SpooledDetection], response: httpx.Response) -> None:
+        """Dead-letter the events of a delivered batch that the API reported as invalid."""
+        try:
+            results = response.json().get("results", [])
+        except ValueError:
+            return
+        for spooled, result in zip(batch, results, strict=False):
+            if result.get("status") != "invalid":
+                continue
+            self.detection_spool.dead_letter(spooled.detection_id, "invalid")
+            logger.error(
+                "Dead-lettered spooled detection the web API will not accept",
+                extra={
+                    "detection_id": spooled.detection_id,
+                    "species": spooled.metadata.get("species_tensor", "Unknown"),
+                    "error": result.get("message"),
+                },
             )
 
+    async def close_detection_delivery(self) -> None:
+        """Wait briefly for queued detection sends, then close the pooled client.
+
+        Detections still held open by the merger or waiting for post-roll are sent
+        first, and the audio history is released. Sends that do not
+        finish in time are cancelled; their detections are lost with the process, as
+        they would be if the daemon were killed. Call this after stop_inference and
+        stop_buffer_flush_task, as it also closes the spool.
+        """
+        if self.detection_merger is not None:
+            await self._dispatch_merged_detections(self.detection_merger.flush())
+        if self.audio_history is not None:
+            # Clips still waiting for post-roll are sent with what was captured
+            await self._release_pending_clips(self.audio_history, final=True)
+            self.audio_history.close()
+        if self._send_tasks:
+            _, pending = await asyncio.wait(set(self._send_tasks), timeout=SEND_DRAIN_TIMEOUT)
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.warning(
+                    "Dropped unsent detections on shutdown", extra={"count": len(pending)}
+                )
+        await self.detection_sender.aclose()
+        self.detection_spool.close()
+
+    def stop_worker_pool(self) -> None:
+        """Stop the analysis worker processes, if a pool is in use."""
+        if self.worker_pool is not None:
+            self.worker_pool.stop()
+
     def stop_buffer_flush_task(self) -> None:
         """Stop the background buffer flush task."""
         self._stop_flush_task = True
         if self._flush_task and self._flush_task.is_alive():
             self._flush_task.join(timeout=5.0)
 
-    async def process_audio_chunk(self, audio_data_bytes: bytes) -> None:
-        """Process a chunk of audio data for analysis."""
-        # Convert bytes to numpy array (assuming int16 from audio capture)
-        audio_data = np.frombuffer(audio_data_bytes, dtype=np.int16)
+    def _get_overlap_samples(self) -> int:
+        """Return the configured window overlap in samples.
+
+        Overlap is clamped to 1.5 seconds so consecutive windows always advance.
+        """
+        overlap_seconds = min(self.config.audio_overlap, 1.5)
+        if overlap_seconds < 0:
+            logger.warning(
+                "Invalid audio_overlap %.1f seconds (must be >= 0), using 0 seconds",
+                self.config.audio_overlap,
+            )
+            overlap_seconds = 0.0
+        return int(overlap_seconds * self.config.sample_rate)
+
+    async def process_audio_chunk(
+        self, audio_data_bytes: bytes, captured_ns: int | None = None
+    ) -> None:
+        """Process a chunk of audio data for analysis.
+
+        Args:
+            audio_data_bytes: Interleaved samples read from the FIFO
+            captured_ns: time.monotonic_ns() at which the chunk's last sample was
+                captured (default: now)
+        """
+        # A FIFO read is not guaranteed to end on a sample boundary
+        if self._partial_sample:
+            audio_data_bytes = self._partial_sample + audio_data_bytes
+        itemsize = np.dtype(self.sample_dtype).itemsize
+        usable = len(audio_data_bytes) - len(audio_data_bytes) % itemsize
+        self._partial_sample = audio_data_bytes[usable:]
+
+        # Convert bytes to numpy array in the sample format written by audio capture
+        audio_data = np.frombuffer(audio_data_bytes[:usable], dtype=self.sample_dtype)
+        await self.process_audio_samples(audio_data, captured_ns)
+
+    async def process_audio_samples(
+        self, audio_data: np.ndarray, captured_ns: int | None = None
+    ) -> None:
+        """Process a block of samples for analysis.
+
+        Args:
+            audio_data: Samples from the capture transport (FIFO or shared memory), int16
+                or normalized float32 depending on the configured sample format, with
+                channels interleaved
+            captured_ns: time.monotonic_ns() at which the block's last sample was
+                captured, as reported by the transport (default: now)
+        """
         logger.debug("AudioAnalysisService received chunk", extra={"shape": audio_data.shape})
+        received = time.perf_counter()
+        received_ns = time.monotonic_ns()
+        if captured_ns is None:
+            captured_ns = received_ns
+        else:
+            self.stage_latencies.record("transport", max(received_ns - captured_ns, 0) / 1e9)
 
         # Audio streaming is now handled by separate WebSocket daemon via livestream.fifo
 
-        # Accumulate audio data in buffer
-        self.audio_buffer = np.concatenate([self.audio_buffer, audio_data])
+        # De-interleave whole frames; a frame split across reads waits for the next one
+        if self._partial_frame.size:
+            audio_data = np.concatenate((self._partial_frame, audio_data))
+        usable = len(audio_data) - len(audio_data) % self.channels
+        self._partial_frame = audio_data[usable:].copy()
+        frames = audio_data[:usable].reshape(-1, self.channels)
+
+        # Accumulate each channel in its ring buffer (copies in place, no reallocation)
+        for channel, buffer in enumerate(self.audio_buffers):
+            buffer.write(frames[:, channel])
+        self._capture_clock = (self.audio_buffer.total_written, captured_ns)
+        if self.audio_history is not None:
+            self.audio_history.write(frames)
+            await self._release_pending_clips(self.audio_history)
 
         # Log buffer accumulation progress every ~0.5 seconds worth of data
-        if len(self.audio_buffer) % (self.config.sample_rate // 2) < len(audio_data):
+        if self.audio_buffer.total_written % (self.config.sample_rate // 2) < len(frames):
             logger.debug(
                 "Buffer accumulation: %d/%d samples (%.1f%%)",
                 len(self.audio_buffer),
@@ -185,112 +501,643 @@ class AudioAnalysisManager:
                 (len(self.audio_buffer) / self.buffer_size_samples) * 100,
             )
 
-        # Process when we have enough audio (3 seconds worth)
-        if len(self.audio_buffer) >= self.buffer_size_samples:
+        windows, timestamps, channels, stamps = self._collect_windows()
+        self.windows_seen += len(windows)
+        if self.activity_gates:
+            windows, timestamps, channels, stamps = self._apply_activity_gate(
+                self.activity_gates, windows, timestamps, channels, stamps
+            )
+        if windows:
+            self.stage_latencies.record("window_assembly", time.perf_counter() - received)
+        self._publish_stats()
+
+        if self.worker_pool is not None:
+            await self._analyze_with_pool(self.worker_pool, windows, timestamps, channels, stamps)
+            return
+
+        for window, timestamp, channel, stamp in zip(
+            windows, timestamps, channels, stamps, strict=True
+        ):
+            await self._enqueue_window(window, timestamp, channel, stamp)
+
+    def _collect_windows(
+        self,
+    ) -> tuple[list[np.ndarray], list[datetime.datetime], list[int], list[WindowStamp]]:
+        """Take every complete 3-second window, per channel, out of the ring buffers.
+
+        The channels' buffers receive the same frames, so their windows line up and
+        share a capture time and stamp.
+
+        Returns:
+            Normalized float32 windows with their capture times, channels and
+            stamps, in capture order and channel order within each moment
+        """
+        windows: list[np.ndarray] = []
+        timestamps: list[datetime.datetime] = []
+        channels: list[int] = []
+        stamps: list[WindowStamp] = []
+        for channel_chunks in zip(
+            *(buffer.windows() for buffer in self.audio_buffers), strict=True
+        ):
             logger.debug(
                 "Buffer full, analyzing audio chunk (%d samples)", self.buffer_size_samples
             )
-            # Take the first 3 seconds for analysis
-            analysis_chunk = self.audio_buffer[: self.buffer_size_samples]
+            timestamp = self._window_timestamp(self.audio_buffer.window_start)
+            stamp = self._window_stamp(self.audio_buffer.window_start)
+            if self.audio_history is not None:
+                self.audio_history.remember_window(timestamp, self.audio_buffer.window_start)
+            for channel, analysis_chunk in enumerate(channel_chunks):
+                if self.sample_dtype is np.float32:
+                    # Already normalized; copy out of the ring before it is overwritten
+                    windows.append(analysis_chunk.copy())
+                else:
+                    # Convert int16 to float32 and normalize for BirdNET analysis (the only copy)
+                    windows.append(analysis_chunk.astype(np.float32) / 32768.0)
+                timestamps.append(timestamp)
+                channels.append(channel)
+                stamps.append(stamp)
+        return windows, timestamps, channels, stamps
+
+    async def _enqueue_window(
+        self,
+        window: np.ndarray,
+        timestamp: datetime.datetime,
+        channel: int = 0,
+        stamp: WindowStamp | None = None,
+    ) -> None:
+        """Queue a window for the inference task, applying the queue policy when full.
 
-            # Remove processed samples from buffer (keep overlap for continuity)
-            # Clamp overlap to reasonable range (0.5 to 1.5 seconds, never >= buffer size)
-            overlap_seconds = min(self.config.audio_overlap, 1.5)
-            if overlap_seconds >= 3.0:
+        Args:
+            window: Normalized float32 window
+            timestamp: Capture time of the window
+            channel: Capture channel of the window
+            stamp: The window's place in the capture stream (default: the newest window)
+        """
+        stamp = stamp or self._window_stamp(self.audio_buffer.window_start)
+        if self._inference_task is None or self._inference_task.done():
+            self._inference_task = asyncio.get_running_loop().create_task(self._run_inference())
+        if self._window_queue.full() and not self.block_when_queue_full:
+            # Keep the analysis near realtime; the oldest window is the least useful
+            self._window_queue.get_nowait()
+            self._window_queue.task_done()
+            self.windows_dropped += 1
+            logger.debug("Inference queue full, dropped oldest window")
+        await self._window_queue.put((window, timestamp, channel, stamp, time.monotonic()))
+        self._queue_depth_max = max(self._queue_depth_max, self._window_queue.qsize())
+
+    async def _run_inference(self) -> None:
+        """Analyze queued windows in capture order until cancelled."""
+        # The channels' windows for one moment are always analyzed in one invoke
+        batch_size = max(1, self.config.audio_pipeline.inference_batch_size, self.channels)
+        while True:
+            batch = [await self._window_queue.get()]
+            # Several windows are only queued at once when catching up, so batch those
+            while len(batch) < batch_size and not self._window_queue.empty():
+                batch.append(self._window_queue.get_nowait())
+            dequeued = time.monotonic()
+            for *_, enqueued in batch:
+                self.stage_latencies.record("inference_queue", dequeued - enqueued)
+            windows = [window for window, _, _, _, _ in batch]
+            timestamps = [timestamp for _, timestamp, _, _, _ in batch]
+            channels = [channel for _, _, channel, _, _ in batch]
+            stamps = [stamp for _, _, _, stamp, _ in batch]
+            try:
+                if len(batch) == 1:
+                    await self._analyze_audio_chunk(
+                        windows[0], timestamp=timestamps[0], channel=channels[0], stamp=stamps[0]
+                    )
+                else:
+                    await self._analyze_audio_batch(windows, timestamps, channels, stamps)
+            except Exception:
+                logger.exception("Error during BirdNET analysis")
+            finally:
+                for _ in batch:
+                    self._window_queue.task_done()
+            self._analysis_lag = max((time.monotonic_ns() - stamps[-1].captured_ns) / 1e9, 0.0)
+            self._analysis_lag_max = max(self._analysis_lag_max, self._analysis_lag)
+
+    async def wait_for_analysis(self) -> None:
+        """Wait until every queued window has been analyzed and its results handled."""
+        await self._window_queue.join()
+
+    async def stop_inference(self) -> None:
+        """Analyze the windows still queued, within a time limit, then stop inference."""
+        if self._inference_task is not None:
+            try:
+                await asyncio.wait_for(self.wait_for_analysis(), INFERENCE_DRAIN_TIMEOUT)
+            except TimeoutError:
                 logger.warning(
-                    "Invalid audio_overlap %.1f seconds (must be < 3.0), using 1.0 second",
-                    self.config.audio_overlap,
+                    "Abandoning queued analysis windows at shutdown",
+                    extra={"windows": self._window_queue.qsize()},
                 )
-                overlap_seconds = 1.0
-            overlap_samples = int(overlap_seconds * self.config.sample_rate)
-            self.audio_buffer = self.audio_buffer[self.buffer_size_samples - overlap_samples :]
+            self._inference_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._inference_task
+            self._inference_task = None
+        self._inference_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _apply_activity_gate(
+        self,
+        gates: list[ActivityGate],
+        windows: list[np.ndarray],
+        timestamps: list[datetime.datetime],
+        channels: list[int],
+        stamps: list[WindowStamp],
+    ) -> tuple[list[np.ndarray], list[datetime.datetime], list[int], list[WindowStamp]]:
+        """Drop windows without acoustic activity before they reach the interpreter.
 
-            # Convert int16 to float32 and normalize for BirdNET analysis
-            audio_float = analysis_chunk.astype(np.float32) / 32768.0
+        Each window is scored by its channel's gate. In validation mode every window
+        is kept; the ones the gate would have dropped are remembered so their results
+        can be checked for missed detections.
 
-            # Perform BirdNET analysis
-            await self._analyze_audio_chunk(audio_float)
+        Returns:
+            The windows to analyze, their capture times, channels and stamps
+        """
+        kept_windows: list[np.ndarray] = []
+        kept_timestamps: list[datetime.datetime] = []
+        kept_channels: list[int] = []
+        kept_stamps: list[WindowStamp] = []
+        for window, timestamp, channel, stamp in zip(
+            windows, timestamps, channels, stamps, strict=True
+        ):
+            gate = gates[channel]
+            if not gate.admit(window):
+                if not self.validate_activity_gate:
+                    continue
+                if len(self._gated_windows) >= GATE_VALIDATION_BACKLOG:
+                    # Results for the oldest entry never arrived (analysis error or lost worker)
+                    self._gated_windows.pop(next(iter(self._gated_windows)))
+                level_above_floor = gate.last_level_db - (gate.level_floor_db or 0.0)
+                self._gated_windows[(timestamp, channel)] = (level_above_floor, gate.last_flux)
+            kept_windows.append(window)
+            kept_timestamps.append(timestamp)
+            kept_channels.append(channel)
+            kept_stamps.append(stamp)
+        return kept_windows, kept_timestamps, kept_channels, kept_stamps
 
-    async def _analyze_audio_chunk(self, audio_chunk: np.ndarray) -> None:
+    def _check_gated_window(
+        self,
+        gate: ActivityGate,
+        results: list[tuple[str, float]],
+        timestamp: datetime.datetime,
+        channel: int,
+    ) -> None:
+        """Log detections in a window the activity gate would have skipped (validation mode)."""
+        features = self._gated_windows.pop((timestamp, channel), None)
+        if features is None:
+            return
+        missed = [
+            (species, round(confidence, 3))
+            for species, confidence in results
+            if confidence >= self.config.species_confidence_threshold
+        ]
+        if missed:
+            gate.missed_windows += 1
+            logger.warning(
+                "Activity gate would have skipped a window with detections",
+                extra={
+                    "detections": missed,
+                    "channel": channel,
+                    "level_above_floor_db": round(features[0], 1),
+                    "flux": round(features[1], 4),
+                },
+            )
+
+    def _publish_stats(self) -> None:
+        """Publish analysis counters for the health API at most every few seconds."""
+        now = time.monotonic()
+        if now - self._stats_published < STATS_INTERVAL_SECONDS:
+            return
+        self._stats_published = now
+        stats: dict[str, Any] = {"windows": self.windows_seen}
+        if self.activity_gates:
+            # One entry per channel, in channel order
+            stats["activity_gate"] = [gate.stats() for gate in self.activity_gates]
+        if self.transport_stats is not None:
+            stats["transport"] = self.transport_stats()
+        if self.worker_pool is None:
+            stats["inference"] = {
+                "queue_depth": self._window_queue.qsize(),
+                "queue_depth_max": self._queue_depth_max,
+                "queue_capacity": self._window_queue.maxsize,
+                "windows_dropped": self.windows_dropped,
+                "lag_s": round(self._analysis_lag, 2),
+                "lag_max_s": round(self._analysis_lag_max, 2),
+            }
+            self._queue_depth_max = self._window_queue.qsize()
+            self._analysis_lag_max = self._analysis_lag
+        else:
+            stats["inference"] = {
+                "queue_depth": self.worker_pool.queue_depth,
+                "queue_capacity": self.worker_pool.max_pending,
+                "windows_dropped": self.worker_pool.windows_dropped,
+                "windows_lost": self.worker_pool.windows_lost,
+            }
+        if self.detection_merger is not None:
+            stats["merging"] = {
+                "open_events": self.detection_merger.open_events,
+                "windows_merged": self.detection_merger.windows_merged,
+            }
+        stats["delivery"] = {
+            **self.detection_sender.stats(),
+            "pending": len(self._send_tasks),
+            "spooled": len(self.detection_spool),
+            "spool_discarded": self.detection_spool.discarded,
+            "spool_dead_lettered": self.detection_spool.dead_lettered,
+        }
+        stats["latency"] = self.stage_latencies.snapshot()
+        self.stage_latencies.roll("analysis")
+        self.stats_store.write("analysis", stats)
+
+    async def _analyze_with_pool(
+        self,
+        pool: AnalysisWorkerPool,
+        windows: list[np.ndarray],
+        timestamps: list[datetime.datetime],
+        channels: list[int],
+        stamps: list[WindowStamp],
+    ) -> None:
+        """Dispatch windows to the worker pool and handle finished ones in capture order.
+
+        Under the block policy a full pool holds up reading, as the in-process queue
+        does; otherwise the pool drops its oldest window to make room.
+        """
+        for window, timestamp, channel, stamp in zip(
+            windows, timestamps, channels, stamps, strict=True
+        ):
+            while self.block_when_queue_full and pool.full:
+                await self._handle_pool_results(pool)
+                if pool.full:
+                    await asyncio.sleep(POOL_WAIT_SECONDS)
+            pool.submit(window, timestamp, channel, stamp)
+        await self._handle_pool_results(pool)
+
+    async def _handle_pool_results(self, pool: AnalysisWorkerPool) -> None:
+        """Handle the windows the worker pool has finished, in capture order."""
+        for timestamp, window, channel, stamp, results in pool.collect():
+            try:
+                await self._handle_analysis_results(results, window, timestamp, channel, stamp)
+            except Exception:
+                logger.exception("Error handling analysis results")
+
+    def _window_timestamp(self, window_start: int) -> datetime.datetime:
+        """Estimate the wall-clock capture time of a window from its sample position.
+
+        Args:
+            window_start: Absolute sample index of the first sample in the window
+
+        Returns:
+            UTC time at which the first sample of the window was captured
+        """
+        samples_since_start = self.audio_buffer.total_written - window_start
+        return datetime.datetime.now(UTC) - datetime.timedelta(
+            seconds=samples_since_start / self.config.sample_rate
+        )
+
+    def _window_stamp(self, window_start: int) -> WindowStamp:
+        """Stamp a window with its sample index and the capture time of its last sample.
+
+        The capture time is counted back from the newest sample's, at the sample
+        rate, so it follows the capture clock rather than when reads happened.
+
+        Args:
+            window_start: Absolute sample index of the first sample in the window
+        """
+        written, captured_ns = self._capture_clock
+        later_samples = written - (window_start + self.buffer_size_samples)
+        return WindowStamp(
+            window_start,
+            captured_ns - later_samples * 1_000_000_000 // self.config.sample_rate,
+        )
+
+    async def _analyze_audio_chunk(
+        self,
+        audio_chunk: np.ndarray,
+        timestamp: datetime.datetime | None = None,
+        channel: int = 0,
+        stamp: WindowStamp | None = None,
+    ) -> None:
         """Analyze an audio chunk using BirdNET and send detection events."""
         try:
+            timestamp = timestamp or datetime.datetime.now(UTC)
             # Get current week for species filtering
-            current_week = datetime.datetime.now(UTC).isocalendar()[1]
+            current_week = timestamp.isocalendar()[1]
 
-            # Perform BirdNET analysis
+            if self.analysis_client is None:
+                raise RuntimeError("Analysis is delegated to the worker pool")
+
+            # Perform BirdNET analysis on the inference thread
             logger.debug("Starting BirdNET analysis...")
-            results = self.analysis_client.get_analysis_results(
-                audio_chunk=audio_chunk,
-                latitude=self.config.latitude,
-                longitude=self.config.longitude,
-                week=current_week,
-                sensitivity=self.config.sensitivity_setting,
+            started = time.perf_counter()
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._inference_executor,
+                functools.partial(
+                    self.analysis_client.get_analysis_results,
+                    audio_chunk=audio_chunk,
+                    latitude=self.config.latitude,
+                    longitude=self.config.longitude,
+                    week=current_week,
+                    sensitivity=self.config.sensitivity_setting,
+                ),
             )
+            self.stage_latencies.record("inference", time.perf_counter() - started)
+            await self._handle_analysis_results(results, audio_chunk, timestamp, channel, stamp)
 
-            self.analysis_count += 1
-            current_time = time.time()
+        except Exception:
+            logger.exception("Error during BirdNET analysis")
 
-            # Log analysis frequency every 30 seconds at INFO level
-            if current_time - self.last_analysis_log_time >= 30.0:
-                time_elapsed = current_time - self.last_analysis_log_time
-                analyses_per_second = self.analysis_count / time_elapsed
+    async def _analyze_audio_batch(
+        self,
+        audio_chunks: list[np.ndarray],
+        timestamps: list[datetime.datetime],
+        channels: list[int] | None = None,
+        stamps: list[WindowStamp] | None = None,
+    ) -> None:
+        """Analyze several windows in one interpreter invoke and send detection events.
+
+        Args:
+            audio_chunks: Normalized float32 windows of equal length
+            timestamps: Capture time of each window, in the same order
+            channels: Capture channel of each window, in the same order (default: all 0)
+            stamps: Stream position of each window, in the same order (default: the
+                newest window's)
+        """
+        channels = channels or [0] * len(audio_chunks)
+        stamps = stamps or [self._window_stamp(self.audio_buffer.window_start)] * len(audio_chunks)
+        try:
+            if self.analysis_client is None:
+                raise RuntimeError("Analysis is delegated to the worker pool")
+            current_week = timestamps[0].isocalendar()[1]
+
+            logger.debug("Starting batched BirdNET analysis of %d windows...", len(audio_chunks))
+            started = time.perf_counter()
+            batch_results = await asyncio.get_running_loop().run_in_executor(
+                self._inference_executor,
+                functools.partial(
+                    self.analysis_client.get_analysis_results_batch,
+                    audio_chunks=np.stack(audio_chunks),
+                    latitude=self.config.latitude,
+                    longitude=self.config.longitude,
+                    week=current_week,
+                    sensitivity=self.config.sensitivity_setting,
+                ),
+            )
+            self.stage_latencies.record("inference", time.perf_counter() - started)
+            for results, audio_chunk, timestamp, channel, stamp in zip(
+                batch_results, audio_chunks, timestamps, channels, stamps, strict=True
+            ):
+                await self._handle_analysis_results(results, audio_chunk, timestamp, channel, stamp)
+
+        except Exception:
+            logger.exception("Error during batched BirdNET analysis")
+
+    def _log_analysis_frequency(self) -> None:
+        """Count an analyzed window and log throughput and pool/gate counters every 30s."""
+        self.analysis_count += 1
+        current_time = time.time()
+
+        # Log analysis frequency every 30 seconds at INFO level
+        if current_time - self.last_analysis_log_time >= 30.0:
+            time_elapsed = current_time - self.last_analysis_log_time
+            analyses_per_second = self.analysis_count / time_elapsed
+            logger.info(
+                "Analysis frequency: %.1f analyses/sec (%d analyses in %.1f seconds)",
+                analyses_per_second,
+                self.analysis_count,
+                time_elapsed,
+            )
+            self.analysis_count = 0
+            self.last_analysis_log_time = current_time
+            if self.worker_pool is not None:
+                logger.info("Analysis worker pool", extra=self.worker_pool.stats())
+            for channel, gate in enumerate(self.activity_gates):
+                logger.info("Activity gate", extra={"channel": channel, **gate.stats()})
+
+    async def _handle_analysis_results(
+        self,
+        results: list[tuple[str, float]],
+        audio_chunk: np.ndarray,
+        timestamp: datetime.datetime,
+        channel: int = 0,
+        stamp: WindowStamp | None = None,
+    ) -> None:
+        """Send detection events for the confident results of one analyzed window.
+
+        Args:
+            results: Filtered (species_tensor, confidence) pairs for the window
+            audio_chunk: Normalized float32 window the results were computed from
+            timestamp: Capture time of the window
+            channel: Capture channel the window was taken from
+            stamp: The window's place in the capture stream (default: the newest window)
+        """
+        started = time.perf_counter()
+        stamp = stamp or self._window_stamp(self.audio_buffer.window_start)
+        parsing = 0.0
+        self._log_analysis_frequency()
+
+        logger.debug("BirdNET analysis complete: %d potential detections", len(results))
+        if self._gated_windows and self.activity_gates:
+            self._check_gated_window(self.activity_gates[channel], results, timestamp, channel)
+
+        # Process results and send detection events for confident detections
+        detections_above_threshold = 0
+        hits: list[tuple[SpeciesComponents, float]] = []
+        for species_tensor, confidence in results:
+            if confidence >= self.config.species_confidence_threshold:
+                detections_above_threshold += 1
+                # Parse species tensor using SpeciesParser
+                parse_started = time.perf_counter()
+                try:
+                    species_components = await SpeciesParser.parse_tensor_species(species_tensor)
+                except ValueError as e:
+                    logger.error(
+                        "Invalid species tensor format",
+                        extra={"species_tensor": species_tensor, "error": str(e)},
+                    )
+                    continue  # Skip this detection if tensor format is invalid
+                finally:
+                    parse_seconds = time.perf_counter() - parse_started
+                    self.stage_latencies.record("species_parsing", parse_seconds)
+                    parsing += parse_seconds
+                hits.append((species_components, confidence))
                 logger.info(
-                    "Analysis frequency: %.1f analyses/sec (%d analyses in %.1f seconds)",
-                    analyses_per_second,
-                    self.analysis_count,
-                    time_elapsed,
+                    f"Bird detected: {species_components.scientific_name} "
+                    f"(confidence: {confidence:.3f})"
                 )
-                self.analysis_count = 0
-                self.last_analysis_log_time = current_time
 
-            logger.debug("BirdNET analysis complete: %d potential detections", len(results))
+        if detections_above_threshold == 0:
+            # Log at INFO level if we have a reasonably confident detection below threshold
+            if results and results[0][1] > 0.5:
+                logger.info(
+                    "Detection below threshold: %s with confidence %.3f (threshold: %.2f)",
+                    results[0][0],
+                    results[0][1],
+                    self.config.species_confidence_threshold,
+                )
+            else:
+                logger.debug(
+                    "No detections above threshold (%.2f). Top result: %s with confidence %.3f",
+                    self.config.species_confidence_threshold,
+                    results[0][0] if results else "None",
+                    results[0][1] if results else 0.0,
+                )
+        if self.detection_merger is not None:
+            # Every window is added, hit or not, so events close once their gap has passed
+            await self._dispatch_merged_detections(
+                self.detection_merger.add_window(audio_chunk, timestamp, channel, hits, stamp)
+            )
+        else:
+            await self._dispatch_window_hits(hits, audio_chunk, timestamp, channel, stamp)
+        self.stage_latencies.record("post_processing", time.perf_counter() - started - parsing)
 
-            # Process results and send detection events for confident detections
-            detections_above_threshold = 0
-            for species_tensor, confidence in results:
-                if confidence >= self.config.species_confidence_threshold:
-                    detections_above_threshold += 1
-                    # Parse species tensor using SpeciesParser
-                    try:
-                        species_components = await SpeciesParser.parse_tensor_species(
-                            species_tensor
-                        )
-                    except ValueError as e:
-                        logger.error(
-                            "Invalid species tensor format",
-                            extra={"species_tensor": species_tensor, "error": str(e)},
-                        )
-                        continue  # Skip this detection if tensor format is invalid
-                    # Convert audio chunk back to bytes for saving
-                    audio_bytes = (audio_chunk * 32767).astype(np.int16).tobytes()
-                    await self._send_detection_event(species_components, confidence, audio_bytes)
-                    logger.info(
-                        f"Bird detected: {species_components.scientific_name} "
-                        f"(confidence: {confidence:.3f})"
-                    )
+    async def _dispatch_window_hits(
+        self,
+        hits: list[tuple[SpeciesComponents, float]],
+        audio_chunk: np.ndarray,
+        timestamp: datetime.datetime,
+        channel: int,
+        stamp: WindowStamp,
+    ) -> None:
+        """Send one detection event per hit, its clip the window or the history around it."""
+        audio_bytes: bytes | None = None
+        for species_components, confidence in hits:
+            if self._defer_history_clip(
+                species_components,
+                confidence,
+                timestamp,
+                channel,
+                stamp,
+                self.buffer_size_samples,
+            ):
+                continue
+            if audio_bytes is None:
+                # Encode the clip as int16 once per window; in float32 mode this
+                # is the only int16 conversion on the analysis path
+                clip = np.clip(audio_chunk, -1.0, 1.0) * 32767
+                audio_bytes = clip.astype(np.int16).tobytes()
+            await self._dispatch_detection_event(
+                species_components, confidence, audio_bytes, timestamp, channel, stamp
+            )
+        if self.audio_history is not None:
+            await self._release_pending_clips(self.audio_history)
 
-            if detections_above_threshold == 0:
-                # Log at INFO level if we have a reasonably confident detection below threshold
-                if results and results[0][1] > 0.5:
-                    logger.info(
-                        "Detection below threshold: %s with confidence %.3f (threshold: %.2f)",
-                        results[0][0],
-                        results[0][1],
-                        self.config.species_confidence_threshold,
-                    )
-                else:
-                    logger.debug(
-                        "No detections above threshold (%.2f). Top result: %s with confidence %.3f",
-                        self.config.species_confidence_threshold,
-                        results[0][0] if results else "None",
-                        results[0][1] if results else 0.0,
-                    )
+    async def _dispatch_merged_detections(self, detections: list[MergedDetection]) -> None:
+        """Send one detection event per merged event, its clip spanning every hit."""
+        for detection in detections:
+            if self._defer_history_clip(
+                detection.species_components,
+                detection.confidence,
+                detection.timestamp,
+                detection.channel,
+                detection.stamp,
+                len(detection.clip) // 2,
+            ):
+                continue
+            await self._dispatch_detection_event(
+                detection.species_components,
+                detection.confidence,
+                detection.clip,
+                detection.timestamp,
+                detection.channel,
+                detection.stamp,
+            )
+        if self.audio_history is not None:
+            await self._release_pending_clips(self.audio_history)
 
-        except Exception:
-            logger.exception("Error during BirdNET analysis")
+    def _defer_history_clip(
+        self,
+        species_components: SpeciesComponents,
+        confidence: float,
+        timestamp: datetime.datetime,
+        channel: int,
+        stamp: WindowStamp,
+        frames: int,
+    ) -> bool:
+        """Queue a detection to be sent with its clip cut from the audio history.
+
+        Args:
+            species_components: Parsed species of the detection
+            confidence: Detection confidence
+            timestamp: Capture time of the detection's first window
+            channel: Capture channel of the detection
+            stamp: Stream position of the detection's last window
+            frames: Frames from the window's start the detection covers
+
+        Returns:
+            False if there is no history or it no longer holds the window, in which
+            case the caller sends the window itself as the clip
+        """
+        if self.audio_history is None:
+            return False
+        clip_range = self.audio_history.clip_range(
+            timestamp, frames, self.clip_pre_roll, self.clip_post_roll
+        )
+        if clip_range is None:
+            return False
+        self._pending_clips.append(
+            (species_components, confidence, timestamp, channel, stamp, *clip_range)
+        )
+        self._pending_clips.sort(key=operator.itemgetter(6))
+        return True
+
+    async def _release_pending_clips(self, history: AudioHistory, final: bool = False) -> None:
+        """Send the queued detections whose post-roll has been captured.
+
+        Args:
+            history: History the clips are cut from
+            final: Send every queued detection with the audio captured so far
+        """
+        written = history.frames_written
+        while self._pending_clips and (final or self._pending_clips[0][6] <= written):
+            species_components, confidence, timestamp, channel, stamp, start, end = (
+                self._pending_clips.pop(0)
+            )
+            await self._dispatch_detection_event(
+                species_components,
+                confidence,
+                history.read_clip(start, end, channel),
+                timestamp,
+                channel,
+                stamp,
+            )
+
+    async def _dispatch_detection_event(
+        self,
+        species_components: SpeciesComponents,
+        confidence: float,
+        raw_audio_bytes: bytes,
+        timestamp: datetime.datetime,
+        channel: int = 0,
+        stamp: WindowStamp | None = None,
+    ) -> None:
+        """Send a detection event in the background so analysis is not held up by the API.
+
+        Once MAX_PENDING_SENDS are outstanding this waits for one of them to finish,
+        which bounds memory if the API is slow but still accepting requests.
+        """
+        if len(self._send_tasks) >= MAX_PENDING_SENDS:
+            await asyncio.wait(set(self._send_tasks), return_when=asyncio.FIRST_COMPLETED)
+        task = asyncio.create_task(
+            self._send_detection_event(
+                species_components,
+                confidence,
+                raw_audio_bytes,
+                timestamp=timestamp,
+                channel=channel,
+                stamp=stamp,
+            )
+        )
+        self._send_tasks.add(task)
+        task.add_done_callback(self._send_tasks.discard)
 
     async def _send_detection_event(
-        self, species_components: SpeciesComponents, confidence: float, raw_audio_bytes: bytes
+        self,
+        species_components: SpeciesComponents,
+        confidence: float,
+        raw_audio_bytes: bytes,
+        timestamp: datetime.datetime | None = None,
+        channel: int = 0,
+        stamp: WindowStamp | None = None,
     ) -> None:
         """Send a detection event to the FastAPI application.
 
@@ -298,16 +1145,17 @@ class AudioAnalysisManager:
             species_components: Parsed species components from SpeciesParser
             confidence: Detection confidence score
             raw_audio_bytes: Raw audio data bytes
+            timestamp: Capture time of the analyzed window (defaults to now)
+            channel: Capture channel the clip was taken from
+            stamp: Stream position of the detection's last window; the web app
+                measures end-to-end latency from its capture time at commit
         """
-        timestamp = datetime.datetime.now(UTC)
+        timestamp = timestamp or datetime.datetime.now(UTC)
         current_week = timestamp.isocalendar()[1]
 
-        # Convert raw audio to base64 for transmission
-        import base64
-
-        audio_base64 = base64.b64encode(raw_audio_bytes).decode("utf-8")
-
+        # The ID is generated here so that retries of this detection are idempotent
         detection_data = {
+            "id": str(uuid.uuid4()),
             "species_tensor": species_components.scientific_name
             + "_"
             + species_components.common_name,
@@ -315,9 +1163,9 @@ class AudioAnalysisManager:
             "common_name": species_components.common_name,
             "confidence": confidence,
             "timestamp": timestamp.isoformat(),
-            "audio_data": audio_base64,  # Send audio data with detection
             "sample_rate": self.config.sample_rate,
-            "channels": self.config.audio_channels,
+            "channels": 1,  # The clip is the single channel the detection was heard on
+            "channel": channel,
             "latitude": self.config.latitude,
             "longitude": self.config.longitude,
             "species_confidence_threshold": self.config.species_confidence_threshold,
@@ -325,33 +1173,38 @@ class AudioAnalysisManager:
             "sensitivity_setting": self.config.sensitivity_setting,
             "overlap": self.config.audio_overlap,
         }
+        if stamp is not None:
+            detection_data["sample_index"] = stamp.sample_index
+            detection_data["captured_ns"] = stamp.captured_ns
 
         # Try to send detection event to API
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(self.config.detections_endpoint, json=detection_data)
-                response.raise_for_status()  # Raise an exception for bad status codes
-                logger.info(
-                    "Detection event sent", extra={"species": species_components.scientific_name}
-                )
-                return  # Success - no need to buffer
+            started = time.perf_counter()
+            await self.detection_sender.post(detection_data, raw_audio_bytes)
+            self.stage_latencies.record("http_delivery", time.perf_counter() - started)
+            logger.info(
+                "Detection event sent", extra={"species": species_components.scientific_name}
+            )
+            return  # Success - no need to spool
         except (httpx.RequestError, httpx.HTTPStatusError) as e:
             logger.warning(
-                "FastAPI unavailable, buffering detection",
+                "FastAPI unavailable, spooling detection",
                 extra={"error": str(e), "detection_buffered": True},
             )
         except Exception as e:
             logger.warning(
-                "Unexpected error sending detection, buffering",
+                "Unexpected error sending detection, spooling",
                 extra={"error": str(e), "detection_buffered": True},
             )
 
-        # FastAPI is unavailable - buffer the detection
-        with self.buffer_lock:
-            self.detection_buffer.append(detection_data)
-            buffer_size = len(self.detection_buffer)
-
+        # FastAPI is unavailable - spool the detection to disk for replay, off the loop
+        await asyncio.to_thread(
+            self.detection_spool.append, detection_data["id"], detection_data, raw_audio_bytes
+        )
         logger.info(
-            f"Buffered detection event for {species_components.scientific_name} "
-            f"(buffer size: {buffer_size})"
+            "Spooled detection event",
+            extra={
+                "species": species_components.scientific_name,
+                "spooled": len(self.detection_spool),
+            },
         )
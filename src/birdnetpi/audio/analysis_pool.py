@@ -0,0 +1,324 @@
+"""Multi-process pool of BirdNET interpreters for parallel window analysis.
+
+A single TFLite interpreter keeps one core busy. On boards with more cores,
+high overlap settings produce windows faster than one interpreter can analyze
+them. The pool runs N worker processes, each owning its own interpreter.
+Windows are dispatched round-robin and tagged with a sequence number in capture
+order. Results are re-sequenced before they are handed back, so detections are
+parsed and posted in timestamp order no matter which worker finishes first.
+
+Each worker is sent only a couple of windows ahead; the rest wait in the parent,
+where the number held is bounded like the in-process inference queue. When the
+bound is reached the oldest window is dropped, or, with the block policy, the
+caller waits for the workers to catch up.
+"""
+
+import collections
+import datetime
+import logging
+import multiprocessing
+import queue
+import signal
+import time
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+import numpy as np
+
+from birdnetpi.audio.ring_buffer import WindowStamp
+from birdnetpi.config import BirdNETConfig
+from birdnetpi.detections.birdnet import BirdDetectionService
+from birdnetpi.system.structlog_configurator import configure_structlog
+
+logger = logging.getLogger(__name__)
+
+RESTART_BACKOFF_SECONDS = 5.0  # Minimum time between restarts of the same worker
+WORKER_PREFETCH = 2  # Windows sent ahead to each worker so it never waits on the parent
+
+
+def _worker_main(
+    worker_id: int,
+    config: BirdNETConfig,
+    num_threads: int,
+    tasks: "multiprocessing.Queue[Any]",
+    results: "multiprocessing.Queue[Any]",
+) -> None:
+    """Analyze windows from the task queue until a None sentinel arrives."""
+    # The parent daemon owns shutdown; a Ctrl+C must not kill workers mid-window
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    configure_structlog(config)
+    service = BirdDetectionService(config, num_threads=num_threads, batch_size=1)
+    logger.info("Analysis worker %d ready", worker_id)
+
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        seq, window, latitude, longitude, week, sensitivity = task
+        started = time.perf_counter()
+        try:
+            detections = service.get_analysis_results(
+                audio_chunk=window,
+                latitude=latitude,
+                longitude=longitude,
+                week=week,
+                sensitivity=sensitivity,
+            )
+        except Exception:
+            logger.exception("Analysis worker %d failed on window %d", worker_id, seq)
+            detections = []
+        results.put((seq, worker_id, detections, time.perf_counter() - started))
+
+
+class AnalysisWorkerPool:
+    """Round-robin pool of analysis worker processes with an ordered result merge."""
+
+    def __init__(self, config: BirdNETConfig, workers: int, num_threads: int = 1) -> None:
+        """Initialize the pool without starting any processes.
+
+        Args:
+            config: BirdNET configuration passed to each worker's interpreter
+            workers: Number of worker processes
+            num_threads: Interpreter threads per worker; one thread per worker lets
+                N workers use N cores without oversubscribing them
+
+        Raises:
+            ValueError: If workers is not positive
+        """
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+
+        self.config = config
+        self.workers = workers
+        self.num_threads = num_threads
+        # Windows held at once, as for the in-process queue, but never fewer than in flight
+        pipeline = config.audio_pipeline
+        self.max_pending = max(
+            max(pipeline.analysis_queue_windows, 1) * max(config.audio_channels, 1),
+            workers * WORKER_PREFETCH,
+        )
+        self.drop_oldest = pipeline.analysis_queue_policy != "block"
+        # Spawn rather than fork so workers never inherit the daemon's event loop or threads
+        self._context = multiprocessing.get_context("spawn")
+        self._tasks = [self._context.Queue() for _ in range(workers)]
+        self._results = self._context.Queue()
+        self._processes: list[BaseProcess | None] = [None] * workers
+
+        self._next_seq = 0  # Sequence number of the next submitted window
+        self._next_emit = 0  # Sequence number of the next result to hand back
+        # Submitted windows awaiting their results: seq -> (timestamp, window, channel, stamp)
+        self._pending: dict[int, tuple[datetime.datetime, np.ndarray, int, WindowStamp | None]] = {}
+        self._completed: dict[int, list[tuple[str, float]]] = {}
+        self._outstanding: list[set[int]] = [set() for _ in range(workers)]
+        self._backlog: collections.deque[int] = collections.deque()  # Not yet sent, in order
+
+        self.windows_completed = 0
+        self.windows_lost = 0
+        self.windows_dropped = 0
+        self.worker_restarts = 0
+        self._spawned_at = [0.0] * workers
+        self._busy_seconds = [0.0] * workers
+        self._stats_started = time.monotonic()
+
+    def start(self) -> None:
+        """Start every worker process."""
+        for worker_id in range(self.workers):
+            self._spawn_worker(worker_id)
+        logger.info(
+            "Started %d analysis workers (%d interpreter threads each)",
+            self.workers,
+            self.num_threads,
+        )
+
+    def _spawn_worker(self, worker_id: int) -> None:
+        process = self._context.Process(
+            target=_worker_main,
+            args=(
+                worker_id,
+                self.config,
+                self.num_threads,
+                self._tasks[worker_id],
+                self._results,
+            ),
+            name=f"birdnetpi-analysis-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        self._processes[worker_id] = process
+        self._spawned_at[worker_id] = time.monotonic()
+
+    def submit(
+        self,
+        window: np.ndarray,
+        timestamp: datetime.datetime,
+        channel: int = 0,
+        stamp: WindowStamp | None = None,
+    ) -> int:
+        """Queue a window for analysis on the next worker in round-robin order.
+
+        Windows must be submitted in capture order; results are returned in the
+        same order. When the pool already holds max_pending windows, the oldest
+        is dropped under the drop_oldest policy; under the block policy callers
+        wait for full to clear before submitting.
+
+        Args:
+            window: Normalized float32 analysis window
+            timestamp: Capture time of the window
+            channel: Capture channel of the window, handed back with its results
+            stamp: Stream position of the window, handed back with its results
+
+        Returns:
+            Sequence number assigned to the window
+        """
+        if self.full and self.drop_oldest:
+            self._drop_oldest()
+        seq = self._next_seq
+        self._next_seq += 1
+        self._pending[seq] = (timestamp, window, channel, stamp)
+        self._backlog.append(seq)
+        self._dispatch()
+        return seq
+
+    @property
+    def full(self) -> bool:
+        """Whether the pool holds as many windows as it may."""
+        return len(self._pending) >= self.max_pending
+
+    def _drop_oldest(self) -> None:
+        """Give up on the oldest held window; a late result for it is ignored."""
+        seq = next(iter(self._pending))  # Windows are held in capture order
+        del self._pending[seq]
+        self._completed.pop(seq, None)
+        if self._backlog and self._backlog[0] == seq:
+            self._backlog.popleft()
+        self.windows_dropped += 1
+        logger.debug("Analysis pool full, dropped oldest window")
+
+    def _dispatch(self) -> None:
+        """Send waiting windows, in order, to workers with room for them."""
+        while self._backlog:
+            seq = self._backlog[0]
+            worker_id = seq % self.workers
+            if len(self._outstanding[worker_id]) >= WORKER_PREFETCH:
+                break
+            self._backlog.popleft()
+            timestamp, window, _, _ = self._pending[seq]
+            self._outstanding[worker_id].add(seq)
+            self._tasks[worker_id].put(
+                (
+                    seq,
+                    window,
+                    self.config.latitude,
+                    self.config.longitude,
+                    timestamp.isocalendar()[1],
+                    self.config.sensitivity_setting,
+                )
+            )
+
+    def collect(
+        self,
+    ) -> list[
+        tuple[datetime.datetime, np.ndarray, int, WindowStamp | None, list[tuple[str, float]]]
+    ]:
+        """Return finished windows in capture order without blocking.
+
+        A result that finishes ahead of an earlier window is held back until every
+        earlier window has completed.
+
+        Returns:
+            (timestamp, window, channel, stamp, detections) for each window ready to be
+            handed on
+        """
+        while True:
+            try:
+                seq, worker_id, detections, busy_seconds = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._outstanding[worker_id].discard(seq)
+            self._busy_seconds[worker_id] += busy_seconds
+            if seq in self._pending:  # Late results for windows given up on are dropped
+                self._completed[seq] = detections
+
+        self._recover_dead_workers()
+        self._dispatch()
+
+        ready = []
+        while self._next_emit < self._next_seq:
+            seq = self._next_emit
+            if seq in self._completed:
+                detections = self._completed.pop(seq)
+                timestamp, window, channel, stamp = self._pending.pop(seq)
+                ready.append((timestamp, window, channel, stamp, detections))
+            elif seq in self._pending:
+                break
+            # Otherwise the window was dropped and is skipped
+            self._next_emit += 1
+        self.windows_completed += len(ready)
+        return ready
+
+    def _recover_dead_workers(self) -> None:
+        """Give up on a crashed worker's windows and restart it after a backoff."""
+        now = time.monotonic()
+        for worker_id, process in enumerate(self._processes):
+            if process is None or process.is_alive():
+                continue
+            # Mark lost windows complete with no detections so the merge keeps moving
+            lost = [seq for seq in self._outstanding[worker_id] if seq in self._pending]
+            for seq in lost:
+                self._completed[seq] = []
+            self.windows_lost += len(lost)
+            self._outstanding[worker_id].clear()
+
+            # A worker that cannot load its model would otherwise respawn continuously
+            if now - self._spawned_at[worker_id] < RESTART_BACKOFF_SECONDS:
+                continue
+            logger.error(
+                "Analysis worker %d exited (code %s), restarting", worker_id, process.exitcode
+            )
+            self._tasks[worker_id] = self._context.Queue()
+            self.worker_restarts += 1
+            self._spawn_worker(worker_id)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of submitted windows not yet handed back."""
+        return len(self._pending)
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool counters; utilisation covers the interval since the last call."""
+        now = time.monotonic()
+        elapsed = max(now - self._stats_started, 1e-9)
+        utilisation = [round(busy / elapsed, 3) for busy in self._busy_seconds]
+        self._busy_seconds = [0.0] * self.workers
+        self._stats_started = now
+        return {
+            "workers": self.workers,
+            "queue_depth": self.queue_depth,
+            "reorder_backlog": len(self._completed),
+            "worker_queue_depth": [len(outstanding) for outstanding in self._outstanding],
+            "worker_utilisation": utilisation,
+            "windows_completed": self.windows_completed,
+            "windows_lost": self.windows_lost,
+            "windows_dropped": self.windows_dropped,
+            "worker_restarts": self.worker_restarts,
+        }
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Ask every worker to exit and wait for it, terminating stragglers."""
+        for worker_id, process in enumerate(self._processes):
+            if process is not None and process.is_alive():
+                self._tasks[worker_id].put(None)
+        deadline = time.monotonic() + timeout
+        for worker_id, process in enumerate(self._processes):
+            if process is None:
+                continue
+            process.join(max(deadline - time.monotonic(), 0.0))
+            if process.is_alive():
+                logger.warning("Analysis worker %d did not exit, terminating", worker_id)
+                process.terminate()
+                process.join(1.0)
+            self._processes[worker_id] = None
+        for task_queue in [*self._tasks, self._results]:
+            # Unsent windows must not block interpreter exit
+            task_queue.cancel_join_thread()
+        logger.info("Stopped analysis workers")
@@ -0,0 +1,162 @@
+"""Rolling history of raw capture audio for detection clips and on-demand playback.
+
+Without a history, a detection's clip can only be the 3-second analysis window,
+converted back to int16 from the float32 copy the model saw. The analysis
+daemon can instead keep the last few minutes of the samples it reads, in the
+capture sample format, in a shared-memory ring. Positions in it are frame
+counts since the daemon started, the same counts the analysis windows are cut
+at. A clip with any pre- and post-roll is then a slice of the ring, and the web
+API can attach to the same ring to serve the last minute of audio.
+"""
+
+import datetime
+from pathlib import Path
+
+import numpy as np
+
+from birdnetpi.audio.shared_ring import HISTORY_RING_NAME, SharedAudioRing, SharedAudioRingView
+
+
+def to_pcm16(samples: np.ndarray) -> np.ndarray:
+    """Return int16 samples unchanged and convert normalized float32 ones."""
+    if samples.dtype == np.int16:
+        return samples
+    return (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+
+
+class AudioHistory:
+    """Producer side of the history ring, with clip extraction by window."""
+
+    def __init__(
+        self,
+        seconds: float,
+        sample_rate: int,
+        channels: int,
+        dtype: type[np.generic],
+        doorbell_dir: str | Path,
+        name: str = HISTORY_RING_NAME,
+    ) -> None:
+        """Create the history ring.
+
+        Args:
+            seconds: Audio retained
+            sample_rate: Capture sample rate
+            channels: Interleaved capture channels
+            dtype: Capture sample type, np.int16 or np.float32
+            doorbell_dir: Directory the ring keeps consumer doorbells in (none are used)
+            name: Shared-memory segment name
+        """
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.capacity_frames = max(int(seconds * sample_rate), 1)
+        self.ring = SharedAudioRing(
+            name,
+            self.capacity_frames * channels,
+            doorbell_dir,
+            sample_rate=sample_rate,
+            channels=channels,
+            max_consumers=1,
+            dtype=dtype,
+        )
+        # Frame position of each analyzed window's first sample, by its capture time,
+        # while the window is still in the history
+        self._window_positions: dict[datetime.datetime, int] = {}
+
+    @property
+    def frames_written(self) -> int:
+        """Frames written since the history was created."""
+        return self.ring.write_seq // self.channels
+
+    @property
+    def oldest_frame(self) -> int:
+        """Position of the oldest frame still held."""
+        return max(self.frames_written - self.capacity_frames, 0)
+
+    def write(self, frames: np.ndarray) -> None:
+        """Append frames of shape (frames, channels) in the capture sample type."""
+        self.ring.write(frames)
+
+    def remember_window(self, timestamp: datetime.datetime, position: int) -> None:
+        """Record where an analysis window starts, so its clip can be found by capture time.
+
+        Args:
+            timestamp: Capture time the window's results will carry
+            position: Frame position of the window's first sample
+        """
+        self._window_positions[timestamp] = position
+        oldest = self.oldest_frame
+        for stale, stale_position in list(self._window_positions.items()):
+            if stale_position >= oldest:
+                break
+            del self._window_positions[stale]
+
+    def clip_range(
+        self, timestamp: datetime.datetime, frames: int, pre_roll: int, post_roll: int
+    ) -> tuple[int, int] | None:
+        """Return the frame range of a clip around a window, if the window is known.
+
+        Args:
+            timestamp: Capture time of the clip's first window
+            frames: Frames from the window's start the detection covers
+            pre_roll: Frames to add before it
+            post_roll: Frames to add after it
+
+        Returns:
+            (start, end) frame positions, or None if the window is no longer held
+        """
+        position = self._window_positions.get(timestamp)
+        if position is None:
+            return None
+        return max(position - pre_roll, 0), position + frames + post_roll
+
+    def read_clip(self, start: int, end: int, channel: int) -> bytes:
+        """Return one channel of a frame range as raw int16 PCM.
+
+        The range is clamped to the frames still held and already written.
+
+        Args:
+            start: First frame position
+            end: Frame position just after the clip
+            channel: Channel to extract
+        """
+        start = max(start, self.oldest_frame)
+        end = min(end, self.frames_written)
+        if end <= start:
+            return b""
+        samples = self.ring.read_range(start * self.channels, end * self.channels)
+        if samples is None:
+            return b""
+        return to_pcm16(samples.reshape(-1, self.channels)[:, channel]).tobytes()
+
+    def close(self) -> None:
+        """Release and unlink the history ring."""
+        self.ring.close()
+
+
+def read_recent_audio(
+    seconds: float, channel: int = 0, name: str = HISTORY_RING_NAME
+) -> tuple[np.ndarray, int]:
+    """Copy the newest audio out of the analysis daemon's history.
+
+    Args:
+        seconds: Audio wanted; less is returned if the history is shorter
+        channel: Capture channel to return
+        name: Shared-memory segment name of the history
+
+    Returns:
+        int16 samples of the channel and their sample rate
+
+    Raises:
+        FileNotFoundError: If the analysis daemon is not keeping a history
+        ValueError: If the channel is not captured
+    """
+    view = SharedAudioRingView(name)
+    try:
+        channels = max(view.channels, 1)
+        if not 0 <= channel < channels:
+            raise ValueError(f"Channel {channel} is not captured ({channels} channels)")
+        samples = view.read_latest(int(seconds * view.sample_rate) * channels)
+        frames = samples[len(samples) % channels :].reshape(-1, channels)
+        return to_pcm16(frames[:, channel]), view.sample_rate
+    finally:
+        view.close()
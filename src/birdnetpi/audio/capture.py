@@ -1,77 +1,192 @@
 import logging
 import os
+import threading
+import time
+from typing import Any
 
 import numpy as np
 import sounddevice as sd
 
 from birdnetpi.audio.devices import AudioDeviceService
-from birdnetpi.audio.filters import FilterChain
+from birdnetpi.audio.filters import FilterChain, ResampleFilter
+from birdnetpi.audio.ring_buffer import FrameRing
+from birdnetpi.audio.shared_ring import SharedAudioRing
 from birdnetpi.config import BirdNETConfig
+from birdnetpi.system.pipeline_stats import StageLatencies
 
 logger = logging.getLogger(__name__)
 
+CALLBACK_RING_SECONDS = 2.0  # Audio the worker may fall behind before blocks are dropped
+WORKER_WAKE_TIMEOUT = 0.1  # Upper bound on how long the worker sleeps between checks
+
 
 class AudioCaptureService:
-    """Manages audio capture from a specified input device using sounddevice."""
+    """Manages audio capture from a specified input device using sounddevice.
+
+    The PortAudio callback runs on a realtime thread and only copies each block
+    into a lock-free single-producer/single-consumer ring. A worker thread drains
+    the ring, runs the filter chains and writes to the FIFOs or shared-memory
+    rings, so a slow filter or a full pipe delays the worker instead of
+    overflowing the input stream.
+    """
 
     def __init__(
         self,
         config: BirdNETConfig,
-        analysis_fifo_fd: int,
-        livestream_fifo_fd: int,
+        analysis_fifo_fd: int | None,
+        livestream_fifo_fd: int | None,
         analysis_filter_chain: FilterChain | None = None,
         livestream_filter_chain: FilterChain | None = None,
+        analysis_ring: SharedAudioRing | None = None,
+        livestream_ring: SharedAudioRing | None = None,
     ) -> None:
         """Initialize the AudioCaptureService.
 
+        Audio is published either to the two FIFOs or, when both rings are given,
+        to the shared-memory rings (in which case the FIFO descriptors are unused).
+
         Args:
             config: BirdNET configuration
             analysis_fifo_fd: File descriptor for analysis FIFO
             livestream_fifo_fd: File descriptor for livestream FIFO
             analysis_filter_chain: Optional filter chain for analysis pipeline
             livestream_filter_chain: Optional filter chain for livestream pipeline
+            analysis_ring: Optional shared-memory ring for analysis consumers
+            livestream_ring: Optional shared-memory ring for livestream consumers
         """
         self.config = config
         self.analysis_fifo_fd = analysis_fifo_fd
         self.livestream_fifo_fd = livestream_fifo_fd
+        self.analysis_ring = analysis_ring
+        self.livestream_ring = livestream_ring
         self.analysis_filter_chain = analysis_filter_chain
         self.livestream_filter_chain = livestream_filter_chain
+        # Livestream audio stays int16 for the browser; analysis audio may stay float32
+        self.float32_analysis = config.audio_pipeline.sample_format == "float32"
         self.stream = None
         self._shutdown_requested = False
         self.device_sample_rate = None  # Will be determined from device
+        self.resampler: ResampleFilter | None = None  # Set when capturing at a native rate
         self.audio_device_service = AudioDeviceService()
 
+        # Callback-to-worker handoff, sized for the rate the device will be opened at
+        capture_rate = config.audio_pipeline.capture_sample_rate or config.sample_rate
+        self.frame_ring = FrameRing(
+            int(capture_rate * CALLBACK_RING_SECONDS), config.audio_channels
+        )
+        self._audio_ready = threading.Event()
+        self._worker_stop = threading.Event()
+        self._worker: threading.Thread | None = None
+        self._pending_status: sd.CallbackFlags | None = None
+
+        # Counters reported by stats(); cumulative unless noted
+        self.callbacks = 0
+        self.status_flags = 0
+        self.input_overflows = 0
+        self.input_underflows = 0
+        self._callback_seconds = 0.0  # Since the last stats() call
+        self._callback_max_seconds = 0.0  # Since the last stats() call
+        self._worker_seconds = 0.0  # Since the last stats() call
+        self._worker_max_lag = 0  # Frames, since the last stats() call
+        self._stats_callbacks = 0
+        self._stats_started = time.monotonic()
+        self.latencies = StageLatencies()
+        # perf_counter() when the oldest block not yet published was captured
+        self._oldest_pending: float | None = None
+
         # Filter chains configured after determining device sample rate
         logger.info("AudioCaptureService initialized.")
 
     def _callback(
-        self, indata: np.ndarray, frames: int, time: sd.CallbackStop, status: sd.CallbackFlags
+        self, indata: np.ndarray, frames: int, time_info: object, status: sd.CallbackFlags
     ) -> None:
-        """Process a block of audio data from the sounddevice stream."""
+        """Hand a block from the sounddevice stream to the worker thread.
+
+        This runs on PortAudio's realtime thread, so it only counts status flags,
+        copies the block into the frame ring and wakes the worker. It never
+        filters, logs or writes to a pipe.
+        """
+        started = time.perf_counter()
+        if status:
+            self.status_flags += 1
+            self.input_overflows += bool(status.input_overflow)
+            self.input_underflows += bool(status.input_underflow)
+            self._pending_status = status  # Logged by the worker
+
+        self.frame_ring.write(indata)
+        if self._oldest_pending is None:
+            self._oldest_pending = started
+        self._audio_ready.set()
+
+        elapsed = time.perf_counter() - started
+        self.latencies.record("capture_callback", elapsed)
+        self.callbacks += 1
+        self._callback_seconds += elapsed
+        if elapsed > self._callback_max_seconds:
+            self._callback_max_seconds = elapsed
+
+    def _worker_loop(self) -> None:
+        """Drain the frame ring until the worker is asked to stop."""
+        while not self._worker_stop.is_set():
+            self._audio_ready.wait(WORKER_WAKE_TIMEOUT)
+            self._audio_ready.clear()
+            self._drain_frame_ring()
+
+    def _drain_frame_ring(self) -> None:
+        """Filter and publish every block the callback has queued since the last drain."""
+        status, self._pending_status = self._pending_status, None
         if status:
             logger.warning("Audio stream status: %s", status)
 
-        # Convert float32 to int16 for processing
-        audio_int16 = (indata * 32767).astype(np.int16)
+        lag = len(self.frame_ring)
+        if lag == 0:
+            return
+        if lag > self._worker_max_lag:
+            self._worker_max_lag = lag
+
+        queued_at, self._oldest_pending = self._oldest_pending, None
+        started = time.perf_counter()
+        self._process_block(self.frame_ring.read())
+        finished = time.perf_counter()
+        self._worker_seconds += finished - started
+        if queued_at is not None:
+            # From the callback to the block being readable by consumers
+            self.latencies.record("capture_publish", finished - queued_at)
+
+    def _process_block(self, indata: np.ndarray) -> None:
+        """Filter a float32 block of captured audio and publish it to both consumers."""
+        # Bring native-rate audio to the analysis rate before anything else sees it
+        if self.resampler is not None:
+            indata = self.resampler.process(indata)
 
-        # Apply analysis filter chain if configured
-        analysis_audio = audio_int16
+        # Convert float32 to int16 for processing; the resampler's FIR can overshoot
+        # full scale, and unclipped samples would wrap around to the opposite sign
+        audio_int16 = (np.clip(indata, -1.0, 1.0) * 32767).astype(np.int16)
+
+        # Apply analysis filter chain if configured; float32 mode skips the int16 round trip
+        analysis_audio = indata if self.float32_analysis else audio_int16
         if self.analysis_filter_chain:
-            analysis_audio = self.analysis_filter_chain.process(audio_int16)
+            analysis_audio = self.analysis_filter_chain.process(analysis_audio)
 
         # Apply livestream filter chain if configured
         livestream_audio = audio_int16
         if self.livestream_filter_chain:
             livestream_audio = self.livestream_filter_chain.process(audio_int16)
 
+        # Publish to shared memory; consumers track their own position and overruns
+        if self.analysis_ring is not None and self.livestream_ring is not None:
+            self.analysis_ring.write(analysis_audio)
+            self.livestream_ring.write(livestream_audio)
+            return
+
         # Convert filtered audio to bytes for FIFO writing
         analysis_bytes = analysis_audio.tobytes()
         livestream_bytes = livestream_audio.tobytes()
 
         # Write filtered audio to respective FIFOs
         try:
-            os.write(self.analysis_fifo_fd, analysis_bytes)
-            os.write(self.livestream_fifo_fd, livestream_bytes)
+            os.write(self.analysis_fifo_fd, analysis_bytes)  # type: ignore[arg-type]
+            os.write(self.livestream_fifo_fd, livestream_bytes)  # type: ignore[arg-type]
         except BlockingIOError:
             # This can happen if the readers are not keeping up
             logger.warning("FIFO write would block, skipping frame.")
@@ -98,19 +213,32 @@ class AudioCaptureService:
             channels = self.config.audio_channels
             target_sample_rate = self.config.sample_rate  # What BirdNET expects (48000)
 
-            # Let sounddevice/PortAudio handle sample rate conversion automatically
-            # This works on all platforms (macOS, Linux, Windows) though quality may vary:
-            # - macOS: CoreAudio provides high-quality resampling
-            # - Linux/ALSA: Basic resampling (usually linear or speex)
-            # - Linux/PulseAudio: Better quality resampling
-            # - Works well enough for bird detection on Raspberry Pi and other SBCs
-            logger.info(
-                "Using sounddevice automatic resampling (PortAudio) - requesting %dHz",
-                target_sample_rate,
-            )
-
-            # Store the target sample rate (what we request from sounddevice)
-            self.device_sample_rate = target_sample_rate
+            native_sample_rate = self.config.audio_pipeline.capture_sample_rate
+            if native_sample_rate and native_sample_rate != target_sample_rate:
+                # Open the device at its native rate and convert in-process with the
+                # streaming polyphase resampler instead of PortAudio's converter
+                self.resampler = ResampleFilter(target_sample_rate, name="CaptureResample")
+                self.resampler.configure(native_sample_rate, channels)
+                self.device_sample_rate = native_sample_rate
+                logger.info(
+                    "Capturing at native %dHz, resampling in-process to %dHz",
+                    native_sample_rate,
+                    target_sample_rate,
+                )
+            else:
+                # Let sounddevice/PortAudio handle sample rate conversion automatically
+                # This works on all platforms (macOS, Linux, Windows) though quality may vary:
+                # - macOS: CoreAudio provides high-quality resampling
+                # - Linux/ALSA: Basic resampling (usually linear or speex)
+                # - Linux/PulseAudio: Better quality resampling
+                # - Works well enough for bird detection on Raspberry Pi and other SBCs
+                logger.info(
+                    "Using sounddevice automatic resampling (PortAudio) - requesting %dHz",
+                    target_sample_rate,
+                )
+                self.resampler = None
+                # Store the target sample rate (what we request from sounddevice)
+                self.device_sample_rate = target_sample_rate
 
             if self.analysis_filter_chain is not None:
                 # Configure the chain with target sample rate
@@ -131,22 +259,71 @@ class AudioCaptureService:
             logger.info(
                 "Starting audio capture on device ID: %s, sample rate: %dHz, channels: %s",
                 device_id,
-                target_sample_rate,
+                self.device_sample_rate,
                 channels,
             )
 
+            self._start_worker()
             self.stream = sd.InputStream(
                 device=device_id,
-                samplerate=target_sample_rate,  # Request target rate, let sounddevice resample
+                samplerate=self.device_sample_rate,
                 channels=channels,
                 callback=self._callback,
             )
             self.stream.start()
-            logger.info("Audio capture stream started at %dHz.", target_sample_rate)
+            logger.info("Audio capture stream started at %dHz.", self.device_sample_rate)
         except Exception as e:
             logger.error("Failed to start audio capture stream: %s", e)
             raise
 
+    def _start_worker(self) -> None:
+        """Start the thread that filters and publishes queued audio."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._worker_stop.clear()
+        self._worker = threading.Thread(
+            target=self._worker_loop, name="birdnetpi-capture-worker", daemon=True
+        )
+        self._worker.start()
+
+    def _stop_worker(self) -> None:
+        """Stop the worker thread after the stream has stopped feeding it."""
+        if self._worker is None:
+            return
+        self._worker_stop.set()
+        self._audio_ready.set()
+        self._worker.join(timeout=2.0)
+        self._worker = None
+
+    def stats(self) -> dict[str, Any]:
+        """Return capture counters; timings and lag cover the interval since the last call."""
+        now = time.monotonic()
+        elapsed = max(now - self._stats_started, 1e-9)
+        callbacks = self.callbacks - self._stats_callbacks
+        sample_rate = self.device_sample_rate or self.config.sample_rate
+        stats = {
+            "sample_rate": sample_rate,
+            "callbacks": self.callbacks,
+            "callback_mean_us": round(self._callback_seconds * 1e6 / max(callbacks, 1), 1),
+            "callback_max_us": round(self._callback_max_seconds * 1e6, 1),
+            "status_flags": self.status_flags,
+            "input_overflows": self.input_overflows,
+            "input_underflows": self.input_underflows,
+            "dropped_frames": self.frame_ring.dropped_frames,
+            "worker_lag_frames": len(self.frame_ring),
+            "worker_max_lag_ms": round(self._worker_max_lag * 1000 / sample_rate, 1),
+            "worker_utilisation": round(self._worker_seconds / elapsed, 3),
+            "latency": self.latencies.snapshot(),
+        }
+        self.latencies.roll("capture")
+        self._stats_callbacks = self.callbacks
+        self._callback_seconds = 0.0
+        self._callback_max_seconds = 0.0
+        self._worker_seconds = 0.0
+        self._worker_max_lag = 0
+        self._stats_started = now
+        return stats
+
     def stop_capture(self) -> None:
         """Stop the audio capture stream gracefully."""
         if self.stream and not self.stream.stopped:
@@ -154,8 +331,6 @@ class AudioCaptureService:
                 # Abort first to immediately stop processing
                 self.stream.abort()
                 # Small delay to allow threads to terminate
-                import time
-
                 time.sleep(0.1)
                 # Then close the stream
                 self.stream.close()
@@ -169,3 +344,4 @@ class AudioCaptureService:
                     logger.error(f"Error stopping audio stream: {e}")
         else:
             logger.info("Audio capture stream is not running.")
+        self._stop_worker()
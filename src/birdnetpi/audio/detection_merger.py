@@ -0,0 +1,204 @@
+"""Merging of same-species hits in consecutive windows into one detection.
+
+With a large audio_overlap, one song is usually heard in two or three
+consecutive windows, and each hit would otherwise become its own detection,
+clip and notification. The merger holds a detection open while the species
+keeps being heard on a channel. Once a window starts more than the configured
+gap after the species was last heard, it emits one detection for the whole
+event. That detection keeps the highest confidence, the first window's start
+time and a clip that runs from the first window's start to the end of the last
+window with a hit.
+
+Windows are placed on each channel by their absolute sample index, not by
+their capture time, which is a wall-clock estimate that jitters by a few
+milliseconds from window to window. Audio is kept once per channel, not once
+per event, and only back to the start of the oldest open event.
+"""
+
+import datetime
+from dataclasses import dataclass
+
+import numpy as np
+
+from birdnetpi.audio.ring_buffer import WindowStamp
+from birdnetpi.species.parser import SpeciesComponents
+
+MAX_EVENT_SECONDS = 30.0  # A longer event is emitted and a new one started, bounding clips
+
+
+@dataclass(frozen=True)
+class MergedDetection:
+    """One detection covering every window of an event."""
+
+    species_components: SpeciesComponents
+    confidence: float  # Highest confidence of the event's hits
+    timestamp: datetime.datetime  # Start of the first window with a hit
+    channel: int
+    windows: int  # Windows with a hit merged into this detection
+    clip: bytes  # Raw int16 PCM from the first window's start to the last hit's end
+    stamp: WindowStamp  # Stream position of the last window with a hit
+
+
+@dataclass
+class _OpenEvent:
+    """An event still waiting to see whether its species is heard again."""
+
+    species_components: SpeciesComponents
+    confidence: float
+    timestamp: datetime.datetime
+    start: int  # Sample index of the first window's start
+    last_hit_end: int  # Sample index of the last hit window's end
+    last_hit_stamp: WindowStamp
+    windows: int = 1
+
+
+class _ChannelTrack:
+    """Contiguous int16 audio of one channel, from the oldest open event onward."""
+
+    def __init__(self) -> None:
+        self.chunks: list[tuple[int, np.ndarray]] = []  # (start sample index, samples)
+        self.end: int | None = None  # Sample index just after the newest sample
+        self.events: dict[str, _OpenEvent] = {}  # Open events by scientific name
+
+    def append(self, window: np.ndarray, start: int) -> None:
+        """Add the part of a window that is not already held, as int16."""
+        if self.end is None or start > self.end:
+            self.chunks.clear()
+            self.end = start
+        new = window[self.end - start :]
+        if len(new):
+            self.chunks.append((self.end, (np.clip(new, -1.0, 1.0) * 32767).astype(np.int16)))
+            self.end += len(new)
+
+    def slice(self, start: int, end: int) -> bytes:
+        """Return the held audio between two sample indices as raw int16 PCM."""
+        parts = [
+            samples[max(start - chunk_start, 0) : end - chunk_start]
+            for chunk_start, samples in self.chunks
+            if chunk_start < end and chunk_start + len(samples) > start
+        ]
+        return np.concatenate(parts).tobytes() if parts else b""
+
+    def trim(self) -> None:
+        """Drop audio no open event can still need."""
+        if not self.events:
+            self.chunks.clear()
+            self.end = None
+            return
+        oldest = min(event.start for event in self.events.values())
+        self.chunks = [
+            (chunk_start, samples)
+            for chunk_start, samples in self.chunks
+            if chunk_start + len(samples) > oldest
+        ]
+
+
+class DetectionMerger:
+    """Coalesce same-species hits within a gap into one detection per channel."""
+
+    def __init__(
+        self,
+        sample_rate: int,
+        window_samples: int,
+        gap_seconds: float,
+        max_event_seconds: float = MAX_EVENT_SECONDS,
+    ) -> None:
+        """Initialize the merger.
+
+        Args:
+            sample_rate: Sample rate of the analyzed windows
+            window_samples: Samples per analysis window
+            gap_seconds: Longest silence between hits of one event, measured from
+                the end of one hit window to the start of the next
+            max_event_seconds: Longest event before it is emitted regardless
+        """
+        self.sample_rate = sample_rate
+        self.window_samples = window_samples
+        self.gap_samples = int(gap_seconds * sample_rate)
+        self.max_event_samples = int(max_event_seconds * sample_rate)
+        self._tracks: dict[int, _ChannelTrack] = {}
+        self.windows_merged = 0  # Hits folded into an existing event rather than emitted
+
+    def add_window(
+        self,
+        window: np.ndarray,
+        timestamp: datetime.datetime,
+        channel: int,
+        hits: list[tuple[SpeciesComponents, float]],
+        stamp: WindowStamp,
+    ) -> list[MergedDetection]:
+        """Add one analyzed window and return the events it closes.
+
+        Every analyzed window must be added, including those without hits, in
+        capture order per channel; a window that does not continue the channel's
+        audio (e.g. after the activity gate skipped some) closes its open events.
+
+        Args:
+            window: Normalized float32 samples of the window
+            timestamp: Capture time of the window's first sample
+            channel: Capture channel of the window
+            hits: Confident (species, confidence) results for the window
+            stamp: The window's place in the capture stream; its sample index
+                positions the window on the channel
+
+        Returns:
+            Detections for the events that ended before this window
+        """
+        track = self._tracks.setdefault(channel, _ChannelTrack())
+        start = stamp.sample_index
+        end = start + self.window_samples
+        discontinuous = track.end is not None and start > track.end
+
+        closed = [
+            self._close(track, name, channel)
+            for name, event in list(track.events.items())
+            if discontinuous
+            or start > event.last_hit_end + self.gap_samples
+            or end - event.start > self.max_event_samples
+        ]
+
+        if track.events or hits:
+            track.append(window, start)
+        for species_components, confidence in hits:
+            event = track.events.get(species_components.scientific_name)
+            if event is None:
+                track.events[species_components.scientific_name] = _OpenEvent(
+                    species_components, confidence, timestamp, start, end, stamp
+                )
+                continue
+            event.confidence = max(event.confidence, confidence)
+            event.last_hit_end = end
+            event.last_hit_stamp = stamp
+            event.windows += 1
+            self.windows_merged += 1
+        track.trim()
+        return closed
+
+    def flush(self) -> list[MergedDetection]:
+        """Close and return every open event, e.g. at shutdown."""
+        closed = [
+            self._close(track, name, channel)
+            for channel, track in self._tracks.items()
+            for name in list(track.events)
+        ]
+        for track in self._tracks.values():
+            track.trim()
+        return closed
+
+    @property
+    def open_events(self) -> int:
+        """Number of events still waiting to be emitted."""
+        return sum(len(track.events) for track in self._tracks.values())
+
+    def _close(self, track: _ChannelTrack, name: str, channel: int) -> MergedDetection:
+        """Remove an open event and build its detection from the channel's audio."""
+        event = track.events.pop(name)
+        return MergedDetection(
+            event.species_components,
+            event.confidence,
+            event.timestamp,
+            channel,
+            event.windows,
+            track.slice(event.start, event.last_hit_end),
+            event.last_hit_stamp,
+        )
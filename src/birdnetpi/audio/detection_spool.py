@@ -0,0 +1,189 @@
+"""Durable on-disk spool for detections the web API could not accept.
+
+Detections that fail to deliver are appended to a small SQLite database under the
+data dir instead of being held in memory. Clips are stored as BLOBs and only read
+back a batch at a time during replay, so an outage costs disk space rather than
+daemon memory, and nothing is lost when the analysis daemon restarts.
+
+Every detection carries a client-generated UUID. The web API treats a repeated
+UUID as already recorded, so a detection that was delivered but whose
+acknowledgement was lost can be replayed without creating a duplicate.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS spool (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    detection_id TEXT NOT NULL UNIQUE,
+    metadata TEXT NOT NULL,
+    audio BLOB NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+# Detections the web API rejects on their own, kept out of replay for inspection
+_DEAD_LETTER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dead_letter (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    detection_id TEXT NOT NULL UNIQUE,
+    metadata TEXT NOT NULL,
+    audio BLOB NOT NULL,
+    attempts INTEGER NOT NULL,
+    reason TEXT NOT NULL
+)
+"""
+
+
+@dataclass(frozen=True)
+class SpooledDetection:
+    """A detection waiting in the spool."""
+
+    detection_id: str
+    metadata: dict[str, Any]
+    audio: bytes
+    attempts: int
+
+
+class DetectionSpool:
+    """Append-only, ordered store of undelivered detections."""
+
+    def __init__(self, path: Path, max_detections: int = 5000) -> None:
+        """Open or create the spool.
+
+        Args:
+            path: SQLite database file
+            max_detections: Detections kept before the oldest are discarded
+        """
+        self.path = path
+        self.max_detections = max_detections
+        self.discarded = 0
+        self.dead_lettered = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Shared by the analysis loop and the replay thread; the lock serializes them
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(_SCHEMA)
+            self._connection.execute(_DEAD_LETTER_SCHEMA)
+            # Kept in memory so appends and len() need no COUNT(*) per detection
+            (self._count,) = self._connection.execute("SELECT COUNT(*) FROM spool").fetchone()
+
+    def append(self, detection_id: str, metadata: dict[str, Any], audio: bytes) -> None:
+        """Spool a detection; appending the same detection ID twice is a no-op.
+
+        Args:
+            detection_id: Client-generated detection UUID
+            metadata: JSON-serializable detection fields, without the clip
+            audio: Raw int16 PCM of the detection clip
+        """
+        with self._lock:
+            self._count += self._connection.execute(
+                "INSERT OR IGNORE INTO spool (detection_id, metadata, audio) VALUES (?, ?, ?)",
+                (detection_id, json.dumps(metadata), audio),
+            ).rowcount
+            excess = self._count - self.max_detections
+            if excess > 0:
+                self._count -= self._connection.execute(
+                    "DELETE FROM spool WHERE seq IN (SELECT seq FROM spool ORDER BY seq LIMIT ?)",
+                    (excess,),
+                ).rowcount
+                self.discarded += excess
+        if excess > 0:
+            logger.warning(
+                "Detection spool full, discarded oldest detections",
+                extra={"discarded": excess, "max_detections": self.max_detections},
+            )
+
+    def peek(self, limit: int) -> list[SpooledDetection]:
+        """Return the oldest spooled detections without removing them.
+
+        Args:
+            limit: Maximum detections to return
+
+        Returns:
+            Detections in the order they were spooled
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT detection_id, metadata, audio, attempts FROM spool ORDER BY seq LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [
+            SpooledDetection(detection_id, json.loads(metadata), bytes(audio), attempts)
+            for detection_id, metadata, audio, attempts in rows
+        ]
+
+    def ack(self, detection_ids: list[str]) -> None:
+        """Remove delivered detections; unknown or already-acked IDs are ignored."""
+        if not detection_ids:
+            return
+        with self._lock:
+            self._count -= self._connection.executemany(
+                "DELETE FROM spool WHERE detection_id = ?", [(i,) for i in detection_ids]
+            ).rowcount
+
+    def record_attempt(self, detection_ids: list[str]) -> None:
+        """Count a failed delivery attempt for each detection."""
+        if not detection_ids:
+            return
+        with self._lock:
+            self._connection.executemany(
+                "UPDATE spool SET attempts = attempts + 1 WHERE detection_id = ?",
+                [(i,) for i in detection_ids],
+            )
+
+    def dead_letter(self, detection_id: str, reason: str) -> None:
+        """Move a detection the web API will not accept out of the replay queue.
+
+        It is kept in the dead_letter table, beyond which the oldest are discarded
+        once it holds max_detections.
+
+        Args:
+            detection_id: Detection to move
+            reason: Why the API rejected it, e.g. its HTTP status
+        """
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.execute(
+                    "INSERT OR IGNORE INTO dead_letter"
+                    " (detection_id, metadata, audio, attempts, reason)"
+                    " SELECT detection_id, metadata, audio, attempts, ? FROM spool"
+                    " WHERE detection_id = ?",
+                    (reason, detection_id),
+                )
+                moved = self._connection.execute(
+                    "DELETE FROM spool WHERE detection_id = ?", (detection_id,)
+                ).rowcount
+                self._connection.execute(
+                    "DELETE FROM dead_letter WHERE seq NOT IN"
+                    " (SELECT seq FROM dead_letter ORDER BY seq DESC LIMIT ?)",
+                    (self.max_detections,),
+                )
+                self._connection.execute("COMMIT")
+            except sqlite3.Error:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._count -= moved
+            self.dead_lettered += moved
+
+    def __len__(self) -> int:
+        """Return the number of spooled detections."""
+        with self._lock:
+            return self._count
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,118 @@
+"""Event-driven reader for the capture-to-analysis FIFO.
+
+Polling a non-blocking FIFO with a 4 KB read and a 10 ms sleep wakes the
+analysis daemon around a hundred times a second whether or not capture has
+written anything, and hands audio over one small read at a time. This reader
+registers the FIFO with the event loop instead, sleeps until it is readable, and
+then drains everything the pipe holds, up to one analysis window, in a single
+call.
+"""
+
+import array
+import asyncio
+import fcntl
+import os
+import termios
+import time
+from typing import Any
+
+
+class FifoReader:
+    """Read a FIFO on the event loop, draining it in large reads."""
+
+    def __init__(self, path: str, max_read_bytes: int) -> None:
+        """Open the FIFO for reading.
+
+        Args:
+            path: FIFO written by audio capture
+            max_read_bytes: Most bytes returned by one read, e.g. one analysis window
+
+        Raises:
+            FileNotFoundError: If the FIFO does not exist yet
+        """
+        self.path = path
+        self.max_read_bytes = max_read_bytes
+        self.fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        # Hold a write end ourselves so the FIFO never reports end-of-file while
+        # capture restarts, which would otherwise make it permanently readable.
+        self._keepalive_fd = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+        self._interval_started = time.monotonic()
+        self._wakeups = 0
+        self._reads = 0
+        self._bytes_read = 0
+        self._largest_read = 0
+
+    async def read(self, timeout: float | None = None) -> bytes:
+        """Return the audio the FIFO holds, waiting on the event loop if it is empty.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            Up to max_read_bytes; empty on timeout
+        """
+        self._wakeups += 1
+        data = self._drain()
+        if data:
+            return data
+
+        loop = asyncio.get_running_loop()
+        readable = loop.create_future()
+
+        def on_readable() -> None:
+            if not readable.done():
+                readable.set_result(None)
+
+        loop.add_reader(self.fd, on_readable)
+        try:
+            await asyncio.wait_for(readable, timeout)
+        except TimeoutError:
+            return b""
+        finally:
+            loop.remove_reader(self.fd)
+        return self._drain()
+
+    def _drain(self) -> bytes:
+        """Read whatever is buffered in the pipe, up to max_read_bytes."""
+        chunks: list[bytes] = []
+        total = 0
+        while total < self.max_read_bytes:
+            try:
+                chunk = os.read(self.fd, self.max_read_bytes - total)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            chunks.append(chunk)
+            total += len(chunk)
+        if total:
+            self._reads += 1
+            self._bytes_read += total
+            self._largest_read = max(self._largest_read, total)
+        return b"".join(chunks)
+
+    def queued_bytes(self) -> int:
+        """Return how many bytes are waiting in the pipe, without reading them."""
+        queued = array.array("i", [0])
+        fcntl.ioctl(self.fd, termios.FIONREAD, queued)
+        return queued[0]
+
+    def stats(self) -> dict[str, Any]:
+        """Return wakeup and read-size counters since the previous call."""
+        now = time.monotonic()
+        elapsed = max(now - self._interval_started, 1e-9)
+        stats: dict[str, Any] = {
+            "wakeups_per_s": round(self._wakeups / elapsed, 1),
+            "reads_per_s": round(self._reads / elapsed, 1),
+        }
+        if self._reads:
+            stats["read_bytes_avg"] = self._bytes_read // self._reads
+            stats["read_bytes_max"] = self._largest_read
+        self._interval_started = now
+        self._wakeups = self._reads = self._bytes_read = self._largest_read = 0
+        return stats
+
+    def close(self) -> None:
+        """Close both ends of the FIFO held by this reader."""
+        os.close(self.fd)
+        os.close(self._keepalive_fd)
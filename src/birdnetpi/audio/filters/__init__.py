@@ -5,15 +5,17 @@ Filters can be chained together to create complex processing pipelines.
 """
 
 from birdnetpi.audio.filters.base import AudioFilter
-from birdnetpi.audio.filters.chain import FilterChain
-from birdnetpi.audio.filters.frequency import HighPassFilter, LowPassFilter
+from birdnetpi.audio.filters.chain import FilterChain, FusedIIRStage
+from birdnetpi.audio.filters.frequency import HighPassFilter, IIRFilter, LowPassFilter
 from birdnetpi.audio.filters.passthrough import PassThroughFilter
 from birdnetpi.audio.filters.resample import ResampleFilter
 
 __all__ = [
     "AudioFilter",
     "FilterChain",
+    "FusedIIRStage",
     "HighPassFilter",
+    "IIRFilter",
     "LowPassFilter",
     "PassThroughFilter",
     "ResampleFilter",
@@ -8,12 +8,16 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+SAMPLE_DTYPES = (np.int16, np.float32)  # Sample types a pipeline can carry
+
 
 class AudioFilter(ABC):
     """Abstract base class for audio filters.
 
-    Audio filters process numpy arrays of int16 audio data in real-time.
-    They are designed to be lightweight, efficient, and chainable.
+    Audio filters process numpy arrays of int16 audio data, or of float32 audio
+    in the -1.0 to 1.0 range when the pipeline runs in float32 mode, in real-time.
+    They return data of the same type and are designed to be lightweight,
+    efficient, and chainable.
     """
 
     def __init__(self, name: str, enabled: bool = True) -> None:
@@ -50,11 +54,11 @@ class AudioFilter(ABC):
         """Process a chunk of audio data.
 
         Args:
-            audio_data: Input audio data as int16 numpy array
+            audio_data: Input audio data as int16 or float32 numpy array
                        Shape: (samples,) for mono or (samples, channels) for multi-channel
 
         Returns:
-            Processed audio data as int16 numpy array with same shape as input
+            Processed audio data with the same dtype and shape as the input
 
         Raises:
             ValueError: If audio_data format is invalid
@@ -69,7 +73,7 @@ class AudioFilter(ABC):
         enabled/disabled state and provides consistent error handling.
 
         Args:
-            audio_data: Input audio data as int16 numpy array
+            audio_data: Input audio data as int16 or float32 numpy array
 
         Returns:
             Processed audio data (or original data if filter is disabled)
@@ -80,8 +84,8 @@ class AudioFilter(ABC):
         if self._sample_rate is None or self._channels is None:
             raise RuntimeError(f"Filter '{self.name}' not configured. Call configure() first.")
 
-        if audio_data.dtype != np.int16:
-            raise ValueError(f"Expected int16 audio data, got {audio_data.dtype}")
+        if audio_data.dtype not in SAMPLE_DTYPES:
+            raise ValueError(f"Expected int16 or float32 audio data, got {audio_data.dtype}")
 
         try:
             return self.process(audio_data)
@@ -3,28 +3,81 @@
 import logging
 
 import numpy as np
+from scipy import signal
 
 from birdnetpi.audio.filters.base import AudioFilter
+from birdnetpi.audio.filters.frequency import IIRFilter, initial_state
 
 logger = logging.getLogger(__name__)
 
 
+class FusedIIRStage:
+    """Consecutive IIR filters fused into a single stateful SOS cascade.
+
+    Cascading the second-order sections of several filters is mathematically the
+    same as applying them one after another, but the audio is converted to float
+    once on entry and back to int16 once on exit instead of once per filter.
+    """
+
+    def __init__(self, filters: list[IIRFilter]) -> None:
+        """Concatenate the sections of already configured filters.
+
+        Args:
+            filters: Configured IIR filters in the order they are applied
+        """
+        self.filters = filters
+        self.name = "+".join(f.name for f in filters)
+        sections = [f.sos for f in filters if f.sos is not None]
+        self.sos = np.vstack(sections)
+        self._zi: np.ndarray | None = None
+
+    def apply(self, audio_data: np.ndarray) -> np.ndarray:
+        """Filter a block, continuing from the previous block's state.
+
+        Args:
+            audio_data: Input audio data as int16 or float32 numpy array
+
+        Returns:
+            Filtered audio data with the same dtype as the input (original data on error)
+        """
+        try:
+            # float64 costs the same as float32 here and keeps low cutoffs exact
+            audio_float = audio_data.astype(np.float64)
+            self._zi = initial_state(self.sos, audio_float, self._zi)
+            filtered, self._zi = signal.sosfilt(self.sos, audio_float, axis=0, zi=self._zi)
+            if audio_data.dtype == np.float32:
+                return filtered.astype(np.float32)
+            # int16 full scale is kept through the cascade, so no rescaling is needed
+            return np.clip(filtered, -32768, 32767).astype(np.int16)
+        except Exception as e:
+            logger.error("Error in fused filter stage '%s': %s", self.name, e)
+            return audio_data
+
+
 class FilterChain:
     """Container for multiple audio filters applied in sequence.
 
     The FilterChain applies filters in order, passing the output of each
     filter as input to the next filter in the chain.
+
+    In compiled mode, each run of consecutive enabled IIR filters is fused into a
+    single stateful cascade (see FusedIIRStage). The plan is rebuilt whenever a
+    filter is added, removed, enabled or disabled, or the chain is reconfigured.
     """
 
-    def __init__(self, name: str = "FilterChain") -> None:
+    def __init__(self, name: str = "FilterChain", compiled: bool = False) -> None:
         """Initialize an empty filter chain.
 
         Args:
             name: Name for this filter chain
+            compiled: Fuse consecutive IIR filters into one cascade when processing
         """
         self.name = name
+        self.compiled = compiled
         self.filters: list[AudioFilter] = []
         self._configured = False
+        self._plan: list[AudioFilter | FusedIIRStage] = []
+        self._plan_key: tuple[tuple[int, bool], ...] | None = None
         logger.debug("FilterChain '%s' initialized", name)
 
     def add_filter(self, filter_instance: AudioFilter) -> None:
@@ -34,6 +87,7 @@ class FilterChain:
             filter_instance: AudioFilter instance to add
         """
         self.filters.append(filter_instance)
+        self._plan_key = None
         # If chain is already configured, configure the new filter
         if self._configured and hasattr(self, "_sample_rate"):
             filter_instance.configure(self._sample_rate, self._channels)
@@ -51,6 +105,7 @@ class FilterChain:
         for i, filter_instance in enumerate(self.filters):
             if filter_instance.name == filter_name:
                 self.filters.pop(i)
+                self._plan_key = None
                 logger.debug("Removed filter '%s' from chain '%s'", filter_name, self.name)
                 return True
         logger.warning("Filter '%s' not found in chain '%s'", filter_name, self.name)
@@ -66,6 +121,7 @@ class FilterChain:
         self._sample_rate = sample_rate
         self._channels = channels
         self._configured = True
+        self._plan_key = None
 
         for filter_instance in self.filters:
             filter_instance.configure(sample_rate, channels)
@@ -78,20 +134,53 @@ class FilterChain:
         """Process audio data through all filters in the chain.
 
         Args:
-            audio_data: Input audio data as int16 numpy array
+            audio_data: Input audio data as int16 or float32 numpy array
 
         Returns:
             Audio data after processing through all enabled filters
         """
         result = audio_data
-        for filter_instance in self.filters:
-            result = filter_instance.apply(result)
+        stages = self._compiled_plan() if self.compiled else self.filters
+        for stage in stages:
+            result = stage.apply(result)
         return result
 
+    def _compiled_plan(self) -> list[AudioFilter | FusedIIRStage]:
+        """Return the processing stages, rebuilding them if the chain has changed."""
+        plan_key = tuple((id(f), f.enabled) for f in self.filters)
+        if plan_key == self._plan_key:
+            return self._plan
+
+        plan: list[AudioFilter | FusedIIRStage] = []
+        run: list[IIRFilter] = []
+        for filter_instance in self.filters:
+            if not filter_instance.enabled:
+                continue
+            if isinstance(filter_instance, IIRFilter) and filter_instance.sos is not None:
+                run.append(filter_instance)
+                continue
+            if run:
+                plan.append(FusedIIRStage(run))
+                run = []
+            plan.append(filter_instance)
+        if run:
+            plan.append(FusedIIRStage(run))
+
+        self._plan = plan
+        self._plan_key = plan_key
+        logger.debug(
+            "FilterChain '%s' compiled into %d stages: %s",
+            self.name,
+            len(plan),
+            ", ".join(stage.name for stage in plan),
+        )
+        return plan
+
     def clear(self) -> None:
         """Remove all filters from the chain."""
         filter_count = len(self.filters)
         self.filters.clear()
+        self._plan_key = None
         logger.debug("Cleared %d filters from chain '%s'", filter_count, self.name)
 
     def get_filter_names(self) -> list[str]:
@@ -11,7 +11,82 @@ from birdnetpi.audio.filters.base import AudioFilter
 logger = logging.getLogger(__name__)
 
 
-class HighPassFilter(AudioFilter):
+class IIRFilter(AudioFilter):
+    """Base class for IIR filters built from second-order sections.
+
+    Filter state is carried from one block to the next, so a stream processed in
+    blocks produces the same output as the whole stream filtered at once, without
+    transients at block edges.
+    """
+
+    def __init__(self, name: str, enabled: bool = True) -> None:
+        """Initialize the IIR filter.
+
+        Args:
+            name: Human-readable name for the filter
+            enabled: Whether the filter is currently active
+        """
+        super().__init__(name, enabled)
+        self._sos: np.ndarray | None = None  # Second-order sections for filtering
+        self._zi: np.ndarray | None = None  # Section state carried between blocks
+
+    @property
+    def sos(self) -> np.ndarray | None:
+        """Second-order sections of the configured filter, or None before configure()."""
+        return self._sos
+
+    def reset(self) -> None:
+        """Clear the filter state, e.g. after a gap in the stream."""
+        self._zi = None
+
+    def process(self, audio_data: np.ndarray) -> np.ndarray:
+        """Apply the filter to audio data, continuing from the previous block.
+
+        Args:
+            audio_data: Input audio data as int16 or float32 numpy array
+
+        Returns:
+            Filtered audio data with the same dtype as the input
+        """
+        if self._sos is None:
+            raise RuntimeError(f"{self.__class__.__name__} '{self.name}' not configured")
+
+        if audio_data.dtype == np.float32:
+            self._zi = initial_state(self._sos, audio_data, self._zi)
+            filtered, self._zi = signal.sosfilt(self._sos, audio_data, axis=0, zi=self._zi)
+            return filtered.astype(np.float32)
+
+        # Convert int16 to float for processing (preserves precision)
+        audio_float = audio_data.astype(np.float32) / 32768.0
+
+        # Apply filter using second-order sections
+        self._zi = initial_state(self._sos, audio_float, self._zi)
+        filtered_float, self._zi = signal.sosfilt(self._sos, audio_float, axis=0, zi=self._zi)
+
+        # Convert back to int16, with clipping to prevent overflow
+        filtered_int16 = np.clip(filtered_float * 32768.0, -32768, 32767).astype(np.int16)
+
+        return filtered_int16
+
+
+def initial_state(sos: np.ndarray, audio_float: np.ndarray, zi: np.ndarray | None) -> np.ndarray:
+    """Return section state for filtering a block, starting from silence if needed.
+
+    Args:
+        sos: Second-order sections being applied
+        audio_float: Block about to be filtered along axis 0
+        zi: State left by the previous block, if any
+
+    Returns:
+        State array shaped for sosfilt with axis=0
+    """
+    shape = (len(sos), 2, *audio_float.shape[1:])
+    if zi is None or zi.shape != shape:
+        return np.zeros(shape, dtype=audio_float.dtype)
+    return zi
+
+
+class HighPassFilter(IIRFilter):
     """High-pass filter for removing low-frequency noise.
 
     Useful for reducing traffic noise, HVAC hum, and other low-frequency
@@ -36,7 +111,6 @@ class HighPassFilter(AudioFilter):
         super().__init__(name, enabled)
         self.cutoff_frequency = cutoff_frequency
         self.order = order
-        self._sos = None  # Second-order sections for filtering
 
     def configure(self, sample_rate: int, channels: int) -> None:
         """Configure the filter for specific audio parameters."""
@@ -57,6 +131,7 @@ class HighPassFilter(AudioFilter):
 
         # Create second-order sections for stable filtering
         self._sos = signal.butter(self.order, normalized_cutoff, btype="high", output="sos")
+        self.reset()
         logger.debug(
             "HighPassFilter '%s' configured: %dHz cutoff, order %d",
             self.name,
@@ -64,29 +139,6 @@ class HighPassFilter(AudioFilter):
             self.order,
         )
 
-    def process(self, audio_data: np.ndarray) -> np.ndarray:
-        """Apply high-pass filtering to audio data.
-
-        Args:
-            audio_data: Input audio data as int16 numpy array
-
-        Returns:
-            Filtered audio data as int16 numpy array
-        """
-        if self._sos is None:
-            raise RuntimeError(f"HighPassFilter '{self.name}' not configured")
-
-        # Convert int16 to float for processing (preserves precision)
-        audio_float = audio_data.astype(np.float32) / 32768.0
-
-        # Apply filter using second-order sections
-        filtered_float = signal.sosfilt(self._sos, audio_float, axis=0)
-
-        # Convert back to int16, with clipping to prevent overflow
-        filtered_int16 = np.clip(filtered_float * 32768.0, -32768, 32767).astype(np.int16)
-
-        return filtered_int16
-
     def get_parameters(self) -> dict[str, Any]:
         """Get current filter parameters."""
         params = super().get_parameters()
@@ -99,7 +151,7 @@ class HighPassFilter(AudioFilter):
         return params
 
 
-class LowPassFilter(AudioFilter):
+class LowPassFilter(IIRFilter):
     """Low-pass filter for removing high-frequency noise.
 
     Useful for reducing harsh sounds like children's voices, sirens,
@@ -125,7 +177,6 @@ class LowPassFilter(AudioFilter):
         super().__init__(name, enabled)
         self.cutoff_frequency = cutoff_frequency
         self.order = order
-        self._sos = None  # Second-order sections for filtering
 
     def configure(self, sample_rate: int, channels: int) -> None:
         """Configure the filter for specific audio parameters."""
@@ -146,6 +197,7 @@ class LowPassFilter(AudioFilter):
 
         # Create second-order sections for stable filtering
         self._sos = signal.butter(self.order, normalized_cutoff, btype="low", output="sos")
+        self.reset()
         logger.debug(
             "LowPassFilter '%s' configured: %dHz cutoff, order %d",
             self.name,
@@ -153,29 +205,6 @@ class LowPassFilter(AudioFilter):
             self.order,
         )
 
-    def process(self, audio_data: np.ndarray) -> np.ndarray:
-        """Apply low-pass filtering to audio data.
-
-        Args:
-            audio_data: Input audio data as int16 numpy array
-
-        Returns:
-            Filtered audio data as int16 numpy array
-        """
-        if self._sos is None:
-            raise RuntimeError(f"LowPassFilter '{self.name}' not configured")
-
-        # Convert int16 to float for processing (preserves precision)
-        audio_float = audio_data.astype(np.float32) / 32768.0
-
-        # Apply filter using second-order sections
-        filtered_float = signal.sosfilt(self._sos, audio_float, axis=0)
-
-        # Convert back to int16, with clipping to prevent overflow
-        filtered_int16 = np.clip(filtered_float * 32768.0, -32768, 32767).astype(np.int16)
-
-        return filtered_int16
-
     def get_parameters(self) -> dict[str, Any]:
         """Get current filter parameters."""
         params = super().get_parameters()
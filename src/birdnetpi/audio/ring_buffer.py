@@ -0,0 +1,199 @@
+"""Fixed-capacity circular buffers for audio samples and frames."""
+
+import logging
+from collections.abc import Iterator
+from typing import NamedTuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class WindowStamp(NamedTuple):
+    """Where an analysis window sits in the capture stream, carried with its results."""
+
+    sample_index: int  # Absolute index of the window's first sample, per channel
+    captured_ns: int  # time.monotonic_ns() at which the window's last sample was captured
+
+
+class SampleRingBuffer:
+    """Circular buffer of audio samples that hands out overlapping analysis windows.
+
+    Samples are written in place into a preallocated array, so feeding the buffer
+    never allocates. The backing store holds every sample twice (at ``i`` and
+    ``i + capacity``), which keeps any window of up to ``capacity`` samples
+    contiguous in memory and lets ``windows()`` yield zero-copy views.
+
+    Sample positions are tracked as absolute indices since the buffer was created,
+    so consumers can map each window back to its place in the capture stream.
+    """
+
+    def __init__(
+        self,
+        window_size: int,
+        hop_size: int,
+        capacity: int | None = None,
+        dtype: type[np.generic] = np.int16,
+    ) -> None:
+        """Initialize the ring buffer.
+
+        Args:
+            window_size: Number of samples in each analysis window
+            hop_size: Number of samples between the starts of consecutive windows
+            capacity: Maximum number of unread samples to retain (default: 2 windows)
+            dtype: Sample data type
+
+        Raises:
+            ValueError: If the sizes are not consistent
+        """
+        if window_size <= 0:
+            raise ValueError(f"window_size must be positive, got {window_size}")
+        if not 0 < hop_size <= window_size:
+            raise ValueError(f"hop_size must be in (0, {window_size}], got {hop_size}")
+        capacity = capacity if capacity is not None else 2 * window_size
+        if capacity < window_size:
+            raise ValueError(f"capacity {capacity} is smaller than window_size {window_size}")
+
+        self.window_size = window_size
+        self.hop_size = hop_size
+        self.capacity = capacity
+        self._data = np.zeros(2 * capacity, dtype=dtype)
+        self._write_index = 0  # Absolute index of the next sample to be written
+        self._read_index = 0  # Absolute index of the next window start
+        self.window_start = 0  # Absolute index of the most recently yielded window
+        self.overrun_samples = 0  # Unread samples overwritten because the reader fell behind
+
+    def __len__(self) -> int:
+        """Return the number of buffered samples not yet consumed by a window."""
+        return self._write_index - self._read_index
+
+    @property
+    def total_written(self) -> int:
+        """Return the total number of samples written since creation."""
+        return self._write_index
+
+    def write(self, samples: np.ndarray) -> None:
+        """Copy samples into the buffer, overwriting the oldest unread data if full.
+
+        Args:
+            samples: One-dimensional array of samples
+        """
+        count = len(samples)
+        if count == 0:
+            return
+        if count > self.capacity:
+            # Only the most recent samples can be retained
+            self._write_index += count - self.capacity
+            samples = samples[-self.capacity :]
+            count = self.capacity
+
+        start = self._write_index % self.capacity
+        first = min(count, self.capacity - start)
+        second = count - first
+        self._data[start : start + first] = samples[:first]
+        self._data[start + self.capacity : start + self.capacity + first] = samples[:first]
+        if second:
+            self._data[:second] = samples[first:]
+            self._data[self.capacity : self.capacity + second] = samples[first:]
+        self._write_index += count
+
+        unread = self._write_index - self._read_index
+        if unread > self.capacity:
+            dropped = unread - self.capacity
+            self.overrun_samples += dropped
+            self._read_index += dropped
+            logger.warning("Sample ring buffer overrun, dropped %d samples", dropped)
+
+    def windows(self) -> Iterator[np.ndarray]:
+        """Yield every complete window currently available, advancing by the hop size.
+
+        Each window is a read-only view into the buffer. It is only valid until the
+        next call to ``write()``, so copy it if it must outlive that.
+
+        Yields:
+            Views of ``window_size`` samples
+        """
+        while self._write_index - self._read_index >= self.window_size:
+            self.window_start = self._read_index
+            start = self._read_index % self.capacity
+            view = self._data[start : start + self.window_size]
+            view.flags.writeable = False
+            self._read_index += self.hop_size
+            yield view
+
+    def clear(self) -> None:
+        """Discard all buffered samples without releasing the backing store."""
+        self._read_index = self._write_index
+
+
+class FrameRing:
+    """Single-producer/single-consumer ring of audio frames for handing blocks between threads.
+
+    Built for the PortAudio callback, which must never block: the producer only
+    ever advances the write index and the consumer only the read index. Each index
+    is an absolute frame count published by a single assignment, which the GIL
+    makes atomic, so neither side takes a lock. Frame data is copied in before the
+    write index moves and copied out before the read index moves.
+
+    When the consumer falls so far behind that a block does not fit, the producer
+    drops the block rather than overwrite unread frames, and counts it.
+    """
+
+    def __init__(self, capacity: int, channels: int = 1, dtype: type[np.generic] = np.float32):
+        """Initialize the ring.
+
+        Args:
+            capacity: Maximum number of unread frames
+            channels: Samples per frame
+            dtype: Sample data type
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._data = np.zeros((capacity, channels), dtype=dtype)
+        self._write_index = 0  # Written by the producer only
+        self._read_index = 0  # Written by the consumer only
+        self.dropped_frames = 0  # Frames the producer discarded because the ring was full
+
+    def __len__(self) -> int:
+        """Return the number of frames written but not yet read."""
+        return self._write_index - self._read_index
+
+    def write(self, frames: np.ndarray) -> bool:
+        """Copy a block of frames into the ring (producer side).
+
+        Args:
+            frames: Array of shape (frames, channels), or 1-D for mono
+
+        Returns:
+            False if the block was dropped because the ring was full
+        """
+        count = len(frames)
+        if count > self.capacity - (self._write_index - self._read_index):
+            self.dropped_frames += count
+            return False
+
+        frames = frames.reshape(count, -1)
+        start = self._write_index % self.capacity
+        first = min(count, self.capacity - start)
+        self._data[start : start + first] = frames[:first]
+        self._data[: count - first] = frames[first:]
+        self._write_index += count
+        return True
+
+    def read(self) -> np.ndarray:
+        """Copy out every unread frame (consumer side).
+
+        Returns:
+            Array of shape (frames, channels); empty when nothing is pending
+        """
+        end = self._write_index
+        count = end - self._read_index
+        start = self._read_index % self.capacity
+        first = min(count, self.capacity - start)
+        frames = np.concatenate((self._data[start : start + first], self._data[: count - first]))
+        self._read_index = end
+        return frames
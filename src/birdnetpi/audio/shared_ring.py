@@ -0,0 +1,683 @@
+"""Shared-memory audio ring for handing capture audio to other processes.
+
+The capture daemon is the single producer. It writes int16 or float32 PCM into a
+``multiprocessing.shared_memory`` segment. Each consumer process (analysis,
+livestream, recorder, ...) attaches with its own read cursor. The producer never
+waits for consumers. A consumer that falls more than one ring behind loses the
+oldest samples, and the loss is counted in its slot instead of silently dropping
+the frame for every reader.
+
+Sequence numbers count samples written since the ring was created. Positions are
+derived from them modulo the capacity. The producer publishes ``reserve_seq``
+before copying a block and ``write_seq`` after, so a reader can detect when the
+region it was copying got overwritten mid-read (a seqlock).
+
+Consumers wait on a per-slot named FIFO "doorbell" instead of sleeping. A
+consumer raises its slot's waiting flag before blocking, and the producer writes
+a single byte only to consumers that are waiting. A consumer that keeps up
+therefore costs the producer no syscalls, and the audio itself never passes
+through the kernel.
+"""
+
+import asyncio
+import logging
+import os
+import select
+import time
+from collections.abc import Callable
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_RING_NAME = "birdnetpi_audio_analysis"
+LIVESTREAM_RING_NAME = "birdnetpi_audio_livestream"
+HISTORY_RING_NAME = "birdnetpi_audio_history"
+
+_MAGIC = 0x42495244524E4733  # "BIRDRNG3"
+
+# Sample formats a ring can carry, as recorded in the header
+_SAMPLE_FORMATS: dict[int, type[np.generic]] = {0: np.int16, 1: np.float32}
+
+# Segments created by a producer in this process, whose resource tracker owns them
+_created_segments: set[str] = set()
+
+# Header fields (int64 each)
+_H_MAGIC = 0
+_H_CAPACITY = 1
+_H_WRITE_SEQ = 2
+_H_RESERVE_SEQ = 3
+_H_SAMPLE_RATE = 4
+_H_CHANNELS = 5
+_H_CLOSED = 6
+_H_MAX_CONSUMERS = 7
+_H_SAMPLE_FORMAT = 8
+_H_WRITE_NS = 9  # time.monotonic_ns() of the latest write, for transport latency
+_H_FIELDS = 10
+
+# Consumer slot fields (int64 each), following the header
+_S_PID = 0
+_S_READ_SEQ = 1
+_S_OVERRUN = 2
+_S_GENERATION = 3
+_S_WAITING = 4
+_S_FIELDS = 5
+
+
+def _header_length(max_consumers: int) -> int:
+    return _H_FIELDS + _S_FIELDS * max_consumers
+
+
+def _doorbell_path(doorbell_dir: str | Path, name: str, slot: int) -> str:
+    return os.path.join(doorbell_dir, f"{name}.{slot}.doorbell")
+
+
+def _copy_range(
+    header: np.ndarray, data: np.ndarray, capacity: int, start: int, end: int
+) -> np.ndarray | None:
+    """Copy the samples with sequence numbers in [start, end) out of a ring.
+
+    Returns:
+        The samples, or None if any of them are not written yet or were
+        overwritten before or during the copy
+    """
+    if start > end or end > int(header[_H_WRITE_SEQ]) or start < end - capacity:
+        return None
+    count = end - start
+    out = np.empty(count, dtype=data.dtype)
+    offset = start % capacity
+    first = min(count, capacity - offset)
+    out[:first] = data[offset : offset + first]
+    if first < count:
+        out[first:] = data[: count - first]
+    if int(header[_H_RESERVE_SEQ]) - capacity > start:
+        return None
+    return out
+
+
+def _attach_segment(name: str) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+    """Attach to a producer's ring segment and return it with a view of its header.
+
+    Raises:
+        FileNotFoundError: If the producer has not created the ring yet
+        RuntimeError: If the segment is not an audio ring
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    # Attaching registers the segment with this process's resource tracker, which
+    # would unlink it when the consumer exits; only the producer owns its lifetime.
+    if name not in _created_segments:
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    probe = np.ndarray((_H_FIELDS,), dtype=np.int64, buffer=shm.buf)
+    if probe[_H_MAGIC] != _MAGIC:
+        del probe
+        shm.close()
+        raise RuntimeError(f"Shared memory segment {name} is not an audio ring")
+    return shm, probe
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SharedAudioRing:
+    """Producer side of a shared-memory single-producer/multi-consumer audio ring."""
+
+    def __init__(
+        self,
+        name: str,
+        capacity: int,
+        doorbell_dir: str | Path,
+        sample_rate: int = 0,
+        channels: int = 1,
+        max_consumers: int = 4,
+        dtype: type[np.generic] = np.int16,
+    ) -> None:
+        """Create the shared-memory segment, replacing a stale one with the same name.
+
+        Args:
+            name: Shared-memory segment name, shared with consumers
+            capacity: Ring capacity in samples (interleaved across channels)
+            doorbell_dir: Directory holding the consumers' doorbell FIFOs
+            sample_rate: Sample rate recorded in the header for consumers
+            channels: Channel count recorded in the header for consumers
+            max_consumers: Number of consumer slots
+            dtype: Sample type, np.int16 or np.float32
+
+        Raises:
+            ValueError: If capacity or max_consumers is not positive, or the
+                sample type is not supported
+        """
+        if capacity <= 0 or max_consumers <= 0:
+            raise ValueError("capacity and max_consumers must be positive")
+        sample_format = next(
+            (code for code, supported in _SAMPLE_FORMATS.items() if supported is dtype), None
+        )
+        if sample_format is None:
+            raise ValueError(f"Unsupported shared ring sample type: {dtype}")
+
+        self.name = name
+        self.capacity = capacity
+        self.doorbell_dir = doorbell_dir
+        self.max_consumers = max_consumers
+        self._doorbells: dict[int, tuple[int, int]] = {}  # slot -> (fd, generation)
+
+        self._retire_stale_segment(name)
+        header_length = _header_length(max_consumers)
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True, size=header_length * 8 + capacity * np.dtype(dtype).itemsize
+        )
+        self._header = np.ndarray((header_length,), dtype=np.int64, buffer=self._shm.buf)
+        self._data = np.ndarray(
+            (capacity,), dtype=dtype, buffer=self._shm.buf, offset=header_length * 8
+        )
+        self._header[:] = 0
+        self._header[_H_CAPACITY] = capacity
+        self._header[_H_SAMPLE_RATE] = sample_rate
+        self._header[_H_CHANNELS] = channels
+        self._header[_H_MAX_CONSUMERS] = max_consumers
+        self._header[_H_SAMPLE_FORMAT] = sample_format
+        self._header[_H_MAGIC] = _MAGIC
+        _created_segments.add(name)
+        logger.info("Created shared audio ring %s (%d samples)", name, capacity)
+
+    @staticmethod
+    def _retire_stale_segment(name: str) -> None:
+        """Mark a segment left behind by a previous producer closed and unlink it."""
+        try:
+            stale = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            return
+        header = np.ndarray((_H_FIELDS,), dtype=np.int64, buffer=stale.buf)
+        header[_H_CLOSED] = 1
+        del header
+        stale.close()
+        stale.unlink()
+        logger.info("Replaced stale shared audio ring %s", name)
+
+    @property
+    def write_seq(self) -> int:
+        """Total samples written since the ring was created."""
+        return int(self._header[_H_WRITE_SEQ])
+
+    def write(self, samples: np.ndarray) -> None:
+        """Publish a block of samples and ring every attached consumer's doorbell.
+
+        Args:
+            samples: Samples of the ring's type; multi-channel blocks are written interleaved
+        """
+        samples = samples.reshape(-1)
+        count = len(samples)
+        if count == 0:
+            return
+        write_seq = int(self._header[_H_WRITE_SEQ])
+        if count > self.capacity:
+            # Only the newest capacity samples fit; the rest count as consumer overruns
+            write_seq += count - self.capacity
+            samples = samples[-self.capacity :]
+            count = self.capacity
+
+        self._header[_H_RESERVE_SEQ] = write_seq + count
+        start = write_seq % self.capacity
+        first = min(count, self.capacity - start)
+        self._data[start : start + first] = samples[:first]
+        if first < count:
+            self._data[: count - first] = samples[first:]
+        self._header[_H_WRITE_SEQ] = write_seq + count
+        self._header[_H_WRITE_NS] = time.monotonic_ns()
+
+        self._ring_doorbells()
+
+    def read_range(self, start: int, end: int) -> np.ndarray | None:
+        """Copy already written samples out of the ring by sequence number.
+
+        Args:
+            start: Sequence number of the first sample
+            end: Sequence number just after the last sample
+
+        Returns:
+            The samples, or None if they are not written yet or were overwritten
+        """
+        return _copy_range(self._header, self._data, self.capacity, start, end)
+
+    def _ring_doorbells(self) -> None:
+        for slot in range(self.max_consumers):
+            base = _H_FIELDS + slot * _S_FIELDS
+            generation = int(self._header[base + _S_GENERATION])
+            cached = self._doorbells.get(slot)
+            if cached is not None and cached[1] != generation:
+                self._close_doorbell(slot)
+                cached = None
+            if self._header[base + _S_PID] == 0 or self._header[base + _S_WAITING] == 0:
+                continue
+
+            if cached is None:
+                try:
+                    fd = os.open(
+                        _doorbell_path(self.doorbell_dir, self.name, slot),
+                        os.O_WRONLY | os.O_NONBLOCK,
+                    )
+                except OSError:
+                    # No reader on the doorbell yet (ENXIO) or it was removed
+                    continue
+                cached = (fd, generation)
+                self._doorbells[slot] = cached
+
+            self._header[base + _S_WAITING] = 0
+            try:
+                os.write(cached[0], b"\x00")
+            except BlockingIOError:
+                pass  # Doorbell already rung and not yet drained
+            except OSError:
+                self._close_doorbell(slot)
+
+    def _close_doorbell(self, slot: int) -> None:
+        cached = self._doorbells.pop(slot, None)
+        if cached is not None:
+            try:
+                os.close(cached[0])
+            except OSError:
+                pass
+
+    def consumer_stats(self) -> list[dict[str, int]]:
+        """Report the position, lag and overruns of every attached consumer."""
+        stats = []
+        write_seq = self.write_seq
+        for slot in range(self.max_consumers):
+            base = _H_FIELDS + slot * _S_FIELDS
+            pid = int(self._header[base + _S_PID])
+            if pid == 0:
+                continue
+            read_seq = int(self._header[base + _S_READ_SEQ])
+            stats.append(
+                {
+                    "slot": slot,
+                    "pid": pid,
+                    "lag_samples": write_seq - read_seq,
+                    "overrun_samples": int(self._header[base + _S_OVERRUN]),
+                }
+            )
+        return stats
+
+    def close(self) -> None:
+        """Mark the ring closed for consumers, then release and unlink the segment."""
+        if self._shm is None:
+            return
+        for slot in list(self._doorbells):
+            self._close_doorbell(slot)
+        self._header[_H_CLOSED] = 1
+        del self._header
+        del self._data
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
+        _created_segments.discard(self.name)
+        logger.info("Closed shared audio ring %s", self.name)
+
+
+class SharedAudioRingReader:
+    """Consumer side of a shared audio ring with its own cursor and doorbell."""
+
+    def __init__(self, name: str, doorbell_dir: str | Path) -> None:
+        """Attach to an existing ring and claim a consumer slot.
+
+        Reading starts at the producer's current position (live audio).
+
+        Args:
+            name: Shared-memory segment name used by the producer
+            doorbell_dir: Directory in which to create this consumer's doorbell FIFO
+
+        Raises:
+            FileNotFoundError: If the producer has not created the ring yet
+            RuntimeError: If the segment is not an audio ring or has no free slot
+        """
+        self.name = name
+        self._shm, probe = _attach_segment(name)
+        self.max_consumers = int(probe[_H_MAX_CONSUMERS])
+        self.capacity = int(probe[_H_CAPACITY])
+        self.sample_rate = int(probe[_H_SAMPLE_RATE])
+        self.channels = int(probe[_H_CHANNELS])
+        self.dtype = _SAMPLE_FORMATS[int(probe[_H_SAMPLE_FORMAT])]
+        del probe
+
+        header_length = _header_length(self.max_consumers)
+        self._header = np.ndarray((header_length,), dtype=np.int64, buffer=self._shm.buf)
+        self._data = np.ndarray(
+            (self.capacity,), dtype=self.dtype, buffer=self._shm.buf, offset=header_length * 8
+        )
+
+        self.slot = self._claim_slot()
+        self._slot_base = _H_FIELDS + self.slot * _S_FIELDS
+        self._cursor = int(self._header[_H_WRITE_SEQ])
+        self._header[self._slot_base + _S_READ_SEQ] = self._cursor
+        self.overrun_samples = 0
+        self._interval_started = time.monotonic()
+        self._wakeups = 0
+        self._reads = 0
+        self._samples_read = 0
+        self._largest_read = 0
+
+        self._doorbell_path = _doorbell_path(doorbell_dir, name, self.slot)
+        os.makedirs(doorbell_dir, exist_ok=True)
+        if os.path.exists(self._doorbell_path):
+            os.unlink(self._doorbell_path)
+        os.mkfifo(self._doorbell_path)
+        self._doorbell_fd = os.open(self._doorbell_path, os.O_RDONLY | os.O_NONBLOCK)
+        # Hold a write end ourselves so the doorbell never reports hang-up between
+        # producer restarts, which would otherwise make it permanently readable.
+        self._doorbell_keepalive_fd = os.open(self._doorbell_path, os.O_WRONLY | os.O_NONBLOCK)
+        self._header[self._slot_base + _S_GENERATION] += 1
+        logger.info("Attached to shared audio ring %s as consumer slot %d", name, self.slot)
+
+    def _claim_slot(self) -> int:
+        """Claim a free slot, reclaiming slots whose owning process has exited."""
+        pid = os.getpid()
+        for slot in range(self.max_consumers):
+            base = _H_FIELDS + slot * _S_FIELDS
+            owner = int(self._header[base + _S_PID])
+            if owner != 0 and (owner == pid or _pid_alive(owner)):
+                continue
+            self._header[base + _S_PID] = pid
+            self._header[base + _S_OVERRUN] = 0
+            # Consumers are long-running daemons started at different times, so a
+            # simple claim-and-verify is enough to resolve the rare simultaneous claim
+            if int(self._header[base + _S_PID]) == pid:
+                return slot
+        raise RuntimeError(f"No free consumer slot in shared audio ring {self.name}")
+
+    @property
+    def producer_closed(self) -> bool:
+        """Whether the producer has shut down or replaced this ring."""
+        return bool(self._header[_H_CLOSED])
+
+    @property
+    def last_write_ns(self) -> int:
+        """``time.monotonic_ns()`` at the producer's latest write, or 0 before the first."""
+        return int(self._header[_H_WRITE_NS])
+
+    def available(self) -> int:
+        """Return the number of samples written since this consumer's last read."""
+        return int(self._header[_H_WRITE_SEQ]) - self._cursor
+
+    def fileno(self) -> int:
+        """Return the doorbell file descriptor, readable when new audio is published."""
+        return self._doorbell_fd
+
+    def read(self, max_samples: int | None = None) -> np.ndarray:
+        """Copy unread samples out of the ring and advance this consumer's cursor.
+
+        Samples the producer overwrote before they could be read are skipped and
+        added to ``overrun_samples``.
+
+        Args:
+            max_samples: Upper bound on the number of samples returned
+
+        Returns:
+            Samples of the ring's type in capture order; empty if nothing new was published
+        """
+        write_seq = int(self._header[_H_WRITE_SEQ])
+        start = self._cursor
+        lost = 0
+        if write_seq - start > self.capacity:
+            lost = write_seq - self.capacity - start
+            start = write_seq - self.capacity
+        end = write_seq if max_samples is None else min(write_seq, start + max_samples)
+
+        count = end - start
+        out = np.empty(count, dtype=self.dtype)
+        offset = start % self.capacity
+        first = min(count, self.capacity - offset)
+        out[:first] = self._data[offset : offset + first]
+        if first < count:
+            out[first:] = self._data[: count - first]
+
+        # Drop whatever the producer reserved over while we were copying
+        overwritten = int(self._header[_H_RESERVE_SEQ]) - self.capacity - start
+        if overwritten > 0:
+            overwritten = min(overwritten, count)
+            lost += overwritten
+            out = out[overwritten:]
+
+        if lost:
+            self.overrun_samples += lost
+            self._header[self._slot_base + _S_OVERRUN] = self.overrun_samples
+            logger.warning(
+                "Shared audio ring %s overrun: consumer %d lost %d samples",
+                self.name,
+                self.slot,
+                lost,
+            )
+
+        self._cursor = end
+        self._header[self._slot_base + _S_READ_SEQ] = end
+        self._wakeups += 1
+        if out.size:
+            self._reads += 1
+            self._samples_read += out.size
+            self._largest_read = max(self._largest_read, out.size)
+        return out
+
+    def stats(self) -> dict[str, Any]:
+        """Return read counters since the previous call, with the current lag and overruns."""
+        now = time.monotonic()
+        elapsed = max(now - self._interval_started, 1e-9)
+        stats: dict[str, Any] = {
+            "wakeups_per_s": round(self._wakeups / elapsed, 1),
+            "reads_per_s": round(self._reads / elapsed, 1),
+            "lag_samples": self.available(),
+            "overrun_samples": self.overrun_samples,
+        }
+        if self._reads:
+            stats["read_samples_avg"] = self._samples_read // self._reads
+            stats["read_samples_max"] = self._largest_read
+        self._interval_started = now
+        self._wakeups = self._reads = self._samples_read = self._largest_read = 0
+        return stats
+
+    def _drain_doorbell(self) -> None:
+        try:
+            while os.read(self._doorbell_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _arm_doorbell(self) -> bool:
+        """Ask the producer for a wakeup; return True if samples are already available.
+
+        The waiting flag is raised before checking for data, so a block published
+        between the check and the wait still rings the doorbell.
+        """
+        self._drain_doorbell()
+        self._header[self._slot_base + _S_WAITING] = 1
+        if self.available() > 0:
+            self._disarm_doorbell()
+            return True
+        return False
+
+    def _disarm_doorbell(self) -> None:
+        self._header[self._slot_base + _S_WAITING] = 0
+        self._drain_doorbell()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until new samples are available.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if samples are available, False on timeout
+        """
+        if self._arm_doorbell():
+            return True
+        select.select([self._doorbell_fd], [], [], timeout)
+        self._disarm_doorbell()
+        return self.available() > 0
+
+    async def wait_async(self, timeout: float | None = None) -> bool:
+        """Wait on the event loop until new samples are available.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if samples are available, False on timeout
+        """
+        if self._arm_doorbell():
+            return True
+
+        loop = asyncio.get_running_loop()
+        rung = loop.create_future()
+
+        def on_readable() -> None:
+            if not rung.done():
+                rung.set_result(None)
+
+        loop.add_reader(self._doorbell_fd, on_readable)
+        try:
+            await asyncio.wait_for(rung, timeout)
+        except TimeoutError:
+            pass
+        finally:
+            loop.remove_reader(self._doorbell_fd)
+        self._disarm_doorbell()
+        return self.available() > 0
+
+    def close(self) -> None:
+        """Release the consumer slot, remove the doorbell and detach from the ring."""
+        if self._shm is None:
+            return
+        for fd in (self._doorbell_fd, self._doorbell_keepalive_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        try:
+            os.unlink(self._doorbell_path)
+        except FileNotFoundError:
+            pass
+        if int(self._header[self._slot_base + _S_PID]) == os.getpid():
+            self._header[self._slot_base + _S_PID] = 0
+        del self._header
+        del self._data
+        self._shm.close()
+        self._shm = None
+        logger.info("Detached from shared audio ring %s", self.name)
+
+
+class SharedAudioRingView:
+    """Read-only access to the samples still held by a ring, without a consumer slot.
+
+    Suited to on-demand reads such as fetching the last minute of audio, where
+    claiming a slot and a doorbell for each request would be wasteful.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Attach to an existing ring.
+
+        Args:
+            name: Shared-memory segment name used by the producer
+
+        Raises:
+            FileNotFoundError: If the producer has not created the ring yet
+            RuntimeError: If the segment is not an audio ring
+        """
+        self.name = name
+        self._shm, probe = _attach_segment(name)
+        max_consumers = int(probe[_H_MAX_CONSUMERS])
+        self.capacity = int(probe[_H_CAPACITY])
+        self.sample_rate = int(probe[_H_SAMPLE_RATE])
+        self.channels = int(probe[_H_CHANNELS])
+        self.dtype = _SAMPLE_FORMATS[int(probe[_H_SAMPLE_FORMAT])]
+        del probe
+        header_length = _header_length(max_consumers)
+        self._header = np.ndarray((header_length,), dtype=np.int64, buffer=self._shm.buf)
+        self._data = np.ndarray(
+            (self.capacity,), dtype=self.dtype, buffer=self._shm.buf, offset=header_length * 8
+        )
+
+    @property
+    def write_seq(self) -> int:
+        """Total samples the producer has written."""
+        return int(self._header[_H_WRITE_SEQ])
+
+    def read_range(self, start: int, end: int) -> np.ndarray | None:
+        """Copy samples out of the ring by sequence number.
+
+        Args:
+            start: Sequence number of the first sample
+            end: Sequence number just after the last sample
+
+        Returns:
+            The samples, or None if they are not written yet or were overwritten
+        """
+        return _copy_range(self._header, self._data, self.capacity, start, end)
+
+    def read_latest(self, samples: int) -> np.ndarray:
+        """Copy the newest samples, at most the ring's capacity.
+
+        A block published during the copy can overwrite its oldest samples; the
+        read is then retried a little later in the ring.
+
+        Args:
+            samples: Number of samples wanted
+
+        Returns:
+            Up to ``samples`` of the newest samples, oldest first
+        """
+        # Leave headroom at the old end so a write during the copy rarely collides
+        samples = min(samples, self.capacity - self.capacity // 8)
+        for _ in range(3):
+            end = self.write_seq
+            out = self.read_range(max(end - samples, 0), end)
+            if out is not None:
+                return out
+        return np.empty(0, dtype=self.dtype)
+
+    def close(self) -> None:
+        """Detach from the ring."""
+        if self._shm is None:
+            return
+        del self._header
+        del self._data
+        self._shm.close()
+        self._shm = None
+
+
+async def attach_reader(
+    name: str,
+    doorbell_dir: str | Path,
+    should_stop: Callable[[], bool],
+    retry_interval: float = 1.0,
+) -> SharedAudioRingReader | None:
+    """Attach to a ring, retrying until the producer creates it or shutdown is requested.
+
+    Args:
+        name: Shared-memory segment name used by the producer
+        doorbell_dir: Directory in which to create the consumer's doorbell FIFO
+        should_stop: Callable returning True once the caller is shutting down
+        retry_interval: Seconds between attach attempts
+
+    Returns:
+        The attached reader, or None if shutdown was requested first
+    """
+    logged = False
+    while not should_stop():
+        try:
+            return SharedAudioRingReader(name, doorbell_dir)
+        except FileNotFoundError:
+            if not logged:
+                logger.info("Waiting for audio capture to create shared audio ring %s", name)
+                logged = True
+        await asyncio.sleep(retry_interval)
+    return None
@@ -11,6 +11,8 @@ from typing import TYPE_CHECKING
 import websockets
 from websockets.asyncio.server import serve
 
+from birdnetpi.audio.shared_ring import LIVESTREAM_RING_NAME, SharedAudioRingReader, attach_reader
+
 if TYPE_CHECKING:
     from websockets.asyncio.server import ServerConnection
 
@@ -23,8 +25,10 @@ logger = logging.getLogger(__name__)
 class AudioWebSocketService:
     """Service that reads audio from FIFO and streams to WebSocket clients."""
 
-    def __init__(self, path_resolver: PathResolver) -> None:
+    def __init__(self, path_resolver: PathResolver, transport: str = "fifo") -> None:
         self._shutdown_flag = False
+        self._transport = transport
+        self._ring_reader: SharedAudioRingReader | None = None
         self._fifo_livestream_path = None
         self._fifo_livestream_fd = None
         self._websocket_server = None
@@ -33,6 +37,7 @@ class AudioWebSocketService:
 
         # Initialize paths using injected PathResolver
         fifo_base = path_resolver.get_fifo_base_path()
+        self._fifo_base_path = fifo_base
         self._fifo_livestream_path = os.path.join(fifo_base, "birdnet_audio_livestream.fifo")
 
         logger.info("AudioWebSocketService initialized.")
@@ -48,6 +53,9 @@ class AudioWebSocketService:
             os.close(self._fifo_livestream_fd)
             logger.info("Closed FIFO: %s", self._fifo_livestream_path)
             self._fifo_livestream_fd = None
+        if self._ring_reader:
+            self._ring_reader.close()
+            self._ring_reader = None
         if self._websocket_server:
             self._websocket_server.close()
             logger.info("WebSocket server closed")
@@ -160,6 +168,31 @@ class AudioWebSocketService:
                 logger.error("Error reading from FIFO or broadcasting data: %s", e, exc_info=True)
                 await asyncio.sleep(0.1)
 
+    async def _ring_reading_loop(self) -> None:
+        """Read from the shared-memory ring, waking on the producer's doorbell."""
+        while not self._shutdown_flag:
+            reader = self._ring_reader
+            if reader is None or reader.producer_closed:
+                if reader is not None:
+                    reader.close()
+                self._ring_reader = await attach_reader(
+                    LIVESTREAM_RING_NAME, self._fifo_base_path, lambda: self._shutdown_flag
+                )
+                continue
+
+            try:
+                samples = reader.read()
+                if samples.size:
+                    # Keep the cursor current even with no listeners, so a new client
+                    # starts from live audio instead of an overrun
+                    if self._audio_clients:
+                        await self._broadcast_audio_data(samples.tobytes())
+                else:
+                    await reader.wait_async(timeout=0.5)
+            except Exception as e:
+                logger.error("Error reading from shared audio ring: %s", e, exc_info=True)
+                await asyncio.sleep(0.1)
+
     async def start(self) -> None:
         """Start the audio WebSocket service."""
         logger.info("Starting AudioWebSocketService.")
@@ -171,11 +204,13 @@ class AudioWebSocketService:
 
         try:
             # Open FIFO for reading
-            if self._fifo_livestream_path is not None:
+            if self._transport == "shared_memory":
+                logger.info("Reading livestream audio from shared memory")
+            elif self._fifo_livestream_path is not None:
                 self._fifo_livestream_fd = os.open(
                     self._fifo_livestream_path, os.O_RDONLY | os.O_NONBLOCK
                 )
-            logger.info("Opened FIFO for reading: %s", self._fifo_livestream_path)
+                logger.info("Opened FIFO for reading: %s", self._fifo_livestream_path)
 
             # Start WebSocket server
             self._websocket_server = await serve(
@@ -183,8 +218,11 @@ class AudioWebSocketService:
             )
             logger.info("WebSocket server started on 0.0.0.0:9001")
 
-            # Create FIFO reading task
-            self._fifo_task = asyncio.create_task(self._fifo_reading_loop())
+            # Create FIFO (or shared-memory ring) reading task
+            if self._transport == "shared_memory":
+                self._fifo_task = asyncio.create_task(self._ring_reading_loop())
+            else:
+                self._fifo_task = asyncio.create_task(self._fifo_reading_loop())
 
         except FileNotFoundError:
             logger.error(
@@ -0,0 +1,552 @@
+"""CLI for running BirdNET over an archive of WAV/FLAC recordings.
+
+Files are decoded a block at a time and cut into windows with the same length
+and overlap as the analysis daemon, one ring buffer per channel. Each file is
+analyzed in a worker process that loads its own interpreter once and invokes it
+on batches of windows. Detections come back to the main process and are posted
+to the web API's batch endpoint, so they are recorded, filtered and announced
+exactly like live detections, a single commit per batch.
+
+Detection IDs are derived from the file and the position in it, so posting a
+file again after an interruption is recognised as a duplicate. Finished files
+are appended to a checkpoint and skipped on the next run. A file that cannot be
+decoded or analyzed is logged, counted and left out of the checkpoint, so the
+rest of the archive is still analyzed and the file is retried next time.
+"""
+
+import asyncio
+import datetime
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC
+from pathlib import Path
+from typing import Any
+
+import click
+import numpy as np
+import soundfile as sf
+
+from birdnetpi.audio.detection_sender import DetectionSender
+from birdnetpi.audio.filters import ResampleFilter
+from birdnetpi.audio.ring_buffer import SampleRingBuffer
+from birdnetpi.config import BirdNETConfig, ConfigManager
+from birdnetpi.detections.birdnet import BirdDetectionService
+from birdnetpi.species.parser import SpeciesParser
+from birdnetpi.system.path_resolver import PathResolver
+
+logger = logging.getLogger(__name__)
+
+AUDIO_SUFFIXES = {".wav", ".flac"}
+DECODE_BLOCK_SECONDS = 30.0  # Audio decoded per read; bounds worker memory per file
+DELIVERY_BATCH = 32  # Detections per request to the batch endpoint, as in spool replay
+WINDOW_SECONDS = 3.0
+
+# Namespace for detection IDs derived from a file and a position in it
+_DETECTION_NAMESPACE = uuid.UUID("6f1c2a8e-0b7d-4d3e-9a51-2c4e8f7b9d10")
+
+# Interpreter loaded once per worker process by _init_worker
+_worker_service: BirdDetectionService | None = None
+
+
+@dataclass(frozen=True)
+class FileDetection:
+    """A confident result in one window of a file."""
+
+    species_tensor: str
+    confidence: float
+    timestamp: datetime.datetime
+    channel: int
+    offset_seconds: float  # Start of the window within the file
+    clip: bytes  # Raw int16 PCM of the window
+
+
+@dataclass
+class FileResult:
+    """Outcome of analyzing one file."""
+
+    path: str
+    audio_seconds: float
+    windows: int
+    detections: list[FileDetection] = field(default_factory=list)
+
+
+def find_audio_files(paths: Iterable[Path]) -> list[Path]:
+    """Expand files and directories into a sorted list of WAV/FLAC files.
+
+    Args:
+        paths: Files, or directories searched recursively
+
+    Returns:
+        Unique audio files in path order
+    """
+    files: set[Path] = set()
+    for path in paths:
+        candidates = path.rglob("*") if path.is_dir() else [path]
+        files.update(
+            candidate.resolve()
+            for candidate in candidates
+            if candidate.is_file() and candidate.suffix.lower() in AUDIO_SUFFIXES
+        )
+    return sorted(files)
+
+
+def recording_start(path: Path, sound_file: sf.SoundFile) -> datetime.datetime:
+    """Return when a recording started, from its metadata or its modification time.
+
+    A date in the file's tags (RIFF ICRD or FLAC DATE) is used when it holds a
+    full date and time; one without a timezone is taken as local time. Otherwise
+    the file is assumed to have been closed when recording ended.
+
+    Args:
+        path: The recording
+        sound_file: The recording, opened
+
+    Returns:
+        UTC start time of the first sample
+    """
+    tagged = (sound_file.date or "").strip()
+    if "T" in tagged or " " in tagged:
+        try:
+            return datetime.datetime.fromisoformat(tagged).astimezone(UTC)
+        except ValueError:
+            logger.debug("Ignoring unparseable recording date %r in %s", tagged, path)
+    duration = sound_file.frames / sound_file.samplerate
+    modified = datetime.datetime.fromtimestamp(path.stat().st_mtime, UTC)
+    return modified - datetime.timedelta(seconds=duration)
+
+
+def _init_worker(config: BirdNETConfig) -> None:
+    """Load this worker process's interpreter."""
+    global _worker_service
+    _worker_service = BirdDetectionService(config)
+
+
+def iter_windows(
+    sound_file: sf.SoundFile, config: BirdNETConfig
+) -> Iterator[tuple[float, list[np.ndarray]]]:
+    """Decode a recording a block at a time and cut it into analysis windows.
+
+    Windows have the daemon's length and overlap, and are resampled to the
+    model's rate first when the recording uses another.
+
+    Args:
+        sound_file: The recording, opened
+        config: Station configuration (sample rate and overlap)
+
+    Yields:
+        Offset of the window in seconds, and a copy of the window per channel
+    """
+    window_size = int(WINDOW_SECONDS * config.sample_rate)
+    hop_size = window_size - int(config.audio_overlap * config.sample_rate)
+    buffers = [
+        SampleRingBuffer(window_size, hop_size, dtype=np.float32)
+        for _ in range(sound_file.channels)
+    ]
+    resampler: ResampleFilter | None = None
+    if sound_file.samplerate != config.sample_rate:
+        resampler = ResampleFilter(config.sample_rate)
+        resampler.configure(sound_file.samplerate, sound_file.channels)
+
+    block_frames = int(DECODE_BLOCK_SECONDS * sound_file.samplerate)
+    for block in sound_file.blocks(block_frames, dtype="float32", always_2d=True):
+        if resampler is not None:
+            block = resampler.process(block)
+        for channel, buffer in enumerate(buffers):
+            buffer.write(block[:, channel])
+        for channel_windows in zip(*(buffer.windows() for buffer in buffers), strict=True):
+            offset = buffers[0].window_start / config.sample_rate
+            yield offset, [window.copy() for window in channel_windows]
+
+
+def analyze_file(
+    path: str,
+    config: BirdNETConfig,
+    latitude: float,
+    longitude: float,
+    batch_size: int,
+) -> FileResult:
+    """Analyze one recording with this worker's interpreter.
+
+    Args:
+        path: WAV or FLAC file
+        config: Station configuration (sample rate, overlap, thresholds)
+        latitude: Recording location latitude
+        longitude: Recording location longitude
+        batch_size: Windows per interpreter invoke
+
+    Returns:
+        Windows analyzed and confident detections, in file order
+    """
+    if _worker_service is None:
+        raise RuntimeError("analyze_file must run in a process set up by _init_worker")
+    service = _worker_service
+    # A no-op unless the batch size changed; the tensor is then resized once
+    service.set_batch_size(batch_size)
+
+    with sf.SoundFile(path) as sound_file:
+        start = recording_start(Path(path), sound_file)
+        result = FileResult(path, sound_file.frames / sound_file.samplerate, 0)
+        pending: list[tuple[np.ndarray, float, int]] = []  # (window, offset seconds, channel)
+
+        def analyze_pending() -> None:
+            batch_results = service.get_analysis_results_batch(
+                audio_chunks=np.stack([window for window, _, _ in pending]),
+                latitude=latitude,
+                longitude=longitude,
+                week=(start + datetime.timedelta(seconds=pending[0][1])).isocalendar()[1],
+                sensitivity=config.sensitivity_setting,
+            )
+            for (window, offset, channel), results in zip(pending, batch_results, strict=True):
+                confident = [
+                    (species_tensor, float(confidence))
+                    for species_tensor, confidence in results
+                    if confidence >= config.species_confidence_threshold
+                ]
+                if not confident:
+                    continue
+                clip = (np.clip(window, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+                timestamp = start + datetime.timedelta(seconds=offset)
+                result.detections.extend(
+                    FileDetection(species_tensor, confidence, timestamp, channel, offset, clip)
+                    for species_tensor, confidence in confident
+                )
+            result.windows += len(pending)
+            pending.clear()
+
+        for offset, channel_windows in iter_windows(sound_file, config):
+            pending.extend(
+                (window, offset, channel) for channel, window in enumerate(channel_windows)
+            )
+            if len(pending) >= batch_size:
+                analyze_pending()
+        if pending:
+            analyze_pending()
+    return result
+
+
+class AnalysisCheckpoint:
+    """Append-only record of the files a run has finished.
+
+    One JSON line is appended and synced per file, so a crash loses at most the
+    file being written. A file is only considered done while its size and
+    modification time match what was recorded.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Load the files already finished.
+
+        Args:
+            path: Checkpoint file, created on the first finished file
+        """
+        self.path = path
+        self._done: dict[str, tuple[int, int]] = {}
+        if path.exists():
+            for line in path.read_text().splitlines():
+                try:
+                    entry = json.loads(line)
+                    self._done[entry["path"]] = (entry["size"], entry["mtime_ns"])
+                except (ValueError, KeyError):
+                    continue  # A line cut short by a crash
+
+    def __len__(self) -> int:
+        """Return the number of finished files."""
+        return len(self._done)
+
+    def is_done(self, path: Path) -> bool:
+        """Whether a file was finished and has not changed since."""
+        stat = path.stat()
+        return self._done.get(str(path)) == (stat.st_size, stat.st_mtime_ns)
+
+    def mark_done(self, path: Path, result: FileResult) -> None:
+        """Record a finished file."""
+        stat = path.stat()
+        entry = {
+            "path": str(path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "audio_seconds": round(result.audio_seconds, 3),
+            "detections": len(result.detections),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a") as checkpoint:
+            checkpoint.write(json.dumps(entry) + "\n")
+            checkpoint.flush()
+            os.fsync(checkpoint.fileno())
+        self._done[str(path)] = (stat.st_size, stat.st_mtime_ns)
+
+    def clear(self) -> None:
+        """Forget every finished file."""
+        self.path.unlink(missing_ok=True)
+        self._done.clear()
+
+
+async def _detection_payloads(
+    result: FileResult, config: BirdNETConfig, latitude: float, longitude: float
+) -> list[tuple[dict[str, Any], bytes]]:
+    """Build the batch endpoint's (metadata, clip) pairs for a file's detections."""
+    payloads = []
+    for detection in result.detections:
+        try:
+            species = await SpeciesParser.parse_tensor_species(detection.species_tensor)
+        except ValueError:
+            logger.error("Invalid species tensor format %r", detection.species_tensor)
+            continue
+        detection_id = uuid.uuid5(
+            _DETECTION_NAMESPACE,
+            f"{result.path}:{detection.offset_seconds}:{detection.channel}:"
+            f"{detection.species_tensor}",
+        )
+        metadata = {
+            "id": str(detection_id),
+            "species_tensor": detection.species_tensor,
+            "scientific_name": species.scientific_name,
+            "common_name": species.common_name,
+            "confidence": detection.confidence,
+            "timestamp": detection.timestamp.isoformat(),
+            "sample_rate": config.sample_rate,
+            "channels": 1,
+            "channel": detection.channel,
+            "latitude": latitude,
+            "longitude": longitude,
+            "species_confidence_threshold": config.species_confidence_threshold,
+            "week": detection.timestamp.isocalendar()[1],
+            "sensitivity_setting": config.sensitivity_setting,
+            "overlap": config.audio_overlap,
+        }
+        payloads.append((metadata, detection.clip))
+    return payloads
+
+
+async def _deliver_detections(
+    result: FileResult,
+    config: BirdNETConfig,
+    sender: DetectionSender,
+    latitude: float,
+    longitude: float,
+) -> int:
+    """Post a file's detections to the batch endpoint in small batches.
+
+    Returns:
+        The number of detections posted
+    """
+    payloads = await _detection_payloads(result, config, latitude, longitude)
+    for offset in range(0, len(payloads), DELIVERY_BATCH):
+        await sender.post_batch(payloads[offset : offset + DELIVERY_BATCH])
+    return len(payloads)
+
+
+@dataclass
+class RunSummary:
+    """Totals for one run of the CLI."""
+
+    files: int = 0
+    skipped: int = 0
+    errors: int = 0  # Files that could not be analyzed
+    audio_seconds: float = 0.0
+    windows: int = 0
+    detections: int = 0
+    wall_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the totals with throughput figures."""
+        wall = max(self.wall_seconds, 1e-9)
+        return {
+            "files": self.files,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "audio_hours": round(self.audio_seconds / 3600, 3),
+            "windows": self.windows,
+            "detections": self.detections,
+            "wall_seconds": round(self.wall_seconds, 1),
+            "files_per_second": round(self.files / wall, 3),
+            "realtime_factor": round(self.audio_seconds / wall, 1),
+        }
+
+
+async def run_analysis(
+    files: list[Path],
+    config: BirdNETConfig,
+    executor: Executor,
+    checkpoint: AnalysisCheckpoint,
+    sender: DetectionSender,
+    latitude: float,
+    longitude: float,
+    batch_size: int,
+    max_in_flight: int,
+) -> RunSummary:
+    """Analyze files on the executor, delivering and checkpointing each as it finishes.
+
+    Files finish out of order; each is checkpointed only once its detections
+    have been accepted, so an interrupted run never skips undelivered ones. A
+    file whose analysis fails is counted in the summary's errors and not
+    checkpointed.
+
+    Args:
+        files: Recordings to analyze
+        config: Station configuration
+        executor: Pool whose workers were set up with _init_worker
+        checkpoint: Finished files, skipped here and extended as files finish
+        sender: Client for the web API's batch endpoint
+        latitude: Recording location latitude
+        longitude: Recording location longitude
+        batch_size: Windows per interpreter invoke
+        max_in_flight: Files analyzed or awaiting delivery at once, bounding memory
+
+    Returns:
+        Totals for the run
+    """
+    summary = RunSummary()
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    in_flight: dict[asyncio.Future[FileResult], Path] = {}
+
+    async def finish(path: Path, future: asyncio.Future[FileResult]) -> None:
+        try:
+            result = future.result()
+        except Exception as e:
+            summary.errors += 1
+            logger.exception("Failed to analyze recording", extra={"path": str(path)})
+            click.echo(f"{path}: analysis failed: {e}", err=True)
+            return
+        delivered = await _deliver_detections(result, config, sender, latitude, longitude)
+        checkpoint.mark_done(Path(result.path), result)
+        summary.files += 1
+        summary.audio_seconds += result.audio_seconds
+        summary.windows += result.windows
+        summary.detections += delivered
+        click.echo(
+            f"[{summary.files + summary.skipped + summary.errors}/{len(files)}] {result.path}: "
+            f"{delivered} detections in {result.audio_seconds / 60:.1f} min of audio"
+        )
+
+    async def finish_next() -> None:
+        done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+        for future in done:
+            await finish(in_flight.pop(future), future)
+
+    try:
+        for path in files:
+            if checkpoint.is_done(path):
+                summary.skipped += 1
+                continue
+            while len(in_flight) >= max_in_flight:
+                await finish_next()
+            future = loop.run_in_executor(
+                executor, analyze_file, str(path), config, latitude, longitude, batch_size
+            )
+            in_flight[future] = path
+        while in_flight:
+            await finish_next()
+    finally:
+        summary.wall_seconds = time.perf_counter() - started
+        for future in in_flight:
+            future.cancel()
+        await sender.aclose()
+    return summary
+
+
+@click.command()
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "--workers",
+    default=max((os.cpu_count() or 1) - 1, 1),
+    show_default="CPU count - 1",
+    help="Worker processes, each with its own interpreter",
+)
+@click.option("--batch-size", default=8, show_default=True, help="Windows per interpreter invoke")
+@click.option("--latitude", type=float, help="Recording latitude (default: configured station)")
+@click.option("--longitude", type=float, help="Recording longitude (default: configured station)")
+@click.option(
+    "--checkpoint",
+    "checkpoint_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Checkpoint file (default: analyze_files_checkpoint.jsonl in the data directory)",
+)
+@click.option("--restart", is_flag=True, help="Ignore the checkpoint and analyze every file")
+@click.option("--json", "json_output", is_flag=True, help="Emit the run summary as JSON")
+def analyze_files(
+    paths: tuple[Path, ...],
+    workers: int,
+    batch_size: int,
+    latitude: float | None,
+    longitude: float | None,
+    checkpoint_path: Path | None,
+    restart: bool,
+    json_output: bool,
+) -> None:
+    """Analyze WAV/FLAC recordings and record their detections.
+
+    The web API must be running; detections are posted to its batch endpoint.
+
+    Examples:
+        # Analyze an archive, resuming where the last run stopped
+        analyze-files /mnt/archive/2025
+
+        # Recordings made away from the station
+        analyze-files --latitude 63.46 --longitude -19.36 ./trip
+    """
+    path_resolver = PathResolver()
+    config = ConfigManager(path_resolver).load()
+    checkpoint = AnalysisCheckpoint(
+        checkpoint_path or path_resolver.get_analyze_files_checkpoint_path()
+    )
+    if restart:
+        checkpoint.clear()
+    files = find_audio_files(paths)
+    click.echo(f"Found {len(files)} recordings, {len(checkpoint)} already analyzed")
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(config,),
+    )
+    try:
+        summary = asyncio.run(
+            run_analysis(
+                files,
+                config,
+                executor,
+                checkpoint,
+                DetectionSender(config.detections_endpoint),
+                config.latitude if latitude is None else latitude,
+                config.longitude if longitude is None else longitude,
+                max(batch_size, 1),
+                max_in_flight=2 * workers,
+            )
+        )
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+    totals = summary.as_dict()
+    if json_output:
+        click.echo(json.dumps(totals, indent=2))
+    else:
+        click.echo(
+            f"Analyzed {totals['files']} files ({totals['skipped']} skipped, "
+            f"{totals['errors']} failed), {totals['audio_hours']} h of audio, "
+            f"{totals['detections']} detections"
+        )
+        click.echo(
+            f"{totals['files_per_second']} files/s, {totals['realtime_factor']}x realtime "
+            f"in {totals['wall_seconds']} s"
+        )
+    if summary.errors:
+        sys.exit(1)
+
+
+def main() -> None:
+    """Entry point for the offline file analysis CLI."""
+    analyze_files()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,771 @@
+"""CLI micro-benchmarks for the real-time audio analysis pipeline.
+
+These benchmarks run on synthetic audio so they can be compared across boards and
+releases without a microphone or a running system. Stage benchmarks that exercise
+the BirdNET model load it through the configured model path; all others need no
+model files. Results are normalised to one hour of audio where that makes sense.
+The model inference benchmark can also cut its windows from a recording, and
+compares every installed model variant across interpreter thread counts.
+"""
+
+import base64
+import json
+import multiprocessing
+import operator
+import os
+import platform
+import resource
+import time
+import tracemalloc
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import click
+import librosa
+import numpy as np
+import soundfile as sf
+
+import birdnetpi
+from birdnetpi.audio.filters import FilterChain, HighPassFilter, LowPassFilter, ResampleFilter
+from birdnetpi.audio.ring_buffer import SampleRingBuffer
+from birdnetpi.config import BirdNETConfig, ConfigManager
+from birdnetpi.detections.birdnet import BirdDetectionService
+from birdnetpi.detections.constants import NON_BIRD_LABELS
+from birdnetpi.detections.frame import decode_detection_frame, encode_detection_frame
+from birdnetpi.system.path_resolver import PathResolver
+from birdnetpi.web.models.detections import DetectionEvent
+
+SECONDS_PER_HOUR = 3600.0
+
+
+def _legacy_window_assembly(
+    chunks: list[np.ndarray], window_size: int, hop_size: int, on_window: Callable
+) -> dict[str, int]:
+    """Assemble windows by growing an array with np.concatenate (pre ring-buffer behaviour).
+
+    Returns:
+        Allocation counters for the run
+    """
+    allocations = 0
+    allocated_bytes = 0
+    buffer = np.array([], dtype=np.int16)
+    for chunk in chunks:
+        buffer = np.concatenate([buffer, chunk])
+        allocations += 1
+        allocated_bytes += buffer.nbytes
+        if len(buffer) >= window_size:
+            on_window(buffer[:window_size])
+            buffer = buffer[hop_size:]
+    return {"allocations": allocations, "allocated_bytes": allocated_bytes, "preallocated_bytes": 0}
+
+
+def _ring_window_assembly(
+    chunks: list[np.ndarray], window_size: int, hop_size: int, on_window: Callable
+) -> dict[str, int]:
+    """Assemble windows with the preallocated SampleRingBuffer.
+
+    Returns:
+        Allocation counters for the run
+    """
+    ring = SampleRingBuffer(window_size=window_size, hop_size=hop_size)
+    for chunk in chunks:
+        ring.write(chunk)
+        for window in ring.windows():
+            on_window(window)
+    return {"allocations": 0, "allocated_bytes": 0, "preallocated_bytes": ring._data.nbytes}
+
+
+def benchmark_window_assembly(
+    seconds: float = 60.0,
+    sample_rate: int = 48000,
+    overlap: float = 0.5,
+    chunk_bytes: int = 4096,
+) -> dict[str, Any]:
+    """Compare window assembly strategies on synthetic int16 audio.
+
+    Args:
+        seconds: Seconds of audio to simulate
+        sample_rate: Sample rate in Hz
+        overlap: Window overlap in seconds
+        chunk_bytes: Size of each FIFO read in bytes
+
+    Returns:
+        Dictionary with per-strategy results normalised to one hour of audio
+    """
+    window_size = int(3.0 * sample_rate)
+    hop_size = window_size - int(overlap * sample_rate)
+    chunk_samples = chunk_bytes // 2
+    total_samples = int(seconds * sample_rate)
+    rng = np.random.default_rng(0)
+    audio = rng.integers(-32768, 32767, size=total_samples, dtype=np.int16)
+    chunks = [audio[i : i + chunk_samples] for i in range(0, total_samples, chunk_samples)]
+    scale = SECONDS_PER_HOUR / seconds
+
+    strategies = {
+        "concatenate": _legacy_window_assembly,
+        "ring_buffer": _ring_window_assembly,
+    }
+    results: dict[str, Any] = {
+        "audio_seconds": seconds,
+        "sample_rate": sample_rate,
+        "overlap": overlap,
+        "chunk_bytes": chunk_bytes,
+        "strategies": {},
+    }
+    for name, strategy in strategies.items():
+        window_count = 0
+
+        def on_window(window: np.ndarray) -> None:
+            nonlocal window_count
+            window_count += 1
+
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        counters = strategy(chunks, window_size, hop_size, on_window)
+        cpu_seconds = time.process_time() - cpu_start
+        wall_seconds = time.perf_counter() - wall_start
+
+        results["strategies"][name] = {
+            "windows": window_count,
+            "cpu_seconds_per_hour": cpu_seconds * scale,
+            "wall_seconds_per_hour": wall_seconds * scale,
+            "allocations_per_hour": int(counters["allocations"] * scale),
+            "allocated_mb_per_hour": counters["allocated_bytes"] * scale / 1e6,
+            "preallocated_mb": counters["preallocated_bytes"] / 1e6,
+        }
+    return results
+
+
+def benchmark_inference_batch(
+    service: BirdDetectionService,
+    batch_sizes: tuple[int, ...] = (1, 2, 4, 8),
+    windows: int = 32,
+) -> dict[str, Any]:
+    """Compare interpreter throughput across batch sizes on synthetic windows.
+
+    Args:
+        service: Loaded detection service whose interpreter is exercised
+        batch_sizes: Batch sizes to compare
+        windows: Number of windows analysed per batch size
+
+    Returns:
+        Dictionary with per-batch-size throughput and latency
+    """
+    rng = np.random.default_rng(0)
+    audio = rng.uniform(-0.5, 0.5, size=(windows, service.input_length)).astype(np.float32)
+    results: dict[str, Any] = {"windows": windows, "strategies": {}}
+    for batch_size in batch_sizes:
+        # Warm up so tensor reallocation is not counted against the batch size; a
+        # partial last batch is padded to the same size, as in live analysis
+        service.set_batch_size(batch_size)
+        service.get_raw_predictions(audio[:batch_size], 0.0, 0.0, 1, 1.0)
+
+        latencies = []
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        for offset in range(0, windows, batch_size):
+            batch_start = time.perf_counter()
+            service.get_raw_predictions(audio[offset : offset + batch_size], 0.0, 0.0, 1, 1.0)
+            latencies.append(time.perf_counter() - batch_start)
+        cpu_seconds = time.process_time() - cpu_start
+        wall_seconds = time.perf_counter() - wall_start
+
+        results["strategies"][f"batch_{batch_size}"] = {
+            "windows_per_second": windows / wall_seconds,
+            "cpu_ms_per_window": cpu_seconds * 1000 / windows,
+            "batch_latency_ms": float(np.mean(latencies)) * 1000,
+            "max_batch_latency_ms": max(latencies) * 1000,
+        }
+    return results
+
+
+def find_model_variants(models_dir: Path) -> list[str]:
+    """Return the installed detection models, skipping the metadata (location) models.
+
+    Args:
+        models_dir: Directory holding the *.tflite model files
+
+    Returns:
+        Model names without the .tflite extension, as used by the model setting
+    """
+    return sorted(path.stem for path in models_dir.glob("*.tflite") if "_MData_" not in path.stem)
+
+
+def _benchmark_windows(input_length: int, windows: int, audio: np.ndarray | None) -> np.ndarray:
+    """Cut recorded audio into model-sized windows, or generate synthetic ones.
+
+    Recorded audio shorter than the requested windows is repeated.
+    """
+    if audio is None:
+        rng = np.random.default_rng(0)
+        return rng.uniform(-0.5, 0.5, size=(windows, input_length)).astype(np.float32)
+    repeats = -(-windows * input_length // max(len(audio), 1))
+    samples = np.tile(audio.astype(np.float32), repeats)[: windows * input_length]
+    return samples.reshape(windows, input_length)
+
+
+def _peak_rss_mb() -> float:
+    """Return the process's peak resident set size in MB (ru_maxrss is in KB on Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def benchmark_model_inference(
+    config: BirdNETConfig,
+    model: str,
+    thread_counts: tuple[int, ...] = (1,),
+    windows: int = 32,
+    audio: np.ndarray | None = None,
+) -> dict[str, Any]:
+    """Measure load time, invoke latency and throughput of one model per thread count.
+
+    The model is loaded afresh for each thread count, since the interpreter's
+    thread count is fixed when it is created. Windows are invoked one at a time,
+    as the daemon does when it keeps up with capture.
+
+    Args:
+        config: Station configuration; its model setting is replaced by ``model``
+        model: Model name, as found by find_model_variants
+        thread_counts: Interpreter thread counts to compare
+        windows: Windows invoked per thread count
+        audio: Mono audio at the model's sample rate, or None for synthetic noise
+
+    Returns:
+        Dictionary with one row per thread count, keyed "<model>/threads_<n>". The
+        peak RSS is the process's high-water mark, so it covers every model loaded
+        by this process so far.
+    """
+    model_config = config.model_copy(update={"model": model})
+    results: dict[str, Any] = {"windows": windows, "strategies": {}}
+    for threads in thread_counts:
+        load_start = time.perf_counter()
+        service = BirdDetectionService(model_config, num_threads=threads, batch_size=1)
+        load_seconds = time.perf_counter() - load_start
+        chunks = _benchmark_windows(service.input_length, windows, audio)
+        # Warm up so one-off tensor allocation is not counted as an invoke
+        service.get_raw_predictions(chunks[:1], 0.0, 0.0, 1, 1.0)
+
+        latencies = []
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        for window in chunks:
+            invoke_start = time.perf_counter()
+            service.get_raw_predictions(window[np.newaxis], 0.0, 0.0, 1, 1.0)
+            latencies.append(time.perf_counter() - invoke_start)
+        cpu_seconds = time.process_time() - cpu_start
+        wall_seconds = time.perf_counter() - wall_start
+
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+        results["strategies"][f"{model}/threads_{threads}"] = {
+            "load_ms": load_seconds * 1000,
+            "windows_per_second": windows / wall_seconds,
+            "cpu_ms_per_window": cpu_seconds * 1000 / windows,
+            "latency_p50_ms": float(p50),
+            "latency_p95_ms": float(p95),
+            "latency_p99_ms": float(p99),
+            "latency_max_ms": max(latencies) * 1000,
+            "peak_rss_mb": _peak_rss_mb(),
+        }
+        del service
+    return results
+
+
+def _benchmark_model_isolated(
+    config: BirdNETConfig,
+    model: str,
+    thread_counts: tuple[int, ...],
+    windows: int,
+    audio: np.ndarray | None,
+) -> dict[str, Any]:
+    """Run benchmark_model_inference in a fresh process so peak RSS covers one model."""
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        future = executor.submit(
+            benchmark_model_inference, config, model, thread_counts, windows, audio
+        )
+        return future.result()
+
+
+def _build_filter_chain(filters: int, sample_rate: int, compiled: bool) -> FilterChain:
+    """Build a chain alternating high-pass and low-pass filters at distinct cutoffs."""
+    chain = FilterChain(f"benchmark_{filters}", compiled=compiled)
+    for index in range(filters):
+        if index % 2 == 0:
+            chain.add_filter(HighPassFilter(100.0 * (index + 1), name=f"HighPass{index}"))
+        else:
+            chain.add_filter(LowPassFilter(12000.0 / index, name=f"LowPass{index}"))
+    chain.configure(sample_rate, 1)
+    return chain
+
+
+def benchmark_filter_chain(
+    max_filters: int = 4,
+    block_samples: int = 1024,
+    sample_rate: int = 48000,
+    seconds: float = 10.0,
+) -> dict[str, Any]:
+    """Compare per-block CPU cost of sequential and compiled filter chains.
+
+    Args:
+        max_filters: Benchmark chains of 1 up to this many filters
+        block_samples: Samples per PortAudio block
+        sample_rate: Sample rate in Hz
+        seconds: Seconds of audio pushed through each chain
+
+    Returns:
+        Dictionary with per-chain-length CPU microseconds per block
+    """
+    rng = np.random.default_rng(0)
+    total_samples = int(seconds * sample_rate)
+    audio = rng.integers(-16000, 16000, size=total_samples, dtype=np.int16)
+    blocks = [audio[i : i + block_samples] for i in range(0, total_samples, block_samples)]
+
+    results: dict[str, Any] = {
+        "block_samples": block_samples,
+        "sample_rate": sample_rate,
+        "blocks": len(blocks),
+        "strategies": {},
+    }
+    for filters in range(1, max_filters + 1):
+        row: dict[str, float] = {}
+        for mode, compiled in (("sequential", False), ("compiled", True)):
+            chain = _build_filter_chain(filters, sample_rate, compiled)
+            chain.process(blocks[0])  # Build the compiled plan outside the timed loop
+            cpu_start = time.process_time()
+            for block in blocks:
+                chain.process(block)
+            cpu_seconds = time.process_time() - cpu_start
+            row[f"{mode}_us_per_block"] = cpu_seconds * 1e6 / len(blocks)
+        row["speedup"] = row["sequential_us_per_block"] / max(row["compiled_us_per_block"], 1e-9)
+        results["strategies"][f"{filters}_filters"] = row
+    return results
+
+
+def _legacy_resample(block: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+    """Resample one block in isolation with librosa (pre-streaming behaviour).
+
+    Returns:
+        The resampled block
+    """
+    return librosa.resample(
+        block, orig_sr=source_rate, target_sr=target_rate, res_type="kaiser_best"
+    )
+
+
+def benchmark_resample(
+    source_rates: tuple[int, ...] = (16000, 44100, 96000),
+    target_rate: int = 48000,
+    block_samples: int = 1024,
+    seconds: float = 10.0,
+) -> dict[str, Any]:
+    """Compare CPU cost of per-block librosa resampling and the streaming polyphase filter.
+
+    Args:
+        source_rates: Device rates converted to the target rate
+        target_rate: Analysis sample rate in Hz
+        block_samples: Samples per PortAudio block at the source rate
+        seconds: Seconds of audio resampled per source rate
+
+    Returns:
+        Dictionary with per-source-rate CPU milliseconds per second of audio
+    """
+    rng = np.random.default_rng(0)
+    results: dict[str, Any] = {
+        "target_rate": target_rate,
+        "block_samples": block_samples,
+        "seconds": seconds,
+        "strategies": {},
+    }
+    for source_rate in source_rates:
+        audio = rng.uniform(-0.5, 0.5, int(seconds * source_rate)).astype(np.float32)
+        blocks = [audio[i : i + block_samples] for i in range(0, len(audio), block_samples)]
+        resampler = ResampleFilter(target_rate)
+        resampler.configure(source_rate, 1)
+
+        cpu_start = time.process_time()
+        for block in blocks:
+            _legacy_resample(block, source_rate, target_rate)
+        librosa_seconds = time.process_time() - cpu_start
+
+        cpu_start = time.process_time()
+        for block in blocks:
+            resampler.process(block)
+        polyphase_seconds = time.process_time() - cpu_start
+
+        results["strategies"][f"{source_rate}_hz"] = {
+            "librosa_ms_per_second": librosa_seconds * 1e3 / seconds,
+            "polyphase_ms_per_second": polyphase_seconds * 1e3 / seconds,
+            "speedup": librosa_seconds / max(polyphase_seconds, 1e-9),
+        }
+    return results
+
+
+def _legacy_postprocessing(
+    service: BirdDetectionService, prediction: np.ndarray, sensitivity: float
+) -> list[tuple[str, float]]:
+    """Rank and filter one window with dict/sorted/set lookups (pre-vectorized behaviour).
+
+    Returns:
+        Bird species above the species frequency threshold, sorted by confidence
+    """
+    p_sigmoid = service._custom_sigmoid(prediction, sensitivity)
+    p_labels = dict(zip(service.classes, p_sigmoid, strict=False))
+    p_sorted = sorted(p_labels.items(), key=operator.itemgetter(1), reverse=True)
+    privacy_threshold = service.privacy_threshold if service.privacy_threshold is not None else 10.0
+    human_cutoff = max(10, int(len(p_sorted) * privacy_threshold / 100.0))
+    ranked = [(species, float(confidence)) for species, confidence in p_sorted[:human_cutoff]]
+
+    threshold = service.species_frequency_threshold or 0.03
+    return [
+        (species, confidence)
+        for species, confidence in ranked
+        if confidence >= threshold and species not in NON_BIRD_LABELS
+    ]
+
+
+def benchmark_postprocessing(
+    service: BirdDetectionService, windows: int = 200, sensitivity: float = 1.25
+) -> dict[str, Any]:
+    """Compare per-window post-processing of model output on synthetic scores.
+
+    Scores are drawn so that a handful of classes per window clear the default
+    threshold, as in typical field recordings. No interpreter is invoked.
+
+    Args:
+        service: Detection service providing labels and thresholds
+        windows: Number of windows to post-process per strategy
+        sensitivity: Sigmoid sensitivity applied to the scores
+
+    Returns:
+        Dictionary with per-strategy cost per window
+    """
+    rng = np.random.default_rng(0)
+    predictions = rng.normal(-9.0, 2.5, size=(windows, len(service.classes))).astype(np.float32)
+
+    strategies = {
+        "python_sort": lambda prediction: _legacy_postprocessing(service, prediction, sensitivity),
+        "vectorized": lambda prediction: service._detect_species(
+            prediction, sensitivity, service._non_bird_mask
+        ),
+    }
+    results: dict[str, Any] = {
+        "windows": windows,
+        "classes": len(service.classes),
+        "sensitivity": sensitivity,
+        "strategies": {},
+    }
+    for name, strategy in strategies.items():
+        detections = 0
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        for prediction in predictions:
+            detections += len(strategy(prediction))
+        cpu_seconds = time.process_time() - cpu_start
+        wall_seconds = time.perf_counter() - wall_start
+
+        results["strategies"][name] = {
+            "detections": detections,
+            "cpu_us_per_window": cpu_seconds * 1e6 / windows,
+            "wall_us_per_window": wall_seconds * 1e6 / windows,
+        }
+    return results
+
+
+def _json_ingest_round_trip(metadata: dict[str, Any], audio: bytes) -> bytes:
+    """Encode a detection as JSON with base64 audio and decode it as the web API does.
+
+    Returns:
+        The decoded audio
+    """
+    body = json.dumps({**metadata, "audio_data": base64.b64encode(audio).decode("utf-8")})
+    event = DetectionEvent.model_validate_json(body)
+    return base64.b64decode(event.audio_data)
+
+
+def _frame_ingest_round_trip(metadata: dict[str, Any], audio: bytes) -> bytes:
+    """Encode a detection as a binary frame and decode it as the web API does.
+
+    Returns:
+        The decoded audio
+    """
+    header, decoded = decode_detection_frame(encode_detection_frame(metadata, audio))
+    DetectionEvent.model_validate_json(header)
+    return decoded
+
+
+def benchmark_detection_ingest(
+    detections: int = 200, clip_seconds: float = 3.0, sample_rate: int = 48000
+) -> dict[str, Any]:
+    """Compare client+server cost of JSON/base64 and binary-frame detection ingest.
+
+    Each round trip encodes one detection as the analysis daemon does and parses it
+    back into a DetectionEvent plus PCM bytes as the web API does. HTTP and the
+    database are left out so only the serialization cost is measured.
+
+    Args:
+        detections: Round trips timed per format
+        clip_seconds: Length of the int16 mono clip sent with each detection
+        sample_rate: Clip sample rate in Hz
+
+    Returns:
+        Dictionary with per-format CPU time and peak traced memory per detection
+    """
+    rng = np.random.default_rng(0)
+    audio = rng.integers(-3000, 3000, int(clip_seconds * sample_rate), dtype=np.int16).tobytes()
+    metadata = {
+        "species_tensor": "Turdus migratorius_American Robin",
+        "scientific_name": "Turdus migratorius",
+        "common_name": "American Robin",
+        "confidence": 0.85,
+        "timestamp": "2026-05-01T06:00:00+00:00",
+        "sample_rate": sample_rate,
+        "channels": 1,
+        "latitude": 63.4591,
+        "longitude": -19.3647,
+        "species_confidence_threshold": 0.03,
+        "week": 18,
+        "sensitivity_setting": 1.25,
+        "overlap": 0.5,
+    }
+    strategies = {"json_base64": _json_ingest_round_trip, "binary_frame": _frame_ingest_round_trip}
+    results: dict[str, Any] = {
+        "detections": detections,
+        "clip_kib": len(audio) / 1024,
+        "strategies": {},
+    }
+    for name, round_trip in strategies.items():
+        cpu_start = time.process_time()
+        for _ in range(detections):
+            round_trip(metadata, audio)
+        cpu_seconds = time.process_time() - cpu_start
+
+        tracemalloc.start()
+        round_trip(metadata, audio)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results["strategies"][name] = {
+            "cpu_us_per_detection": cpu_seconds * 1e6 / detections,
+            "peak_kib_per_detection": peak / 1024,
+        }
+    return results
+
+
+def _print_results(title: str, results: dict[str, Any]) -> None:
+    """Print benchmark results as a table."""
+    click.echo("\n" + "=" * 60)
+    click.echo(title)
+    click.echo("=" * 60)
+    params = {k: v for k, v in results.items() if k != "strategies"}
+    click.echo("  " + ", ".join(f"{k}={v}" for k, v in params.items()))
+    click.echo()
+    rows = results["strategies"]
+    metrics = list(next(iter(rows.values())).keys())
+    click.echo(f"{'metric':<26}" + "".join(f"{name:>18}" for name in rows))
+    click.echo("-" * (26 + 18 * len(rows)))
+    for metric in metrics:
+        cells = []
+        for row in rows.values():
+            value = row[metric]
+            cells.append(f"{value:>18.3f}" if isinstance(value, float) else f"{value:>18}")
+        click.echo(f"{metric:<26}" + "".join(cells))
+
+
+@click.group()
+@click.option("--json", "json_output", is_flag=True, help="Emit results as JSON")
+@click.pass_context
+def cli(ctx: click.Context, json_output: bool) -> None:
+    """Benchmark stages of the real-time audio analysis pipeline."""
+    ctx.ensure_object(dict)
+    ctx.obj["json"] = json_output
+
+
+def _emit(ctx: click.Context, title: str, results: dict[str, Any]) -> None:
+    """Emit results as JSON or as a table depending on the --json flag."""
+    if ctx.obj.get("json"):
+        click.echo(json.dumps(results, indent=2))
+    else:
+        _print_results(title, results)
+
+
+@cli.command("window-assembly")
+@click.option("--seconds", default=60.0, show_default=True, help="Seconds of audio to simulate")
+@click.option("--sample-rate", default=48000, show_default=True, help="Sample rate in Hz")
+@click.option("--overlap", default=0.5, show_default=True, help="Window overlap in seconds")
+@click.option("--chunk-bytes", default=4096, show_default=True, help="FIFO read size in bytes")
+@click.pass_context
+def window_assembly(
+    ctx: click.Context, seconds: float, sample_rate: int, overlap: float, chunk_bytes: int
+) -> None:
+    """Compare np.concatenate window assembly with the preallocated ring buffer."""
+    results = benchmark_window_assembly(seconds, sample_rate, overlap, chunk_bytes)
+    _emit(ctx, "WINDOW ASSEMBLY (per hour of audio)", results)
+
+
+@cli.command("filter-chain")
+@click.option("--max-filters", default=4, show_default=True, help="Longest chain benchmarked")
+@click.option("--block-samples", default=1024, show_default=True, help="Samples per block")
+@click.option("--sample-rate", default=48000, show_default=True, help="Sample rate in Hz")
+@click.option("--seconds", default=10.0, show_default=True, help="Seconds of audio per chain")
+@click.pass_context
+def filter_chain(
+    ctx: click.Context, max_filters: int, block_samples: int, sample_rate: int, seconds: float
+) -> None:
+    """Compare per-filter and fused IIR filter chains on streaming blocks."""
+    results = benchmark_filter_chain(max_filters, block_samples, sample_rate, seconds)
+    _emit(ctx, "FILTER CHAIN (per block)", results)
+
+
+@cli.command("resample")
+@click.option(
+    "--source-rate",
+    "source_rates",
+    multiple=True,
+    type=int,
+    default=(16000, 44100, 96000),
+    show_default=True,
+    help="Device sample rate to convert from (repeatable)",
+)
+@click.option("--target-rate", default=48000, show_default=True, help="Analysis rate in Hz")
+@click.option("--block-samples", default=1024, show_default=True, help="Samples per block")
+@click.option("--seconds", default=10.0, show_default=True, help="Seconds of audio per rate")
+@click.pass_context
+def resample(
+    ctx: click.Context,
+    source_rates: tuple[int, ...],
+    target_rate: int,
+    block_samples: int,
+    seconds: float,
+) -> None:
+    """Compare per-block librosa resampling with the streaming polyphase resampler."""
+    results = benchmark_resample(source_rates, target_rate, block_samples, seconds)
+    _emit(ctx, "RESAMPLING (CPU per second of audio)", results)
+
+
+@cli.command("inference-batch")
+@click.option(
+    "--batch-size",
+    "batch_sizes",
+    multiple=True,
+    type=int,
+    default=(1, 2, 4, 8),
+    show_default=True,
+    help="Batch size to compare (repeatable)",
+)
+@click.option("--windows", default=32, show_default=True, help="Windows analysed per batch size")
+@click.pass_context
+def inference_batch(ctx: click.Context, batch_sizes: tuple[int, ...], windows: int) -> None:
+    """Compare BirdNET interpreter throughput for single and batched invokes."""
+    path_resolver = PathResolver()
+    config = ConfigManager(path_resolver).load()
+    service = BirdDetectionService(config)
+    results = benchmark_inference_batch(service, batch_sizes, windows)
+    results["model"] = config.model
+    _emit(ctx, "INFERENCE BATCHING", results)
+
+
+@cli.command("inference")
+@click.option(
+    "--model",
+    "models",
+    multiple=True,
+    help="Model to benchmark (repeatable; default: every installed detection model)",
+)
+@click.option(
+    "--threads",
+    "thread_counts",
+    multiple=True,
+    type=int,
+    help="Interpreter thread count to compare (repeatable; default: 1 to CPU count)",
+)
+@click.option("--windows", default=64, show_default=True, help="Windows invoked per thread count")
+@click.option(
+    "--audio",
+    "audio_path",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Recording to cut windows from instead of synthetic noise",
+)
+@click.option(
+    "--isolate/--no-isolate",
+    default=True,
+    show_default=True,
+    help="Benchmark each model in a fresh process so its peak RSS is its own",
+)
+@click.pass_context
+def inference(
+    ctx: click.Context,
+    models: tuple[str, ...],
+    thread_counts: tuple[int, ...],
+    windows: int,
+    audio_path: str | None,
+    isolate: bool,
+) -> None:
+    """Compare load time, invoke latency and throughput of the installed models."""
+    path_resolver = PathResolver()
+    config = ConfigManager(path_resolver).load()
+    models = models or tuple(find_model_variants(path_resolver.get_models_dir()))
+    if not models:
+        raise click.ClickException(f"No models found in {path_resolver.get_models_dir()}")
+    thread_counts = thread_counts or tuple(range(1, (os.cpu_count() or 1) + 1))
+
+    audio = None
+    if audio_path is not None:
+        recording, sample_rate = sf.read(audio_path, dtype="float32", always_2d=True)
+        audio = recording[:, 0]
+        if sample_rate != config.sample_rate:
+            resampler = ResampleFilter(config.sample_rate)
+            resampler.configure(sample_rate, 1)
+            audio = resampler.process(audio)
+
+    results: dict[str, Any] = {
+        "version": birdnetpi.__version__,
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "audio": audio_path or "synthetic",
+        "windows": windows,
+        "strategies": {},
+    }
+    run = _benchmark_model_isolated if isolate else benchmark_model_inference
+    for model in models:
+        results["strategies"].update(
+            run(config, model, thread_counts, windows, audio)["strategies"]
+        )
+    _emit(ctx, "MODEL INFERENCE (single-window invokes)", results)
+
+
+@cli.command("postprocessing")
+@click.option("--windows", default=200, show_default=True, help="Windows post-processed")
+@click.option("--sensitivity", default=1.25, show_default=True, help="Sigmoid sensitivity")
+@click.pass_context
+def postprocessing(ctx: click.Context, windows: int, sensitivity: float) -> None:
+    """Compare Python sorting of model output with vectorized top-k post-processing."""
+    path_resolver = PathResolver()
+    config = ConfigManager(path_resolver).load()
+    service = BirdDetectionService(config)
+    results = benchmark_postprocessing(service, windows, sensitivity)
+    results["model"] = config.model
+    _emit(ctx, "POST-PROCESSING (per window)", results)
+
+
+@cli.command("detection-ingest")
+@click.option("--detections", default=200, show_default=True, help="Round trips per format")
+@click.option("--clip-seconds", default=3.0, show_default=True, help="Clip length per detection")
+@click.option("--sample-rate", default=48000, show_default=True, help="Clip sample rate in Hz")
+@click.pass_context
+def detection_ingest(
+    ctx: click.Context, detections: int, clip_seconds: float, sample_rate: int
+) -> None:
+    """Compare JSON/base64 and binary-frame encoding of detections sent to the web API."""
+    results = benchmark_detection_ingest(detections, clip_seconds, sample_rate)
+    _emit(ctx, "DETECTION INGEST (per detection)", results)
+
+
+def main() -> None:
+    """Entry point for the audio pipeline benchmark CLI."""
+    cli(obj={})
+
+
+if __name__ == "__main__":
+    main()
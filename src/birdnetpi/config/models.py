@@ -83,6 +83,44 @@ class EBirdFilterConfig(BaseModel):
     off_season_penalty: float = 1.0  # Penalty during off-season (1.0 = no penalty)
 
 
+class AudioPipelineConfig(BaseModel):
+    """Performance tuning for the capture, analysis and detection delivery pipeline.
+
+    Defaults reproduce the behaviour of a single-threaded pipeline on a Raspberry Pi;
+    larger boards can raise these to trade memory and cores for throughput.
+    """
+
+    inference_batch_size: int = 1  # Windows per interpreter invoke (smaller batches are padded)
+    inference_threads: int = 2  # Interpreter threads (0 = calibrate per model and board, cached)
+    analysis_workers: int = 0  # Analysis worker processes (0 = analyze in the daemon itself)
+    transport: str = "fifo"  # fifo, shared_memory (capture to analysis/livestream audio path)
+    shared_memory_seconds: float = 10.0  # Audio retained per shared-memory ring
+    sample_format: str = "int16"  # int16, float32 (capture to analysis sample type)
+    capture_sample_rate: int = 0  # Device rate to open (0 = sample_rate, PortAudio resamples)
+    activity_gate: str = "off"  # off, on, validate (skip inference on windows without activity)
+    activity_gate_threshold_db: float = 6.0  # Band level above the noise floor that is activity
+    delivery_concurrency: int = 4  # Detection POSTs to the web API in flight at once
+    detection_format: str = "json"  # json, binary (base64 clip in JSON or raw PCM frame)
+    analysis_queue_windows: int = 8  # Windows waiting for inference before the policy applies
+    analysis_queue_policy: str = "drop_oldest"  # drop_oldest, block (when inference falls behind)
+    audio_history_seconds: float = 0.0  # Raw audio kept in shared memory for clips (0 = off)
+    clip_pre_roll: float = 0.0  # Seconds before the window added to clips (needs the history)
+    clip_post_roll: float = 0.0  # Seconds after the window added to clips (delays delivery)
+    detection_merge_gap: float = 0.0  # Max seconds between same-species hits in one event (0 = off)
+    clip_write_queue: int = 64  # Clips queued for the web app's writer thread (0 = write inline)
+    clip_fsync_interval: float = 1.0  # Seconds the clip writer gathers clips for one fsync
+    # CPU pinning in cpuset format, e.g. "0" or "2-3" (empty = any CPU), and niceness from
+    # -20 to 19 (0 = unchanged; negative needs CAP_SYS_NICE), applied per process at startup
+    capture_cpus: str = ""
+    capture_nice: int = 0
+    analysis_cpus: str = ""
+    analysis_nice: int = 0
+    websocket_cpus: str = ""
+    websocket_nice: int = 0
+    web_cpus: str = ""
+    web_nice: int = 0
+
+
 class BirdNETConfig(BaseModel):
     """Configuration settings for the BirdNET-Pi application."""
 
@@ -98,14 +136,16 @@ class BirdNETConfig(BaseModel):
     model: str = "BirdNET_GLOBAL_6K_V2.4_Model_FP16"  # Main detection model filename
     metadata_model: str = "BirdNET_GLOBAL_6K_V2.4_MData_Model_FP16"  # Metadata model for filtering
     species_confidence_threshold: float = 0.03  # Min confidence threshold for species detection
+    species_occurrence_threshold: float = 0.03  # Min metadata-model occurrence at the location/week
     sensitivity_setting: float = 1.25  # Audio analysis sensitivity setting
     privacy_threshold: float = 10.0  # Privacy threshold percentage for human detection cutoff
 
     # Audio Configuration
     audio_device_index: int = -1  # Default to -1 for system default or auto-detection
     sample_rate: int = 48000  # Default sample rate (BirdNET expects 48kHz)
-    audio_channels: int = 1  # Default to mono (BirdNET processes mono audio)
+    audio_channels: int = 1  # Capture channels; each microphone is analyzed separately
     audio_overlap: float = 0.5  # Overlap in seconds between consecutive audio segments
+    audio_pipeline: AudioPipelineConfig = Field(default_factory=AudioPipelineConfig)
 
     # Logging settings
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
@@ -36,6 +36,7 @@ class ConfigVersion_2_0_0:  # noqa: N801
             "model": "BirdNET_GLOBAL_6K_V2.4_Model_FP16.tflite",
             "metadata_model": "BirdNET_GLOBAL_6K_V2.4_MData_Model_FP16.tflite",
             "species_confidence_threshold": 0.03,  # Renamed from sf_thresh
+            "species_occurrence_threshold": 0.03,
             "sensitivity_setting": 1.25,  # Renamed from sensitivity
             "privacy_threshold": 10.0,
             # Audio Configuration
@@ -374,6 +375,14 @@ class ConfigVersion_2_0_0:  # noqa: N801
                     f"species_confidence_threshold must be between 0.0 and 1.0, got {thresh}"
                 )
 
+        # Validate species_occurrence_threshold
+        if "species_occurrence_threshold" in config:
+            thresh = config["species_occurrence_threshold"]
+            if not 0.0 <= thresh <= 1.0:
+                errors.append(
+                    f"species_occurrence_threshold must be between 0.0 and 1.0, got {thresh}"
+                )
+
         # Validate privacy_threshold (new in 2.0.0)
         if "privacy_threshold" in config:
             privacy = config["privacy_threshold"]
@@ -4,17 +4,22 @@ import logging
 import os
 import signal
 import time
+from pathlib import Path
 from types import FrameType
 from typing import TYPE_CHECKING
 
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from birdnetpi.audio.analysis import AudioAnalysisManager
+from birdnetpi.audio.fifo_reader import FifoReader
+from birdnetpi.audio.shared_ring import ANALYSIS_RING_NAME, SharedAudioRingReader, attach_reader
 from birdnetpi.config import ConfigManager
 from birdnetpi.database.species import SpeciesDatabaseService
 from birdnetpi.system.file_manager import FileManager
 from birdnetpi.system.path_resolver import PathResolver
+from birdnetpi.system.process_placement import apply_process_placement
 from birdnetpi.system.structlog_configurator import configure_structlog
 
 if TYPE_CHECKING:
@@ -30,7 +35,8 @@ class DaemonState:
 
     shutdown_flag: bool = False
     fifo_analysis_path: str | None = None
-    fifo_analysis_fd: int | None = None
+    fifo_reader: FifoReader | None = None
+    analysis_ring_reader: SharedAudioRingReader | None = None
     session: "AsyncSession | None" = None
     event_loop: asyncio.AbstractEventLoop | None = None
     audio_analysis_service: AudioAnalysisManager | None = None
@@ -40,7 +46,8 @@ class DaemonState:
         """Reset state to initial values (useful for testing)."""
         cls.shutdown_flag = False
         cls.fifo_analysis_path = None
-        cls.fifo_analysis_fd = None
+        cls.fifo_reader = None
+        cls.analysis_ring_reader = None
         cls.session = None
         cls.event_loop = None
         cls.audio_analysis_service = None
@@ -57,19 +64,32 @@ def _cleanup_fifo() -> None:
         try:
             DaemonState.audio_analysis_service.stop_buffer_flush_task()
             logger.info("Stopped audio analysis buffer flush task")
+            DaemonState.audio_analysis_service.stop_worker_pool()
             # Give a moment for threads to finish
             time.sleep(0.2)
         except Exception as e:
             logger.debug("Error stopping buffer flush task: %s", e)
 
     # Close FIFO
-    if DaemonState.fifo_analysis_fd:
-        os.close(DaemonState.fifo_analysis_fd)
+    if DaemonState.fifo_reader:
+        DaemonState.fifo_reader.close()
         logger.info("Closed FIFO: %s", DaemonState.fifo_analysis_path)
-        DaemonState.fifo_analysis_fd = None
+        DaemonState.fifo_reader = None
+
+    # Detach from the shared-memory ring
+    if DaemonState.analysis_ring_reader:
+        DaemonState.analysis_ring_reader.close()
+        DaemonState.analysis_ring_reader = None
 
     # Clean up database session and event loop
     if DaemonState.event_loop and not DaemonState.event_loop.is_closed():
+        if DaemonState.audio_analysis_service:
+            try:
+                DaemonState.event_loop.run_until_complete(
+                    _finish_analysis(DaemonState.audio_analysis_service)
+                )
+            except Exception as e:
+                logger.debug("Error finishing analysis: %s", e)
         if DaemonState.session:
             try:
                 DaemonState.event_loop.run_until_complete(DaemonState.session.close())
@@ -78,6 +98,12 @@ def _cleanup_fifo() -> None:
         DaemonState.event_loop.close()
 
 
+async def _finish_analysis(service: AudioAnalysisManager) -> None:
+    """Analyze windows still queued, then deliver or cancel their detections."""
+    await service.stop_inference()
+    await service.close_detection_delivery()
+
+
 async def init_session_and_service(
     path_resolver: PathResolver, config: "BirdNETConfig"
 ) -> tuple["AsyncSession", AudioAnalysisManager]:
@@ -112,6 +138,9 @@ async def async_main() -> None:
     config_manager = ConfigManager(path_resolver)
     config = config_manager.load()
     configure_structlog(config)
+    apply_process_placement(
+        "analysis", config.audio_pipeline.analysis_cpus, config.audio_pipeline.analysis_nice
+    )
 
     logger.info("Starting audio analysis wrapper.")
 
@@ -132,33 +161,12 @@ async def async_main() -> None:
     # Start the buffer flush task
     DaemonState.audio_analysis_service.start_buffer_flush_task()
 
-    try:
-        # Open FIFO for reading (non-blocking)
-        DaemonState.fifo_analysis_fd = os.open(
-            DaemonState.fifo_analysis_path, os.O_RDONLY | os.O_NONBLOCK
-        )
-        logger.info("Opened FIFO for reading: %s", DaemonState.fifo_analysis_path)
-
-        # Main processing loop
-        while not DaemonState.shutdown_flag:
-            try:
-                buffer_size = 4096  # Must match producer's write size
-                audio_data_bytes = os.read(DaemonState.fifo_analysis_fd, buffer_size)
-
-                if audio_data_bytes:
-                    # Process audio chunk asynchronously without creating a new event loop
-                    await DaemonState.audio_analysis_service.process_audio_chunk(audio_data_bytes)
-                else:
-                    # No data available, sleep briefly
-                    await asyncio.sleep(0.01)
-
-            except BlockingIOError:
-                # No data available in non-blocking mode
-                await asyncio.sleep(0.01)
-            except Exception as e:
-                logger.error("Error reading from FIFO: %s", e, exc_info=True)
-                await asyncio.sleep(1)
+    if config.audio_pipeline.transport == "shared_memory":
+        await _read_shared_memory(DaemonState.audio_analysis_service, fifo_base_path)
+        return
 
+    try:
+        await _read_fifo(DaemonState.audio_analysis_service, DaemonState.fifo_analysis_path)
     except FileNotFoundError:
         logger.error(
             "FIFO not found at %s. Ensure audio_capture is running and creating it.",
@@ -168,6 +176,58 @@ async def async_main() -> None:
         logger.error("An error occurred in the audio analysis wrapper: %s", e, exc_info=True)
 
 
+async def _read_fifo(service: AudioAnalysisManager, fifo_path: str) -> None:
+    """Analyze audio from the capture FIFO, waking only when it is readable."""
+    # Drain up to one analysis window of frames per wakeup
+    frame_bytes = service.channels * np.dtype(service.sample_dtype).itemsize
+    window_bytes = service.buffer_size_samples * frame_bytes
+    bytes_per_second = service.config.sample_rate * frame_bytes
+    DaemonState.fifo_reader = FifoReader(fifo_path, window_bytes)
+    service.transport_stats = DaemonState.fifo_reader.stats
+    logger.info("Opened FIFO for reading: %s", fifo_path)
+
+    while not DaemonState.shutdown_flag:
+        try:
+            # Bounded wait so shutdown is noticed while capture is silent
+            audio_data_bytes = await DaemonState.fifo_reader.read(timeout=0.5)
+            if audio_data_bytes:
+                # Capture writes in real time, so the audio still queued behind this
+                # read was captured after its last sample: that backlog is its age
+                queued = DaemonState.fifo_reader.queued_bytes()
+                captured_ns = time.monotonic_ns() - queued * 1_000_000_000 // bytes_per_second
+                await service.process_audio_chunk(audio_data_bytes, captured_ns)
+        except Exception as e:
+            logger.error("Error reading from FIFO: %s", e, exc_info=True)
+            await asyncio.sleep(1)
+
+
+async def _read_shared_memory(service: AudioAnalysisManager, doorbell_dir: Path) -> None:
+    """Analyze audio from the shared-memory ring, waking on the producer's doorbell."""
+    while not DaemonState.shutdown_flag:
+        reader = DaemonState.analysis_ring_reader
+        if reader is None or reader.producer_closed:
+            if reader is not None:
+                logger.info("Audio capture restarted, re-attaching to shared audio ring")
+                reader.close()
+            DaemonState.analysis_ring_reader = await attach_reader(
+                ANALYSIS_RING_NAME, doorbell_dir, lambda: DaemonState.shutdown_flag
+            )
+            if DaemonState.analysis_ring_reader is not None:
+                service.transport_stats = DaemonState.analysis_ring_reader.stats
+            continue
+
+        try:
+            samples = reader.read()
+            if samples.size:
+                await service.process_audio_samples(samples, reader.last_write_ns)
+            else:
+                # Bounded wait so shutdown and producer restarts are noticed
+                await reader.wait_async(timeout=0.5)
+        except Exception as e:
+            logger.error("Error reading from shared audio ring: %s", e, exc_info=True)
+            await asyncio.sleep(1)
+
+
 def main() -> None:
     """Run the audio analysis wrapper with a single persistent event loop."""
     # Create and run the event loop
@@ -3,14 +3,22 @@ import logging
 import os
 import signal
 import time
+from pathlib import Path
+
+import numpy as np
 
 from birdnetpi.audio.capture import AudioCaptureService
-from birdnetpi.config import ConfigManager
+from birdnetpi.audio.shared_ring import ANALYSIS_RING_NAME, LIVESTREAM_RING_NAME, SharedAudioRing
+from birdnetpi.config import BirdNETConfig, ConfigManager
 from birdnetpi.system.path_resolver import PathResolver
+from birdnetpi.system.pipeline_stats import PipelineStatsStore
+from birdnetpi.system.process_placement import apply_process_placement
 from birdnetpi.system.structlog_configurator import configure_structlog
 
 logger = logging.getLogger(__name__)
 
+STATS_INTERVAL_SECONDS = 5.0  # How often capture counters are published for the health API
+
 
 class DaemonState:
     """Encapsulates daemon state to avoid module-level globals."""
@@ -20,6 +28,8 @@ class DaemonState:
     fifo_livestream_path: str | None = None
     fifo_analysis_fd: int | None = None
     fifo_livestream_fd: int | None = None
+    analysis_ring: SharedAudioRing | None = None
+    livestream_ring: SharedAudioRing | None = None
 
     @classmethod
     def reset(cls) -> None:
@@ -29,6 +39,8 @@ class DaemonState:
         cls.fifo_livestream_path = None
         cls.fifo_analysis_fd = None
         cls.fifo_livestream_fd = None
+        cls.analysis_ring = None
+        cls.livestream_ring = None
 
 
 def _signal_handler(signum: int, frame: object) -> None:
@@ -40,6 +52,11 @@ def _signal_handler(signum: int, frame: object) -> None:
 
 
 def _cleanup_fifos() -> None:
+    for ring in (DaemonState.analysis_ring, DaemonState.livestream_ring):
+        if ring is not None:
+            ring.close()
+    DaemonState.analysis_ring = None
+    DaemonState.livestream_ring = None
     if DaemonState.fifo_analysis_fd:
         os.close(DaemonState.fifo_analysis_fd)
         logger.info("Closed FIFO: %s", DaemonState.fifo_analysis_path)
@@ -61,6 +78,9 @@ def main() -> None:
     config_manager = ConfigManager(path_resolver)
     config = config_manager.load()
     configure_structlog(config)
+    apply_process_placement(
+        "capture", config.audio_pipeline.capture_cpus, config.audio_pipeline.capture_nice
+    )
 
     logger.info("Starting audio capture wrapper.")
 
@@ -71,43 +91,36 @@ def main() -> None:
 
     fifo_base_path = path_resolver.get_fifo_base_path()
 
-    DaemonState.fifo_analysis_path = os.path.join(fifo_base_path, "birdnet_audio_analysis.fifo")
-    DaemonState.fifo_livestream_path = os.path.join(fifo_base_path, "birdnet_audio_livestream.fifo")
+    fifo_analysis_path = os.path.join(fifo_base_path, "birdnet_audio_analysis.fifo")
+    fifo_livestream_path = os.path.join(fifo_base_path, "birdnet_audio_livestream.fifo")
+    DaemonState.fifo_analysis_path = fifo_analysis_path
+    DaemonState.fifo_livestream_path = fifo_livestream_path
 
     audio_capture_service = None
 
     try:
-        # Create named pipes
-        os.makedirs(fifo_base_path, exist_ok=True)  # Ensure base path exists
-        if not os.path.exists(DaemonState.fifo_analysis_path):
-            os.mkfifo(DaemonState.fifo_analysis_path)
-            logger.info("Created FIFO: %s", DaemonState.fifo_analysis_path)
-        if not os.path.exists(DaemonState.fifo_livestream_path):
-            os.mkfifo(DaemonState.fifo_livestream_path)
-            logger.info("Created FIFO: %s", DaemonState.fifo_livestream_path)
-
-        # Open FIFOs for writing
-        DaemonState.fifo_analysis_fd = os.open(DaemonState.fifo_analysis_path, os.O_WRONLY)
-        DaemonState.fifo_livestream_fd = os.open(DaemonState.fifo_livestream_path, os.O_WRONLY)
-        logger.info("FIFOs opened for writing.")
-
-        # Configuration already loaded above
-        logger.info("Configuration loaded successfully.")
-
-        # Instantiate and start the AudioCaptureService
-        # Pass the file descriptors to the service - let it handle all audio logic
-        audio_capture_service = AudioCaptureService(
-            config, DaemonState.fifo_analysis_fd, DaemonState.fifo_livestream_fd
-        )
+        if config.audio_pipeline.transport == "shared_memory":
+            audio_capture_service = _create_shared_memory_capture(config, fifo_base_path)
+        else:
+            audio_capture_service = _create_fifo_capture(
+                config, fifo_base_path, fifo_analysis_path, fifo_livestream_path
+            )
+
+        # Start the AudioCaptureService
         audio_capture_service.start_capture()
         logger.info("AudioCaptureService started.")
 
+        stats_store = PipelineStatsStore(path_resolver)
+        stats_published = time.monotonic()
         while not DaemonState.shutdown_flag:
             # Check if audio capture service requested shutdown (FIFO closed)
             if audio_capture_service and hasattr(audio_capture_service, "_shutdown_requested"):
                 if audio_capture_service._shutdown_requested:
                     logger.info("Audio capture service detected FIFO closure, initiating shutdown")
                     break
+            if time.monotonic() - stats_published >= STATS_INTERVAL_SECONDS:
+                stats_store.write("capture", audio_capture_service.stats())
+                stats_published = time.monotonic()
             time.sleep(0.1)  # Check more frequently for responsive shutdown
 
     except FileNotFoundError:
@@ -127,5 +140,59 @@ def main() -> None:
         _cleanup_fifos()
 
 
+def _create_shared_memory_capture(config: BirdNETConfig, doorbell_dir: Path) -> AudioCaptureService:
+    """Create the shared-memory rings and a capture service that writes into them."""
+    capacity = int(
+        config.audio_pipeline.shared_memory_seconds * config.sample_rate * config.audio_channels
+    )
+    os.makedirs(doorbell_dir, exist_ok=True)
+    analysis_dtype = np.float32 if config.audio_pipeline.sample_format == "float32" else np.int16
+    DaemonState.analysis_ring = SharedAudioRing(
+        ANALYSIS_RING_NAME,
+        capacity,
+        doorbell_dir,
+        config.sample_rate,
+        config.audio_channels,
+        dtype=analysis_dtype,
+    )
+    DaemonState.livestream_ring = SharedAudioRing(
+        LIVESTREAM_RING_NAME, capacity, doorbell_dir, config.sample_rate, config.audio_channels
+    )
+    logger.info("Shared-memory audio rings created.")
+
+    return AudioCaptureService(
+        config,
+        None,
+        None,
+        analysis_ring=DaemonState.analysis_ring,
+        livestream_ring=DaemonState.livestream_ring,
+    )
+
+
+def _create_fifo_capture(
+    config: BirdNETConfig, fifo_base_path: Path, analysis_path: str, livestream_path: str
+) -> AudioCaptureService:
+    """Create and open the FIFOs and a capture service that writes into them."""
+    # Create named pipes
+    os.makedirs(fifo_base_path, exist_ok=True)  # Ensure base path exists
+    if not os.path.exists(analysis_path):
+        os.mkfifo(analysis_path)
+        logger.info("Created FIFO: %s", analysis_path)
+    if not os.path.exists(livestream_path):
+        os.mkfifo(livestream_path)
+        logger.info("Created FIFO: %s", livestream_path)
+
+    # Open FIFOs for writing
+    DaemonState.fifo_analysis_fd = os.open(analysis_path, os.O_WRONLY)
+    DaemonState.fifo_livestream_fd = os.open(livestream_path, os.O_WRONLY)
+    logger.info("FIFOs opened for writing.")
+
+    # Configuration already loaded above
+    logger.info("Configuration loaded successfully.")
+
+    # Pass the file descriptors to the service - let it handle all audio logic
+    return AudioCaptureService(config, DaemonState.fifo_analysis_fd, DaemonState.fifo_livestream_fd)
+
+
 if __name__ == "__main__":
     main()
@@ -4,17 +4,22 @@ import logging
 from birdnetpi.audio.websocket import AudioWebSocketService
 from birdnetpi.config import ConfigManager
 from birdnetpi.system.path_resolver import PathResolver
+from birdnetpi.system.process_placement import apply_process_placement
 from birdnetpi.system.structlog_configurator import configure_structlog
 
 logger = logging.getLogger(__name__)
 
 
-async def main_async() -> None:
-    """Async main function that wraps the AudioWebSocketService."""
+async def main_async(transport: str = "fifo") -> None:
+    """Async main function that wraps the AudioWebSocketService.
+
+    Args:
+        transport: Livestream audio transport, "fifo" or "shared_memory"
+    """
     logger.info("Starting audio websocket daemon.")
 
     path_resolver = PathResolver()
-    service = AudioWebSocketService(path_resolver)
+    service = AudioWebSocketService(path_resolver, transport=transport)
 
     try:
         await service.start()
@@ -32,9 +37,12 @@ def main() -> None:
     config_manager = ConfigManager(path_resolver)
     config = config_manager.load()
     configure_structlog(config)
+    apply_process_placement(
+        "websocket", config.audio_pipeline.websocket_cpus, config.audio_pipeline.websocket_nice
+    )
 
     try:
-        asyncio.run(main_async())
+        asyncio.run(main_async(config.audio_pipeline.transport))
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt, shutting down...")
     except Exception:
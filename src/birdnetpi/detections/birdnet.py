@@ -1,6 +1,6 @@
 import logging
 import math
-import operator
+import os
 
 import numpy as np
 from ai_edge_litert.interpreter import Interpreter
@@ -10,6 +10,20 @@ from birdnetpi.detections.constants import MODEL_LABELS, NON_BIRD_LABELS
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SPECIES_FREQUENCY_THRESHOLD = 0.03
+DEFAULT_SPECIES_OCCURRENCE_THRESHOLD = 0.03  # BirdNET's sf_thresh for the location filter
+MIN_RANKED_SPECIES = 10  # Smallest ranking returned regardless of the privacy threshold
+LOCATION_DECIMALS = 2  # Coordinate rounding (~1 km) used to key cached species occurrence
+
+
+def _logit(probability: float) -> float:
+    """Return the model score at which the sigmoid reaches the given probability."""
+    if probability <= 0.0:
+        return -math.inf
+    if probability >= 1.0:
+        return math.inf
+    return math.log(probability / (1.0 - probability))
+
 
 class BirdDetectionService:
     """Service for bird species detection using BirdNET TensorFlow Lite models.
@@ -25,43 +39,82 @@ class BirdDetectionService:
     - Applying confidence thresholds and sensitivity adjustments
     """
 
-    def __init__(self, config: BirdNETConfig) -> None:
+    def __init__(
+        self, config: BirdNETConfig, num_threads: int = 2, batch_size: int | None = None
+    ) -> None:
         """Initialize the bird detection service with configuration.
 
         Args:
             config: BirdNET configuration containing model paths, thresholds,
                    and other detection parameters
+            num_threads: Number of threads the TFLite interpreter may use
+            batch_size: Windows per interpreter invoke; the input tensor is sized for
+                       this many once and smaller batches are zero-padded (defaults
+                       to the configured inference batch size)
         """
         self.config = config
+        self.num_threads = num_threads
         self.interpreter: Interpreter | None = None  # type: ignore[name-defined]
         self.metadata_interpreter: Interpreter | None = None  # type: ignore[name-defined]
-        self.predicted_species_list = []  # This list is populated by the meta-model
-        self.current_week = None
+        # Metadata-model occurrence scores for the last (latitude, longitude, week) key
+        self._occurrence_key: tuple[float, float, int] | None = None
+        self._occurrence: np.ndarray | None = None
         self.model_name = None
         self.privacy_threshold = None
         self.species_frequency_threshold = None
+        self.species_occurrence_threshold = None
         self.metadata = None
         self.metadata_params = None
 
         self.input_layer_index = None
         self.output_layer_index = None
         self.metadata_input_index = None
-        self.classes = []
+        self.input_length = 0  # Samples per window expected by the model input tensor
+        # Windows per invoke; the tensor arena is only reallocated when this changes
+        self.batch_size = max(batch_size or config.audio_pipeline.inference_batch_size, 1)
+        self._allocated_batch_size = 0  # Batch size the input tensor is currently sized for
+        self._batch_input: np.ndarray | None = None  # Zero-padded input for partial batches
+        self.classes = []  # Also builds the label and non-bird index arrays
 
         self.metadata_input_layer_index = None
         self.metadata_output_layer_index = None
 
         self._load_global_model()
 
+    @property
+    def classes(self) -> list[str]:
+        """Species labels in model output order."""
+        return self._classes
+
+    @classes.setter
+    def classes(self, labels: list[str]) -> None:
+        """Set the species labels and precompute the arrays used for post-processing.
+
+        Post-processing works on class indices so that only the few surviving
+        candidates of each window are ever turned into Python strings.
+        """
+        self._classes = list(labels)
+        self._labels = np.array(self._classes, dtype=object)
+        self._non_bird_mask = np.fromiter(
+            (label in NON_BIRD_LABELS for label in self._classes),
+            dtype=bool,
+            count=len(self._classes),
+        )
+        self._occurrence_key = None
+        self._excluded_key: tuple | None = None
+        self._excluded = self._non_bird_mask
+
     def _load_global_model(self) -> None:
         """Load the global BirdNET model and initialize configuration parameters.
 
-        This method sets up the model name, privacy threshold, and species frequency
-        threshold from the configuration, then loads the main detection model.
+        This method sets up the model name, privacy threshold, species frequency
+        threshold and location filter threshold from the configuration, then loads
+        the main detection model.
         """
         self.model_name = self.config.model
         self.privacy_threshold = self.config.privacy_threshold
         self.species_frequency_threshold = self.config.species_confidence_threshold
+        self.species_occurrence_threshold = self.config.species_occurrence_threshold
         self._load_model()
 
     def _load_model(self) -> None:
@@ -87,7 +140,7 @@ class BirdDetectionService:
         # case
         if model_path is None:
             raise ValueError(f"Model path not found for model: {self.model_name}")
-        self.interpreter = Interpreter(model_path=str(model_path), num_threads=2)  # type: ignore[attr-defined]
+        self.interpreter = Interpreter(model_path=str(model_path), num_threads=self.num_threads)  # type: ignore[attr-defined]
         self.interpreter.allocate_tensors()  # type: ignore[union-attr]
 
         if self.interpreter is None:
@@ -97,6 +150,8 @@ class BirdDetectionService:
         output_details = self.interpreter.get_output_details()
 
         self.input_layer_index = input_details[0]["index"]
+        self.input_length = int(input_details[0]["shape"][-1])
+        self._allocated_batch_size = int(input_details[0]["shape"][0])
         if self.config.model == "BirdNET_6K_GLOBAL_MODEL":
             self.metadata_input_index = input_details[1]["index"]
         self.output_layer_index = output_details[0]["index"]
@@ -238,7 +293,7 @@ class BirdDetectionService:
 
         Filters the complete species list based on location and temporal
         occurrence data from the metadata model. Only species with occurrence
-        probability above the threshold are included.
+        probability above the location filter threshold are included.
 
         Args:
             latitude: Geographic latitude (-90 to 90)
@@ -250,27 +305,137 @@ class BirdDetectionService:
             location and time
 
         Notes:
-            - Results are cached per week to avoid redundant predictions
+            - Occurrence scores are cached per location and week, on disk as well
+              as in memory, to avoid redundant predictions
             - Only applies to certain model versions that support metadata filtering
         """
-        if self.config.model == "BirdNET_GLOBAL_6K_V2.4_Model_FP16":
-            if week != self.current_week or not self.predicted_species_list:
-                self.current_week = week
-                self.predicted_species_list = []  # Clear previous list
-                location_filter = self._predict_filter_raw(latitude, longitude, week)
-                threshold = (
-                    self.species_frequency_threshold
-                    if self.species_frequency_threshold is not None
-                    else 0.03
-                )
-                location_filter = np.where(location_filter >= float(threshold), location_filter, 0)
+        occurrence = self._location_occurrence(latitude, longitude, week)
+        if occurrence is None:
+            return []
+        return self._labels[occurrence >= self._occurrence_threshold()].tolist()
+
+    def _frequency_threshold(self) -> float:
+        """Return the species frequency threshold, falling back to the default."""
+        if self.species_frequency_threshold is None:
+            return DEFAULT_SPECIES_FREQUENCY_THRESHOLD
+        return float(self.species_frequency_threshold)
+
+    def _occurrence_threshold(self) -> float:
+        """Return the location filter threshold, falling back to the default."""
+        if self.species_occurrence_threshold is None:
+            return DEFAULT_SPECIES_OCCURRENCE_THRESHOLD
+        return float(self.species_occurrence_threshold)
+
+    def _location_occurrence(
+        self, latitude: float, longitude: float, week: int
+    ) -> np.ndarray | None:
+        """Return metadata-model occurrence scores for a location and week.
+
+        Coordinates are rounded to LOCATION_DECIMALS places to form the cache key,
+        so small GPS jitter does not trigger a new prediction.
+
+        Args:
+            latitude: Geographic latitude (-90 to 90)
+            longitude: Geographic longitude (-180 to 180)
+            week: Week of the year (1-48)
+
+        Returns:
+            Occurrence score per class, or None when the model has no separate
+            metadata model or the scores are unavailable
+        """
+        if self.config.model != "BirdNET_GLOBAL_6K_V2.4_Model_FP16":
+            return None
 
-                # Zip with labels and filter for non-zero scores
-                filtered_species = [
-                    s[1] for s in zip(location_filter, self.classes, strict=False) if s[0] > 0
-                ]
-                self.predicted_species_list.extend(filtered_species)
-        return self.predicted_species_list
+        key = (
+            round(latitude, LOCATION_DECIMALS),
+            round(longitude, LOCATION_DECIMALS),
+            int(week),
+        )
+        if key != self._occurrence_key:
+            self._occurrence_key = key
+            self._occurrence = self._load_occurrence(*key)
+        return self._occurrence
+
+    def _load_occurrence(self, latitude: float, longitude: float, week: int) -> np.ndarray | None:
+        """Read occurrence scores from the disk cache, running the metadata model on a miss.
+
+        Args:
+            latitude: Rounded geographic latitude
+            longitude: Rounded geographic longitude
+            week: Week of the year (1-48)
+
+        Returns:
+            Occurrence score per class, or None if the metadata model cannot be run
+        """
+        from birdnetpi.system.path_resolver import PathResolver
+
+        cache_dir = PathResolver().get_species_occurrence_cache_dir()
+        cache_path = cache_dir / (
+            f"{self.config.metadata_model}_{latitude:.{LOCATION_DECIMALS}f}"
+            f"_{longitude:.{LOCATION_DECIMALS}f}_w{week:02d}.npy"
+        )
+        num_classes = len(self._classes)
+
+        try:
+            occurrence = np.load(cache_path)
+            if occurrence.shape == (num_classes,):
+                return occurrence
+            logger.warning("Ignoring species occurrence cache %s with wrong shape", cache_path)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable species occurrence cache %s", cache_path)
+
+        try:
+            occurrence = np.asarray(
+                self._predict_filter_raw(latitude, longitude, week), dtype=np.float32
+            )
+        except Exception:
+            logger.exception("Metadata model unavailable, species will not be filtered by location")
+            return None
+        if occurrence.shape != (num_classes,):
+            logger.warning(
+                "Metadata model returned %d scores for %d classes, ignoring",
+                occurrence.size,
+                num_classes,
+            )
+            return None
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with temp_path.open("wb") as cache_file:
+                np.save(cache_file, occurrence)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            logger.warning("Could not write species occurrence cache %s", cache_path)
+        return occurrence
+
+    def _excluded_classes(self, latitude: float, longitude: float, week: int) -> np.ndarray:
+        """Return a boolean mask of classes that must never be reported.
+
+        Non-bird labels are always excluded; species whose metadata-model occurrence
+        at this location and week is below the location filter threshold are
+        excluded as well. The mask is rebuilt only when the location, week or that
+        threshold changes.
+
+        Args:
+            latitude: Geographic latitude (-90 to 90)
+            longitude: Geographic longitude (-180 to 180)
+            week: Week of the year (1-48)
+
+        Returns:
+            Boolean array with one entry per class
+        """
+        occurrence = self._location_occurrence(latitude, longitude, week)
+        threshold = self._occurrence_threshold()
+        key = (self._occurrence_key, threshold)
+        if key != self._excluded_key:
+            self._excluded_key = key
+            self._excluded = self._non_bird_mask
+            if occurrence is not None:
+                self._excluded = self._non_bird_mask | (occurrence < threshold)
+        return self._excluded
 
     def _convert_metadata(self, m: np.ndarray) -> np.ndarray:
         """Convert location and week metadata into model-compatible format.
@@ -336,6 +501,175 @@ class BirdDetectionService:
         """
         return 1 / (1.0 + np.exp(-sensitivity * x))
 
+    def set_batch_size(self, batch_size: int) -> None:
+        """Set how many windows each interpreter invoke runs.
+
+        The input tensor is resized on the next invoke. Resizing reallocates the
+        interpreter's tensor arena, so callers pick one size up front rather than
+        changing it per batch.
+
+        Args:
+            batch_size: Windows per invoke
+        """
+        self.batch_size = max(batch_size, 1)
+
+    def _allocate_batch(self) -> None:
+        """Size the interpreter input tensors for batch_size windows, if not already.
+
+        Raises:
+            RuntimeError: If the model interpreter is not initialized
+        """
+        if self.interpreter is None:
+            raise RuntimeError("Interpreter not initialized")
+        if self._allocated_batch_size == self.batch_size:
+            return
+
+        self.interpreter.resize_tensor_input(
+            self.input_layer_index, [self.batch_size, self.input_length]
+        )
+        if self.config.model == "BirdNET_6K_GLOBAL_MODEL":
+            self.interpreter.resize_tensor_input(self.metadata_input_index, [self.batch_size, 6])
+        self.interpreter.allocate_tensors()
+        self._allocated_batch_size = self.batch_size
+        self._batch_input = None
+        logger.debug("BirdDetectionService: resized input tensor to batch size %d", self.batch_size)
+
+    def _predict_batch(
+        self, audio_chunks: np.ndarray, latitude: float, longitude: float, week: int
+    ) -> np.ndarray:
+        """Run the model over a batch of windows, batch_size windows per invoke.
+
+        The last invoke of a batch that is not a multiple of batch_size is padded
+        with silent windows whose outputs are dropped, so the input tensor keeps
+        its size whatever the number of windows.
+
+        Args:
+            audio_chunks: Array of shape (windows, samples)
+            latitude: Recording location latitude (-90 to 90)
+            longitude: Recording location longitude (-180 to 180)
+            week: Week of the year when recording was made (1-48)
+
+        Returns:
+            Raw model output of shape (windows, classes)
+
+        Raises:
+            RuntimeError: If the model interpreter is not initialized
+        """
+        # Prepare metadata for the main model
+        if self.metadata_params != [latitude, longitude, week]:
+            self.metadata_params = [latitude, longitude, week]
+            self.metadata = self._convert_metadata(np.array([latitude, longitude, week]))
+            self.metadata = np.expand_dims(self.metadata, 0)
+
+        if self.interpreter is None:
+            raise RuntimeError("Interpreter not initialized")
+
+        self._allocate_batch()
+        audio_chunks = np.asarray(audio_chunks, dtype="float32")
+        if len(audio_chunks) == 0:
+            return np.empty((0, len(self.classes)), dtype=np.float32)
+        outputs = []
+        for offset in range(0, len(audio_chunks), self.batch_size):
+            chunk = audio_chunks[offset : offset + self.batch_size]
+            windows = len(chunk)
+            if windows < self.batch_size:
+                if self._batch_input is None:
+                    self._batch_input = np.zeros(
+                        (self.batch_size, self.input_length), dtype="float32"
+                    )
+                self._batch_input[:windows] = chunk
+                self._batch_input[windows:] = 0.0
+                chunk = self._batch_input
+
+            self.interpreter.set_tensor(self.input_layer_index, chunk)
+            if self.config.model == "BirdNET_6K_GLOBAL_MODEL":
+                self.interpreter.set_tensor(
+                    self.metadata_input_index,
+                    np.repeat(np.asarray(self.metadata, dtype="float32"), self.batch_size, axis=0),
+                )
+            self.interpreter.invoke()
+            outputs.append(self.interpreter.get_tensor(self.output_layer_index)[:windows])
+        return outputs[0] if len(outputs) == 1 else np.concatenate(outputs)
+
+    def _ranking_cutoff(self, num_classes: int) -> int:
+        """Return how many top-ranked classes the privacy threshold allows through."""
+        privacy_threshold = self.privacy_threshold if self.privacy_threshold is not None else 10.0
+        cutoff = max(MIN_RANKED_SPECIES, int(num_classes * privacy_threshold / 100.0))
+        return min(cutoff, num_classes)
+
+    def _top_k(self, scores: np.ndarray, candidates: np.ndarray, k: int) -> np.ndarray:
+        """Return the candidate indices with the k highest scores, best first.
+
+        Args:
+            scores: Scores for every class of one window
+            candidates: Class indices to choose from
+            k: Maximum number of indices to return
+
+        Returns:
+            Class indices ordered by descending score, ties in label order
+        """
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+    def _rank_prediction(
+        self, prediction: np.ndarray, sensitivity: float
+    ) -> list[tuple[str, float]]:
+        """Convert one window of raw model output into ranked (species, confidence) pairs.
+
+        The sigmoid is monotonic, so classes are ranked on the scaled model scores and
+        the sigmoid is only applied to the classes that are returned.
+
+        Args:
+            prediction: Raw model output for a single window
+            sensitivity: Detection sensitivity adjustment
+
+        Returns:
+            List of (species_name, confidence_score) tuples sorted by confidence
+        """
+        scores = prediction * sensitivity
+        top = self._top_k(scores, np.arange(len(scores)), self._ranking_cutoff(len(scores)))
+        confidences = self._custom_sigmoid(prediction[top], sensitivity)
+        # tolist() converts numpy float32 to Python float for consistent type handling
+        return list(zip(self._labels[top].tolist(), confidences.tolist(), strict=True))
+
+    def _detect_species(
+        self, prediction: np.ndarray, sensitivity: float, excluded: np.ndarray
+    ) -> list[tuple[str, float]]:
+        """Return the bird species in one window that pass the confidence threshold.
+
+        Equivalent to ranking the window and filtering the ranking, but the threshold
+        is applied first, as a single comparison in model score space, so only the
+        handful of classes above it are ranked.
+
+        Args:
+            prediction: Raw model output for a single window
+            sensitivity: Detection sensitivity adjustment
+            excluded: Boolean mask of classes that must not be reported
+
+        Returns:
+            List of (species_name, confidence_score) tuples for bird species above
+            the species frequency threshold, sorted by confidence
+        """
+        scores = prediction * sensitivity
+        candidates = np.flatnonzero(scores >= _logit(self._frequency_threshold()))
+        # Only classes inside the privacy cutoff of the full ranking may be reported
+        top = self._top_k(scores, candidates, self._ranking_cutoff(len(scores)))
+
+        dropped = excluded[top]
+        if logger.isEnabledFor(logging.DEBUG):
+            for index in top[dropped]:
+                logger.debug(
+                    "Filtered out %s detection: %s (confidence: %.3f)",
+                    "non-bird" if self._non_bird_mask[index] else "out-of-range",
+                    self._labels[index],
+                    float(self._custom_sigmoid(prediction[index], sensitivity)),
+                )
+
+        top = top[~dropped]
+        confidences = self._custom_sigmoid(prediction[top], sensitivity)
+        return list(zip(self._labels[top].tolist(), confidences.tolist(), strict=True))
+
     def get_raw_prediction(
         self,
         audio_chunk: np.ndarray,
@@ -365,41 +699,40 @@ class BirdDetectionService:
         Raises:
             RuntimeError: If the model interpreter is not initialized
         """
-        # Prepare metadata for the main model
-        if self.metadata_params != [latitude, longitude, week]:
-            self.metadata_params = [latitude, longitude, week]
-            self.metadata = self._convert_metadata(np.array([latitude, longitude, week]))
-            self.metadata = np.expand_dims(self.metadata, 0)
+        return self.get_raw_predictions(
+            np.expand_dims(audio_chunk, 0), latitude, longitude, week, sensitivity
+        )[0]
 
-        # Prepare audio chunk as input signal
-        sig = np.expand_dims(audio_chunk, 0)
-
-        # Make a prediction
-        if self.interpreter is None:
-            raise RuntimeError("Interpreter not initialized")
-
-        self.interpreter.set_tensor(self.input_layer_index, np.array(sig, dtype="float32"))
-        if self.config.model == "BirdNET_6K_GLOBAL_MODEL":
-            self.interpreter.set_tensor(
-                self.metadata_input_index, np.array(self.metadata, dtype="float32")
-            )
-        self.interpreter.invoke()
-        prediction = self.interpreter.get_tensor(self.output_layer_index)[0]
-
-        # Apply custom sigmoid
-        p_sigmoid = self._custom_sigmoid(prediction, sensitivity)
+    def get_raw_predictions(
+        self,
+        audio_chunks: np.ndarray,
+        latitude: float,
+        longitude: float,
+        week: int,
+        sensitivity: float,
+    ) -> list[list[tuple[str, float]]]:
+        """Generate species predictions for a batch of windows in a single invoke.
 
-        # Get label and scores for pooled predictions
-        p_labels = dict(zip(self.classes, p_sigmoid, strict=False))
+        Batching amortises the interpreter overhead when several windows are ready
+        at once, e.g. catching up after a stall or re-analysing recordings.
 
-        # Sort by score
-        p_sorted = sorted(p_labels.items(), key=operator.itemgetter(1), reverse=True)
+        Args:
+            audio_chunks: Array of shape (windows, samples), or a sequence of
+                         equal-length windows
+            latitude: Recording location latitude (-90 to 90)
+            longitude: Recording location longitude (-180 to 180)
+            week: Week of the year when recording was made (1-48)
+            sensitivity: Detection sensitivity adjustment (0.5-1.5 typical)
 
-        privacy_threshold = self.privacy_threshold if self.privacy_threshold is not None else 10.0
-        human_cutoff = max(10, int(len(p_sorted) * privacy_threshold / 100.0))
+        Returns:
+            One ranked list of (species_name, confidence_score) tuples per window,
+            in the same order as the input windows
 
-        # Convert numpy float32 to Python float for consistent type handling
-        return [(species, float(confidence)) for species, confidence in p_sorted[:human_cutoff]]
+        Raises:
+            RuntimeError: If the model interpreter is not initialized
+        """
+        predictions = self._predict_batch(audio_chunks, latitude, longitude, week)
+        return [self._rank_prediction(prediction, sensitivity) for prediction in predictions]
 
     def get_analysis_results(
         self,
@@ -412,8 +745,9 @@ class BirdDetectionService:
         """Analyze audio and return filtered species detections.
 
         Similar to get_raw_prediction but applies additional filtering based on
-        the species frequency threshold. Only returns species with confidence
-        scores above the configured threshold.
+        the species frequency threshold. Only returns bird species with confidence
+        scores above the configured threshold that the metadata model expects at
+        the given location and week.
 
         Args:
             audio_chunk: Audio samples as numpy array (typically 3 seconds at 48kHz)
@@ -430,31 +764,34 @@ class BirdDetectionService:
             This is the primary method for production use as it filters out
             low-confidence predictions that are likely to be false positives.
         """
-        raw_predictions = self.get_raw_prediction(
-            audio_chunk,
-            latitude,
-            longitude,
-            week,
-            sensitivity,
-        )
+        return self.get_analysis_results_batch(
+            np.expand_dims(audio_chunk, 0), latitude, longitude, week, sensitivity
+        )[0]
 
-        species_frequency_threshold = (
-            self.species_frequency_threshold
-            if self.species_frequency_threshold is not None
-            else 0.03
-        )
+    def get_analysis_results_batch(
+        self,
+        audio_chunks: np.ndarray,
+        latitude: float,
+        longitude: float,
+        week: int,
+        sensitivity: float,
+    ) -> list[list[tuple[str, float]]]:
+        """Analyze a batch of windows and return filtered detections for each.
 
-        filtered_results = []
-        for species, confidence in raw_predictions:
-            if confidence >= species_frequency_threshold:
-                # Filter out non-bird sounds
-                if species not in NON_BIRD_LABELS:
-                    filtered_results.append((species, confidence))
-                else:
-                    logger.debug(
-                        "Filtered out non-bird detection: %s (confidence: %.3f)",
-                        species,
-                        confidence,
-                    )
+        Args:
+            audio_chunks: Array of shape (windows, samples), or a sequence of
+                         equal-length windows
+            latitude: Recording location latitude (-90 to 90)
+            longitude: Recording location longitude (-180 to 180)
+            week: Week of the year when recording was made (1-48)
+            sensitivity: Detection sensitivity adjustment (0.5-1.5 typical)
 
-        return filtered_results
+        Returns:
+            One filtered list of (species_name, confidence_score) tuples per window,
+            in the same order as the input windows
+        """
+        excluded = self._excluded_classes(latitude, longitude, week)
+        predictions = self._predict_batch(audio_chunks, latitude, longitude, week)
+        return [
+            self._detect_species(prediction, sensitivity, excluded) for prediction in predictions
+        ]
@@ -0,0 +1,235 @@
+"""Background writer for detection clips, off the ingest request path.
+
+Writing a clip from the ingest handler holds the request open for the SD-card
+write, and a slow card stalls every detection behind it. With the writer
+enabled, a detection and its AudioFile row are committed at once with the clip
+marked pending, and the WAV is written by a dedicated thread fed from a
+bounded queue. The thread gathers the clips queued within a short interval,
+writes them, and syncs them and their directories to disk together, so a burst
+of detections costs one round of fsyncs rather than one per clip. The batch is
+then marked ready, or failed, in the database, and only then is the detection
+signal sent for each clip's detection, so listeners never see a detection whose
+clip cannot be played yet.
+"""
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+import numpy as np
+import soundfile as sf
+from sqlalchemy import update
+from sqlalchemy.exc import SQLAlchemyError
+
+from birdnetpi.database.core import CoreDatabaseService
+from birdnetpi.detections.models import AudioFile, ClipStatus, Detection
+from birdnetpi.notifications.signals import detection_signal
+from birdnetpi.system.path_resolver import PathResolver
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_CLIPS = 32  # Clips written before one fsync round, bounding open files
+
+
+@dataclass(frozen=True)
+class ClipWrite:
+    """A clip waiting to be written for a committed AudioFile row."""
+
+    audio_file_id: uuid.UUID
+    relative_path: Path  # Relative to the recordings directory
+    audio: bytes  # Raw int16 PCM
+    sample_rate: int
+    channels: int
+    detection: Detection | None = None  # Signalled once the clip is ready or has failed
+
+
+class ClipWriter:
+    """Write detection clips on a dedicated thread and record when they are on disk."""
+
+    def __init__(
+        self,
+        database_service: CoreDatabaseService,
+        path_resolver: PathResolver,
+        max_queued: int,
+        fsync_interval: float = 1.0,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            database_service: Database holding the AudioFile rows to update
+            path_resolver: Resolver for the recordings directory
+            max_queued: Clips queued before submitters wait for the writer
+            fsync_interval: Seconds to gather clips after the first before syncing
+        """
+        self.database_service = database_service
+        self.path_resolver = path_resolver
+        self.fsync_interval = fsync_interval
+        self._queue: queue.Queue[ClipWrite | None] = queue.Queue(max_queued)
+        self._directories: set[Path] = set()  # Directories known to exist
+        self._thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.clips_written = 0
+        self.clips_failed = 0
+        self.fsync_rounds = 0
+
+    async def start(self) -> None:
+        """Fail clips a previous run left pending and start the writer thread."""
+        self._loop = asyncio.get_running_loop()
+        await self._fail_abandoned_clips()
+        self._thread = threading.Thread(target=self._run, name="clip-writer", daemon=True)
+        self._thread.start()
+
+    async def submit(self, write: ClipWrite) -> None:
+        """Queue a clip, waiting off the event loop while the queue is full."""
+        try:
+            self._queue.put_nowait(write)
+        except queue.Full:
+            logger.warning("Clip writer queue is full; waiting for it to drain")
+            await asyncio.to_thread(self._queue.put, write)
+
+    async def stop(self) -> None:
+        """Write every queued clip and stop the writer thread."""
+        if self._thread is None:
+            return
+        await asyncio.to_thread(self._queue.put, None)
+        await asyncio.to_thread(self._thread.join)
+        self._thread = None
+
+    @property
+    def queued(self) -> int:
+        """Clips waiting to be written."""
+        return self._queue.qsize()
+
+    def _run(self) -> None:
+        """Write clips in batches until stopped."""
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.fsync_interval
+            while batch[-1] is not None and len(batch) < MAX_BATCH_CLIPS:
+                try:
+                    batch.append(self._queue.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            stopping = batch[-1] is None
+            writes = [write for write in batch if write is not None]
+            if writes:
+                self._write_batch(writes)
+
+    def _write_batch(self, writes: Sequence[ClipWrite]) -> None:
+        """Write clips, sync them to disk together and record the outcome."""
+        recordings_dir = self.path_resolver.get_recordings_dir()
+        written: list[tuple[ClipWrite, IO[bytes]]] = []
+        failed: list[uuid.UUID] = []
+        for write in writes:
+            try:
+                written.append(
+                    (write, self._write_clip(recordings_dir / write.relative_path, write))
+                )
+            except (OSError, RuntimeError, ValueError) as e:
+                logger.error("Could not write clip %s: %s", write.relative_path, e)
+                failed.append(write.audio_file_id)
+
+        ready: list[uuid.UUID] = []
+        for write, handle in written:
+            try:
+                os.fsync(handle.fileno())
+                ready.append(write.audio_file_id)
+            except OSError as e:
+                logger.error("Could not sync clip %s: %s", write.relative_path, e)
+                failed.append(write.audio_file_id)
+            finally:
+                handle.close()
+        # New files are only durable once their directory entries are synced too
+        for directory in {(recordings_dir / write.relative_path).parent for write, _ in written}:
+            self._sync_directory(directory)
+        self.fsync_rounds += 1
+        self.clips_written += len(ready)
+        self.clips_failed += len(failed)
+
+        if self._loop is not None:
+            for ids, status in ((ready, ClipStatus.READY), (failed, ClipStatus.FAILED)):
+                if ids:
+                    asyncio.run_coroutine_threadsafe(self._mark(ids, status), self._loop).result()
+            detections = [write.detection for write in writes if write.detection is not None]
+            if detections:
+                asyncio.run_coroutine_threadsafe(self._announce(detections), self._loop).result()
+
+    def _write_clip(self, path: Path, write: ClipWrite) -> IO[bytes]:
+        """Write one clip without syncing it and return its still-open file."""
+        if path.parent not in self._directories:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._directories.add(path.parent)
+        try:
+            handle = path.open("wb")
+        except FileNotFoundError:
+            # The directory was removed since it was cached, e.g. by cleanup
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle = path.open("wb")
+        try:
+            audio = np.frombuffer(write.audio, dtype=np.int16)
+            if write.channels > 1:
+                audio = audio.reshape(-1, write.channels)
+            sf.write(handle, audio, write.sample_rate, format="WAV", subtype="PCM_16")
+            handle.flush()
+        except BaseException:
+            handle.close()
+            raise
+        return handle
+
+    @staticmethod
+    def _sync_directory(directory: Path) -> None:
+        """Sync a directory's entries, logging rather than failing the batch."""
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.warning("Could not sync clip directory %s: %s", directory, e)
+
+    async def _fail_abandoned_clips(self) -> None:
+        """Mark clips a previous run queued but never wrote as failed."""
+        async with self.database_service.get_async_db() as session:
+            try:
+                result = await session.execute(
+                    update(AudioFile)
+                    .where(AudioFile.clip_status == ClipStatus.PENDING.value)  # type: ignore[arg-type]
+                    .values(clip_status=ClipStatus.FAILED.value)
+                )
+                await session.commit()
+            except SQLAlchemyError:
+                await session.rollback()
+                logger.exception("Error failing abandoned clips")
+                return
+        abandoned = result.rowcount  # type: ignore[attr-defined]
+        if abandoned:
+            logger.warning("Marked %d clips left pending by a previous run as failed", abandoned)
+
+    async def _mark(self, ids: list[uuid.UUID], status: ClipStatus) -> None:
+        """Set the clip status of AudioFile rows."""
+        async with self.database_service.get_async_db() as session:
+            try:
+                await session.execute(
+                    update(AudioFile)
+                    .where(AudioFile.id.in_(ids))  # type: ignore[attr-defined]
+                    .values(clip_status=status.value)
+                )
+                await session.commit()
+            except SQLAlchemyError:
+                await session.rollback()
+                logger.exception("Error updating clip status")
+
+    async def _announce(self, detections: list[Detection]) -> None:
+        """Send the detection signal, on the event loop, for detections held for their clips."""
+        for detection in detections:
+            detection_signal.send(self, detection=detection)
@@ -6,21 +6,27 @@ species display service. It acts as a facade to simplify data access
 patterns while preserving the underlying service architecture.
 """
 
+import asyncio
 import base64
+import dataclasses
 import functools
 import logging
+import time
 from collections.abc import Callable, Sequence
 from typing import Any, TypeVar
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from birdnetpi.database.core import CoreDatabaseService
 from birdnetpi.database.species import SpeciesDatabaseService
+from birdnetpi.detections.clip_writer import ClipWrite, ClipWriter
 from birdnetpi.detections.models import (
     AudioFile,
+    ClipStatus,
     Detection,
     DetectionBase,
 )
@@ -31,6 +37,7 @@ from birdnetpi.notifications.signals import detection_signal
 from birdnetpi.species.display import SpeciesDisplayService
 from birdnetpi.system.file_manager import FileManager
 from birdnetpi.system.path_resolver import PathResolver
+from birdnetpi.system.pipeline_stats import StageLatencies
 from birdnetpi.web.models.detections import DetectionEvent
 
 logger = logging.getLogger(__name__)
@@ -45,6 +52,8 @@ def emit_detection_event(func: Callable[..., Any]) -> Callable[..., Any]:
     This decorator automatically emits a Blinker signal when a Detection
     is successfully created or modified. It replaces the need for a separate
     DetectionManager by handling event emission at the point of data modification.
+    A detection whose clip went to the clip writer is signalled by the writer
+    instead, once the clip is on disk.
 
     Args:
         func: A method that returns a Detection object
@@ -59,7 +68,7 @@ def emit_detection_event(func: Callable[..., Any]) -> Callable[..., Any]:
         detection = await func(self, *args, **kwargs)
 
         # Emit the detection event if we have a valid detection
-        if detection and isinstance(detection, Detection):
+        if detection and isinstance(detection, Detection) and not self._clip_queued(detection):
             logger.info(f"Emitting detection signal for {detection.id}")
             detection_signal.send(self, detection=detection)
 
@@ -84,6 +93,7 @@ class DataManager:
         file_manager: FileManager,
         path_resolver: PathResolver,
         detection_query_service: DetectionQueryService | None = None,
+        clip_writer: ClipWriter | None = None,
     ) -> None:
         """Initialize the DataManager with required services.
 
@@ -94,6 +104,7 @@ class DataManager:
             file_manager: Handles file operations for audio and spectrograms
             path_resolver: Resolves paths for detection files
             detection_query_service: Legacy service for compatibility (will be absorbed)
+            clip_writer: Background writer for clips; None writes them before the commit
         """
         self.database_service = database_service
         self.species = species_database
@@ -101,6 +112,9 @@ class DataManager:
         self.file_manager = file_manager
         self.path_resolver = path_resolver
         self.query_service = detection_query_service
+        self.clip_writer = clip_writer
+        # Ingest commit timings, the last stage of the audio pipeline
+        self.stage_latencies = StageLatencies()
 
     # ==================== Core CRUD Operations ====================
 
@@ -141,80 +155,252 @@ class DataManager:
                 raise
 
     @emit_detection_event
-    async def create_detection(self, detection_event: DetectionEvent) -> Detection:
+    async def create_detection(
+        self, detection_event: DetectionEvent, audio_bytes: bytes | None = None
+    ) -> Detection:
         """Create a new detection record from a DetectionEvent.
 
         This method handles both audio file saving and database persistence.
         It creates a detection in the database and automatically emits a
-        detection event via the @emit_detection_event decorator.
+        detection event via the @emit_detection_event decorator. With a clip
+        writer, the clip is queued once the detection is committed and the
+        writer sends the event when the clip is ready.
+
+        Args:
+            detection_event: Detection metadata, with base64 audio from the JSON API
+            audio_bytes: Raw PCM from the binary ingest path; takes precedence over
+                detection_event.audio_data
         """
+        audio_file, clip_write = await asyncio.to_thread(
+            self._save_detection_clip, detection_event, audio_bytes
+        )
         async with self.database_service.get_async_db() as session:
             try:
-                # Decode and save audio data if provided
-                audio_file = None
-                if detection_event.audio_data:
-                    # Decode base64 audio data
-                    audio_bytes = base64.b64decode(detection_event.audio_data)
-
-                    # Get the file path for this detection
-                    audio_file_path = self.path_resolver.get_detection_audio_path(
-                        detection_event.scientific_name, detection_event.timestamp
-                    )
+                if audio_file is not None:
+                    session.add(audio_file)
+                detection = self._build_detection(detection_event, audio_file)
+                session.add(detection)
+                await self._commit_detections(session, [detection_event])
+                await session.refresh(detection)
+            except SQLAlchemyError:
+                await session.rollback()
+                logger.exception("Error creating detection")
+                await asyncio.to_thread(self._discard_written_clips, [(audio_file, clip_write)])
+                raise
+        await self._queue_clip_writes([clip_write], [detection])
+        return detection
 
-                    # Save audio file (convert numpy array back to bytes)
-                    audio_file_instance = self.file_manager.save_detection_audio(
-                        audio_file_path,
-                        audio_bytes,  # Use the decoded bytes directly
-                        detection_event.sample_rate,
-                        detection_event.channels,
-                    )
+    async def create_detections(
+        self, items: Sequence[tuple[DetectionEvent, bytes | None]]
+    ) -> list[Detection]:
+        """Create many detection records in a single transaction.
 
-                    # Create AudioFile record
-                    audio_file = AudioFile(
-                        file_path=audio_file_instance.file_path,
-                        duration=audio_file_instance.duration,
-                        size_bytes=audio_file_instance.size_bytes,
-                    )
-                    session.add(audio_file)
-                    await session.flush()
+        Clips are written concurrently in worker threads (or queued for the clip
+        writer after the commit), every row is inserted under one commit, and a
+        detection signal is sent for each detection only once that commit has
+        succeeded, or by the clip writer once the detection's clip is ready. If
+        the commit fails, the clips already written are deleted so no WAV file is
+        left without a detection.
 
-                    logger.info(
-                        "Saved detection audio",
-                        extra={"file_path": str(audio_file_instance.file_path)},
-                    )
+        Args:
+            items: (detection event, raw PCM or None) pairs; None falls back to the
+                event's base64 audio_data
 
-                # Create Detection
-                # Calculate hour_epoch for optimized weather JOINs
-                hour_epoch = (
-                    int(detection_event.timestamp.timestamp() / 3600)
-                    if detection_event.timestamp
-                    else None
+        Returns:
+            The created detections, in the order given
+        """
+        if not items:
+            return []
+        clips = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._save_detection_clip, event, audio_bytes)
+                for event, audio_bytes in items
+            )
+        )
+        audio_files = [audio_file for audio_file, _ in clips]
+        detections = [
+            self._build_detection(event, audio_file)
+            for (event, _), audio_file in zip(items, audio_files, strict=True)
+        ]
+        async with self.database_service.get_async_db() as session:
+            try:
+                session.add_all([audio_file for audio_file in audio_files if audio_file])
+                session.add_all(detections)
+                await self._commit_detections(session, [event for event, _ in items])
+                # One reload for the whole batch instead of a refresh per row
+                ids = [detection.id for detection in detections]
+                result = await session.execute(
+                    select(Detection).where(Detection.id.in_(ids))  # type: ignore[attr-defined]
                 )
+                by_id = {detection.id: detection for detection in result.scalars()}
+            except SQLAlchemyError:
+                await session.rollback()
+                logger.exception("Error creating detection batch")
+                await asyncio.to_thread(self._discard_written_clips, clips)
+                raise
+
+        created = [by_id[detection.id] for detection in detections]
+        await self._queue_clip_writes([clip_write for _, clip_write in clips], created)
+        for detection in created:
+            if not self._clip_queued(detection):
+                detection_signal.send(self, detection=detection)
+        logger.info("Created detection batch", extra={"detections": len(created)})
+        return created
 
-                detection = Detection(
-                    species_tensor=detection_event.species_tensor,
-                    scientific_name=detection_event.scientific_name,
-                    common_name=detection_event.common_name,
-                    confidence=detection_event.confidence,
-                    timestamp=detection_event.timestamp,
-                    audio_file_id=audio_file.id if audio_file else None,
-                    latitude=detection_event.latitude,
-                    longitude=detection_event.longitude,
-                    species_confidence_threshold=detection_event.species_confidence_threshold,
-                    week=detection_event.week,
-                    sensitivity_setting=detection_event.sensitivity_setting,
-                    overlap=detection_event.overlap,
-                    hour_epoch=hour_epoch,
+    async def _commit_detections(
+        self, session: AsyncSession, events: Sequence[DetectionEvent]
+    ) -> None:
+        """Commit newly added detections, timing the commit for the pipeline histograms.
+
+        End-to-end latency runs from the capture of each detection's last window to
+        this commit. Capture and this process share the host's monotonic clock; a
+        capture time ahead of it was taken before a reboot (a replayed detection)
+        and is not counted.
+        """
+        started = time.perf_counter()
+        await session.commit()
+        committed_ns = time.monotonic_ns()
+        self.stage_latencies.record("db_commit", time.perf_counter() - started)
+        for event in events:
+            if event.captured_ns is not None and event.captured_ns <= committed_ns:
+                self.stage_latencies.record("end_to_end", (committed_ns - event.captured_ns) / 1e9)
+        self.stage_latencies.roll("web")
+
+    async def get_existing_detection_ids(self, detection_ids: Sequence[UUID]) -> set[UUID]:
+        """Return which of the given detection IDs are already stored."""
+        if not detection_ids:
+            return set()
+        async with self.database_service.get_async_db() as session:
+            try:
+                result = await session.execute(
+                    select(Detection.id).where(
+                        Detection.id.in_(detection_ids)  # type: ignore[attr-defined]
+                    )
                 )
-                session.add(detection)
-                await session.commit()
-                await session.refresh(detection)
-                return detection
+                return set(result.scalars())
             except SQLAlchemyError:
                 await session.rollback()
-                logger.exception("Error creating detection")
+                logger.exception("Error checking existing detection IDs")
                 raise
 
+    def _save_detection_clip(
+        self, detection_event: DetectionEvent, audio_bytes: bytes | None
+    ) -> tuple[AudioFile | None, ClipWrite | None]:
+        """Write a detection's clip to disk, or prepare it for the clip writer.
+
+        Args:
+            detection_event: Detection metadata, with base64 audio from the JSON API
+            audio_bytes: Raw PCM; takes precedence over detection_event.audio_data
+
+        Returns:
+            The unsaved AudioFile record, or None if the detection has no audio, and
+            the clip for the clip writer once the record is committed, or None if
+            it was written here
+        """
+        if audio_bytes is None and detection_event.audio_data:
+            audio_bytes = base64.b64decode(detection_event.audio_data)
+        if not audio_bytes:
+            return None, None
+
+        audio_file_path = self.path_resolver.get_detection_audio_path(
+            detection_event.scientific_name, detection_event.timestamp, detection_event.channel
+        )
+        if self.clip_writer is not None:
+            audio_file = FileManager.detection_audio_record(
+                audio_file_path,
+                audio_bytes,
+                detection_event.sample_rate,
+                detection_event.channels,
+                ClipStatus.PENDING,
+            )
+            return audio_file, ClipWrite(
+                audio_file.id,
+                audio_file_path,
+                audio_bytes,
+                detection_event.sample_rate,
+                detection_event.channels,
+            )
+
+        audio_file_instance = self.file_manager.save_detection_audio(
+            audio_file_path,
+            audio_bytes,
+            detection_event.sample_rate,
+            detection_event.channels,
+        )
+        logger.info(
+            "Saved detection audio",
+            extra={"file_path": str(audio_file_instance.file_path)},
+        )
+        audio_file = AudioFile(
+            file_path=audio_file_instance.file_path,
+            duration=audio_file_instance.duration,
+            size_bytes=audio_file_instance.size_bytes,
+            clip_status=ClipStatus.READY.value,
+        )
+        return audio_file, None
+
+    def _discard_written_clips(
+        self, clips: Sequence[tuple[AudioFile | None, ClipWrite | None]]
+    ) -> None:
+        """Delete clips written for detections whose commit was rolled back.
+
+        Clips left to the clip writer were never written, so only inline writes
+        are removed.
+        """
+        recordings_dir = self.path_resolver.get_recordings_dir()
+        for audio_file, clip_write in clips:
+            if audio_file is None or clip_write is not None:
+                continue
+            try:
+                (recordings_dir / audio_file.file_path).unlink(missing_ok=True)
+            except OSError:
+                logger.warning(
+                    "Could not delete clip of rolled back detection",
+                    extra={"file_path": str(audio_file.file_path)},
+                )
+
+    async def _queue_clip_writes(
+        self, clip_writes: Sequence[ClipWrite | None], detections: Sequence[Detection]
+    ) -> None:
+        """Hand clips of committed detections to the clip writer, which signals each detection."""
+        if self.clip_writer is None:
+            return
+        for clip_write, detection in zip(clip_writes, detections, strict=True):
+            if clip_write is not None:
+                await self.clip_writer.submit(dataclasses.replace(clip_write, detection=detection))
+
+    def _clip_queued(self, detection: Detection) -> bool:
+        """Whether the detection's clip went to the clip writer, which then signals it."""
+        return self.clip_writer is not None and detection.audio_file_id is not None
+
+    @staticmethod
+    def _build_detection(
+        detection_event: DetectionEvent, audio_file: AudioFile | None
+    ) -> Detection:
+        """Build an unsaved Detection row from a DetectionEvent."""
+        # Calculate hour_epoch for optimized weather JOINs
+        hour_epoch = (
+            int(detection_event.timestamp.timestamp() / 3600) if detection_event.timestamp else None
+        )
+        return Detection(
+            # Keep a client-supplied ID so replayed detections can be recognised
+            id=detection_event.id or uuid4(),
+            species_tensor=detection_event.species_tensor,
+            scientific_name=detection_event.scientific_name,
+            common_name=detection_event.common_name,
+            confidence=detection_event.confidence,
+            timestamp=detection_event.timestamp,
+            audio_file_id=audio_file.id if audio_file else None,
+            latitude=detection_event.latitude,
+            longitude=detection_event.longitude,
+            species_confidence_threshold=detection_event.species_confidence_threshold,
+            week=detection_event.week,
+            sensitivity_setting=detection_event.sensitivity_setting,
+            overlap=detection_event.overlap,
+            channel=detection_event.channel,
+            hour_epoch=hour_epoch,
+        )
+
     async def update_detection(
         self, detection_id: UUID, updates: dict[str, Any]
     ) -> Detection | None:
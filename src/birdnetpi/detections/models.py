@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import UTC, datetime
+from enum import StrEnum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -24,6 +25,14 @@ if TYPE_CHECKING:
 from birdnetpi.location.models import Weather
 
 
+class ClipStatus(StrEnum):
+    """Whether an audio file's clip has been written to disk yet."""
+
+    PENDING = "pending"  # Queued for the background clip writer
+    READY = "ready"
+    FAILED = "failed"  # The write failed or was lost to a restart
+
+
 class AudioFile(SQLModel, table=True):
     """Represents an audio file record in the database."""
 
@@ -33,6 +42,8 @@ class AudioFile(SQLModel, table=True):
     file_path: Path = Field(sa_column=Column(PathType, unique=True, index=True))
     duration: float | None = None
     size_bytes: int | None = None
+    # ClipStatus value; None for clips stored before the status was tracked
+    clip_status: str | None = Field(default=None, sa_column=Column(String(10)))
 
 
 class DetectionBase(SQLModel):
@@ -67,6 +78,7 @@ class DetectionBase(SQLModel):
     overlap: float | None = (
         None  # Audio analysis window overlap (0.0-1.0) for signal processing continuity
     )
+    channel: int | None = None  # Capture channel (0-based) on multi-microphone stations
 
     # eBird regional filtering parameters (stored like tensor parameters for auditing)
     ebird_confidence_tier: str | None = (
@@ -0,0 +1,145 @@
+"""Startup calibration of the interpreter thread count.
+
+How much a BirdNET invoke gains from extra interpreter threads depends on the
+model and on the board: a Pi 4 and a Pi 5 scale differently, and an INT8 model
+scales differently from an FP16 one. Rather than fixing the thread count, the
+analysis daemon can time single-window invokes at each thread count the process
+may use and keep the fastest. The choice is cached per model and board, so the
+calibration only runs the first time a model is used on a board.
+"""
+
+import datetime
+import json
+import logging
+import os
+import platform
+import time
+from datetime import UTC
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from birdnetpi.config import BirdNETConfig
+from birdnetpi.detections.birdnet import BirdDetectionService
+from birdnetpi.system.path_resolver import PathResolver
+from birdnetpi.system.process_placement import available_cpu_count
+
+logger = logging.getLogger(__name__)
+
+CALIBRATION_WINDOWS = 8  # Timed single-window invokes per thread count
+MIN_SPEEDUP = 0.9  # More threads must cut median latency by 10% to be preferred
+
+
+def board_fingerprint() -> str:
+    """Identify the board by architecture, CPU model and the CPUs this process may use.
+
+    The CPU count is the affinity-limited one, so pinning the analysis daemon to
+    fewer cores calibrates afresh.
+    """
+    cpu_model = platform.processor()
+    try:
+        for line in Path("/proc/cpuinfo").read_text().splitlines():
+            key, _, value = line.partition(":")
+            # "model name" on x86; "Model" is the board name on Raspberry Pi
+            if key.strip() in ("model name", "Model") and value.strip():
+                cpu_model = value.strip()
+    except OSError:
+        pass
+    return f"{platform.machine()}|{cpu_model}|{available_cpu_count()}cpu"
+
+
+class InferenceThreadCalibrator:
+    """Choose and cache the interpreter thread count for the configured model."""
+
+    def __init__(self, config: BirdNETConfig, path_resolver: PathResolver) -> None:
+        """Initialize the calibrator.
+
+        Args:
+            config: Configuration naming the model to calibrate
+            path_resolver: Resolver for the calibration cache
+        """
+        self.config = config
+        self.cache_path = path_resolver.get_inference_threads_cache_path()
+
+    @property
+    def cache_key(self) -> str:
+        """Key of the configured model on this board in the cache."""
+        return f"{self.config.model}|{board_fingerprint()}"
+
+    def measure(self, num_threads: int, windows: int = CALIBRATION_WINDOWS) -> float:
+        """Return the median single-window invoke latency in ms at a thread count.
+
+        Args:
+            num_threads: Interpreter threads
+            windows: Timed invokes, after one untimed warm-up
+        """
+        service = BirdDetectionService(self.config, num_threads=num_threads, batch_size=1)
+        rng = np.random.default_rng(0)
+        audio = rng.uniform(-0.5, 0.5, size=(windows, service.input_length)).astype(np.float32)
+        service.get_raw_predictions(audio[:1], 0.0, 0.0, 1, 1.0)
+        latencies = []
+        for window in audio:
+            started = time.perf_counter()
+            service.get_raw_predictions(window[np.newaxis], 0.0, 0.0, 1, 1.0)
+            latencies.append(time.perf_counter() - started)
+        return float(np.median(latencies)) * 1000
+
+    def calibrate(self) -> tuple[int, dict[int, float]]:
+        """Time every thread count the process may use and pick the fastest.
+
+        Fewer threads win unless more are clearly faster, leaving cores to the
+        rest of the pipeline when extra threads barely help.
+
+        Returns:
+            The chosen thread count and the median latency (ms) at each count
+        """
+        latencies = {
+            num_threads: self.measure(num_threads)
+            for num_threads in range(1, available_cpu_count() + 1)
+        }
+        best = 1
+        for num_threads, latency in sorted(latencies.items()):
+            if latency < latencies[best] * MIN_SPEEDUP:
+                best = num_threads
+        return best, latencies
+
+    def num_threads(self) -> int:
+        """Return the cached thread count, calibrating and caching it if there is none."""
+        cache = self._load_cache()
+        entry = cache.get(self.cache_key)
+        if entry is not None:
+            return int(entry["num_threads"])
+
+        logger.info("Calibrating interpreter threads for %s", self.config.model)
+        best, latencies = self.calibrate()
+        logger.info(
+            "Using %d interpreter threads for %s (median invoke ms by threads: %s)",
+            best,
+            self.config.model,
+            {threads: round(latency, 1) for threads, latency in latencies.items()},
+        )
+        cache[self.cache_key] = {
+            "num_threads": best,
+            "latency_ms": {str(threads): round(ms, 2) for threads, ms in latencies.items()},
+            "calibrated_at": datetime.datetime.now(UTC).isoformat(),
+        }
+        self._save_cache(cache)
+        return best
+
+    def _load_cache(self) -> dict[str, Any]:
+        """Read the cache, treating a missing or corrupt file as empty."""
+        try:
+            return json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, cache: dict[str, Any]) -> None:
+        """Replace the cache file atomically so a crash never leaves it half-written."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.cache_path.with_suffix(".tmp")
+            temporary.write_text(json.dumps(cache, indent=2))
+            os.replace(temporary, self.cache_path)
+        except OSError as e:
+            logger.warning("Could not cache interpreter thread calibration: %s", e)
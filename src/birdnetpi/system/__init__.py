@@ -3,6 +3,9 @@
 This package contains system-level management components:
 - FileManager: File system operations and management
 - PathResolver: Path resolution and management
+- process_placement: CPU affinity and niceness for each BirdNET-Pi process
+- PipelineStatsStore: Runtime statistics snapshots published by the audio daemons
+- StageLatencies: Per-stage pipeline latency histograms
 - PulseAudioSetup: PulseAudio configuration utilities
 - ServiceStrategies: Service management strategies
 - SystemControlService: System service control (start/stop/restart)
@@ -16,6 +19,7 @@ This package contains system-level management components:
 from birdnetpi.system import structlog_configurator
 from birdnetpi.system.log_reader import LogReaderService
 from birdnetpi.system.path_resolver import PathResolver
+from birdnetpi.system.pipeline_stats import PipelineStatsStore, StageLatencies
 from birdnetpi.system.pulseaudio_setup import PulseAudioSetup
 from birdnetpi.system.service_strategies import ServiceManagementStrategy
 from birdnetpi.system.status import HealthStatus, SystemInspector
@@ -26,8 +30,10 @@ __all__ = [
     "HealthStatus",
     "LogReaderService",
     "PathResolver",
+    "PipelineStatsStore",
     "PulseAudioSetup",
     "ServiceManagementStrategy",
+    "StageLatencies",
     "SystemControlService",
     "SystemInspector",
     "SystemUtils",
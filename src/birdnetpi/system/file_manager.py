@@ -3,7 +3,7 @@ from pathlib import Path
 
 import soundfile as sf
 
-from birdnetpi.detections.models import AudioFile
+from birdnetpi.detections.models import AudioFile, ClipStatus
 from birdnetpi.system.path_resolver import PathResolver
 
 
@@ -92,13 +92,36 @@ class FileManager:
         # Write the audio file
         sf.write(str(full_path), audio_array, sample_rate, subtype="PCM_16")
 
+        return self.detection_audio_record(
+            relative_path, raw_audio_bytes, sample_rate, channels, ClipStatus.READY
+        )
+
+    @staticmethod
+    def detection_audio_record(
+        relative_path: Path,
+        raw_audio_bytes: bytes,
+        sample_rate: int,
+        channels: int,
+        clip_status: ClipStatus,
+    ) -> AudioFile:
+        """Return the in-memory AudioFile instance for a clip, without writing it.
+
+        Args:
+            relative_path: Path relative to recordings directory
+            raw_audio_bytes: Raw int16 audio data as bytes
+            sample_rate: Sample rate in Hz
+            channels: Number of audio channels
+            clip_status: Whether the clip is on disk yet
+
+        Returns:
+            AudioFile instance with path relative to recordings directory
+        """
         duration = len(raw_audio_bytes) / (
             sample_rate * channels * 2
         )  # 2 bytes per sample for int16
-        size_bytes = len(raw_audio_bytes)
-
         return AudioFile(
             file_path=relative_path,
             duration=duration,
-            size_bytes=size_bytes,
+            size_bytes=len(raw_audio_bytes),
+            clip_status=clip_status.value,
         )
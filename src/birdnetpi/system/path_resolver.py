@@ -72,17 +72,43 @@ class PathResolver:
         model_path = self.data_dir / "models" / model_filename
         return model_path
 
+    def get_species_occurrence_cache_dir(self) -> Path:
+        """Get the directory for cached metadata-model species occurrence scores."""
+        cache_dir = self.data_dir / "species_occurrence"
+        return cache_dir
+
+    def get_pipeline_stats_dir(self) -> Path:
+        """Get the directory where audio daemons publish runtime statistics."""
+        stats_dir = self.data_dir / "pipeline_stats"
+        return stats_dir
+
+    def get_detection_spool_path(self) -> Path:
+        """Get the path to the spool of detections awaiting delivery to the web API."""
+        return self.data_dir / "detection_spool.db"
+
+    def get_analyze_files_checkpoint_path(self) -> Path:
+        """Get the path to the record of recordings finished by offline analysis."""
+        return self.data_dir / "analyze_files_checkpoint.jsonl"
+
+    def get_inference_threads_cache_path(self) -> Path:
+        """Get the path to the cached interpreter thread counts per model and board."""
+        return self.data_dir / "inference_threads.json"
+
     def get_recordings_dir(self) -> Path:
         """Get the directory for audio recordings."""
         recordings_dir = self.data_dir / "recordings"
         return recordings_dir
 
-    def get_detection_audio_path(self, scientific_name: str, timestamp: datetime.datetime) -> Path:
+    def get_detection_audio_path(
+        self, scientific_name: str, timestamp: datetime.datetime, channel: int | None = None
+    ) -> Path:
         """Get the relative path for saving detection audio files.
 
         Args:
             scientific_name: The detected bird's scientific name
             timestamp: Timestamp of the detection (datetime object)
+            channel: Capture channel of the clip; windows of every channel share a
+                timestamp, so it keeps one bird heard on two microphones apart
 
         Returns:
             Path relative to recordings_dir for the detection audio file
@@ -91,10 +117,12 @@ class PathResolver:
         safe_name = scientific_name.replace(" ", "_")
 
         # Generate filename with timestamp including microseconds for uniqueness
-        filename = f"{timestamp.strftime('%Y%m%d_%H%M%S')}_{timestamp.microsecond:06d}.wav"
+        stem = f"{timestamp.strftime('%Y%m%d_%H%M%S')}_{timestamp.microsecond:06d}"
+        if channel is not None:
+            stem = f"{stem}_ch{channel}"
 
         # Return relative path from recordings_dir: safe_name/filename
-        return Path(safe_name) / filename
+        return Path(safe_name) / f"{stem}.wav"
 
     def get_database_dir(self) -> Path:
         """Get the directory for database files."""
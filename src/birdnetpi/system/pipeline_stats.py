@@ -0,0 +1,162 @@
+"""Runtime statistics published by the audio daemons for the health API.
+
+The capture and analysis daemons run in their own processes. Each one
+periodically writes a JSON snapshot of its counters into the pipeline stats
+directory, and the web process reads the latest snapshots on request. Files are
+replaced atomically, so a reader never sees a partially written snapshot.
+
+Stage timings along the path from microphone to database are kept in
+StageLatencies histograms in whichever process runs the stage, and published
+with that process's counters.
+"""
+
+import json
+import logging
+import math
+import os
+import time
+from typing import Any
+
+from birdnetpi.system.path_resolver import PathResolver
+
+logger = logging.getLogger(__name__)
+
+STALE_AFTER_SECONDS = 30.0  # Snapshots older than this come from a stopped or hung daemon
+LATENCY_INTERVAL_SECONDS = 60.0  # Stage histograms are logged and restarted this often
+
+_BUCKETS_PER_DECADE = 20  # Bucket bounds step by ~12%, the precision of reported percentiles
+_BUCKET_FLOOR_SECONDS = 1e-6
+_BUCKET_COUNT = 9 * _BUCKETS_PER_DECADE  # 1 us to 1000 s
+
+
+class PipelineStatsStore:
+    """Read and write per-component pipeline statistics snapshots."""
+
+    def __init__(self, path_resolver: PathResolver) -> None:
+        """Initialize the store.
+
+        Args:
+            path_resolver: PathResolver instance for path resolution
+        """
+        self.stats_dir = path_resolver.get_pipeline_stats_dir()
+
+    def write(self, component: str, stats: dict[str, Any]) -> None:
+        """Atomically replace the snapshot for a component.
+
+        Failures are logged rather than raised; statistics must never take a
+        daemon down.
+
+        Args:
+            component: Component name, e.g. "capture"
+            stats: JSON-serializable counters
+        """
+        snapshot = {"updated_at": time.time(), **stats}
+        path = self.stats_dir / f"{component}.json"
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.stats_dir.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps(snapshot))
+            temp_path.replace(path)  # Atomic on POSIX
+        except OSError as e:
+            logger.warning("Could not publish %s pipeline stats: %s", component, e)
+
+    def read_all(self) -> dict[str, dict[str, Any]]:
+        """Read every component's latest snapshot.
+
+        Each snapshot gains ``age_seconds`` and a ``stale`` flag so callers can
+        tell live counters from those left behind by a stopped daemon.
+
+        Returns:
+            Snapshots keyed by component name
+        """
+        snapshots: dict[str, dict[str, Any]] = {}
+        if not self.stats_dir.exists():
+            return snapshots
+        now = time.time()
+        for path in sorted(self.stats_dir.glob("*.json")):
+            try:
+                snapshot = json.loads(path.read_text())
+            except (json.JSONDecodeError, OSError):
+                continue
+            age = max(now - snapshot.get("updated_at", 0.0), 0.0)
+            snapshot["age_seconds"] = round(age, 1)
+            snapshot["stale"] = age > STALE_AFTER_SECONDS
+            snapshots[path.stem] = snapshot
+        return snapshots
+
+
+class StageLatencies:
+    """Histograms of how long each pipeline stage takes, per reporting interval.
+
+    Buckets are logarithmic and fixed, so recording is a constant-time increment
+    that is cheap enough for the capture callback, memory does not grow with
+    traffic, and percentiles are accurate to one bucket width. Recording takes no
+    lock; a sample racing a reset on another thread is simply lost.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty histograms."""
+        self._counts: dict[str, list[int]] = {}
+        self._max_seconds: dict[str, float] = {}
+        self.interval_started = time.monotonic()
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Count one timing for a stage.
+
+        Args:
+            stage: Stage name, e.g. "inference"
+            seconds: How long the stage took
+        """
+        counts = self._counts.get(stage)
+        if counts is None:
+            counts = self._counts[stage] = [0] * _BUCKET_COUNT
+        if seconds > _BUCKET_FLOOR_SECONDS:
+            bucket = int(math.log10(seconds / _BUCKET_FLOOR_SECONDS) * _BUCKETS_PER_DECADE)
+            counts[min(bucket, _BUCKET_COUNT - 1)] += 1
+        else:
+            counts[0] += 1
+        if seconds > self._max_seconds.get(stage, 0.0):
+            self._max_seconds[stage] = seconds
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Return count, p50, p95, p99 and max (in ms) per stage for the interval."""
+        snapshot: dict[str, dict[str, float]] = {}
+        for stage, counts in self._counts.items():
+            total = sum(counts)
+            if not total:
+                continue
+            max_ms = self._max_seconds.get(stage, 0.0) * 1000.0
+            summary: dict[str, float] = {"count": total}
+            for name, quantile in (("p50_ms", 0.50), ("p95_ms", 0.95), ("p99_ms", 0.99)):
+                summary[name] = round(min(self._bucket_upper_ms(counts, quantile), max_ms), 3)
+            summary["max_ms"] = round(max_ms, 3)
+            snapshot[stage] = summary
+        return snapshot
+
+    @staticmethod
+    def _bucket_upper_ms(counts: list[int], quantile: float) -> float:
+        """Return the upper bound, in ms, of the bucket holding the quantile."""
+        rank = quantile * sum(counts)
+        cumulative = 0
+        holding = _BUCKET_COUNT - 1
+        for bucket, count in enumerate(counts):
+            cumulative += count
+            if count and cumulative >= rank:
+                holding = bucket
+                break
+        return _BUCKET_FLOOR_SECONDS * 10 ** ((holding + 1) / _BUCKETS_PER_DECADE) * 1000.0
+
+    def roll(self, component: str) -> None:
+        """Log the interval's percentiles and start a new interval, once one is due.
+
+        Args:
+            component: Process the stages belong to, for the log line
+        """
+        if time.monotonic() - self.interval_started < LATENCY_INTERVAL_SECONDS:
+            return
+        stages = self.snapshot()
+        if stages:
+            logger.info("Pipeline stage latency", extra={"component": component, "stages": stages})
+        self._counts.clear()
+        self._max_seconds.clear()
+        self.interval_started = time.monotonic()
@@ -0,0 +1,77 @@
+"""CPU affinity and scheduling niceness for the BirdNET-Pi processes.
+
+Capture, analysis, the audio websocket and the web app all run on the same few
+cores. Left to the scheduler, a burst of web analytics can land on the core
+serving the PortAudio callback or an interpreter invoke. Each process can
+instead be confined to its own CPUs and given a niceness from the audio
+pipeline configuration.
+
+Affinity and niceness are per-thread on Linux and inherited by threads created
+afterwards, so each process applies its placement first thing at startup, before
+it starts any threads.
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def parse_cpu_list(spec: str) -> set[int]:
+    """Parse a CPU list in the kernel's cpuset format.
+
+    Args:
+        spec: Comma-separated CPUs and inclusive ranges, e.g. "0" or "0,2-3"
+
+    Returns:
+        The CPU numbers, empty for an empty spec
+
+    Raises:
+        ValueError: If the spec is malformed
+    """
+    cpus: set[int] = set()
+    for part in filter(None, (part.strip() for part in spec.split(","))):
+        first, _, last = part.partition("-")
+        start = int(first)
+        end = int(last) if last else start
+        if start < 0 or end < start:
+            raise ValueError(f"Invalid CPU range {part!r} in {spec!r}")
+        cpus.update(range(start, end + 1))
+    return cpus
+
+
+def apply_process_placement(process: str, cpus: str, nice: int) -> None:
+    """Pin the calling process to CPUs and set its niceness.
+
+    Failures are logged rather than raised: a process that cannot be placed as
+    configured still runs, just without the isolation.
+
+    Args:
+        process: Name used in log messages, e.g. "capture"
+        cpus: CPU list in cpuset format (empty = leave affinity alone)
+        nice: Niceness from -20 (highest priority) to 19 (0 = leave it alone);
+            negative values need CAP_SYS_NICE
+    """
+    if cpus:
+        try:
+            cpu_set = parse_cpu_list(cpus)
+            os.sched_setaffinity(0, cpu_set)
+            logger.info("Pinned %s to CPUs %s", process, sorted(cpu_set))
+        except AttributeError:
+            logger.warning("CPU affinity is not supported on this platform; ignoring %s", cpus)
+        except (ValueError, OSError) as e:
+            logger.error("Could not pin %s to CPUs %r: %s", process, cpus, e)
+    if nice:
+        try:
+            os.setpriority(os.PRIO_PROCESS, 0, nice)
+            logger.info("Set %s niceness to %d", process, nice)
+        except OSError as e:
+            logger.error("Could not set %s niceness to %d: %s", process, nice, e)
+
+
+def available_cpu_count() -> int:
+    """Return how many CPUs the calling process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
@@ -7,10 +7,12 @@ from jinja2 import StrictUndefined
 from birdnetpi.analytics.analytics import AnalyticsManager
 from birdnetpi.analytics.presentation import PresentationManager
 from birdnetpi.audio.websocket import AudioWebSocketService
+from birdnetpi.config import BirdNETConfig
 from birdnetpi.database.core import CoreDatabaseService
 from birdnetpi.database.ebird import EBirdRegionService
 from birdnetpi.database.species import SpeciesDatabaseService
 from birdnetpi.detections.cleanup import DetectionCleanupService
+from birdnetpi.detections.clip_writer import ClipWriter
 from birdnetpi.detections.manager import DataManager
 from birdnetpi.detections.queries import DetectionQueryService
 from birdnetpi.i18n.translation_manager import TranslationManager
@@ -46,6 +48,18 @@ def create_jinja2_templates(resolver: PathResolver) -> Jinja2Templates:
     return templates
 
 
+def create_clip_writer(
+    config: BirdNETConfig, database_service: CoreDatabaseService, path_resolver: PathResolver
+) -> ClipWriter | None:
+    """Create the background clip writer, or None if clips are written inline."""
+    pipeline = config.audio_pipeline
+    if pipeline.clip_write_queue <= 0:
+        return None
+    return ClipWriter(
+        database_service, path_resolver, pipeline.clip_write_queue, pipeline.clip_fsync_interval
+    )
+
+
 class Container(containers.DeclarativeContainer):
     """Application dependency injection container.
 
@@ -148,6 +162,14 @@ class Container(containers.DeclarativeContainer):
         path_resolver=path_resolver,
     )
 
+    # Detection clip writer thread - singleton, None when clips are written inline
+    clip_writer = providers.Singleton(
+        create_clip_writer,
+        config=config,
+        database_service=core_database,
+        path_resolver=path_resolver,
+    )
+
     # Data Manager - single source of truth for detection data access and event emission
     data_manager = providers.Singleton(
         DataManager,
@@ -157,6 +179,7 @@ class Container(containers.DeclarativeContainer):
         file_manager=file_manager,
         path_resolver=path_resolver,
         detection_query_service=detection_query_service,
+        clip_writer=clip_writer,
     )
 
     # Detection cleanup service for eBird filtering - singleton
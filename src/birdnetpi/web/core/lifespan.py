@@ -8,6 +8,7 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+from birdnetpi.system.process_placement import apply_process_placement
 from birdnetpi.web.core.container import Container
 
 logger = logging.getLogger(__name__)
@@ -34,6 +35,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Get config (structlog is already configured in main.py)
     config = container.config()
+    apply_process_placement("web", config.audio_pipeline.web_cpus, config.audio_pipeline.web_nice)
 
     # Initialize file resolver and mount static files
     path_resolver = container.path_resolver()
@@ -89,6 +91,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await database_service.initialize()
         logger.info("Database initialized successfully")
 
+        # Start the clip writer once the audio_files table exists
+        clip_writer = container.clip_writer()
+        if clip_writer is not None:
+            await clip_writer.start()
+
         # Skip audio services - handled by standalone audio_websocket_daemon for better reliability
 
         # Start field mode services
@@ -116,6 +123,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             await container.gps_service().stop()
             # Skip audio services - handled by standalone audio_websocket_daemon
 
+            # Finish writing queued clips before the process exits
+            clip_writer = container.clip_writer()
+            if clip_writer is not None:
+                await clip_writer.stop()
+
             logger.info("All services stopped successfully")
 
         except Exception as e:
@@ -1,6 +1,7 @@
 """Detection-related API contract models."""
 
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_serializer
@@ -24,9 +25,15 @@ class DetectionEvent(BaseModel):
     timestamp: datetime
 
     # Audio data
-    audio_data: str  # Base64-encoded audio bytes
+    audio_data: str = ""  # Base64-encoded audio bytes (empty when sent as a binary frame)
     sample_rate: int
     channels: int
+    # Capture channel (0-based) the clip was taken from; None from single-channel senders
+    channel: int | None = None
+    # Stream position of the detection's last window: absolute sample index and the
+    # time.monotonic_ns() its last sample was captured, for end-to-end latency at commit
+    sample_index: int | None = None
+    captured_ns: int | None = None
 
     # Optional fields
     spectrogram_path: str | None = None
@@ -131,6 +138,34 @@ class DetectionCreatedResponse(BaseModel):
     detection_id: UUID | None = Field(..., description="ID of created detection (None if filtered)")
 
 
+class DetectionBatchItemResult(BaseModel):
+    """Outcome for one event of a batch detection request."""
+
+    status: Literal["created", "duplicate", "filtered", "invalid"] = Field(
+        ...,
+        description=(
+            "created, duplicate (ID already recorded), filtered (eBird), or invalid "
+            "(not a valid detection event)"
+        ),
+    )
+    detection_id: UUID | None = Field(..., description="ID of the stored detection, if any")
+    message: str | None = Field(
+        default=None, description="Reason the event was filtered or is invalid"
+    )
+
+
+class DetectionBatchResponse(BaseModel):
+    """Response after creating a batch of detections."""
+
+    created: int = Field(..., description="Detections stored by this request")
+    duplicates: int = Field(..., description="Events whose ID was already recorded")
+    filtered: int = Field(..., description="Events blocked by eBird filtering")
+    invalid: int = Field(..., description="Events that are not valid detection events")
+    results: list[DetectionBatchItemResult] = Field(
+        ..., description="One result per submitted event, in request order"
+    )
+
+
 class RecentDetectionsResponse(BaseModel):
     """Response for recent detections endpoint."""
 
@@ -46,3 +46,13 @@ class DetailedHealthResponse(BaseModel):
     components: dict[str, ComponentHealth] = Field(
         ..., description="Health status of each component"
     )
+
+
+class PipelineHealthResponse(BaseModel):
+    """Response for the audio pipeline health endpoint."""
+
+    status: str = Field(..., description="Pipeline status (healthy/degraded/unknown)")
+    timestamp: str = Field(..., description="ISO timestamp of health check")
+    components: dict[str, dict[str, Any]] = Field(
+        ..., description="Latest counters published by each audio daemon"
+    )
@@ -10,14 +10,16 @@ from uuid import UUID
 import h3
 import pytz
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, status
 from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import ValidationError
 
 from birdnetpi.analytics.presentation import PresentationManager
 from birdnetpi.config import BirdNETConfig
 from birdnetpi.database.core import CoreDatabaseService
 from birdnetpi.database.ebird import EBirdRegionService
 from birdnetpi.detections.cleanup import DetectionCleanupService
+from birdnetpi.detections.frame import DETECTION_FRAME_CONTENT_TYPE, decode_detection_frame
 from birdnetpi.detections.manager import DataManager
 from birdnetpi.detections.models import Detection
 from birdnetpi.detections.queries import DetectionQueryService
@@ -35,6 +37,8 @@ from birdnetpi.web.models.admin import (
 from birdnetpi.web.models.detections import (
     BestRecordingsFilters,
     BestRecordingsResponse,
+    DetectionBatchItemResult,
+    DetectionBatchResponse,
     DetectionCountResponse,
     DetectionCreatedResponse,
     DetectionDetailResponse,
@@ -61,6 +65,8 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/detections")
 
+MAX_DETECTION_BATCH = 1000  # Events accepted by one POST /detections/batch
+
 # Track if cache invalidation handler is registered
 _paginated_cache_handler_registered = False
 
@@ -101,58 +107,190 @@ async def create_detection(
     DataManager handles both audio file saving and database persistence.
     eBird filtering can optionally filter or warn about detections based on regional confidence.
     """
+    return await _record_detection(
+        data_manager, core_database, ebird_service, registry_service, config, detection_event
+    )
+
+
+@router.post(
+    "/binary", status_code=status.HTTP_201_CREATED, response_model=DetectionCreatedResponse
+)
+@inject
+async def create_detection_from_frame(
+    request: Request,
+    data_manager: Annotated[DataManager, Depends(Provide[Container.data_manager])],
+    core_database: Annotated[CoreDatabaseService, Depends(Provide[Container.core_database])],
+    ebird_service: Annotated[EBirdRegionService, Depends(Provide[Container.ebird_region_service])],
+    registry_service: Annotated[RegistryService, Depends(Provide[Container.registry_service])],
+    config: Annotated[BirdNETConfig, Depends(Provide[Container.config])],
+) -> DetectionCreatedResponse:
+    """Receive a detection as a binary frame of JSON metadata followed by raw PCM.
+
+    Same fields and handling as ``POST /``, without base64-encoding the clip.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type != DETECTION_FRAME_CONTENT_TYPE:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Expected {DETECTION_FRAME_CONTENT_TYPE}",
+        )
+    try:
+        metadata, audio_bytes = decode_detection_frame(await request.body())
+        detection_event = DetectionEvent.model_validate_json(metadata)
+    except ValueError as e:  # Includes pydantic.ValidationError
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"Invalid detection frame: {e}"
+        ) from e
+    return await _record_detection(
+        data_manager,
+        core_database,
+        ebird_service,
+        registry_service,
+        config,
+        detection_event,
+        audio_bytes,
+    )
+
+
+@router.post("/batch", status_code=status.HTTP_201_CREATED, response_model=DetectionBatchResponse)
+@inject
+async def create_detections_batch(
+    data_manager: Annotated[DataManager, Depends(Provide[Container.data_manager])],
+    core_database: Annotated[CoreDatabaseService, Depends(Provide[Container.core_database])],
+    ebird_service: Annotated[EBirdRegionService, Depends(Provide[Container.ebird_region_service])],
+    registry_service: Annotated[RegistryService, Depends(Provide[Container.registry_service])],
+    config: Annotated[BirdNETConfig, Depends(Provide[Container.config])],
+    payload: Annotated[list[Any], Body()],
+) -> DetectionBatchResponse:
+    """Receive many detection events and record them in a single transaction.
+
+    Each event gets the same handling as ``POST /``: events whose ID is already
+    recorded are acknowledged as duplicates and eBird filtering is applied per
+    event. Events are validated one by one, so a malformed event is reported as
+    invalid without failing the rest. Clips are written concurrently and every
+    remaining detection is committed at once, so replaying a spool or importing a
+    re-analysis costs one request and one commit instead of one of each per
+    detection.
+    """
+    if len(payload) > MAX_DETECTION_BATCH:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {MAX_DETECTION_BATCH} detections per batch",
+        )
+    logger.info("Received detection batch of %d events", len(payload))
+
+    results: list[DetectionBatchItemResult | None] = [None] * len(payload)
+    detection_events = _validate_batch_events(payload, results)
+    client_ids = [event.id for event in detection_events.values() if event.id is not None]
+    recorded = await data_manager.get_existing_detection_ids(client_ids)
+
+    to_create: list[int] = []
+    block_reasons: dict[tuple[str, float | None, float | None], str | None] = {}
+    for index, event in detection_events.items():
+        if event.id is not None and event.id in recorded:
+            results[index] = DetectionBatchItemResult(status="duplicate", detection_id=event.id)
+            continue
+        # Imports repeat the same species at the same site; filter each pair once
+        key = (event.scientific_name, event.latitude, event.longitude)
+        if key not in block_reasons:
+            block_reasons[key] = await _ebird_block_reason(
+                core_database, ebird_service, registry_service, config, event
+            )
+        if block_reasons[key] is not None:
+            results[index] = DetectionBatchItemResult(
+                status="filtered", detection_id=None, message=block_reasons[key]
+            )
+            continue
+        if event.id is not None:
+            recorded.add(event.id)  # A repeat later in the same batch is a duplicate
+        to_create.append(index)
+
+    created: list[Detection] = []
+    if to_create:
+        try:
+            created = await data_manager.create_detections(
+                [(detection_events[index], None) for index in to_create]
+            )
+        except Exception as e:
+            logger.error("Failed to create detection batch: %s\n%s", e, traceback.format_exc())
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to create detection batch: {e!s}",
+            ) from e
+    for index, detection in zip(to_create, created, strict=True):
+        results[index] = DetectionBatchItemResult(status="created", detection_id=detection.id)
+
+    items = [result for result in results if result is not None]
+    return DetectionBatchResponse(
+        created=len(created),
+        duplicates=sum(1 for item in items if item.status == "duplicate"),
+        filtered=sum(1 for item in items if item.status == "filtered"),
+        invalid=sum(1 for item in items if item.status == "invalid"),
+        results=items,
+    )
+
+
+def _validate_batch_events(
+    payload: list[Any], results: list[DetectionBatchItemResult | None]
+) -> dict[int, DetectionEvent]:
+    """Validate each event of a batch on its own, recording invalid ones in results.
+
+    Returns:
+        The valid detection events, keyed by their position in the batch
+    """
+    detection_events: dict[int, DetectionEvent] = {}
+    for index, item in enumerate(payload):
+        try:
+            detection_events[index] = DetectionEvent.model_validate(item)
+        except ValidationError as e:
+            logger.warning("Invalid event %d in detection batch: %s", index, e)
+            results[index] = DetectionBatchItemResult(
+                status="invalid", detection_id=None, message=str(e)
+            )
+    return detection_events
+
+
+async def _record_detection(
+    data_manager: DataManager,
+    core_database: CoreDatabaseService,
+    ebird_service: EBirdRegionService,
+    registry_service: RegistryService,
+    config: BirdNETConfig,
+    detection_event: DetectionEvent,
+    audio_bytes: bytes | None = None,
+) -> DetectionCreatedResponse:
+    """Apply eBird filtering to a received detection and persist it.
+
+    A detection whose client-generated ID is already stored is acknowledged without
+    being recorded again, so senders can safely retry.
+    """
     logger.info(
         "Received detection: %s with confidence %s",
         detection_event.species_tensor or "Unknown",
         detection_event.confidence,
     )
 
-    # Apply eBird filtering if enabled (detection-time filtering)
-    if (
-        config.ebird_filtering.enabled
-        and config.ebird_filtering.detection_mode != "off"
-        and detection_event.latitude is not None
-        and detection_event.longitude is not None
-    ):
-        try:
-            should_filter, reason = await _apply_ebird_filter(
-                core_database=core_database,
-                ebird_service=ebird_service,
-                registry_service=registry_service,
-                config=config,
-                scientific_name=detection_event.scientific_name,
-                latitude=detection_event.latitude,
-                longitude=detection_event.longitude,
+    if detection_event.id is not None:
+        existing = await data_manager.get_detection_by_id(detection_event.id)
+        if existing is not None:
+            return DetectionCreatedResponse(
+                message="Detection already recorded", detection_id=existing.id
             )
 
-            if should_filter:
-                if config.ebird_filtering.detection_mode == "warn":
-                    # Warn mode: Log but allow detection
-                    logger.warning(
-                        "eBird filter would block %s: %s",
-                        detection_event.species_tensor,
-                        reason,
-                    )
-                elif config.ebird_filtering.detection_mode == "filter":
-                    # Filter mode: Block detection
-                    logger.info(
-                        "eBird filter blocked %s: %s",
-                        detection_event.species_tensor,
-                        reason,
-                    )
-                    return DetectionCreatedResponse(
-                        message=f"Detection filtered: {reason}",
-                        detection_id=None,
-                    )
-        except Exception as e:
-            # Don't fail detection creation if eBird filtering fails
-            logger.error("eBird filtering error (allowing detection): %s", e)
+    reason = await _ebird_block_reason(
+        core_database, ebird_service, registry_service, config, detection_event
+    )
+    if reason is not None:
+        return DetectionCreatedResponse(
+            message=f"Detection filtered: {reason}",
+            detection_id=None,
+        )
 
     # Create detection - DataManager handles audio saving and database persistence
     # Store the raw data from BirdNET as-is
     # The @emit_detection_event decorator on create_detection handles event emission
     try:
-        saved_detection = await data_manager.create_detection(detection_event)
+        saved_detection = await data_manager.create_detection(detection_event, audio_bytes)
         return DetectionCreatedResponse(
             message="Detection received and dispatched", detection_id=saved_detection.id
         )
@@ -164,6 +302,54 @@ async def create_detection(
         ) from e
 
 
+async def _ebird_block_reason(
+    core_database: CoreDatabaseService,
+    ebird_service: EBirdRegionService,
+    registry_service: RegistryService,
+    config: BirdNETConfig,
+    detection_event: DetectionEvent,
+) -> str | None:
+    """Apply detection-time eBird filtering to a detection.
+
+    Returns:
+        Why the detection should be blocked, or None if it should be recorded
+    """
+    if not (
+        config.ebird_filtering.enabled
+        and config.ebird_filtering.detection_mode != "off"
+        and detection_event.latitude is not None
+        and detection_event.longitude is not None
+    ):
+        return None
+
+    try:
+        should_filter, reason = await _apply_ebird_filter(
+            core_database=core_database,
+            ebird_service=ebird_service,
+            registry_service=registry_service,
+            config=config,
+            scientific_name=detection_event.scientific_name,
+            latitude=detection_event.latitude,
+            longitude=detection_event.longitude,
+        )
+    except Exception as e:
+        # Don't fail detection creation if eBird filtering fails
+        logger.error("eBird filtering error (allowing detection): %s", e)
+        return None
+
+    if not should_filter:
+        return None
+    if config.ebird_filtering.detection_mode == "warn":
+        # Warn mode: Log but allow detection
+        logger.warning("eBird filter would block %s: %s", detection_event.species_tensor, reason)
+        return None
+    if config.ebird_filtering.detection_mode == "filter":
+        # Filter mode: Block detection
+        logger.info("eBird filter blocked %s: %s", detection_event.species_tensor, reason)
+        return reason
+    return None
+
+
 def _check_strictness(confidence_tier: str, strictness: str) -> tuple[bool, str]:
     """Check if a species should be blocked based on strictness level.
 
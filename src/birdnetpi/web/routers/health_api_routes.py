@@ -11,7 +11,8 @@ from fastapi import APIRouter, Depends, Response
 from sqlalchemy import text
 
 from birdnetpi.database.core import CoreDatabaseService
-from birdnetpi.system import PathResolver
+from birdnetpi.detections.manager import DataManager
+from birdnetpi.system import PathResolver, PipelineStatsStore
 from birdnetpi.utils.cache.cache import Cache
 from birdnetpi.web.core.container import Container
 from birdnetpi.web.models.health import (
@@ -19,6 +20,7 @@ from birdnetpi.web.models.health import (
     DetailedHealthResponse,
     HealthCheckResponse,
     LivenessProbeResponse,
+    PipelineHealthResponse,
     ReadinessProbeResponse,
 )
 
@@ -189,3 +191,41 @@ async def detailed_health_check(
         service="birdnet-pi",
         components=components,
     )
+
+
+@router.get("/pipeline", status_code=200, response_model=PipelineHealthResponse)
+@inject
+async def pipeline_health_check(
+    path_resolver: Annotated[PathResolver, Depends(Provide[Container.path_resolver])],
+    data_manager: Annotated[DataManager, Depends(Provide[Container.data_manager])],
+    response: Response,
+) -> PipelineHealthResponse:
+    """Report the audio pipeline counters published by the capture and analysis daemons.
+
+    Capture counters include realtime callback duration, PortAudio overflow and
+    underflow flags, frames dropped before filtering and worker lag. Each
+    component's "latency" holds p50/p95/p99 stage timings; the web process's own
+    database commit timings appear as the "ingest" component once detections arrive.
+
+    Returns:
+        Latest snapshot per daemon; degraded if any snapshot is stale.
+    """
+    components = PipelineStatsStore(path_resolver).read_all()
+
+    if not components:
+        overall_status = "unknown"
+    elif any(snapshot["stale"] for snapshot in components.values()):
+        overall_status = "degraded"
+        response.status_code = 503
+    else:
+        overall_status = "healthy"
+
+    ingest_latency = data_manager.stage_latencies.snapshot()
+    if ingest_latency:
+        components["ingest"] = {"latency": ingest_latency, "age_seconds": 0.0, "stale": False}
+
+    return PipelineHealthResponse(
+        status=overall_status,
+        timestamp=datetime.utcnow().isoformat() + "Z",
+        components=components,
+    )
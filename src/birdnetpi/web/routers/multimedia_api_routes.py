@@ -1,16 +1,21 @@
 """Multimedia API routes for serving audio and image files."""
 
+import asyncio
+import io
 import logging
 from typing import Annotated
 from uuid import UUID
 
+import soundfile as sf
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse, Response
 from sqlalchemy import select
 
+from birdnetpi.audio.audio_history import read_recent_audio
+from birdnetpi.config import BirdNETConfig
 from birdnetpi.database.core import CoreDatabaseService
-from birdnetpi.detections.models import AudioFile
+from birdnetpi.detections.models import AudioFile, ClipStatus
 from birdnetpi.system.path_resolver import PathResolver
 from birdnetpi.web.core.container import Container
 
@@ -18,6 +23,59 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _encode_recent_audio(seconds: float, channel: int) -> bytes:
+    """Copy the newest audio out of the history and encode it as 16-bit WAV."""
+    samples, sample_rate = read_recent_audio(seconds, channel)
+    buffer = io.BytesIO()
+    sf.write(buffer, samples, sample_rate, format="WAV", subtype="PCM_16")
+    return buffer.getvalue()
+
+
+@router.get("/audio/recent")
+@inject
+async def get_recent_audio(
+    config: Annotated[BirdNETConfig, Depends(Provide[Container.config])],
+    seconds: float = Query(60.0, gt=0, le=3600, description="Seconds of audio to return"),
+    channel: int = Query(0, ge=0, description="Capture channel"),
+) -> Response:
+    """Serve the newest audio from the analysis daemon's rolling history as WAV.
+
+    Reading and encoding run in a worker thread so a long request does not
+    stall the event loop.
+
+    Args:
+        config: Station configuration, for the history's length
+        seconds: Audio wanted; capped at the configured history length
+        channel: Capture channel to return
+
+    Returns:
+        Response with the audio as 16-bit WAV
+
+    Raises:
+        HTTPException: If no history is kept or the channel is not captured
+    """
+    history_seconds = config.audio_pipeline.audio_history_seconds
+    try:
+        if history_seconds <= 0:
+            raise FileNotFoundError("audio_history_seconds is 0")
+        content = await asyncio.to_thread(
+            _encode_recent_audio, min(seconds, history_seconds), channel
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Audio history is not enabled in the analysis service",
+        ) from e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    return Response(
+        content=content,
+        media_type="audio/wav",
+        headers={"Cache-Control": "no-store"},
+    )
+
+
 @router.get("/audio/{audio_file_id}")
 @inject
 async def get_audio_file(
@@ -38,7 +96,7 @@ async def get_audio_file(
         FileResponse with the WAV audio file
 
     Raises:
-        HTTPException: If audio file not found or missing on disk
+        HTTPException: If audio file not found, missing on disk or not written yet
     """
     try:
         async with core_database.get_async_db() as session:
@@ -60,6 +118,12 @@ async def get_audio_file(
                 audio_path = path_resolver.get_recordings_dir() / audio_path
 
             # Check if file exists on disk
+            if not audio_path.exists() and audio_file.clip_status == ClipStatus.PENDING:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Audio file is still being written",
+                    headers={"Retry-After": "1"},
+                )
             if not audio_path.exists():
                 logger.warning("Audio file not found on disk: %s", audio_path)
                 raise HTTPException(
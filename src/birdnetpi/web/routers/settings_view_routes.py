@@ -212,6 +212,7 @@ async def post_settings_view(
         # System fields (always preserved)
         config_version=current_config.config_version,
         logging=current_config.logging,
+        audio_pipeline=current_config.audio_pipeline,
         # Basic Settings (always from form)
         site_name=site_name,
         latitude=latitude,
@@ -219,6 +220,7 @@ async def post_settings_view(
         model=model,
         metadata_model=metadata_model,
         species_confidence_threshold=species_confidence_threshold,
+        species_occurrence_threshold=current_config.species_occurrence_threshold,
         sensitivity_setting=sensitivity,
         audio_device_index=audio_device_index,
         sample_rate=sample_rate,
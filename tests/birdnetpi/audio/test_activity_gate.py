@@ -0,0 +1,84 @@
+"""Tests for the pre-inference acoustic activity gate."""
+
+import numpy as np
+import pytest
+
+from birdnetpi.audio.activity_gate import ActivityGate
+
+SAMPLE_RATE = 48000
+WINDOW = 3 * SAMPLE_RATE
+
+
+@pytest.fixture
+def rng():
+    """Provide a seeded generator so noise windows are reproducible."""
+    return np.random.default_rng(7)
+
+
+def noise(rng, level):
+    """Return a window of white noise with the given standard deviation."""
+    return (rng.standard_normal(WINDOW) * level).astype(np.float32)
+
+
+def with_call(window, amplitude, frequency=4000.0, seconds=0.1):
+    """Return a copy of the window with a short tonal call mixed in."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    call = amplitude * np.sin(2 * np.pi * frequency * t) * np.hanning(len(t))
+    mixed = window.copy()
+    mixed[SAMPLE_RATE : SAMPLE_RATE + len(call)] += call.astype(np.float32)
+    return mixed
+
+
+class TestActivityGate:
+    """Test ActivityGate features and decisions."""
+
+    def test_skips_steady_background(self, rng):
+        """Should analyze the first window and skip steady noise after it."""
+        gate = ActivityGate(SAMPLE_RATE)
+
+        decisions = [gate.admit(noise(rng, 0.003)) for _ in range(10)]
+
+        assert decisions[0] is True
+        assert not any(decisions[1:])
+        assert gate.stats()["skipped_fraction"] == 0.9
+
+    def test_admits_call_above_noise_floor(self, rng):
+        """Should admit a short call well above the noise floor, plus one hangover window."""
+        gate = ActivityGate(SAMPLE_RATE)
+        for _ in range(5):
+            gate.admit(noise(rng, 0.003))
+
+        assert gate.admit(with_call(noise(rng, 0.003), amplitude=0.05)) is True
+        assert gate.admit(noise(rng, 0.003)) is True
+        assert gate.admit(noise(rng, 0.003)) is False
+
+    def test_ignores_out_of_band_energy(self, rng):
+        """Should not treat loud low-frequency sound as activity."""
+        gate = ActivityGate(SAMPLE_RATE)
+        for _ in range(5):
+            gate.admit(noise(rng, 0.003))
+
+        hum = with_call(noise(rng, 0.003), amplitude=0.5, frequency=200.0, seconds=1.0)
+
+        assert gate.admit(hum) is False
+
+    def test_noise_floor_adapts_to_sustained_noise(self, rng):
+        """Should absorb a lasting rise in background noise, such as rain, into the floor."""
+        gate = ActivityGate(SAMPLE_RATE)
+        for _ in range(5):
+            gate.admit(noise(rng, 0.003))
+
+        decisions = [gate.admit(noise(rng, 0.03)) for _ in range(400)]
+
+        assert decisions[0] is True
+        # Once adapted, only occasional noise fluctuations are let through
+        assert sum(decisions[-100:]) <= 5
+
+    def test_measure_reports_louder_band_level(self, rng):
+        """Should report a higher band level for a louder window."""
+        gate = ActivityGate(SAMPLE_RATE)
+
+        quiet_level, _ = gate.measure(noise(rng, 0.001))
+        loud_level, _ = gate.measure(noise(rng, 0.01))
+
+        assert loud_level - quiet_level == pytest.approx(20.0, abs=1.0)
@@ -1,22 +1,27 @@
 import asyncio
 import logging
-import threading
 import time
-from datetime import datetime
+import uuid
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, create_autospec, patch
 
 import httpx
 import numpy as np
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from birdnetpi.audio.activity_gate import ActivityGate
 from birdnetpi.audio.analysis import AudioAnalysisManager
+from birdnetpi.audio.audio_history import AudioHistory
+from birdnetpi.audio.detection_merger import DetectionMerger
+from birdnetpi.audio.ring_buffer import WindowStamp
 from birdnetpi.database.species import SpeciesDatabaseService
 from birdnetpi.detections.birdnet import BirdDetectionService
 from birdnetpi.detections.models import AudioFile
 from birdnetpi.species.parser import SpeciesComponents, SpeciesParser
 from birdnetpi.system.file_manager import FileManager
+from birdnetpi.system.pipeline_stats import PipelineStatsStore
 
 
 @pytest.fixture
@@ -106,7 +111,7 @@ def audio_analysis_service(
         test_config,
         mock_species_database,
         mock_session,
-        detection_buffer_max_size=100,
+        spool_max_detections=100,
         buffer_flush_interval=0.1,
     )
     service.analysis_client = mock_analysis_client
@@ -170,8 +175,7 @@ class TestAudioAnalysisManager:
         assert audio_analysis_service.config == test_config
         assert hasattr(audio_analysis_service, "analysis_client")
         assert hasattr(audio_analysis_service, "audio_buffer")
-        assert hasattr(audio_analysis_service, "detection_buffer")
-        assert hasattr(audio_analysis_service, "buffer_lock")
+        assert hasattr(audio_analysis_service, "detection_spool")
         assert audio_analysis_service._flush_task is None
 
     @pytest.mark.asyncio
@@ -199,8 +203,488 @@ class TestAudioAnalysisManager:
         chunks_needed = test_audio_data["buffer_size_samples"] // chunk_size + 1
         for _ in range(chunks_needed):
             await audio_analysis_service.process_audio_chunk(audio_chunk)
+        await audio_analysis_service.wait_for_analysis()
         assert mock_analyze_audio_chunk.call_count >= 1
 
+    @pytest.mark.asyncio
+    @patch(
+        "birdnetpi.audio.analysis.AudioAnalysisManager._analyze_audio_chunk", new_callable=AsyncMock
+    )
+    async def test_process_audio_chunk_windows_advance_by_hop(
+        self, mock_analyze_audio_chunk, audio_analysis_service, test_audio_data
+    ):
+        """Should analyze overlapping windows that advance by window size minus overlap."""
+        window_size = audio_analysis_service.buffer_size_samples
+        hop_size = audio_analysis_service.audio_buffer.hop_size
+        ramp = (np.arange(window_size + hop_size) % 32768).astype(np.int16)
+        for start in range(0, len(ramp), test_audio_data["chunk_size"]):
+            chunk = ramp[start : start + test_audio_data["chunk_size"]]
+            await audio_analysis_service.process_audio_chunk(chunk.tobytes())
+        await audio_analysis_service.wait_for_analysis()
+
+        assert mock_analyze_audio_chunk.call_count == 2
+        second_window = mock_analyze_audio_chunk.call_args_list[1][0][0]
+        expected = ramp[hop_size : hop_size + window_size].astype(np.float32) / 32768.0
+        np.testing.assert_array_equal(second_window, expected)
+
+    @pytest.mark.asyncio
+    @patch("birdnetpi.audio.analysis.BirdDetectionService", autospec=True)
+    async def test_process_audio_chunk__float32_samples_split_across_reads(
+        self,
+        mock_analysis_client_class,
+        mock_file_manager,
+        mock_path_resolver,
+        test_config,
+    ):
+        """Should analyze float32 samples unconverted, even when reads split a sample."""
+        test_config.audio_pipeline.sample_format = "float32"
+        service = AudioAnalysisManager(
+            mock_file_manager,
+            mock_path_resolver,
+            test_config,
+            MagicMock(spec=SpeciesDatabaseService),
+            MagicMock(spec=AsyncSession),
+        )
+        service._analyze_audio_chunk = AsyncMock(spec=AudioAnalysisManager._analyze_audio_chunk)
+        window = np.linspace(-0.9, 0.9, service.buffer_size_samples, dtype=np.float32)
+        data = window.tobytes()
+
+        for start in range(0, len(data), 4099):  # Not a multiple of the sample size
+            await service.process_audio_chunk(data[start : start + 4099])
+        await service.wait_for_analysis()
+
+        assert service.audio_buffer._data.dtype == np.float32
+        service._analyze_audio_chunk.assert_awaited_once()
+        np.testing.assert_array_equal(service._analyze_audio_chunk.call_args[0][0], window)
+
+    @pytest.mark.asyncio
+    async def test_activity_gate_skips_inactive_windows(self, audio_analysis_service):
+        """Should only analyze windows the activity gate admits."""
+        gate = create_autospec(ActivityGate, instance=True)
+        gate.admit.side_effect = [False, True]
+        audio_analysis_service.activity_gates = [gate]
+        audio_analysis_service._analyze_audio_chunk = AsyncMock(
+            spec=AudioAnalysisManager._analyze_audio_chunk
+        )
+        window_size = audio_analysis_service.buffer_size_samples
+        hop_size = audio_analysis_service.audio_buffer.hop_size
+        ramp = (np.arange(window_size + hop_size) % 1000).astype(np.int16)
+
+        await audio_analysis_service.process_audio_chunk(ramp.tobytes())
+        await audio_analysis_service.wait_for_analysis()
+
+        assert gate.admit.call_count == 2
+        audio_analysis_service._analyze_audio_chunk.assert_awaited_once()
+        analyzed = audio_analysis_service._analyze_audio_chunk.call_args[0][0]
+        np.testing.assert_array_equal(analyzed, ramp[hop_size:].astype(np.float32) / 32768.0)
+
+    @pytest.mark.asyncio
+    @patch(
+        "birdnetpi.audio.analysis.AudioAnalysisManager._send_detection_event",
+        new_callable=AsyncMock,
+    )
+    async def test_activity_gate_validation_reports_missed_detections(
+        self, mock_send_detection_event, audio_analysis_service, test_species_data, caplog
+    ):
+        """Should analyze gated windows anyway and flag the ones that held detections."""
+        gate = create_autospec(ActivityGate, instance=True)
+        gate.admit.return_value = False
+        gate.last_level_db, gate.level_floor_db, gate.last_flux = -40.0, -42.0, 0.4
+        gate.missed_windows = 0
+        audio_analysis_service.activity_gates = [gate]
+        audio_analysis_service.validate_activity_gate = True
+        audio_analysis_service.analysis_client.get_analysis_results.return_value = (
+            test_species_data["confident"][:1]
+        )
+        window = np.zeros(audio_analysis_service.buffer_size_samples, dtype=np.int16)
+
+        await audio_analysis_service.process_audio_chunk(window.tobytes())
+        await audio_analysis_service.wait_for_analysis()
+        await audio_analysis_service.close_detection_delivery()
+
+        mock_send_detection_event.assert_awaited_once()
+        assert gate.missed_windows == 1
+        assert audio_analysis_service._gated_windows == {}
+        assert "Activity gate would have skipped a window with detections" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_publishes_analysis_stats(self, audio_analysis_service, path_resolver):
+        """Should publish window, activity gate and transport counters for the health API."""
+        audio_analysis_service.activity_gates = [ActivityGate(48000)]
+        audio_analysis_service.transport_stats = lambda: {"wakeups_per_s": 2.0}
+        audio_analysis_service._stats_published -= 10.0
+
+        await audio_analysis_service.process_audio_chunk(np.zeros(10, dtype=np.int16).tobytes())
+
+        published = PipelineStatsStore(path_resolver).read_all()["analysis"]
+        assert published["windows"] == 0
+        assert published["activity_gate"][0]["skipped"] == 0
+        assert published["delivery"]["pending"] == 0
+        assert published["transport"] == {"wakeups_per_s": 2.0}
+        assert published["inference"]["windows_dropped"] == 0
+        assert published["inference"]["queue_capacity"] == 8
+        assert published["latency"] == {}
+
+    @pytest.mark.asyncio
+    @patch(
+        "birdnetpi.audio.analysis.AudioAnalysisManager._send_detection_event",
+        new_callable=AsyncMock,
+    )
+    async def test_handle_analysis_results__sends_in_background(
+        self, mock_send_detection_event, audio_analysis_service, test_species_data
+    ):
+        """Should return before detection sends complete and drain them on close."""
+        sent = asyncio.Event()
+
+        async def wait_for_release(*args, **kwargs):
+            await sent.wait()
+
+        mock_send_detection_event.side_effect = wait_for_release
+        audio_chunk = np.zeros(3, dtype=np.float32)
+
+        await audio_analysis_service._handle_analysis_results(
+            test_species_data["confident"], audio_chunk, datetime(2026, 5, 1, 6, 0)
+        )
+
+        assert len(audio_analysis_service._send_tasks) == 3
+        sent.set()
+        await audio_analysis_service.close_detection_delivery()
+        assert audio_analysis_service._send_tasks == set()
+        assert mock_send_detection_event.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_inference_runs_off_the_event_loop(self, audio_analysis_service):
+        """Should keep the event loop responsive while the interpreter is busy."""
+
+        def slow_invoke(**kwargs):
+            time.sleep(0.2)
+            return []
+
+        audio_analysis_service.analysis_client.get_analysis_results.side_effect = slow_invoke
+        window = np.zeros(audio_analysis_service.buffer_size_samples, dtype=np.float32)
+
+        analysis = asyncio.create_task(audio_analysis_service._analyze_audio_chunk(window))
+        ticks = 0
+        while not analysis.done():
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("block", [False, True], ids=["drop_oldest", "block"])
+    async def test_full_inference_queue_applies_policy(self, audio_analysis_service, block):
+        """Should drop the oldest queued window, or wait for room, when the queue is full."""
+        audio_analysis_service._window_queue = asyncio.Queue(2)
+        audio_analysis_service.block_when_queue_full = block
+        # Stand in for a busy inference task so nothing is taken off the queue
+        audio_analysis_service._inference_task = asyncio.create_task(asyncio.Event().wait())
+        window = np.zeros(4, dtype=np.float32)
+        timestamps = [datetime(2026, 5, 1, 6, 0, second, tzinfo=UTC) for second in (0, 3, 6)]
+        try:
+            await audio_analysis_service._enqueue_window(window, timestamps[0])
+            await audio_analysis_service._enqueue_window(window, timestamps[1])
+            third = asyncio.create_task(
+                audio_analysis_service._enqueue_window(window, timestamps[2])
+            )
+            await asyncio.sleep(0.01)
+
+            if block:
+                assert not third.done()
+                audio_analysis_service._window_queue.get_nowait()
+                audio_analysis_service._window_queue.task_done()
+            await asyncio.wait_for(third, timeout=1.0)
+        finally:
+            audio_analysis_service._inference_task.cancel()
+
+        queued = [audio_analysis_service._window_queue.get_nowait()[1] for _ in range(2)]
+        assert queued == timestamps[1:]
+        assert audio_analysis_service.windows_dropped == (0 if block else 1)
+
+    @pytest.mark.asyncio
+    async def test_stop_inference_analyzes_queued_windows(self, audio_analysis_service):
+        """Should finish the windows already queued before stopping the inference task."""
+        audio_analysis_service._analyze_audio_chunk = AsyncMock(
+            spec=AudioAnalysisManager._analyze_audio_chunk
+        )
+        await audio_analysis_service._enqueue_window(
+            np.zeros(4, dtype=np.float32), datetime(2026, 5, 1, 6, 0, 0, tzinfo=UTC)
+        )
+
+        await audio_analysis_service.stop_inference()
+
+        audio_analysis_service._analyze_audio_chunk.assert_awaited_once()
+        assert audio_analysis_service._inference_task is None
+
+    @pytest.mark.asyncio
+    @patch(
+        "birdnetpi.audio.analysis.AudioAnalysisManager._send_detection_event",
+        new_callable=AsyncMock,
+    )
+    async def test_process_audio_chunk_batches_backlog(
+        self, mock_send_detection_event, audio_analysis_service, test_species_data
+    ):
+        """Should analyze a backlog of windows in one batched call when batching is enabled."""
+        audio_analysis_service.config.audio_pipeline.inference_batch_size = 4
+        client = audio_analysis_service.analysis_client
+        client.get_analysis_results_batch.return_value = [
+            test_species_data["confident"][:1],
+            test_species_data["confident"][1:2],
+        ]
+        window_size = audio_analysis_service.buffer_size_samples
+        hop_size = audio_analysis_service.audio_buffer.hop_size
+        backlog = np.zeros(window_size + hop_size, dtype=np.int16)
+        captured_ns = time.monotonic_ns()
+
+        await audio_analysis_service.process_audio_chunk(backlog.tobytes(), captured_ns)
+        await audio_analysis_service.wait_for_analysis()
+
+        client.get_analysis_results.assert_not_called()
+        batch = client.get_analysis_results_batch.call_args.kwargs["audio_chunks"]
+        assert batch.shape == (2, window_size)
+        assert mock_send_detection_event.call_count == 2
+        timestamps = [call.kwargs["timestamp"] for call in mock_send_detection_event.call_args_list]
+        assert timestamps[0] < timestamps[1]
+        # Each window is stamped with its sample index and its last sample's capture time
+        stamps = [call.kwargs["stamp"] for call in mock_send_detection_event.call_args_list]
+        hop_ns = hop_size * 1_000_000_000 // audio_analysis_service.config.sample_rate
+        assert stamps == [
+            WindowStamp(0, captured_ns - hop_ns),
+            WindowStamp(hop_size, captured_ns),
+        ]
+
+    @pytest.mark.asyncio
+    @patch(
+        "birdnetpi.audio.analysis.AudioAnalysisManager._send_detection_event",
+        new_callable=AsyncMock,
+    )
+    async def test_records_stage_latencies(
+        self, mock_send_detection_event, audio_analysis_service, test_species_data
+    ):
+        """Should time every in-process stage a window passes through."""
+        audio_analysis_service.analysis_client.get_analysis_results.return_value = (
+            test_species_data["confident"][:1]
+        )
+        window = np.zeros(audio_analysis_service.buffer_size_samples, dtype=np.int16)
+
+        # The transport reports when the block's last sample was captured
+        await audio_analysis_service.process_audio_chunk(
+            window.tobytes(), time.monotonic_ns() - 20_000_000
+        )
+        await audio_analysis_service.wait_for_analysis()
+
+        stages = audio_analysis_service.stage_latencies.snapshot()
+        assert stages["transport"]["max_ms"] >= 20.0
+        for stage in (
+            "transport",
+            "window_assembly",
+            "inference_queue",
+            "inference",
+            "species_parsing",
+            "post_processing",
+        ):
+            assert stages[stage]["count"] == 1
+            assert stages[stage]["p50_ms"] <= stages[stage]["max_ms"]
+
+    @pytest.mark.asyncio
+    @patch("birdnetpi.audio.analysis.BirdDetectionService", autospec=True)
+    async def test_multichannel_windows_share_one_invoke(
+        self,
+        mock_analysis_client_class,
+        mock_file_manager,
+        mock_path_resolver,
+        test_config,
+        test_species_data,
+    ):
+        """Should de-interleave channels and analyze their windows together, tagged by channel."""
+        test_config.audio_channels = 2
+        service = AudioAnalysisManager(
+            mock_file_manager,
+            mock_path_resolver,
+            test_config,
+            MagicMock(spec=SpeciesDatabaseService),
+            MagicMock(spec=AsyncSession),
+        )
+        client = mock_analysis_client_class.return_value
+        client.get_analysis_results_batch.return_value = [
+            test_species_data["confident"][:1],
+            test_species_data["confident"][1:2],
+        ]
+        service._send_detection_event = AsyncMock(spec=AudioAnalysisManager._send_detection_event)
+        frames = np.zeros((service.buffer_size_samples, 2), dtype=np.int16)
+        frames[:, 1] = 16384
+        interleaved = frames.tobytes()
+        split = len(interleaved) // 2 + 2  # Ends mid-frame, on a sample boundary
+
+        await service.process_audio_chunk(interleaved[:split])
+        await service.process_audio_chunk(interleaved[split:])
+        await service.wait_for_analysis()
+        await service.close_detection_delivery()
+
+        client.get_analysis_results.assert_not_called()
+        client.get_analysis_results_batch.assert_called_once()
+        batch = client.get_analysis_results_batch.call_args.kwargs["audio_chunks"]
+        assert batch.shape == (2, service.buffer_size_samples)
+        assert not batch[0].any()
+        np.testing.assert_allclose(batch[1], 0.5)
+        sent = service._send_detection_event.call_args_list
+        assert [call.kwargs["channel"] for call in sent] == [0, 1]
+        assert sent[0].kwargs["timestamp"] == sent[1].kwargs["timestamp"]
+        await service.stop_inference()
+
+    @pytest.mark.asyncio
+    @patch("birdnetpi.audio.analysis.BirdDetectionService", autospec=True)
+    async def test_multichannel_activity_gate_per_channel(
+        self,
+        mock_analysis_client_class,
+        mock_file_manager,
+        mock_path_resolver,
+        test_config,
+    ):
+        """Should score each channel's windows with that channel's own gate."""
+        test_config.audio_channels = 2
+        test_config.audio_pipeline.activity_gate = "on"
+        service = AudioAnalysisManager(
+            mock_file_manager,
+            mock_path_resolver,
+            test_config,
+            MagicMock(spec=SpeciesDatabaseService),
+            MagicMock(spec=AsyncSession),
+        )
+        assert len(service.activity_gates) == 2
+        assert service.activity_gates[0] is not service.activity_gates[1]
+        quiet, busy = (create_autospec(ActivityGate, instance=True) for _ in range(2))
+        quiet.admit.return_value = False
+        busy.admit.return_value = True
+        service.activity_gates = [quiet, busy]
+        service._analyze_audio_chunk = AsyncMock(spec=AudioAnalysisManager._analyze_audio_chunk)
+        frames = np.zeros((service.buffer_size_samples, 2), dtype=np.int16)
+        frames[:, 1] = 16384
+
+        await service.process_audio_chunk(frames.tobytes())
+        await service.wait_for_analysis()
+
+        np.testing.assert_array_equal(quiet.admit.call_args.args[0], 0.0)
+        np.testing.assert_allclose(busy.admit.call_args.args[0], 0.5)
+        service._analyze_audio_chunk.assert_awaited_once()
+        assert service._analyze_audio_chunk.call_args.kwargs["channel"] == 1
+        await service.stop_inference()
+
+    @pytest.mark.parametrize(
+        "configured,expected",
+        [pytest.param(3, 3, id="configured"), pytest.param(0, 4, id="calibrated")],
+    )
+    @patch("birdnetpi.audio.analysis.InferenceThreadCalibrator", autospec=True)
+    @patch("birdnetpi.audio.analysis.BirdDetectionService", autospec=True)
+    def test_interpreter_thread_count(
+        self,
+        mock_analysis_client_class,
+        mock_calibrator_class,
+        mock_file_manager,
+        mock_path_resolver,
+        test_config,
+        configured,
+        expected,
+    ):
+        """Should use the configured thread count, or calibrate one when it is 0."""
+        test_config.audio_pipeline.inference_threads = configured
+        mock_calibrator_class.return_value.num_threads.return_value = 4
+
+        AudioAnalysisManager(
+            mock_file_manager,
+            mock_path_resolver,
+            test_config,
+            MagicMock(spec=SpeciesDatabaseService),
+            MagicMock(spec=AsyncSession),
+        )
+
+        mock_analysis_client_class.assert_called_once_with(
+            test_config,
+            num_threads=expected,
+            batch_size=max(
+                test_config.audio_pipeline.inference_batch_size, test_config.audio_channels
+            ),
+        )
+        assert mock_calibrator_class.called is (configured == 0)
+
+    @pytest.mark.asyncio
+    @patch("birdnetpi.audio.analysis.AnalysisWorkerPool", autospec=True)
+    @patch("birdnetpi.audio.analysis.BirdDetectionService", autospec=True)
+    async def test_process_audio_chunk_dispatches_to_worker_pool(
+        self,
+        mock_analysis_client_class,
+        mock_pool_class,
+        mock_file_manager,
+        mock_path_resolver,
+        test_config,
+        test_species_data,
+    ):
+        """Should submit windows to the worker pool and handle its results in order."""
+        test_config.audio_pipeline.analysis_workers = 2
+        service = AudioAnalysisManager(
+            mock_file_manager,
+            mock_path_resolver,
+            test_config,
+            MagicMock(spec=SpeciesDatabaseService),
+            MagicMock(spec=AsyncSession),
+        )
+        pool = mock_pool_class.return_value
+        finished = [
+            (datetime(2026, 5, 1, 6, 0, 0), np.zeros(4, dtype=np.float32), 0, None, []),
+            (datetime(2026, 5, 1, 6, 0, 3), np.zeros(4, dtype=np.float32), 0, None, []),
+        ]
+        pool.collect.return_value = finished
+        service._handle_analysis_results = AsyncMock(
+            spec=AudioAnalysisManager._handle_analysis_results
+        )
+        window = np.zeros(service.buffer_size_samples, dtype=np.int16)
+
+        await service.process_audio_chunk(window.tobytes())
+
+        mock_analysis_client_class.assert_not_called()
+        mock_pool_class.assert_called_once_with(test_config, 2)
+        pool.start.assert_called_once()
+        assert pool.submit.call_count == 1
+        handled = [call.args[2] for call in service._handle_analysis_results.call_args_list]
+        assert handled == [finished[0][0], finished[1][0]]
+
+        service.stop_worker_pool()
+        pool.stop.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("birdnetpi.audio.analysis.AnalysisWorkerPool", autospec=True)
+    @patch("birdnetpi.audio.analysis.BirdDetectionService", autospec=True)
+    async def test_block_policy_waits_for_worker_pool(
+        self,
+        mock_analysis_client_class,
+        mock_pool_class,
+        mock_file_manager,
+        mock_path_resolver,
+        test_config,
+        test_species_data,
+    ):
+        """Should handle finished windows until the pool has room before submitting more."""
+        test_config.audio_pipeline.analysis_workers = 2
+        test_config.audio_pipeline.analysis_queue_policy = "block"
+        service = AudioAnalysisManager(
+            mock_file_manager,
+            mock_path_resolver,
+            test_config,
+            MagicMock(spec=SpeciesDatabaseService),
+            MagicMock(spec=AsyncSession),
+        )
+        pool = mock_pool_class.return_value
+        type(pool).full = PropertyMock(side_effect=[True, True, False])
+        pool.collect.return_value = []
+        window = np.zeros(service.buffer_size_samples, dtype=np.int16)
+
+        with patch("birdnetpi.audio.analysis.asyncio.sleep", autospec=True) as mock_sleep:
+            await service.process_audio_chunk(window.tobytes())
+
+        mock_sleep.assert_awaited_once()
+        assert pool.collect.call_count == 2
+        assert pool.submit.call_count == 1
+
     @pytest.mark.asyncio
     @patch(
         "birdnetpi.audio.analysis.AudioAnalysisManager._send_detection_event",
@@ -223,6 +707,106 @@ class TestAudioAnalysisManager:
         assert calls[1][0][0].scientific_name == "Corvus brachyrhynchos"
         assert calls[1][0][1] == expected_species[1][1]
 
+    @pytest.mark.asyncio
+    @patch(
+        "birdnetpi.audio.analysis.AudioAnalysisManager._send_detection_event",
+        new_callable=AsyncMock,
+    )
+    async def test_handle_analysis_results__encodes_clip_once(
+        self, mock_send_detection_event, audio_analysis_service, test_species_data
+    ):
+        """Should encode the clip as clipped int16 once per window, shared by its detections."""
+        audio_chunk = np.array([0.5, -1.5, 1.5], dtype=np.float32)
+
+        await audio_analysis_service._handle_analysis_results(
+            test_species_data["confident"], audio_chunk, datetime(2026, 5, 1, 6, 0)
+        )
+
+        sent_clips = [call.args[2] for call in mock_send_detection_event.call_args_list]
+        assert len(sent_clips) == 3
+        assert all(clip is sent_clips[0] for clip in sent_clips)
+        np.testing.assert_array_equal(
+            np.frombuffer(sent_clips[0], dtype=np.int16), [16383, -32767, 32767]
+        )
+
+    @pytest.mark.asyncio
+    @patch(
+        "birdnetpi.audio.analysis.AudioAnalysisManager._send_detection_event",
+        new_callable=AsyncMock,
+    )
+    async def test_handle_analysis_results__merges_overlapping_hits(
+        self, mock_send_detection_event, audio_analysis_service, test_species_data
+    ):
+        """Should send one detection per event when merging, and flush open events on close."""
+        service = audio_analysis_service
+        window = service.buffer_size_samples
+        hop = window - service._get_overlap_samples()
+        service.detection_merger = DetectionMerger(service.config.sample_rate, window, 1.0)
+        robin = [call for call in test_species_data["confident"] if "Turdus" in call[0]]
+        start = datetime(2026, 5, 1, 6, 0, tzinfo=UTC)
+
+        for index, results in enumerate([robin, robin, [], [], robin]):
+            await service._handle_analysis_results(
+                results,
+                np.full(window, 0.25, dtype=np.float32),
+                start + timedelta(seconds=index * hop / service.config.sample_rate),
+                stamp=WindowStamp(index * hop, 0),
+            )
+        await asyncio.gather(*service._send_tasks)
+
+        assert mock_send_detection_event.call_count == 1
+        first = mock_send_detection_event.call_args
+        assert first.kwargs["timestamp"] == start
+        assert len(first.args[2]) == (window + hop) * 2
+
+        await service.close_detection_delivery()
+
+        assert mock_send_detection_event.call_count == 2
+        assert service.detection_merger.open_events == 0
+
+    @pytest.mark.asyncio
+    @patch(
+        "birdnetpi.audio.analysis.AudioAnalysisManager._send_detection_event",
+        new_callable=AsyncMock,
+    )
+    async def test_handle_analysis_results__cuts_clip_from_history(
+        self, mock_send_detection_event, audio_analysis_service, test_species_data, tmp_path
+    ):
+        """Should cut clips with pre- and post-roll from the history once it is captured."""
+        service = audio_analysis_service
+        window = service.buffer_size_samples
+        history = AudioHistory(
+            10.0,
+            service.config.sample_rate,
+            1,
+            np.int16,
+            str(tmp_path),
+            name=f"birdnetpi_test_{uuid.uuid4().hex[:12]}",
+        )
+        service.audio_history = history
+        service.clip_pre_roll = service.clip_post_roll = 100
+        audio = (np.arange(window + 1000) % 1000).astype(np.int16).reshape(-1, 1)
+        timestamp = datetime(2026, 5, 1, 6, 0, tzinfo=UTC)
+        try:
+            history.write(audio[:500])
+            history.remember_window(timestamp, 400)
+            history.write(audio[500 : 400 + window])
+
+            await service._handle_analysis_results(
+                test_species_data["confident"][:1], np.zeros(window, np.float32), timestamp
+            )
+            mock_send_detection_event.assert_not_called()
+
+            history.write(audio[400 + window :])
+            await service._release_pending_clips(history)
+            await asyncio.gather(*service._send_tasks)
+
+            mock_send_detection_event.assert_called_once()
+            clip = np.frombuffer(mock_send_detection_event.call_args.args[2], dtype=np.int16)
+            np.testing.assert_array_equal(clip, audio[300 : 500 + window, 0])
+        finally:
+            history.close()
+
     @pytest.mark.asyncio
     @patch("httpx.AsyncClient", autospec=True)
     async def test_send_detection_event(
@@ -235,16 +819,16 @@ class TestAudioAnalysisManager:
         caplog,
     ):
         """Should successfully send a detection event and log info."""
-        mock_async_client.return_value.__aenter__.return_value.post.return_value = MagicMock(
+        mock_async_client.return_value.post.return_value = MagicMock(
             spec=httpx.Response, status_code=201
         )
         species_tensor, confidence = test_species_data["confident"][0]
         species_components = await SpeciesParser.parse_tensor_species(species_tensor)
         raw_audio_bytes = np.array([1, 2, 3], dtype=np.int16).tobytes()
         await audio_analysis_service._send_detection_event(
-            species_components, confidence, raw_audio_bytes
+            species_components, confidence, raw_audio_bytes, stamp=WindowStamp(288000, 42)
         )
-        mock_post = mock_async_client.return_value.__aenter__.return_value.post
+        mock_post = mock_async_client.return_value.post
         mock_post.assert_called_once()
         call_args = mock_post.call_args
         assert call_args[0][0] == "http://127.0.0.1:8888/api/detections/"
@@ -253,16 +837,22 @@ class TestAudioAnalysisManager:
         assert detection_data["common_name"] == "American Robin"
         assert detection_data["confidence"] == 0.85
         assert "audio_data" in detection_data
+        assert detection_data["channels"] == 1
+        assert detection_data["channel"] == 0
+        assert detection_data["sample_index"] == 288000
+        assert detection_data["captured_ns"] == 42
         assert "Detection event sent" in caplog.text
+        stages = audio_analysis_service.stage_latencies.snapshot()
+        assert stages["http_delivery"]["count"] == 1
 
     @pytest.mark.asyncio
     @patch("httpx.AsyncClient", autospec=True)
     async def test_send_detection_event_httpx_request_error(
         self, mock_async_client, audio_analysis_service, test_species_data, caplog
     ):
-        """Should buffer detection when httpx.RequestError occurs."""
-        mock_async_client.return_value.__aenter__.return_value.post.side_effect = (
-            httpx.RequestError("Network error", request=httpx.Request("POST", "http://test.com"))
+        """Should spool detection when httpx.RequestError occurs."""
+        mock_async_client.return_value.post.side_effect = httpx.RequestError(
+            "Network error", request=httpx.Request("POST", "http://test.com")
         )
         species, confidence = test_species_data["confident"][2]
         raw_audio_bytes = np.array([1, 2, 3], dtype=np.int16).tobytes()
@@ -270,21 +860,41 @@ class TestAudioAnalysisManager:
         await audio_analysis_service._send_detection_event(
             species_components, confidence, raw_audio_bytes
         )
-        assert "FastAPI unavailable, buffering detection" in caplog.text
+        assert "FastAPI unavailable, spooling detection" in caplog.text
         scientific_name = species.split("_")[0]
-        assert f"Buffered detection event for {scientific_name}" in caplog.text
+        assert scientific_name in spooled_species(caplog)
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient", autospec=True)
+    async def test_send_detection_event__binary_format(
+        self, mock_async_client, audio_analysis_service, test_species_data
+    ):
+        """Should send the raw clip as a frame in binary mode and spool it unencoded."""
+        mock_async_client.return_value.post.side_effect = httpx.RequestError(
+            "Network error", request=httpx.Request("POST", "http://test.com")
+        )
+        audio_analysis_service.detection_sender.binary = True
+        species_components = await SpeciesParser.parse_tensor_species(
+            test_species_data["confident"][0][0]
+        )
+        raw_audio_bytes = np.array([1, 2, 3], dtype=np.int16).tobytes()
+
+        await audio_analysis_service._send_detection_event(
+            species_components, 0.85, raw_audio_bytes
+        )
+
+        assert mock_async_client.return_value.post.call_args.args[0].endswith("/binary")
+        assert audio_analysis_service.detection_spool.peek(1)[0].audio == raw_audio_bytes
 
     @pytest.mark.asyncio
     @patch("httpx.AsyncClient", autospec=True)
     async def test_send_detection_event_httpx_status_error(
         self, mock_async_client, audio_analysis_service, test_species_data, caplog
     ):
-        """Should buffer detection when httpx.HTTPStatusError occurs."""
+        """Should spool detection when httpx.HTTPStatusError occurs."""
         mock_response = MagicMock(spec=httpx.Response, status_code=404, text="Not Found")
-        mock_async_client.return_value.__aenter__.return_value.post.side_effect = (
-            httpx.HTTPStatusError(
-                "Not Found", request=MagicMock(spec=httpx.Request), response=mock_response
-            )
+        mock_async_client.return_value.post.side_effect = httpx.HTTPStatusError(
+            "Not Found", request=MagicMock(spec=httpx.Request), response=mock_response
         )
         species, confidence = test_species_data["confident"][0]
         raw_audio_bytes = np.array([1, 2, 3], dtype=np.int16).tobytes()
@@ -292,28 +902,26 @@ class TestAudioAnalysisManager:
         await audio_analysis_service._send_detection_event(
             species_components, confidence, raw_audio_bytes
         )
-        assert "FastAPI unavailable, buffering detection" in caplog.text
+        assert "FastAPI unavailable, spooling detection" in caplog.text
         scientific_name = species.split("_")[0]
-        assert f"Buffered detection event for {scientific_name}" in caplog.text
+        assert scientific_name in spooled_species(caplog)
 
     @pytest.mark.asyncio
     @patch("httpx.AsyncClient", autospec=True)
     async def test_send_detection_event_generic_exception(
         self, mock_async_client, audio_analysis_service, test_species_data, caplog
     ):
-        """Should buffer detection when an unexpected exception occurs."""
-        mock_async_client.return_value.__aenter__.return_value.post.side_effect = Exception(
-            "Unexpected error"
-        )
+        """Should spool detection when an unexpected exception occurs."""
+        mock_async_client.return_value.post.side_effect = Exception("Unexpected error")
         species, confidence = test_species_data["confident"][1]
         raw_audio_bytes = np.array([1, 2, 3], dtype=np.int16).tobytes()
         species_components = await SpeciesParser.parse_tensor_species(species)
         await audio_analysis_service._send_detection_event(
             species_components, confidence, raw_audio_bytes
         )
-        assert "Unexpected error sending detection, buffering" in caplog.text
+        assert "Unexpected error sending detection, spooling" in caplog.text
         scientific_name = species.split("_")[0]
-        assert f"Buffered detection event for {scientific_name}" in caplog.text
+        assert scientific_name in spooled_species(caplog)
 
     @pytest.mark.asyncio
     async def test_analyze_audio_chunk_handles_analysis_client_exception(
@@ -336,8 +944,7 @@ class TestAudioAnalysisManager:
         audio_analysis_service.analysis_client.get_analysis_results.return_value = []
         audio_chunk = test_audio_data["silence_chunk"]
         await audio_analysis_service._analyze_audio_chunk(audio_chunk)
-        with audio_analysis_service.buffer_lock:
-            assert len(audio_analysis_service.detection_buffer) == 0
+        assert len(audio_analysis_service.detection_spool) == 0
 
     @pytest.mark.asyncio
     async def test_analyze_audio_chunk__invalid_audio_format(self, audio_analysis_service, caplog):
@@ -365,8 +972,44 @@ class TestAudioAnalysisManager:
         assert len(audio_analysis_service.audio_buffer) > 0
 
 
-class TestDetectionBuffering:
-    """Test the in-memory detection buffering functionality."""
+def spooled_species(caplog) -> list[str]:
+    """Return the species of each "Spooled detection event" log record, in order."""
+    records = [r for r in caplog.records if r.message == "Spooled detection event"]
+    return [r.species for r in records]  # type: ignore[attr-defined]
+
+
+def spool_detection(service: AudioAnalysisManager, species_tensor: str, confidence: float = 0.9):
+    """Spool a detection the way a failed live send would."""
+    scientific_name, common_name = species_tensor.split("_")
+    detection_id = str(uuid.uuid4())
+    metadata = {
+        "id": detection_id,
+        "species_tensor": species_tensor,
+        "scientific_name": scientific_name,
+        "common_name": common_name,
+        "confidence": confidence,
+        "timestamp": datetime.now().isoformat(),
+    }
+    service.detection_spool.append(detection_id, metadata, b"\x01\x00")
+    return detection_id
+
+
+def rejecting_post(bad_id: str, status_code: int):
+    """Return a batch POST side effect that fails any batch containing bad_id."""
+
+    def post(url, json):
+        if any(event["id"] == bad_id for event in json):
+            response = MagicMock(spec=httpx.Response, status_code=status_code)
+            raise httpx.HTTPStatusError(
+                "Rejected", request=MagicMock(spec=httpx.Request), response=response
+            )
+        return MagicMock(spec=httpx.Response)
+
+    return post
+
+
+class TestDetectionSpooling:
+    """Test spooling and replay of undelivered detections."""
 
     @pytest.fixture(autouse=True)
     def setup_cleanup(self, audio_analysis_service):
@@ -375,7 +1018,7 @@ class TestDetectionBuffering:
         audio_analysis_service.stop_buffer_flush_task()
 
     async def test_start_buffer_flush_task(self, audio_analysis_service):
-        """Should start background thread for buffer flushing."""
+        """Should start background thread for spool replay."""
         assert audio_analysis_service._flush_task is None
         audio_analysis_service.start_buffer_flush_task()
         assert audio_analysis_service._flush_task is not None
@@ -383,7 +1026,7 @@ class TestDetectionBuffering:
         assert not audio_analysis_service._stop_flush_task
 
     async def test_stop_buffer_flush_task(self, audio_analysis_service):
-        """Should stop the background buffer flush task cleanly."""
+        """Should stop the background spool replay task cleanly."""
         audio_analysis_service.start_buffer_flush_task()
         assert audio_analysis_service._flush_task.is_alive()
         audio_analysis_service.stop_buffer_flush_task()
@@ -391,16 +1034,14 @@ class TestDetectionBuffering:
         time.sleep(0.2)
         assert not audio_analysis_service._flush_task.is_alive()
 
-    async def test_send_detection_event_buffers_on_http_failure(
-        self, audio_analysis_service, mock_detection_data, caplog
+    async def test_send_detection_event_spools_on_http_failure(
+        self, audio_analysis_service, caplog
     ):
-        """Should buffer detection when FastAPI is unavailable."""
+        """Should spool the detection with its clip and ID when FastAPI is unavailable."""
         with patch("httpx.AsyncClient", autospec=True) as mock_client:
-            mock_client.return_value.__aenter__.return_value.post.side_effect = httpx.RequestError(
+            mock_client.return_value.post.side_effect = httpx.RequestError(
                 "Connection failed", request=httpx.Request("POST", "http://test.com")
             )
-            with audio_analysis_service.buffer_lock:
-                audio_analysis_service.detection_buffer.clear()
             confidence = 0.8
             raw_audio_bytes = np.array([1, 2, 3], dtype=np.int16).tobytes()
             species_components = SpeciesComponents(
@@ -409,324 +1050,292 @@ class TestDetectionBuffering:
             await audio_analysis_service._send_detection_event(
                 species_components, confidence, raw_audio_bytes
             )
-            with audio_analysis_service.buffer_lock:
-                assert len(audio_analysis_service.detection_buffer) == 1
-                buffered = next(iter(audio_analysis_service.detection_buffer))
-                assert buffered["species_tensor"] == "Test species_Test Species"
-                assert buffered["confidence"] == confidence
-            assert "FastAPI unavailable, buffering detection" in caplog.text
-            assert "Buffered detection event for Test species (buffer size: 1)" in caplog.text
-
-    async def test_send_detection_event_buffers_on_http_status_error(
+            sent_id = mock_client.return_value.post.call_args.kwargs["json"]["id"]
+        (spooled,) = audio_analysis_service.detection_spool.peek(10)
+        assert spooled.detection_id == sent_id
+        assert spooled.metadata["species_tensor"] == "Test species_Test Species"
+        assert spooled.metadata["confidence"] == confidence
+        assert "audio_data" not in spooled.metadata
+        assert spooled.audio == raw_audio_bytes
+        assert "FastAPI unavailable, spooling detection" in caplog.text
+        (record,) = [r for r in caplog.records if r.message == "Spooled detection event"]
+        assert record.species == "Test species"  # type: ignore[attr-defined]
+        assert record.spooled == 1  # type: ignore[attr-defined]
+
+    async def test_send_detection_event_spools_on_http_status_error(
         self, audio_analysis_service, caplog
     ):
-        """Should buffer detection when FastAPI returns HTTP error."""
+        """Should spool detection when FastAPI returns HTTP error."""
         with patch("httpx.AsyncClient", autospec=True) as mock_client:
             mock_response = MagicMock(spec=httpx.Response, status_code=500)
-            mock_client.return_value.__aenter__.return_value.post.side_effect = (
-                httpx.HTTPStatusError(
-                    "Server Error", request=MagicMock(spec=httpx.Request), response=mock_response
-                )
+            mock_client.return_value.post.side_effect = httpx.HTTPStatusError(
+                "Server Error", request=MagicMock(spec=httpx.Request), response=mock_response
             )
-            with audio_analysis_service.buffer_lock:
-                audio_analysis_service.detection_buffer.clear()
-            confidence = 0.8
             raw_audio_bytes = np.array([1, 2, 3], dtype=np.int16).tobytes()
             species_components = SpeciesComponents(
                 "Test species", "Test Species", "Test Species (Test species)"
             )
             await audio_analysis_service._send_detection_event(
-                species_components, confidence, raw_audio_bytes
+                species_components, 0.8, raw_audio_bytes
             )
-            with audio_analysis_service.buffer_lock:
-                assert len(audio_analysis_service.detection_buffer) == 1
-            assert "FastAPI unavailable, buffering detection" in caplog.text
+        assert len(audio_analysis_service.detection_spool) == 1
+        assert "FastAPI unavailable, spooling detection" in caplog.text
 
-    async def test_send_detection_event_buffers_on_generic_exception(
+    async def test_send_detection_event_spools_on_generic_exception(
         self, audio_analysis_service, caplog
     ):
-        """Should buffer detection when unexpected exception occurs during HTTP request."""
+        """Should spool detection when unexpected exception occurs during HTTP request."""
         with patch("httpx.AsyncClient", autospec=True) as mock_client:
-            mock_client.return_value.__aenter__.return_value.post.side_effect = Exception(
-                "Unexpected error"
-            )
-            with audio_analysis_service.buffer_lock:
-                audio_analysis_service.detection_buffer.clear()
-            confidence = 0.8
+            mock_client.return_value.post.side_effect = Exception("Unexpected error")
             raw_audio_bytes = np.array([1, 2, 3], dtype=np.int16).tobytes()
             species_components = SpeciesComponents(
                 "Test species", "Test Species", "Test Species (Test species)"
             )
             await audio_analysis_service._send_detection_event(
-                species_components, confidence, raw_audio_bytes
+                species_components, 0.8, raw_audio_bytes
             )
-            with audio_analysis_service.buffer_lock:
-                assert len(audio_analysis_service.detection_buffer) == 1
-            assert "Unexpected error sending detection, buffering" in caplog.text
+        assert len(audio_analysis_service.detection_spool) == 1
+        assert "Unexpected error sending detection, spooling" in caplog.text
 
-    async def test_flush_detection_buffer__empty_buffer(self, audio_analysis_service, caplog):
-        """Should handle empty buffer gracefully."""
-        with audio_analysis_service.buffer_lock:
-            audio_analysis_service.detection_buffer.clear()
-        await audio_analysis_service._flush_detection_buffer()
-        assert "Attempting to flush" not in caplog.text
+    async def test_flush_detection_buffer__empty_spool(self, audio_analysis_service, caplog):
+        """Should do nothing when the spool is empty."""
+        with patch("httpx.AsyncClient", autospec=True) as mock_client:
+            await audio_analysis_service._flush_detection_buffer()
+        mock_client.return_value.post.assert_not_called()
+        assert "Successfully flushed" not in caplog.text
 
     async def test_flush_detection_buffer_successful_flush(self, audio_analysis_service, caplog):
-        """Should successfully flush buffered detections."""
-        test_detection = {
-            "species_tensor": "Turdus migratorius_American Robin",
-            "scientific_name": "Turdus migratorius",
-            "common_name": "American Robin",
-            "confidence": 0.9,
-            "timestamp": datetime.now().isoformat(),
-        }
-        with audio_analysis_service.buffer_lock:
-            audio_analysis_service.detection_buffer.append(test_detection)
+        """Should replay spooled detections with their original IDs and remove them."""
+        detection_id = spool_detection(audio_analysis_service, "Turdus migratorius_American Robin")
         with patch("httpx.AsyncClient", autospec=True) as mock_client:
-            mock_response = MagicMock(spec=httpx.Response)
-            mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+            mock_client.return_value.post.return_value = MagicMock(spec=httpx.Response)
             await audio_analysis_service._flush_detection_buffer()
-            with audio_analysis_service.buffer_lock:
-                assert len(audio_analysis_service.detection_buffer) == 0
-            mock_client.return_value.__aenter__.return_value.post.assert_called_once()
-            assert "Attempting to flush buffered detections" in caplog.text
-            assert "Successfully flushed buffered detections" in caplog.text
-
-    async def test_flush_detection_buffer_partial_failure(self, audio_analysis_service, caplog):
-        """Should re-buffer failed detections and flush successful ones."""
-        test_detections = [
-            {
-                "species_tensor": "Turdus migratorius_American Robin",
-                "scientific_name": "Turdus migratorius",
-                "common_name": "American Robin",
-                "confidence": 0.9,
-                "timestamp": datetime.now().isoformat(),
-            },
-            {
-                "species_tensor": "Corvus brachyrhynchos_American Crow",
-                "scientific_name": "Corvus brachyrhynchos",
-                "common_name": "American Crow",
-                "confidence": 0.8,
-                "timestamp": datetime.now().isoformat(),
-            },
-            {
-                "species_tensor": "Passer domesticus_House Sparrow",
-                "scientific_name": "Passer domesticus",
-                "common_name": "House Sparrow",
-                "confidence": 0.7,
-                "timestamp": datetime.now().isoformat(),
-            },
+            call = mock_client.return_value.post.call_args
+        (payload,) = call.kwargs["json"]
+        assert call.args[0].endswith("/batch")
+        assert len(audio_analysis_service.detection_spool) == 0
+        assert payload["id"] == detection_id
+        assert payload["audio_data"] == "AQA="
+        assert "Successfully flushed spooled detections" in caplog.text
+
+    async def test_flush_detection_buffer_replays_in_order_across_batches(
+        self, audio_analysis_service, mocker
+    ):
+        """Should replay every spooled detection in the order it was spooled."""
+        mocker.patch("birdnetpi.audio.analysis.REPLAY_BATCH_SIZE", 2)
+        mocker.patch("birdnetpi.audio.analysis.REPLAY_RATE", 1e6)
+        detection_ids = [
+            spool_detection(audio_analysis_service, f"Species{i} name_Bird {i}") for i in range(5)
         ]
-        with audio_analysis_service.buffer_lock:
-            audio_analysis_service.detection_buffer.clear()
-            for detection in test_detections:
-                audio_analysis_service.detection_buffer.append(detection)
         with patch("httpx.AsyncClient", autospec=True) as mock_client:
-            post_mock = mock_client.return_value.__aenter__.return_value.post
-            responses = []
-            success_response = MagicMock(spec=httpx.Response)
-            responses.append(success_response)
+            mock_client.return_value.post.return_value = MagicMock(spec=httpx.Response)
+            await audio_analysis_service._flush_detection_buffer()
+            batches = [
+                [event["id"] for event in call.kwargs["json"]]
+                for call in mock_client.return_value.post.call_args_list
+            ]
+        assert batches == [detection_ids[0:2], detection_ids[2:4], detection_ids[4:]]
+        assert len(audio_analysis_service.detection_spool) == 0
+
+    async def test_flush_detection_buffer_partial_failure(
+        self, audio_analysis_service, caplog, mocker
+    ):
+        """Should acknowledge delivered batches, keep the failed one spooled and stop."""
+        mocker.patch("birdnetpi.audio.analysis.REPLAY_BATCH_SIZE", 1)
+        mocker.patch("birdnetpi.audio.analysis.REPLAY_RATE", 1e6)
+        for species_tensor in (
+            "Turdus migratorius_American Robin",
+            "Corvus brachyrhynchos_American Crow",
+            "Passer domesticus_House Sparrow",
+        ):
+            spool_detection(audio_analysis_service, species_tensor)
+        with patch("httpx.AsyncClient", autospec=True) as mock_client:
             failed_response = MagicMock(spec=httpx.Response)
             failed_response.raise_for_status.side_effect = httpx.HTTPStatusError(
                 "Server error",
                 request=MagicMock(spec=httpx.Request),
                 response=MagicMock(spec=httpx.Response, status_code=500),
             )
-            responses.append(failed_response)
-            success_response2 = MagicMock(spec=httpx.Response)
-            responses.append(success_response2)
-            post_mock.side_effect = responses
+            mock_client.return_value.post.side_effect = [
+                MagicMock(spec=httpx.Response),
+                failed_response,
+                MagicMock(spec=httpx.Response),
+            ]
             await audio_analysis_service._flush_detection_buffer()
-            with audio_analysis_service.buffer_lock:
-                assert len(audio_analysis_service.detection_buffer) == 1
-                rebuffered = next(iter(audio_analysis_service.detection_buffer))
-                assert rebuffered["scientific_name"] == "Corvus brachyrhynchos"
-            assert "Attempting to flush buffered detections" in caplog.text
-            assert "Successfully flushed buffered detections" in caplog.text
-            assert "Re-buffered failed detections" in caplog.text
+        remaining = audio_analysis_service.detection_spool.peek(10)
+        assert [d.metadata["scientific_name"] for d in remaining] == [
+            "Corvus brachyrhynchos",
+            "Passer domesticus",
+        ]
+        assert [d.attempts for d in remaining] == [1, 0]
+        assert mock_client.return_value.post.call_count == 2
+        assert "Successfully flushed spooled detections" in caplog.text
+        assert "Spooled detections still undeliverable" in caplog.text
 
     async def test_flush_detection_buffer_all_failures(self, audio_analysis_service, caplog):
-        """Should re-buffer all detections when all flush attempts fail."""
-        test_detection = {
-            "species_tensor": "Turdus migratorius_American Robin",
-            "scientific_name": "Turdus migratorius",
-            "common_name": "American Robin",
-            "confidence": 0.9,
-            "timestamp": datetime.now().isoformat(),
-        }
-        with audio_analysis_service.buffer_lock:
-            audio_analysis_service.detection_buffer.clear()
-            audio_analysis_service.detection_buffer.append(test_detection)
+        """Should keep all detections spooled when every replay attempt fails."""
+        spool_detection(audio_analysis_service, "Turdus migratorius_American Robin")
         with patch("httpx.AsyncClient", autospec=True) as mock_client:
-            mock_client.return_value.__aenter__.return_value.post.side_effect = httpx.RequestError(
+            mock_client.return_value.post.side_effect = httpx.RequestError(
                 "Connection failed", request=MagicMock(spec=httpx.Request)
             )
             await audio_analysis_service._flush_detection_buffer()
-            with audio_analysis_service.buffer_lock:
-                assert len(audio_analysis_service.detection_buffer) == 1
-                rebuffered = next(iter(audio_analysis_service.detection_buffer))
-                assert rebuffered["scientific_name"] == "Turdus migratorius"
-            assert "Attempting to flush buffered detections" in caplog.text
-            assert "Re-buffered failed detections" in caplog.text
-            assert "Successfully flushed" not in caplog.text
+        (remaining,) = audio_analysis_service.detection_spool.peek(10)
+        assert remaining.metadata["scientific_name"] == "Turdus migratorius"
+        assert "Spooled detections still undeliverable" in caplog.text
+        assert "Successfully flushed" not in caplog.text
 
-    async def test_flush_detection_buffer_unexpected__error_handling(
-        self, audio_analysis_service, caplog
+    async def test_flush_detection_buffer__rejected_detection_does_not_block_spool(
+        self, audio_analysis_service, caplog, mocker
     ):
-        """Should handle unexpected errors during flush and re-buffer detections."""
-        test_detection = {
-            "species_tensor": "Turdus migratorius_American Robin",
-            "scientific_name": "Turdus migratorius",
-            "common_name": "American Robin",
-            "confidence": 0.9,
-            "timestamp": datetime.now().isoformat(),
+        """Should dead-letter a detection the API rejects and deliver the rest in order."""
+        mocker.patch("birdnetpi.audio.analysis.REPLAY_RATE", 1e6)
+        detection_ids = [
+            spool_detection(audio_analysis_service, f"Species{i} name_Bird {i}") for i in range(7)
+        ]
+        with patch("httpx.AsyncClient", autospec=True) as mock_client:
+            mock_client.return_value.post.side_effect = rejecting_post(detection_ids[4], 422)
+            await audio_analysis_service._flush_detection_buffer()
+            batches = [
+                [event["id"] for event in call.kwargs["json"]]
+                for call in mock_client.return_value.post.call_args_list
+            ]
+        delivered = [i for batch in batches if detection_ids[4] not in batch for i in batch]
+
+        spool = audio_analysis_service.detection_spool
+        assert len(spool) == 0
+        assert spool.dead_lettered == 1
+        assert delivered == detection_ids[:4] + detection_ids[5:]
+        assert "Dead-lettered spooled detection the web API will not accept" in caplog.text
+        with spool._lock:
+            dead = spool._connection.execute("SELECT detection_id, reason FROM dead_letter")
+            assert dead.fetchall() == [(detection_ids[4], "rejected")]
+
+    async def test_flush_detection_buffer__server_errors_dead_letter_after_max_attempts(
+        self, audio_analysis_service, mocker
+    ):
+        """Should retry a batch failing with server errors until it reaches the attempt cap."""
+        mocker.patch("birdnetpi.audio.analysis.REPLAY_RATE", 1e6)
+        mocker.patch("birdnetpi.audio.analysis.MAX_REPLAY_ATTEMPTS", 3)
+        bad_id = spool_detection(audio_analysis_service, "Turdus migratorius_American Robin")
+        good_id = spool_detection(audio_analysis_service, "Corvus brachyrhynchos_American Crow")
+        spool = audio_analysis_service.detection_spool
+        with patch("httpx.AsyncClient", autospec=True) as mock_client:
+            mock_client.return_value.post.side_effect = rejecting_post(bad_id, 500)
+            for _ in range(2):
+                await audio_analysis_service._flush_detection_buffer()
+            assert [d.attempts for d in spool.peek(10)] == [2, 2]
+            await audio_analysis_service._flush_detection_buffer()
+
+        assert len(spool) == 0
+        assert spool.dead_lettered == 1
+        last_call = mock_client.return_value.post.call_args_list[-1]
+        assert [event["id"] for event in last_call.kwargs["json"]] == [good_id]
+
+    async def test_flush_detection_buffer__dead_letters_events_reported_invalid(
+        self, audio_analysis_service
+    ):
+        """Should dead-letter events the batch endpoint reports as invalid and ack the rest."""
+        spool_detection(audio_analysis_service, "Turdus migratorius_American Robin")
+        invalid_id = spool_detection(audio_analysis_service, "Corvus brachyrhynchos_Crow")
+        response = MagicMock(spec=httpx.Response)
+        response.json.return_value = {
+            "results": [
+                {"status": "created"},
+                {"status": "invalid", "message": "confidence: Field required"},
+            ]
         }
-        with audio_analysis_service.buffer_lock:
-            audio_analysis_service.detection_buffer.clear()
-            audio_analysis_service.detection_buffer.append(test_detection)
         with patch("httpx.AsyncClient", autospec=True) as mock_client:
-            mock_client.return_value.__aenter__.return_value.post.side_effect = Exception(
-                "Unexpected error"
+            mock_client.return_value.post.return_value = response
+            await audio_analysis_service._flush_detection_buffer()
+
+        spool = audio_analysis_service.detection_spool
+        assert len(spool) == 0
+        assert spool.dead_lettered == 1
+        with spool._lock:
+            dead = spool._connection.execute("SELECT detection_id, reason FROM dead_letter")
+            assert dead.fetchall() == [(invalid_id, "invalid")]
+
+    async def test_flush_detection_buffer__unreachable_api_never_dead_letters(
+        self, audio_analysis_service, mocker
+    ):
+        """Should keep detections spooled however often the API cannot be reached."""
+        mocker.patch("birdnetpi.audio.analysis.MAX_REPLAY_ATTEMPTS", 2)
+        spool_detection(audio_analysis_service, "Turdus migratorius_American Robin")
+        with patch("httpx.AsyncClient", autospec=True) as mock_client:
+            mock_client.return_value.post.side_effect = httpx.RequestError(
+                "Connection failed", request=MagicMock(spec=httpx.Request)
             )
+            for _ in range(4):
+                await audio_analysis_service._flush_detection_buffer()
+
+        (remaining,) = audio_analysis_service.detection_spool.peek(10)
+        assert remaining.attempts == 4
+        assert audio_analysis_service.detection_spool.dead_lettered == 0
+
+    async def test_flush_detection_buffer_unexpected__error_handling(
+        self, audio_analysis_service, caplog
+    ):
+        """Should log unexpected errors during replay and keep the detection spooled."""
+        spool_detection(audio_analysis_service, "Turdus migratorius_American Robin")
+        with patch("httpx.AsyncClient", autospec=True) as mock_client:
+            mock_client.return_value.post.side_effect = Exception("Unexpected error")
             await audio_analysis_service._flush_detection_buffer()
-            with audio_analysis_service.buffer_lock:
-                assert len(audio_analysis_service.detection_buffer) == 1
-            assert "Attempting to flush buffered detections" in caplog.text
-            assert "Unexpected error flushing detection" in caplog.text
-            assert "Re-buffered failed detections" in caplog.text
+        assert len(audio_analysis_service.detection_spool) == 1
+        assert "Unexpected error flushing detection batch" in caplog.text
+        assert "Spooled detections still undeliverable" in caplog.text
 
     @patch("birdnetpi.audio.analysis.BirdDetectionService", autospec=True)
-    async def test_detection_buffer_max_size_enforcement(
-        self, mock_analysis_client_class, audio_analysis_service
-    ):
-        """Should enforce maximum buffer size by evicting oldest detections."""
-        mock_analysis_client = MagicMock(spec=BirdDetectionService)
-        mock_analysis_client_class.return_value = mock_analysis_client
-        mock_species_database = MagicMock(spec=SpeciesDatabaseService)
-        mock_species_database.get_best_common_name = AsyncMock(
-            spec=object, return_value={"common_name": "Test Bird"}
-        )
-        mock_session = MagicMock(spec=AsyncSession)
-        SpeciesParser._instance = None
-        SpeciesParser(mock_species_database)
-        max_size = 5
-        service = AudioAnalysisManager(
+    async def test_spool_survives_restart(
+        self, mock_analysis_client_class, audio_analysis_service, test_config
+    ):
+        """Should hand spooled detections to the next manager opened on the same data dir."""
+        detection_id = spool_detection(audio_analysis_service, "Turdus migratorius_American Robin")
+        audio_analysis_service.detection_spool.close()
+
+        restarted = AudioAnalysisManager(
             audio_analysis_service.file_manager,
             audio_analysis_service.path_resolver,
-            audio_analysis_service.config,
-            mock_species_database,
-            mock_session,
-            detection_buffer_max_size=max_size,
-            buffer_flush_interval=1.0,
-        )
-        service.analysis_client = mock_analysis_client
-        with service.buffer_lock:
-            for i in range(max_size + 3):
-                detection = {
-                    "species_tensor": f"Species_{i}",
-                    "confidence": 0.8,
-                    "timestamp": datetime.now().isoformat(),
-                }
-                service.detection_buffer.append(detection)
-        with service.buffer_lock:
-            assert len(service.detection_buffer) == max_size
-            latest_species = [d["species_tensor"] for d in service.detection_buffer]
-            assert "Species_3" in latest_species
-            assert "Species_0" not in latest_species
-        service.stop_buffer_flush_task()
-
-    async def test_buffer_thread_safety(self, audio_analysis_service):
-        """Should handle concurrent buffer operations safely."""
-        results = []
-
-        def add_detections(thread_id: int):
-            """Add detections from a thread."""
-            try:
-                for i in range(10):
-                    detection = {
-                        "species_tensor": f"Thread{thread_id}_Species_{i}",
-                        "confidence": 0.8,
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                    with audio_analysis_service.buffer_lock:
-                        audio_analysis_service.detection_buffer.append(detection)
-                    time.sleep(0.001)
-                results.append(f"thread_{thread_id}_success")
-            except Exception as e:
-                results.append(f"thread_{thread_id}_error_{e}")
-
-        with audio_analysis_service.buffer_lock:
-            audio_analysis_service.detection_buffer.clear()
-        threads = []
-        for i in range(3):
-            thread = threading.Thread(target=add_detections, args=(i,))
-            threads.append(thread)
-            thread.start()
-        for thread in threads:
-            thread.join(timeout=1.0)
-        assert len(results) == 3
-        assert all("success" in result for result in results)
-        with audio_analysis_service.buffer_lock:
-            buffer_size = len(audio_analysis_service.detection_buffer)
-            species_list = [d["species_tensor"] for d in audio_analysis_service.detection_buffer]
-        assert buffer_size > 0
-        thread_prefixes = {species.split("_")[0] for species in species_list}
-        assert len(thread_prefixes) > 1
+            test_config,
+            MagicMock(spec=SpeciesDatabaseService),
+            MagicMock(spec=AsyncSession),
+        )
+
+        assert [d.detection_id for d in restarted.detection_spool.peek(10)] == [detection_id]
+        restarted.detection_spool.close()
 
     async def test_background_flush_integration(self, audio_analysis_service, caplog):
-        """Should automatically flush buffer in background with working FastAPI."""
+        """Should automatically replay the spool in background with working FastAPI."""
         audio_analysis_service.flush_interval = 0.1
         audio_analysis_service.start_buffer_flush_task()
         with patch("httpx.AsyncClient", autospec=True) as mock_client:
-            mock_response = MagicMock(spec=httpx.Response)
-            mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
-            test_detection = {
-                "species_tensor": "Turdus migratorius",
-                "confidence": 0.9,
-                "timestamp": datetime.now().isoformat(),
-            }
-            with audio_analysis_service.buffer_lock:
-                audio_analysis_service.detection_buffer.clear()
-                audio_analysis_service.detection_buffer.append(test_detection)
-            await asyncio.sleep(0.2)
-            with audio_analysis_service.buffer_lock:
-                buffer_size = len(audio_analysis_service.detection_buffer)
-            assert buffer_size == 0
-            assert "Successfully flushed buffered detections" in caplog.text
+            mock_client.return_value.post.return_value = MagicMock(spec=httpx.Response)
+            spool_detection(audio_analysis_service, "Turdus migratorius_American Robin")
+            await asyncio.sleep(0.3)
+            assert len(audio_analysis_service.detection_spool) == 0
+            assert "Successfully flushed spooled detections" in caplog.text
 
     async def test_background_flush__failed_requests(self, audio_analysis_service, caplog):
-        """Should keep retrying buffered detections in background when FastAPI fails."""
+        """Should keep retrying spooled detections in background when FastAPI fails."""
         audio_analysis_service.flush_interval = 0.1
         audio_analysis_service.start_buffer_flush_task()
         with patch("httpx.AsyncClient", autospec=True) as mock_client:
-            mock_client.return_value.__aenter__.return_value.post.side_effect = httpx.RequestError(
+            mock_client.return_value.post.side_effect = httpx.RequestError(
                 "Connection failed", request=MagicMock(spec=httpx.Request)
             )
-            test_detection = {
-                "species_tensor": "Turdus migratorius",
-                "confidence": 0.9,
-                "timestamp": datetime.now().isoformat(),
-            }
-            with audio_analysis_service.buffer_lock:
-                audio_analysis_service.detection_buffer.clear()
-                audio_analysis_service.detection_buffer.append(test_detection)
-            await asyncio.sleep(0.2)
-            with audio_analysis_service.buffer_lock:
-                buffer_size = len(audio_analysis_service.detection_buffer)
-            assert buffer_size == 1
-            assert "Re-buffered failed detections" in caplog.text
-            mock_response = MagicMock(spec=httpx.Response)
-            mock_client.return_value.__aenter__.return_value.post.side_effect = None
-            mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
-            await asyncio.sleep(0.2)
-            with audio_analysis_service.buffer_lock:
-                buffer_size = len(audio_analysis_service.detection_buffer)
-            assert buffer_size == 0
-            assert "Successfully flushed buffered detections" in caplog.text
-
-
-class TestDetectionBufferingIntegration:
-    """Integration tests for detection buffering with full workflow."""
+            spool_detection(audio_analysis_service, "Turdus migratorius_American Robin")
+            await asyncio.sleep(0.3)
+            assert len(audio_analysis_service.detection_spool) == 1
+            assert "Spooled detections still undeliverable" in caplog.text
+            mock_client.return_value.post.side_effect = None
+            mock_client.return_value.post.return_value = MagicMock(spec=httpx.Response)
+            await asyncio.sleep(0.3)
+            assert len(audio_analysis_service.detection_spool) == 0
+            assert "Successfully flushed spooled detections" in caplog.text
+
+
+class TestDetectionSpoolingIntegration:
+    """Integration tests for detection spooling with full workflow."""
 
     @pytest.fixture(autouse=True)
     def setup_cleanup(self, audio_analysis_service):
@@ -734,68 +1343,49 @@ class TestDetectionBufferingIntegration:
         yield
         audio_analysis_service.stop_buffer_flush_task()
 
-    async def test_end_to_end_detection__buffering(self, audio_analysis_service, caplog):
-        """Should buffer detections during HTTP failures and flush when service recovers."""
+    async def test_end_to_end_detection__spooling(self, audio_analysis_service, caplog):
+        """Should spool detections during HTTP failures and replay when service recovers."""
         audio_analysis_service.analysis_client.get_analysis_results.return_value = [
             ("Turdus migratorius_American Robin", 0.85)
         ]
-        audio_analysis_service.file_manager.save_detection_audio.return_value = MagicMock(
-            spec=AudioFile, file_path="/mock/audio.wav", duration=3.0, size_bytes=1000
-        )
         with patch("httpx.AsyncClient", autospec=True) as mock_client:
-            mock_client.return_value.__aenter__.return_value.post.side_effect = httpx.RequestError(
+            mock_client.return_value.post.side_effect = httpx.RequestError(
                 "Connection failed", request=MagicMock(spec=httpx.Request)
             )
-            with audio_analysis_service.buffer_lock:
-                audio_analysis_service.detection_buffer.clear()
             audio_chunk = np.ones(48000 * 3, dtype=np.float32) * 0.1
             await audio_analysis_service._analyze_audio_chunk(audio_chunk)
-            with audio_analysis_service.buffer_lock:
-                assert len(audio_analysis_service.detection_buffer) == 1
-                buffered = next(iter(audio_analysis_service.detection_buffer))
-                assert buffered["scientific_name"] == "Turdus migratorius"
-                assert buffered["confidence"] == 0.85
-            assert "Buffered detection event for Turdus migratorius" in caplog.text
-            mock_response = MagicMock(spec=httpx.Response)
-            mock_client.return_value.__aenter__.return_value.post.side_effect = None
-            mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
+            await asyncio.gather(*audio_analysis_service._send_tasks)
+            (spooled,) = audio_analysis_service.detection_spool.peek(10)
+            assert spooled.metadata["scientific_name"] == "Turdus migratorius"
+            assert spooled.metadata["confidence"] == 0.85
+            assert "Turdus migratorius" in spooled_species(caplog)
+            mock_client.return_value.post.side_effect = None
+            mock_client.return_value.post.return_value = MagicMock(spec=httpx.Response)
             await audio_analysis_service._flush_detection_buffer()
-            with audio_analysis_service.buffer_lock:
-                assert len(audio_analysis_service.detection_buffer) == 0
-            assert "Successfully flushed buffered detections" in caplog.text
+            assert len(audio_analysis_service.detection_spool) == 0
+            assert "Successfully flushed spooled detections" in caplog.text
 
     async def test_mixed_success__failure_detection_processing(
         self, audio_analysis_service, caplog
     ):
-        """Should handle mixed scenarios where some detections succeed and others buffer."""
+        """Should handle mixed scenarios where some detections succeed and others spool."""
         audio_analysis_service.analysis_client.get_analysis_results.return_value = [
             ("Turdus migratorius_American Robin", 0.85),
             ("Corvus brachyrhynchos_American Crow", 0.75),
             ("Passer domesticus_House Sparrow", 0.8),
         ]
-        audio_analysis_service.file_manager.save_detection_audio.return_value = MagicMock(
-            spec=AudioFile, file_path="/mock/audio.wav", duration=3.0, size_bytes=1000
-        )
         with patch("httpx.AsyncClient", autospec=True) as mock_client:
-            post_mock = mock_client.return_value.__aenter__.return_value.post
-            responses = []
-            success_response = MagicMock(spec=httpx.Response)
-            responses.append(success_response)
-            responses.append(
-                httpx.RequestError("Connection failed", request=MagicMock(spec=httpx.Request))
-            )
-            success_response2 = MagicMock(spec=httpx.Response)
-            responses.append(success_response2)
-            post_mock.side_effect = responses
-            with audio_analysis_service.buffer_lock:
-                audio_analysis_service.detection_buffer.clear()
+            mock_client.return_value.post.side_effect = [
+                MagicMock(spec=httpx.Response),
+                httpx.RequestError("Connection failed", request=MagicMock(spec=httpx.Request)),
+                MagicMock(spec=httpx.Response),
+            ]
             audio_chunk = np.ones(48000 * 3, dtype=np.float32) * 0.1
             await audio_analysis_service._analyze_audio_chunk(audio_chunk)
-            with audio_analysis_service.buffer_lock:
-                assert len(audio_analysis_service.detection_buffer) == 1
-                buffered = next(iter(audio_analysis_service.detection_buffer))
-                assert buffered["scientific_name"] == "Corvus brachyrhynchos"
-            assert "Detection event sent" in caplog.text
-            assert "Bird detected: Turdus migratorius" in caplog.text
-            assert "Bird detected: Passer domesticus" in caplog.text
-            assert "Buffered detection event for Corvus brachyrhynchos" in caplog.text
+            await asyncio.gather(*audio_analysis_service._send_tasks)
+        (spooled,) = audio_analysis_service.detection_spool.peek(10)
+        assert spooled.metadata["scientific_name"] == "Corvus brachyrhynchos"
+        assert "Detection event sent" in caplog.text
+        assert "Bird detected: Turdus migratorius" in caplog.text
+        assert "Bird detected: Passer domesticus" in caplog.text
+        assert "Corvus brachyrhynchos" in spooled_species(caplog)
@@ -0,0 +1,187 @@
+"""Tests for the multi-process analysis worker pool."""
+
+import datetime
+import queue
+import time
+from datetime import UTC
+from multiprocessing.process import BaseProcess
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from birdnetpi.audio.analysis_pool import AnalysisWorkerPool
+from birdnetpi.audio.ring_buffer import WindowStamp
+
+
+def in_process_pool(config, workers):
+    """Return a pool with in-process queues and no worker processes."""
+    pool = AnalysisWorkerPool(config, workers=workers)
+    pool._tasks = [queue.Queue() for _ in range(workers)]  # type: ignore[assignment]
+    pool._results = queue.Queue()  # type: ignore[assignment]
+    return pool
+
+
+@pytest.fixture
+def pool(test_config):
+    """Provide a pool with in-process queues and no worker processes."""
+    return in_process_pool(test_config, workers=3)
+
+
+@pytest.fixture
+def windows():
+    """Provide five distinguishable windows with increasing capture times."""
+    start = datetime.datetime(2026, 5, 1, 6, 0, tzinfo=UTC)
+    return [
+        (np.full(8, index, dtype=np.float32), start + datetime.timedelta(seconds=index))
+        for index in range(5)
+    ]
+
+
+class TestAnalysisWorkerPool:
+    """Test AnalysisWorkerPool dispatch and ordered merge."""
+
+    def test_rejects_empty_pool(self, test_config):
+        """Should require at least one worker."""
+        with pytest.raises(ValueError):
+            AnalysisWorkerPool(test_config, workers=0)
+
+    def test_submit_dispatches_round_robin(self, pool, windows):
+        """Should hand consecutive windows to consecutive workers."""
+        for window, timestamp in windows:
+            pool.submit(window, timestamp)
+
+        dispatched = [[task[0] for task in list(task_queue.queue)] for task_queue in pool._tasks]
+        assert dispatched == [[0, 3], [1, 4], [2]]
+        _, _, latitude, _, week, _ = pool._tasks[0].queue[0]
+        assert week == windows[0][1].isocalendar()[1]
+        assert latitude == pool.config.latitude
+        assert pool.queue_depth == 5
+
+    def test_full_pool_holds_windows_back_and_drops_oldest(self, test_config, windows):
+        """Should send each worker only a couple of windows and drop the oldest when full."""
+        test_config.audio_pipeline.analysis_queue_windows = 3
+        pool = in_process_pool(test_config, workers=1)
+        (tasks,) = pool._tasks
+
+        for window, timestamp in windows:
+            pool.submit(window, timestamp)
+
+        assert [task[0] for task in tasks.queue] == [0, 1]  # type: ignore[attr-defined]
+        assert pool.queue_depth == 3
+        assert pool.full
+        pool._results.put((0, 0, [("Dropped", 0.9)], 0.1))
+        pool._results.put((1, 0, [], 0.1))
+        assert pool.collect() == []
+        assert [task[0] for task in tasks.queue] == [0, 1, 2, 3]  # type: ignore[attr-defined]
+        pool._results.put((2, 0, [], 0.1))
+        pool._results.put((3, 0, [("Species 3", 0.9)], 0.1))
+
+        ready = pool.collect()
+
+        assert [timestamp for timestamp, _, _, _, _ in ready] == [ts for _, ts in windows[2:4]]
+        assert ready[1][4] == [("Species 3", 0.9)]
+        assert pool.stats()["windows_dropped"] == 2
+
+    def test_block_policy_never_drops(self, test_config, windows):
+        """Should leave waiting for room to the caller under the block policy."""
+        test_config.audio_pipeline.analysis_queue_windows = 2
+        test_config.audio_pipeline.analysis_queue_policy = "block"
+        pool = in_process_pool(test_config, workers=1)
+
+        for window, timestamp in windows[:3]:
+            pool.submit(window, timestamp)
+
+        assert pool.queue_depth == 3
+        assert pool.windows_dropped == 0
+
+    def test_collect_resequences_results(self, pool, windows):
+        """Should hold back early finishers until every earlier window has completed."""
+        for window, timestamp in windows:
+            pool.submit(window, timestamp)
+
+        pool._results.put((2, 2, [("Species 2", 0.9)], 0.1))
+        pool._results.put((1, 1, [], 0.1))
+        assert pool.collect() == []
+
+        pool._results.put((0, 0, [("Species 0", 0.8)], 0.1))
+        ready = pool.collect()
+
+        assert [timestamp for timestamp, _, _, _, _ in ready] == [ts for _, ts in windows[:3]]
+        assert ready[0][4] == [("Species 0", 0.8)]
+        assert ready[2][4] == [("Species 2", 0.9)]
+        np.testing.assert_array_equal(ready[1][1], windows[1][0])
+        assert pool.queue_depth == 2
+
+    def test_collect_returns_each_windows_channel_and_stamp(self, pool, windows):
+        """Should hand each window's capture channel and stamp back with its results."""
+        window, timestamp = windows[0]
+        stamp = WindowStamp(144000, 42)
+        pool.submit(window, timestamp, channel=0, stamp=stamp)
+        pool.submit(window, timestamp, channel=1, stamp=stamp)
+
+        pool._results.put((0, 0, [], 0.1))
+        pool._results.put((1, 1, [], 0.1))
+
+        ready = pool.collect()
+        assert [channel for _, _, channel, _, _ in ready] == [0, 1]
+        assert [returned for _, _, _, returned, _ in ready] == [stamp, stamp]
+
+    def test_stats_report_depth_and_utilisation(self, pool, windows):
+        """Should report queue depths and per-worker utilisation."""
+        for window, timestamp in windows:
+            pool.submit(window, timestamp)
+        pool._results.put((1, 1, [], 0.5))
+        pool.collect()
+        pool._stats_started -= 1.0
+
+        stats = pool.stats()
+
+        assert stats["queue_depth"] == 5
+        assert stats["reorder_backlog"] == 1
+        assert stats["worker_queue_depth"] == [2, 1, 1]
+        assert stats["worker_utilisation"][0] == 0
+        assert 0.4 < stats["worker_utilisation"][1] <= 0.5
+        assert pool.stats()["worker_utilisation"] == [0.0, 0.0, 0.0]
+
+    def test_dead_worker_is_restarted_and_merge_continues(self, pool, windows, mocker):
+        """Should give up on a crashed worker's windows and restart it."""
+        spawn = mocker.patch.object(pool, "_spawn_worker", autospec=True)
+        alive = MagicMock(spec=BaseProcess, exitcode=None)
+        alive.is_alive.return_value = True
+        dead = MagicMock(spec=BaseProcess, exitcode=-9)
+        dead.is_alive.return_value = False
+        pool._processes = [dead, alive, alive]
+        for window, timestamp in windows:
+            pool.submit(window, timestamp)
+        pool._results.put((1, 1, [("Species 1", 0.9)], 0.1))
+        pool._results.put((2, 2, [], 0.1))
+
+        ready = pool.collect()
+
+        # Worker 0 held windows 0 and 3; window 4 is still with worker 1
+        assert [detections for _, _, _, _, detections in ready] == [
+            [],
+            [("Species 1", 0.9)],
+            [],
+            [],
+        ]
+        spawn.assert_called_once_with(0)
+        assert pool.worker_restarts == 1
+        assert pool.windows_lost == 2
+        pool._results.put((0, 0, [("Late", 0.9)], 0.1))
+        assert pool.collect() == []
+
+    def test_dead_worker_restart_is_backed_off(self, pool, windows, mocker):
+        """Should not respawn a worker that died moments after it was started."""
+        spawn = mocker.patch.object(pool, "_spawn_worker", autospec=True)
+        dead = MagicMock(spec=BaseProcess, exitcode=1)
+        dead.is_alive.return_value = False
+        pool._processes = [dead, None, None]
+        pool._spawned_at[0] = time.monotonic()
+        pool.submit(*windows[0])
+
+        ready = pool.collect()
+
+        assert [detections for _, _, _, _, detections in ready] == [[]]
+        spawn.assert_not_called()
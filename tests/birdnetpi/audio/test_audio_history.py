@@ -0,0 +1,114 @@
+"""Tests for the rolling audio history."""
+
+import datetime
+import uuid
+from datetime import UTC
+
+import numpy as np
+import pytest
+
+from birdnetpi.audio.audio_history import AudioHistory, read_recent_audio, to_pcm16
+
+
+@pytest.fixture
+def history_name():
+    """Provide a unique segment name so tests never share a history."""
+    return f"birdnetpi_test_{uuid.uuid4().hex[:12]}"
+
+
+@pytest.fixture
+def make_history(history_name, tmp_path):
+    """Provide a factory for histories that are closed after the test."""
+    histories = []
+
+    def factory(seconds=1.0, sample_rate=100, channels=2, dtype=np.int16):
+        history = AudioHistory(
+            seconds, sample_rate, channels, dtype, str(tmp_path), name=history_name
+        )
+        histories.append(history)
+        return history
+
+    yield factory
+    for history in histories:
+        history.close()
+
+
+def stereo(start, stop):
+    """Return frames whose left channel counts up and right channel counts down."""
+    left = np.arange(start, stop, dtype=np.int16)
+    return np.column_stack([left, -left])
+
+
+class TestAudioHistory:
+    """Test AudioHistory."""
+
+    def test_clip_spans_pre_and_post_roll(self, make_history):
+        """Should cut one channel from before the window to after it."""
+        history = make_history()
+        timestamp = datetime.datetime(2026, 5, 1, 6, 0, tzinfo=UTC)
+        history.write(stereo(0, 60))
+        history.remember_window(timestamp, 20)
+
+        start, end = history.clip_range(timestamp, 30, pre_roll=10, post_roll=5)
+
+        assert (start, end) == (10, 55)
+        clip = np.frombuffer(history.read_clip(start, end, channel=1), dtype=np.int16)
+        np.testing.assert_array_equal(clip, -np.arange(10, 55))
+
+    def test_clip_is_clamped_to_held_audio(self, make_history):
+        """Should return only the part of a range that is written and not overwritten."""
+        history = make_history()
+        history.write(stereo(0, 150))
+
+        clip = np.frombuffer(history.read_clip(20, 200, channel=0), dtype=np.int16)
+
+        assert history.oldest_frame == 50
+        np.testing.assert_array_equal(clip, np.arange(50, 150))
+
+    def test_forgets_windows_that_left_the_history(self, make_history):
+        """Should stop finding windows whose audio has been overwritten."""
+        history = make_history()
+        first = datetime.datetime(2026, 5, 1, 6, 0, tzinfo=UTC)
+        second = first + datetime.timedelta(seconds=1)
+        history.remember_window(first, 0)
+        history.write(stereo(0, 150))
+        history.remember_window(second, 120)
+
+        assert history.clip_range(first, 30, 0, 0) is None
+        assert history.clip_range(second, 30, 0, 0) == (120, 150)
+
+    def test_float32_history_clips_as_pcm16(self, make_history):
+        """Should convert float32 capture samples to int16 clips."""
+        history = make_history(channels=1, dtype=np.float32)
+        history.write(np.array([[0.5], [-1.5], [1.0]], dtype=np.float32))
+
+        clip = np.frombuffer(history.read_clip(0, 3, channel=0), dtype=np.int16)
+
+        np.testing.assert_array_equal(clip, [16383, -32767, 32767])
+        np.testing.assert_array_equal(to_pcm16(clip), clip)
+
+
+class TestReadRecentAudio:
+    """Test read_recent_audio."""
+
+    def test_returns_newest_audio_of_a_channel(self, make_history, history_name):
+        """Should copy the newest seconds of one channel with the sample rate."""
+        history = make_history(seconds=2.0)
+        history.write(stereo(0, 250))
+
+        samples, sample_rate = read_recent_audio(0.5, channel=1, name=history_name)
+
+        assert sample_rate == 100
+        np.testing.assert_array_equal(samples, -np.arange(200, 250))
+
+    def test_rejects_uncaptured_channel(self, make_history, history_name):
+        """Should raise ValueError for a channel the history does not hold."""
+        make_history()
+
+        with pytest.raises(ValueError, match="not captured"):
+            read_recent_audio(1.0, channel=2, name=history_name)
+
+    def test_missing_history_raises(self):
+        """Should raise FileNotFoundError when no history is being kept."""
+        with pytest.raises(FileNotFoundError):
+            read_recent_audio(1.0, name=f"birdnetpi_test_{uuid.uuid4().hex[:12]}")
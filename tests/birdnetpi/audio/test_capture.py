@@ -1,6 +1,7 @@
 """Tests for the AudioCaptureService class."""
 
 import os
+import time
 from unittest.mock import create_autospec, patch
 
 import numpy as np
@@ -8,7 +9,8 @@ import pytest
 import sounddevice
 
 from birdnetpi.audio.capture import AudioCaptureService
-from birdnetpi.audio.filters import FilterChain
+from birdnetpi.audio.filters import FilterChain, ResampleFilter
+from birdnetpi.audio.shared_ring import SharedAudioRing
 
 
 @pytest.fixture
@@ -103,14 +105,14 @@ def audio_service_with_fds(test_config):
 
 
 @patch("os.write", autospec=True)
-def test_callback_processes_audio_data(mock_write, audio_service_with_fds):
+def test_process_block_writes_audio_data(mock_write, audio_service_with_fds):
     """Should process audio data and write to FIFOs."""
     # Create test audio data
     frames = 1024
     indata = np.random.rand(frames, 1).astype(np.float32)
 
     # Call the callback
-    audio_service_with_fds._callback(indata, frames, None, None)
+    audio_service_with_fds._process_block(indata)
 
     # Verify data was written to both FIFOs
     assert mock_write.call_count == 2
@@ -122,6 +124,78 @@ def test_callback_processes_audio_data(mock_write, audio_service_with_fds):
         assert len(audio_bytes) == frames * 2
 
 
+@patch("os.write", autospec=True)
+def test_process_block_float32_mode_skips_int16_for_analysis(mock_write, audio_service_with_fds):
+    """Should write float32 samples for analysis and int16 samples for the livestream."""
+    audio_service_with_fds.float32_analysis = True
+    frames = 512
+    indata = np.linspace(-0.5, 0.5, frames, dtype=np.float32).reshape(frames, 1)
+
+    audio_service_with_fds._process_block(indata)
+
+    (_, analysis_bytes), (_, livestream_bytes) = (c[0] for c in mock_write.call_args_list)
+    np.testing.assert_array_equal(np.frombuffer(analysis_bytes, dtype=np.float32), indata[:, 0])
+    assert len(livestream_bytes) == frames * 2
+
+
+@patch("os.write", autospec=True)
+def test_process_block_resamples_native_rate_audio(mock_write, audio_service_with_fds):
+    """Should convert native-rate blocks to the analysis rate before writing."""
+    audio_service_with_fds.resampler = ResampleFilter(48000)
+    audio_service_with_fds.resampler.configure(16000, 1)
+    indata = np.zeros((160, 1), dtype=np.float32)
+
+    audio_service_with_fds._process_block(indata)
+
+    (_, analysis_bytes), (_, livestream_bytes) = (c[0] for c in mock_write.call_args_list)
+    assert len(analysis_bytes) == len(livestream_bytes) == 480 * 2
+
+
+@patch("os.write", autospec=True)
+def test_process_block_clips_resampler_overshoot(mock_write, audio_service_with_fds):
+    """Should saturate full-scale audio the resampler pushes past 1.0 instead of wrapping it."""
+    audio_service_with_fds.resampler = ResampleFilter(48000)
+    audio_service_with_fds.resampler.configure(16000, 1)
+    # A full-scale square wave rings past full scale after band-limiting
+    square = np.where(np.arange(1600) % 40 < 20, 1.0, -1.0).astype(np.float32)
+
+    audio_service_with_fds._process_block(square.reshape(-1, 1))
+
+    (_, analysis_bytes), _ = (c[0] for c in mock_write.call_args_list)
+    reference = ResampleFilter(48000)
+    reference.configure(16000, 1)
+    resampled = reference.process(square.reshape(-1, 1)).ravel()
+    assert np.abs(resampled).max() > 1.0
+    np.testing.assert_array_equal(
+        np.frombuffer(analysis_bytes, dtype=np.int16),
+        (np.clip(resampled, -1.0, 1.0) * 32767).astype(np.int16),
+    )
+
+
+@patch("os.write", autospec=True)
+def test_process_block_publishes_to_shared_rings(mock_write, test_config):
+    """Should publish each block to the shared-memory rings instead of the FIFOs."""
+    analysis_ring = create_autospec(SharedAudioRing, instance=True)
+    livestream_ring = create_autospec(SharedAudioRing, instance=True)
+    service = AudioCaptureService(
+        test_config,
+        None,
+        None,
+        analysis_ring=analysis_ring,
+        livestream_ring=livestream_ring,
+    )
+    frames = 256
+    indata = np.full((frames, 1), 0.5, dtype=np.float32)
+
+    service._process_block(indata)
+
+    mock_write.assert_not_called()
+    published = analysis_ring.write.call_args[0][0]
+    assert published.dtype == np.int16
+    assert published.size == frames
+    livestream_ring.write.assert_called_once()
+
+
 @patch("os.write", autospec=True)
 @patch("birdnetpi.audio.capture.logger", autospec=True)
 def test_callback_handles_stream_status_warning(mock_logger, mock_write, audio_service_with_fds):
@@ -134,13 +208,14 @@ def test_callback_handles_stream_status_warning(mock_logger, mock_write, audio_s
     status.__bool__.return_value = True
 
     audio_service_with_fds._callback(indata, frames, None, status)
+    audio_service_with_fds._drain_frame_ring()
 
-    # Should log the status warning
+    # Should log the status warning from the worker, not the realtime callback
     mock_logger.warning.assert_any_call("Audio stream status: %s", status)
 
 
 @patch("os.write", autospec=True)
-def test_callback_with_analysis_filter_chain(mock_write, audio_service_with_fds):
+def test_process_block_with_analysis_filter_chain(mock_write, audio_service_with_fds):
     """Should apply analysis filter chain to audio data."""
     # Create a mock filter chain
     mock_filter_chain = create_autospec(FilterChain)
@@ -154,7 +229,7 @@ def test_callback_with_analysis_filter_chain(mock_write, audio_service_with_fds)
     # Process audio
     frames = 1024
     indata = np.random.rand(frames, 1).astype(np.float32)
-    audio_service_with_fds._callback(indata, frames, None, None)
+    audio_service_with_fds._process_block(indata)
 
     # Verify filter chain was called
     mock_filter_chain.process.assert_called_once()
@@ -165,7 +240,7 @@ def test_callback_with_analysis_filter_chain(mock_write, audio_service_with_fds)
 
 
 @patch("os.write", autospec=True)
-def test_callback_with_livestream_filter_chain(mock_write, audio_service_with_fds):
+def test_process_block_with_livestream_filter_chain(mock_write, audio_service_with_fds):
     """Should apply livestream filter chain to audio data."""
     # Create a mock filter chain
     mock_filter_chain = create_autospec(FilterChain)
@@ -179,7 +254,7 @@ def test_callback_with_livestream_filter_chain(mock_write, audio_service_with_fd
     # Process audio
     frames = 1024
     indata = np.random.rand(frames, 1).astype(np.float32)
-    audio_service_with_fds._callback(indata, frames, None, None)
+    audio_service_with_fds._process_block(indata)
 
     # Verify filter chain was called
     mock_filter_chain.process.assert_called_once()
@@ -210,15 +285,15 @@ def test_callback_with_livestream_filter_chain(mock_write, audio_service_with_fd
     ],
 )
 @patch("birdnetpi.audio.capture.logger", autospec=True)
-def test_callback_handles_os_errors(
+def test_process_block_handles_os_errors(
     mock_logger, error, should_shutdown, log_level, log_message, audio_service_with_fds
 ):
-    """Should handle various OS errors appropriately during callback."""
+    """Should handle various OS errors appropriately when publishing a block."""
     frames = 256
     indata = np.zeros((frames, 1), dtype=np.float32)
 
     with patch("os.write", side_effect=error):
-        audio_service_with_fds._callback(indata, frames, None, None)
+        audio_service_with_fds._process_block(indata)
 
     # Verify logging
     logger_method = getattr(mock_logger, log_level)
@@ -231,6 +306,73 @@ def test_callback_handles_os_errors(
     assert audio_service_with_fds._shutdown_requested is should_shutdown
 
 
+@patch("os.write", autospec=True)
+def test_callback_only_queues_audio(mock_write, audio_service_with_fds):
+    """Should copy the block into the frame ring and leave filtering and writes to the worker."""
+    frames = 512
+    indata = np.random.rand(frames, 1).astype(np.float32)
+
+    audio_service_with_fds._callback(indata, frames, None, None)
+
+    mock_write.assert_not_called()
+    assert len(audio_service_with_fds.frame_ring) == frames
+
+    audio_service_with_fds._drain_frame_ring()
+
+    assert mock_write.call_count == 2
+    assert len(audio_service_with_fds.frame_ring) == 0
+    latency = audio_service_with_fds.stats()["latency"]
+    assert latency["capture_callback"]["count"] == 1
+    assert latency["capture_publish"]["count"] == 1
+
+
+def test_callback_counts_status_flags(audio_service):
+    """Should count overflow and underflow flags reported by PortAudio."""
+    status = sounddevice.CallbackFlags()
+    status.input_overflow = True
+    status.input_underflow = False
+    indata = np.zeros((64, 1), dtype=np.float32)
+
+    audio_service._callback(indata, 64, None, status)
+    audio_service._callback(indata, 64, None, None)
+
+    stats = audio_service.stats()
+    assert stats["callbacks"] == 2
+    assert stats["status_flags"] == 1
+    assert stats["input_overflows"] == 1
+    assert stats["input_underflows"] == 0
+    assert stats["callback_max_us"] > 0
+
+
+def test_callback_drops_blocks_when_worker_falls_behind(audio_service):
+    """Should drop whole blocks rather than block the callback when the ring is full."""
+    block = np.zeros((audio_service.frame_ring.capacity // 2 + 1, 1), dtype=np.float32)
+
+    audio_service._callback(block, len(block), None, None)
+    audio_service._callback(block, len(block), None, None)
+
+    stats = audio_service.stats()
+    assert stats["dropped_frames"] == len(block)
+    assert stats["worker_lag_frames"] == len(block)
+
+
+@patch("os.write", autospec=True)
+def test_worker_thread_publishes_queued_audio(mock_write, audio_service_with_fds):
+    """Should filter and publish queued blocks on the worker thread."""
+    audio_service_with_fds._start_worker()
+    try:
+        audio_service_with_fds._callback(np.zeros((256, 1), dtype=np.float32), 256, None, None)
+        deadline = time.monotonic() + 5.0
+        while mock_write.call_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        audio_service_with_fds._stop_worker()
+
+    assert mock_write.call_count == 2
+    assert audio_service_with_fds._worker is None
+    assert audio_service_with_fds.stats()["worker_max_lag_ms"] > 0
+
+
 # Default device handling tests
 
 
@@ -308,6 +450,19 @@ def test_filter_chain_with_resampling(mock_logger, mock_input_stream, audio_serv
     )
 
 
+@patch("sounddevice.InputStream", autospec=True)
+def test_native_rate_capture_resamples_in_process(mock_input_stream, audio_service_with_filters):
+    """Should open the device at its native rate and resample to the analysis rate."""
+    audio_service_with_filters.config.audio_pipeline.capture_sample_rate = 44100
+    audio_service_with_filters.start_capture()
+
+    assert mock_input_stream.call_args.kwargs["samplerate"] == 44100
+    assert audio_service_with_filters.resampler is not None
+    assert audio_service_with_filters.resampler.source_sample_rate == 44100
+    # Filters run after resampling, so they still see the analysis rate
+    audio_service_with_filters.analysis_filter_chain.configure.assert_called_once_with(48000, 1)
+
+
 @patch("sounddevice.InputStream", autospec=True)
 def test_filter_chain_without_resampling(mock_input_stream, audio_service_with_filters):
     """Should not add resampling filter regardless of rates."""
@@ -0,0 +1,138 @@
+"""Tests for merging same-species hits in nearby windows into one detection."""
+
+import datetime
+from datetime import UTC
+
+import numpy as np
+import pytest
+
+from birdnetpi.audio.detection_merger import DetectionMerger
+from birdnetpi.audio.ring_buffer import WindowStamp
+from birdnetpi.species.parser import SpeciesComponents
+
+RATE = 10  # Samples per second, so positions are easy to read
+WINDOW = 30  # 3 s windows
+HOP = 15  # 1.5 s overlap
+START = datetime.datetime(2026, 5, 1, 6, 0, tzinfo=UTC)
+ROBIN = SpeciesComponents("Turdus migratorius", "American Robin", "American Robin (...)")
+WREN = SpeciesComponents("Troglodytes aedon", "House Wren", "House Wren (...)")
+
+
+def window_at(index, hop=HOP):
+    """Return window ``index`` of a ramp signal, its capture time and its stamp."""
+    start = index * hop
+    samples = (np.arange(start, start + WINDOW, dtype=np.float32) + 1) / 1000
+    stamp = WindowStamp(start, (start + WINDOW) * 1_000_000_000 // RATE)
+    return samples, START + datetime.timedelta(seconds=start / RATE), stamp
+
+
+def feed(merger, hits_per_window, channel=0, hop=HOP):
+    """Add consecutive windows with the given hits and collect the emitted detections."""
+    emitted = []
+    for index, hits in enumerate(hits_per_window):
+        window, timestamp, stamp = window_at(index, hop)
+        emitted += merger.add_window(window, timestamp, channel, hits, stamp)
+    return emitted
+
+
+def ramp(start, end):
+    """Return the int16 clip bytes the merger builds for ramp samples [start, end)."""
+    return ((np.arange(start, end, dtype=np.float32) + 1) / 1000 * 32767).astype(np.int16).tobytes()
+
+
+class TestDetectionMerger:
+    """Test DetectionMerger."""
+
+    def test_merges_consecutive_hits_into_one_event(self):
+        """Should emit one detection with the max confidence and a clip over every hit."""
+        merger = DetectionMerger(RATE, WINDOW, gap_seconds=1.0)
+
+        emitted = feed(merger, [[(ROBIN, 0.6)], [(ROBIN, 0.9)], [(ROBIN, 0.7)], [], [], []])
+
+        assert len(emitted) == 1
+        detection = emitted[0]
+        assert detection.species_components == ROBIN
+        assert detection.confidence == 0.9
+        assert detection.timestamp == START
+        assert detection.windows == 3
+        # First window start (0) to the third window's end (2 * 15 + 30)
+        assert detection.clip == ramp(0, 60)
+        assert detection.stamp == window_at(2)[2]
+        assert merger.windows_merged == 2
+        assert merger.open_events == 0
+
+    def test_gap_splits_events(self):
+        """Should start a new event once the species is silent for longer than the gap."""
+        merger = DetectionMerger(RATE, WINDOW, gap_seconds=1.0)
+
+        emitted = feed(merger, [[(ROBIN, 0.8)], [], [], [], [(ROBIN, 0.7)]])
+        emitted += merger.flush()
+
+        assert [detection.windows for detection in emitted] == [1, 1]
+        assert emitted[1].timestamp == START + datetime.timedelta(seconds=6)
+        assert emitted[1].clip == ramp(60, 90)
+
+    def test_positions_windows_by_sample_index_not_capture_time(self):
+        """Should merge back-to-back windows whose capture times jitter by milliseconds."""
+        rate, window_samples = 48000, 144000
+        merger = DetectionMerger(rate, window_samples, gap_seconds=1.0)
+        window = np.full(window_samples, 0.25, dtype=np.float32)
+
+        emitted = []
+        for index, jitter_ms in enumerate([0, 2, 11, 5]):
+            start = index * window_samples
+            timestamp = START + datetime.timedelta(seconds=start / rate, milliseconds=jitter_ms)
+            stamp = WindowStamp(start, 0)
+            emitted += merger.add_window(window, timestamp, 0, [(ROBIN, 0.8)], stamp)
+        emitted += merger.flush()
+
+        assert [detection.windows for detection in emitted] == [4]
+        assert len(emitted[0].clip) == 4 * window_samples * 2  # 12 s of int16
+
+    def test_keeps_species_and_channels_apart(self):
+        """Should hold one event per species and channel."""
+        merger = DetectionMerger(RATE, WINDOW, gap_seconds=1.0)
+
+        feed(merger, [[(ROBIN, 0.8), (WREN, 0.5)], [(ROBIN, 0.6)]], channel=0)
+        feed(merger, [[(ROBIN, 0.4)]], channel=1)
+        emitted = merger.flush()
+
+        summary = {(d.channel, d.species_components.scientific_name): d.windows for d in emitted}
+        assert summary == {
+            (0, "Turdus migratorius"): 2,
+            (0, "Troglodytes aedon"): 1,
+            (1, "Turdus migratorius"): 1,
+        }
+
+    def test_discontinuous_audio_closes_events(self):
+        """Should close events when windows were skipped, e.g. by the activity gate."""
+        merger = DetectionMerger(RATE, WINDOW, gap_seconds=60.0)
+        window, timestamp, stamp = window_at(0)
+        merger.add_window(window, timestamp, 0, [(ROBIN, 0.8)], stamp)
+
+        window, timestamp, stamp = window_at(5)
+        emitted = merger.add_window(window, timestamp, 0, [(ROBIN, 0.8)], stamp)
+
+        assert len(emitted) == 1
+        assert emitted[0].clip == ramp(0, 30)
+        assert merger.open_events == 1
+
+    def test_long_events_are_cut(self):
+        """Should emit an event that reaches the maximum length and start another."""
+        merger = DetectionMerger(RATE, WINDOW, gap_seconds=1.0, max_event_seconds=6.0)
+
+        emitted = feed(merger, [[(ROBIN, 0.8)]] * 4)
+
+        assert [detection.windows for detection in emitted] == [3]
+        assert emitted[0].clip == ramp(0, 60)
+        assert merger.open_events == 1
+
+    @pytest.mark.parametrize("hop", [15, 30])
+    def test_events_close_at_any_overlap(self, hop):
+        """Should close the event once a window starts beyond the gap."""
+        merger = DetectionMerger(RATE, WINDOW, gap_seconds=1.0)
+
+        feed(merger, [[(ROBIN, 0.8)], [], [], [], []], hop=hop)
+
+        assert merger.open_events == 0
+        assert merger.flush() == []
@@ -0,0 +1,129 @@
+"""Tests for the pooled detection delivery client."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from birdnetpi.audio.detection_sender import DetectionSender
+from birdnetpi.detections.frame import DETECTION_FRAME_CONTENT_TYPE, decode_detection_frame
+
+ENDPOINT = "http://127.0.0.1:8888/api/detections/"
+
+
+@pytest.fixture
+def mock_async_client():
+    """Patch httpx.AsyncClient so posts succeed without a server."""
+    with patch("birdnetpi.audio.detection_sender.httpx.AsyncClient", autospec=True) as client:
+        client.return_value.post.return_value = MagicMock(spec=httpx.Response, status_code=201)
+        yield client
+
+
+class TestDetectionSender:
+    """Test DetectionSender."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_one_client_per_event_loop(self, mock_async_client):
+        """Should open one keep-alive client and reuse it for every base64 JSON post."""
+        sender = DetectionSender(ENDPOINT, concurrency=2)
+
+        for _ in range(3):
+            await sender.post({"species": "Turdus migratorius"}, b"\x01\x02")
+
+        mock_async_client.assert_called_once()
+        limits = mock_async_client.call_args.kwargs["limits"]
+        assert limits.max_keepalive_connections == 2
+        assert mock_async_client.return_value.post.call_count == 3
+        mock_async_client.return_value.post.assert_called_with(
+            ENDPOINT, json={"species": "Turdus migratorius", "audio_data": "AQI="}
+        )
+
+    @pytest.mark.asyncio
+    async def test_binary_mode_posts_detection_frames(self, mock_async_client):
+        """Should send metadata and raw PCM as a detection frame to the binary endpoint."""
+        sender = DetectionSender(ENDPOINT, binary=True)
+
+        await sender.post({"species": "Turdus migratorius"}, b"\x01\x02")
+
+        call = mock_async_client.return_value.post.call_args
+        assert call.args[0] == "http://127.0.0.1:8888/api/detections/binary"
+        assert call.kwargs["headers"] == {"content-type": DETECTION_FRAME_CONTENT_TYPE}
+        metadata, audio = decode_detection_frame(call.kwargs["content"])
+        assert json.loads(metadata) == {"species": "Turdus migratorius"}
+        assert audio == b"\x01\x02"
+
+    @pytest.mark.asyncio
+    async def test_post_batch_sends_one_json_array(self, mock_async_client):
+        """Should post every event in one request to the batch endpoint."""
+        sender = DetectionSender(ENDPOINT, binary=True)
+
+        await sender.post_batch([({"n": 1}, b"\x01\x02"), ({"n": 2}, b"")])
+
+        mock_async_client.return_value.post.assert_called_once_with(
+            "http://127.0.0.1:8888/api/detections/batch",
+            json=[{"n": 1, "audio_data": "AQI="}, {"n": 2, "audio_data": ""}],
+        )
+        assert sender.sent == 2
+        assert "latency_p50_ms" not in sender.stats()
+
+    @pytest.mark.asyncio
+    async def test_bounds_posts_in_flight(self, mock_async_client):
+        """Should never have more posts in flight than the concurrency limit."""
+        sender = DetectionSender(ENDPOINT, concurrency=2)
+        peak = 0
+
+        async def slow_post(*args, **kwargs):
+            nonlocal peak
+            peak = max(peak, sender.in_flight)
+            await asyncio.sleep(0.01)
+            return MagicMock(spec=httpx.Response, status_code=201)
+
+        mock_async_client.return_value.post.side_effect = slow_post
+
+        await asyncio.gather(*(sender.post({"n": n}, b"") for n in range(6)))
+
+        assert peak == 2
+        assert sender.sent == 6
+        assert sender.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_failures_are_counted_and_raised(self, mock_async_client):
+        """Should count a failed post and re-raise so the caller can buffer it."""
+        mock_async_client.return_value.post.side_effect = httpx.RequestError(
+            "Connection failed", request=httpx.Request("POST", ENDPOINT)
+        )
+        sender = DetectionSender(ENDPOINT)
+
+        with pytest.raises(httpx.RequestError):
+            await sender.post({}, b"")
+
+        assert sender.failed == 1
+        assert sender.sent == 0
+        assert "latency_p50_ms" not in sender.stats()
+
+    @pytest.mark.asyncio
+    async def test_stats_report_interval_latency(self, mock_async_client):
+        """Should report send latency percentiles and reset them for the next interval."""
+        sender = DetectionSender(ENDPOINT)
+        await sender.post({}, b"")
+        await sender.post({}, b"")
+
+        stats = sender.stats()
+
+        assert stats["sent"] == 2
+        assert 0.0 <= stats["latency_p50_ms"] <= stats["latency_max_ms"]
+        assert "latency_p50_ms" not in sender.stats()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_and_forgets_the_client(self, mock_async_client):
+        """Should close the loop's client so the next post opens a fresh one."""
+        sender = DetectionSender(ENDPOINT)
+        await sender.post({}, b"")
+
+        await sender.aclose()
+        await sender.post({}, b"")
+
+        mock_async_client.return_value.aclose.assert_awaited_once()
+        assert mock_async_client.call_count == 2
@@ -0,0 +1,111 @@
+"""Tests for the on-disk spool of undelivered detections."""
+
+import threading
+
+import pytest
+
+from birdnetpi.audio.detection_spool import DetectionSpool
+
+
+@pytest.fixture
+def spool(tmp_path):
+    """Provide a spool that is closed after the test."""
+    spool = DetectionSpool(tmp_path / "detection_spool.db", max_detections=5)
+    yield spool
+    spool.close()
+
+
+class TestDetectionSpool:
+    """Test DetectionSpool."""
+
+    def test_peek_returns_detections_in_spool_order(self, spool):
+        """Should return metadata and clip bytes oldest first without removing them."""
+        for i in range(3):
+            spool.append(f"id-{i}", {"species_tensor": f"Species {i}"}, bytes([i]))
+
+        batch = spool.peek(2)
+
+        assert [d.detection_id for d in batch] == ["id-0", "id-1"]
+        assert batch[1].metadata == {"species_tensor": "Species 1"}
+        assert batch[1].audio == b"\x01"
+        assert len(spool) == 3
+
+    def test_append_is_idempotent_per_detection_id(self, spool):
+        """Should keep one entry when the same detection is spooled twice."""
+        spool.append("id-0", {"confidence": 0.9}, b"a")
+        spool.append("id-0", {"confidence": 0.9}, b"a")
+
+        assert len(spool) == 1
+
+    def test_ack_removes_delivered_and_ignores_unknown_ids(self, spool):
+        """Should delete acknowledged detections and tolerate repeated acks."""
+        spool.append("id-0", {}, b"a")
+        spool.append("id-1", {}, b"b")
+
+        spool.ack(["id-0", "missing"])
+        spool.ack(["id-0"])
+
+        assert [d.detection_id for d in spool.peek(10)] == ["id-1"]
+        assert len(spool) == 1
+
+    def test_record_attempt_counts_failures(self, spool):
+        """Should count failed delivery attempts per detection."""
+        spool.append("id-0", {}, b"a")
+
+        spool.record_attempt(["id-0"])
+        spool.record_attempt(["id-0"])
+
+        assert spool.peek(1)[0].attempts == 2
+
+    def test_dead_letter_moves_detection_out_of_replay(self, spool):
+        """Should move a rejected detection to the dead-letter table with its reason."""
+        spool.append("id-0", {"confidence": 0.9}, b"a")
+        spool.append("id-1", {}, b"b")
+        spool.record_attempt(["id-0"])
+
+        spool.dead_letter("id-0", "rejected")
+
+        assert [d.detection_id for d in spool.peek(10)] == ["id-1"]
+        assert len(spool) == 1
+        assert spool.dead_lettered == 1
+        rows = spool._connection.execute(
+            "SELECT detection_id, metadata, audio, attempts, reason FROM dead_letter"
+        ).fetchall()
+        assert rows == [("id-0", '{"confidence": 0.9}', b"a", 1, "rejected")]
+
+    def test_full_spool_discards_oldest(self, spool):
+        """Should discard the oldest detections beyond the cap and count them."""
+        for i in range(8):
+            spool.append(f"id-{i}", {}, b"")
+
+        assert [d.detection_id for d in spool.peek(10)] == [f"id-{i}" for i in range(3, 8)]
+        assert spool.discarded == 3
+
+    def test_contents_survive_reopen(self, spool, tmp_path):
+        """Should keep spooled detections across a daemon restart."""
+        spool.append("id-0", {"confidence": 0.9}, b"clip")
+        spool.close()
+
+        reopened = DetectionSpool(tmp_path / "detection_spool.db")
+        try:
+            assert len(reopened) == 1
+            assert reopened.peek(1)[0].audio == b"clip"
+        finally:
+            reopened.close()
+
+    def test_concurrent_appends(self, tmp_path):
+        """Should accept appends from several threads without losing any."""
+        spool = DetectionSpool(tmp_path / "detection_spool.db")
+
+        def append_detections(thread_id: int) -> None:
+            for i in range(20):
+                spool.append(f"{thread_id}-{i}", {}, b"")
+
+        threads = [threading.Thread(target=append_detections, args=(i,)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5.0)
+
+        assert len(spool) == 60
+        spool.close()
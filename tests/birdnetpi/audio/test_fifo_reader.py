@@ -0,0 +1,102 @@
+"""Tests for the event-driven capture FIFO reader."""
+
+import asyncio
+import os
+
+import pytest
+
+from birdnetpi.audio.fifo_reader import FifoReader
+
+
+@pytest.fixture
+def fifo_path(tmp_path):
+    """Provide a FIFO in the test's temporary directory."""
+    path = str(tmp_path / "analysis.fifo")
+    os.mkfifo(path)
+    return path
+
+
+@pytest.fixture
+def reader(fifo_path):
+    """Provide a reader that is closed after the test."""
+    fifo_reader = FifoReader(fifo_path, max_read_bytes=10_000)
+    yield fifo_reader
+    fifo_reader.close()
+
+
+@pytest.fixture
+def writer(fifo_path, reader):
+    """Provide a write end of the FIFO, as audio capture would hold."""
+    fd = os.open(fifo_path, os.O_WRONLY)
+    yield fd
+    os.close(fd)
+
+
+class TestFifoReader:
+    """Test FifoReader."""
+
+    @pytest.mark.asyncio
+    async def test_drains_buffered_writes_in_one_read(self, reader, writer):
+        """Should return every buffered write from a single read call."""
+        for _ in range(4):
+            os.write(writer, b"\x01" * 1024)
+
+        assert await reader.read(timeout=1.0) == b"\x01" * 4096
+
+    @pytest.mark.asyncio
+    async def test_read_is_capped_at_max_read_bytes(self, fifo_path, writer):
+        """Should leave anything past max_read_bytes for the next read."""
+        capped = FifoReader(fifo_path, max_read_bytes=100)
+        try:
+            os.write(writer, b"\x02" * 150)
+
+            assert len(await capped.read(timeout=1.0)) == 100
+            assert len(await capped.read(timeout=1.0)) == 50
+        finally:
+            capped.close()
+
+    @pytest.mark.asyncio
+    async def test_queued_bytes_counts_what_a_read_left(self, fifo_path, writer):
+        """Should report the bytes still in the pipe without consuming them."""
+        capped = FifoReader(fifo_path, max_read_bytes=100)
+        try:
+            os.write(writer, b"\x02" * 150)
+            await capped.read(timeout=1.0)
+
+            assert capped.queued_bytes() == 50
+            assert len(await capped.read(timeout=1.0)) == 50
+            assert capped.queued_bytes() == 0
+        finally:
+            capped.close()
+
+    @pytest.mark.asyncio
+    async def test_waits_until_the_fifo_is_written(self, reader, writer):
+        """Should sleep on the event loop and wake when capture writes."""
+        pending = asyncio.create_task(reader.read(timeout=5.0))
+        await asyncio.sleep(0.05)
+        assert not pending.done()
+
+        os.write(writer, b"\x03" * 8)
+
+        assert await asyncio.wait_for(pending, timeout=1.0) == b"\x03" * 8
+
+    @pytest.mark.asyncio
+    async def test_times_out_without_a_writer(self, reader):
+        """Should return nothing on timeout rather than spinning on end-of-file."""
+        assert await reader.read(timeout=0.05) == b""
+        assert reader.stats()["wakeups_per_s"] < 100
+
+    @pytest.mark.asyncio
+    async def test_stats_report_wakeups_and_read_sizes(self, reader, writer):
+        """Should report read sizes for the interval and reset them."""
+        os.write(writer, b"\x04" * 300)
+        await reader.read(timeout=1.0)
+        os.write(writer, b"\x04" * 100)
+        await reader.read(timeout=1.0)
+
+        stats = reader.stats()
+
+        assert stats["read_bytes_avg"] == 200
+        assert stats["read_bytes_max"] == 300
+        assert stats["wakeups_per_s"] > 0
+        assert "read_bytes_avg" not in reader.stats()
@@ -4,10 +4,12 @@ import logging
 
 import numpy as np
 import pytest
+from scipy import signal
 
 from birdnetpi.audio.filters import (
     AudioFilter,
     FilterChain,
+    FusedIIRStage,
     HighPassFilter,
     LowPassFilter,
     PassThroughFilter,
@@ -55,7 +57,7 @@ def sample_int16_data():
         "small": np.array([1000, 2000, 3000], dtype=np.int16),
         "medium": np.array([1000, 2000, 3000, -1000, -2000], dtype=np.int16),
         "zeros": np.zeros(100, dtype=np.int16),
-        "wrong_dtype": np.array([0.1, 0.2, 0.3], dtype=np.float32),
+        "wrong_dtype": np.array([0.1, 0.2, 0.3], dtype=np.float64),
     }
 
 
@@ -286,6 +288,45 @@ class TestFrequencyFilters:
         assert params["type"] == expected_type
         assert params["sample_rate"] == test_audio_config["sample_rate"]
 
+    @pytest.mark.parametrize(
+        "filter_class,cutoff_freq",
+        [
+            pytest.param(HighPassFilter, 1000.0, id="highpass_filter"),
+            pytest.param(LowPassFilter, 2000.0, id="lowpass_filter"),
+        ],
+    )
+    def test_frequency_filter_state_carries_across_blocks(
+        self, filter_class, cutoff_freq, test_audio_config
+    ):
+        """Should filter a stream in blocks exactly as if it were filtered in one pass."""
+        rng = np.random.default_rng(0)
+        stream = rng.integers(-16000, 16000, size=4800, dtype=np.int16)
+        blockwise = filter_class(cutoff_frequency=cutoff_freq)
+        blockwise.configure(test_audio_config["sample_rate"], test_audio_config["channels"])
+        whole = filter_class(cutoff_frequency=cutoff_freq)
+        whole.configure(test_audio_config["sample_rate"], test_audio_config["channels"])
+
+        blocks = [blockwise.apply(stream[i : i + 512]) for i in range(0, len(stream), 512)]
+
+        np.testing.assert_array_equal(np.concatenate(blocks), whole.apply(stream))
+
+    def test_frequency_filter_float32_matches_int16(self, test_audio_config, test_audio_signals):
+        """Should filter float32 audio in place of int16 audio without changing the result."""
+        int16_filter = HighPassFilter(cutoff_frequency=1000.0)
+        float32_filter = HighPassFilter(cutoff_frequency=1000.0)
+        for filter_instance in (int16_filter, float32_filter):
+            filter_instance.configure(test_audio_config["sample_rate"], 1)
+        signal_float = (
+            0.5 * (test_audio_signals["low_freq_100hz"] + test_audio_signals["high_freq_5000hz"])
+        ).astype(np.float32)
+
+        float_result = float32_filter.apply(signal_float)
+        int_result = int16_filter.apply((signal_float * 32768).astype(np.int16))
+
+        assert float_result.dtype == np.float32
+        # int16 quantisation of the input and truncation of the output cost a few LSB
+        np.testing.assert_allclose(float_result * 32768, int_result, atol=3)
+
 
 class TestFilterChain:
     """Test the FilterChain implementation."""
@@ -402,6 +443,65 @@ class TestFilterChain:
         expected = np.array([110, 210, 310], dtype=np.int16)
         np.testing.assert_array_equal(result, expected)
 
+    def test_filter_chain_compiled__matches_sequential_chain(self):
+        """Should fuse consecutive IIR filters without changing the filtered stream."""
+        chains = []
+        for compiled in (False, True):
+            chain = FilterChain("TestChain", compiled=compiled)
+            chain.add_filter(HighPassFilter(cutoff_frequency=200.0))
+            chain.add_filter(LowPassFilter(cutoff_frequency=8000.0))
+            chain.add_filter(HighPassFilter(cutoff_frequency=500.0, name="HighPass2"))
+            chain.configure(48000, 1)
+            chains.append(chain)
+        rng = np.random.default_rng(1)
+        stream = rng.integers(-8000, 8000, size=9600, dtype=np.int16)
+
+        sequential, compiled = (
+            np.concatenate([chain.process(stream[i : i + 1024]) for i in range(0, 9600, 1024)])
+            for chain in chains
+        )
+
+        # The sequential chain rounds to int16 between filters; the fused cascade does not
+        assert np.max(np.abs(sequential.astype(int) - compiled.astype(int))) <= 3
+        plan = chains[1]._compiled_plan()
+        assert len(plan) == 1
+        assert isinstance(plan[0], FusedIIRStage)
+        assert len(plan[0].sos) == 6
+
+    def test_filter_chain_compiled__matches_whole_stream_cascade(self):
+        """Should carry the fused cascade state across blocks."""
+        chain = FilterChain("TestChain", compiled=True)
+        chain.add_filter(HighPassFilter(cutoff_frequency=300.0))
+        chain.add_filter(LowPassFilter(cutoff_frequency=6000.0))
+        chain.configure(48000, 1)
+        rng = np.random.default_rng(2)
+        stream = rng.integers(-8000, 8000, size=4800, dtype=np.int16)
+
+        blocks = [chain.process(stream[i : i + 480]) for i in range(0, len(stream), 480)]
+
+        sos = np.vstack([f.sos for f in chain.filters])
+        expected = np.clip(signal.sosfilt(sos, stream.astype(np.float64)), -32768, 32767)
+        np.testing.assert_array_equal(np.concatenate(blocks), expected.astype(np.int16))
+
+    def test_filter_chain_compiled__other_filters_split_runs(self):
+        """Should fuse only consecutive enabled IIR filters and rebuild when toggled."""
+        chain = FilterChain("TestChain", compiled=True)
+        chain.add_filter(HighPassFilter(cutoff_frequency=200.0))
+        chain.add_filter(PassThroughFilter("Middle"))
+        chain.add_filter(LowPassFilter(cutoff_frequency=8000.0))
+        chain.add_filter(HighPassFilter(cutoff_frequency=500.0, name="HighPass2"))
+        chain.configure(48000, 2)
+
+        assert [stage.name for stage in chain._compiled_plan()] == [
+            "HighPass",
+            "Middle",
+            "LowPass+HighPass2",
+        ]
+        chain.filters[1].disable()
+        assert [stage.name for stage in chain._compiled_plan()] == ["HighPass+LowPass+HighPass2"]
+        stereo = np.zeros((256, 2), dtype=np.int16)
+        assert chain.process(stereo).shape == (256, 2)
+
     def test_filter_chain_clear(self):
         """Should remove all filters when cleared."""
         chain = FilterChain("TestChain")
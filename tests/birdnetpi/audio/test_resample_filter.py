@@ -98,3 +98,48 @@ class TestResampleFilter:
         assert params["source_sample_rate"] == 44100
         assert params["sample_rate"] == 44100
         assert params["channels"] == 2
+
+    @pytest.mark.parametrize("source_rate", [16000, 44100, 96000])
+    def test_resample_filter_streaming_matches_one_shot(self, source_rate):
+        """Should resample block by block exactly as it resamples the whole signal."""
+        audio = np.random.default_rng(0).uniform(-0.5, 0.5, source_rate // 10).astype(np.float32)
+        whole = ResampleFilter(target_sample_rate=48000)
+        whole.configure(sample_rate=source_rate, channels=1)
+        streaming = ResampleFilter(target_sample_rate=48000)
+        streaming.configure(sample_rate=source_rate, channels=1)
+
+        expected = whole.process(audio)
+        blocks = [streaming.process(block) for block in np.array_split(audio, [1, 7, 500, 1111])]
+
+        np.testing.assert_allclose(np.concatenate(blocks), expected, atol=1e-6)
+        assert len(expected) == len(audio) * 48000 // source_rate
+
+    def test_resample_filter_preserves_tone(self):
+        """Should pass an in-band tone through at its original frequency and level."""
+        filter_obj = ResampleFilter(target_sample_rate=48000)
+        filter_obj.configure(sample_rate=44100, channels=1)
+        tone = (0.5 * np.sin(2 * np.pi * 3000 * np.arange(44100) / 44100)).astype(np.float32)
+
+        result = filter_obj.process(tone)
+
+        steady = result[1000:]  # Skip the start-up transient
+        spectrum = np.abs(np.fft.rfft(steady))
+        peak_hz = np.argmax(spectrum) * 48000 / len(steady)
+        assert len(result) == 48000
+        assert abs(peak_hz - 3000) < 2
+        assert np.sqrt(np.mean(steady**2)) == pytest.approx(0.5 / np.sqrt(2), rel=0.01)
+        assert result.dtype == np.float32
+
+    def test_resample_filter_multichannel(self):
+        """Should resample each channel of interleaved frames independently."""
+        filter_obj = ResampleFilter(target_sample_rate=48000)
+        filter_obj.configure(sample_rate=16000, channels=2)
+        frames = np.zeros((1600, 2), dtype=np.int16)
+        frames[:, 1] = 1000
+
+        result = filter_obj.process(frames)
+
+        assert result.shape == (4800, 2)
+        assert result.dtype == np.int16
+        assert not result[:, 0].any()
+        assert abs(int(result[-1, 1]) - 1000) <= 1
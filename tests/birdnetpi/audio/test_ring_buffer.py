@@ -0,0 +1,147 @@
+"""Tests for the fixed-capacity sample ring buffer."""
+
+import numpy as np
+import pytest
+
+from birdnetpi.audio.ring_buffer import FrameRing, SampleRingBuffer
+
+
+@pytest.fixture
+def ramp():
+    """Provide a monotonically increasing int16 signal so sample positions are obvious."""
+    return np.arange(1000, dtype=np.int16)
+
+
+class TestSampleRingBuffer:
+    """Test SampleRingBuffer window assembly."""
+
+    @pytest.mark.parametrize(
+        "window_size,hop_size,capacity",
+        [
+            pytest.param(0, 1, None, id="zero_window"),
+            pytest.param(10, 0, None, id="zero_hop"),
+            pytest.param(10, 11, None, id="hop_larger_than_window"),
+            pytest.param(10, 5, 9, id="capacity_smaller_than_window"),
+        ],
+    )
+    def test_invalid_sizes_raise(self, window_size, hop_size, capacity):
+        """Should reject inconsistent window, hop and capacity sizes."""
+        with pytest.raises(ValueError):
+            SampleRingBuffer(window_size, hop_size, capacity)
+
+    def test_write_accumulates_without_window(self, ramp):
+        """Should buffer samples until a full window is available."""
+        ring = SampleRingBuffer(window_size=100, hop_size=50)
+        ring.write(ramp[:60])
+
+        assert len(ring) == 60
+        assert list(ring.windows()) == []
+
+    def test_windows_overlap_by_hop(self, ramp):
+        """Should yield consecutive windows that advance by the hop size."""
+        ring = SampleRingBuffer(window_size=100, hop_size=75)
+        windows = []
+        for start in range(0, 400, 32):
+            ring.write(ramp[start : start + 32])
+            windows.extend(window.copy() for window in ring.windows())
+
+        assert len(windows) == 5
+        for index, window in enumerate(windows):
+            np.testing.assert_array_equal(window, ramp[index * 75 : index * 75 + 100])
+
+    def test_windows_are_contiguous_across_wraparound(self, ramp):
+        """Should yield contiguous windows even when the data wraps the backing store."""
+        ring = SampleRingBuffer(window_size=100, hop_size=100, capacity=140)
+        collected = []
+        for start in range(0, 1000, 37):
+            ring.write(ramp[start : start + 37])
+            collected.extend(window.copy() for window in ring.windows())
+
+        assert len(collected) == 10
+        for index, window in enumerate(collected):
+            np.testing.assert_array_equal(window, ramp[index * 100 : index * 100 + 100])
+
+    def test_windows_are_read_only_views(self, ramp):
+        """Should hand out read-only views instead of copies."""
+        ring = SampleRingBuffer(window_size=100, hop_size=100)
+        ring.write(ramp[:100])
+
+        window = next(ring.windows())
+
+        assert np.shares_memory(window, ring._data)
+        assert not window.flags.writeable
+
+    def test_window_start_tracks_absolute_position(self, ramp):
+        """Should record the absolute sample index of the last yielded window."""
+        ring = SampleRingBuffer(window_size=100, hop_size=60, capacity=300)
+        ring.write(ramp[:300])
+
+        starts = []
+        for _window in ring.windows():
+            starts.append(ring.window_start)
+
+        assert starts == [0, 60, 120, 180]
+        assert ring.total_written == 300
+
+    def test_overrun_drops_oldest_samples(self, ramp):
+        """Should drop the oldest unread samples and count them when the reader falls behind."""
+        ring = SampleRingBuffer(window_size=100, hop_size=100, capacity=150)
+        ring.write(ramp[:120])
+        ring.write(ramp[120:200])
+
+        assert ring.overrun_samples == 50
+        assert len(ring) == 150
+        window = next(ring.windows())
+        np.testing.assert_array_equal(window, ramp[50:150])
+
+    def test_oversized_write_keeps_latest_samples(self, ramp):
+        """Should keep only the most recent capacity samples from an oversized write."""
+        ring = SampleRingBuffer(window_size=100, hop_size=100, capacity=200)
+        ring.write(ramp[:500])
+
+        windows = [window.copy() for window in ring.windows()]
+
+        assert ring.total_written == 500
+        np.testing.assert_array_equal(windows[0], ramp[300:400])
+        np.testing.assert_array_equal(windows[1], ramp[400:500])
+
+    def test_clear_discards_unread_samples(self, ramp):
+        """Should discard unread samples on clear."""
+        ring = SampleRingBuffer(window_size=100, hop_size=50)
+        ring.write(ramp[:90])
+        ring.clear()
+
+        assert len(ring) == 0
+        ring.write(ramp[90:190])
+        np.testing.assert_array_equal(next(ring.windows()), ramp[90:190])
+
+
+class TestFrameRing:
+    """Test FrameRing single-producer/single-consumer handoff."""
+
+    def test_invalid_capacity_raises(self):
+        """Should reject a ring that cannot hold any frames."""
+        with pytest.raises(ValueError):
+            FrameRing(0)
+
+    def test_reads_are_contiguous_across_wraparound(self):
+        """Should hand back frames in order when blocks wrap the end of the ring."""
+        ring = FrameRing(100, channels=2)
+        frames = np.arange(600, dtype=np.float32).reshape(300, 2)
+        collected = []
+        for start in range(0, 300, 70):
+            assert ring.write(frames[start : start + 70])
+            collected.append(ring.read())
+
+        np.testing.assert_array_equal(np.concatenate(collected), frames)
+        assert len(ring) == 0
+        assert ring.read().shape == (0, 2)
+
+    def test_full_ring_drops_whole_blocks(self):
+        """Should keep unread frames intact and count the block that did not fit."""
+        ring = FrameRing(100)
+        assert ring.write(np.ones(60, dtype=np.float32))
+        assert not ring.write(np.full(60, 2.0, dtype=np.float32))
+
+        assert ring.dropped_frames == 60
+        np.testing.assert_array_equal(ring.read()[:, 0], np.ones(60))
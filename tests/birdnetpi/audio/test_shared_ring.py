@@ -0,0 +1,250 @@
+"""Tests for the shared-memory single-producer/multi-consumer audio ring."""
+
+import threading
+import time
+import uuid
+
+import numpy as np
+import pytest
+
+from birdnetpi.audio.shared_ring import (
+    SharedAudioRing,
+    SharedAudioRingReader,
+    SharedAudioRingView,
+    attach_reader,
+)
+
+
+@pytest.fixture
+def ring_name():
+    """Provide a unique segment name so tests never share a ring."""
+    return f"birdnetpi_test_{uuid.uuid4().hex[:12]}"
+
+
+@pytest.fixture
+def producer(ring_name, tmp_path):
+    """Provide a small producer ring that is closed after the test."""
+    ring = SharedAudioRing(ring_name, 100, str(tmp_path), sample_rate=48000)
+    yield ring
+    ring.close()
+
+
+@pytest.fixture
+def make_reader(ring_name, tmp_path):
+    """Provide a factory for readers that are detached after the test."""
+    readers = []
+
+    def factory():
+        reader = SharedAudioRingReader(ring_name, str(tmp_path))
+        readers.append(reader)
+        return reader
+
+    yield factory
+    for reader in readers:
+        reader.close()
+
+
+class TestSharedAudioRing:
+    """Test SharedAudioRing and SharedAudioRingReader."""
+
+    def test_reader_starts_at_live_position(self, producer, make_reader):
+        """Should only deliver samples written after the reader attached."""
+        producer.write(np.arange(10, dtype=np.int16))
+        reader = make_reader()
+        producer.write(np.arange(10, 20, dtype=np.int16))
+
+        np.testing.assert_array_equal(reader.read(), np.arange(10, 20))
+        assert reader.sample_rate == 48000
+
+    def test_consumers_have_independent_cursors(self, producer, make_reader):
+        """Should let each consumer read at its own pace from the same ring."""
+        fast = make_reader()
+        slow = make_reader()
+        producer.write(np.arange(30, dtype=np.int16))
+
+        np.testing.assert_array_equal(fast.read(), np.arange(30))
+        np.testing.assert_array_equal(slow.read(max_samples=10), np.arange(10))
+        np.testing.assert_array_equal(slow.read(), np.arange(10, 30))
+        assert fast.slot != slow.slot
+
+    def test_readers_see_when_the_latest_write_happened(self, producer, make_reader):
+        """Should stamp each write with the producer's monotonic clock."""
+        reader = make_reader()
+        assert reader.last_write_ns == 0
+
+        before = time.monotonic_ns()
+        producer.write(np.arange(10, dtype=np.int16))
+
+        assert before <= reader.last_write_ns <= time.monotonic_ns()
+
+    def test_reads_are_contiguous_across_wraparound(self, producer, make_reader):
+        """Should return samples in order when they wrap the end of the ring."""
+        reader = make_reader()
+        ramp = np.arange(1000, dtype=np.int16)
+        collected = []
+        for start in range(0, 1000, 37):
+            producer.write(ramp[start : start + 37])
+            collected.append(reader.read())
+
+        np.testing.assert_array_equal(np.concatenate(collected), ramp)
+        assert reader.overrun_samples == 0
+
+    def test_overrun_is_counted_per_consumer(self, producer, make_reader):
+        """Should skip overwritten samples for a lagging consumer and count them."""
+        lagging = make_reader()
+        current = make_reader()
+        ramp = np.arange(250, dtype=np.int16)
+        for start in range(0, 250, 50):
+            producer.write(ramp[start : start + 50])
+            current.read()
+
+        np.testing.assert_array_equal(lagging.read(), ramp[150:])
+        assert lagging.overrun_samples == 150
+        assert current.overrun_samples == 0
+        stats = {entry["slot"]: entry for entry in producer.consumer_stats()}
+        assert stats[lagging.slot]["overrun_samples"] == 150
+        assert stats[lagging.slot]["lag_samples"] == 0
+
+    def test_reader_stats_report_reads_lag_and_overruns(self, producer, make_reader):
+        """Should report the interval's reads with the reader's current lag and overruns."""
+        reader = make_reader()
+        producer.write(np.arange(250, dtype=np.int16))
+        reader.read()
+        reader.read()
+        producer.write(np.arange(30, dtype=np.int16))
+
+        stats = reader.stats()
+
+        assert stats["reads_per_s"] > 0
+        assert stats["read_samples_max"] == 100
+        assert stats["lag_samples"] == 30
+        assert stats["overrun_samples"] == 150
+        assert reader.stats()["reads_per_s"] == 0
+
+    def test_oversized_write_counts_dropped_samples(self, producer, make_reader):
+        """Should keep the newest samples of an oversized block and count the rest as lost."""
+        reader = make_reader()
+        producer.write(np.arange(250, dtype=np.int16))
+
+        np.testing.assert_array_equal(reader.read(), np.arange(150, 250))
+        assert reader.overrun_samples == 150
+
+    def test_float32_ring_round_trip(self, ring_name, tmp_path):
+        """Should carry float32 samples and tell readers the sample type."""
+        producer = SharedAudioRing(ring_name, 64, str(tmp_path), dtype=np.float32)
+        reader = SharedAudioRingReader(ring_name, str(tmp_path))
+        try:
+            samples = np.linspace(-1.0, 1.0, 40, dtype=np.float32)
+            producer.write(samples)
+
+            assert reader.dtype is np.float32
+            np.testing.assert_array_equal(reader.read(), samples)
+        finally:
+            reader.close()
+            producer.close()
+
+    def test_unsupported_sample_type_raises(self, ring_name, tmp_path):
+        """Should reject sample types readers cannot interpret."""
+        with pytest.raises(ValueError):
+            SharedAudioRing(ring_name, 64, str(tmp_path), dtype=np.float64)
+
+    def test_wait_times_out_without_data(self, producer, make_reader):
+        """Should return False when nothing is published before the timeout."""
+        reader = make_reader()
+
+        assert reader.wait(timeout=0.01) is False
+
+    def test_wait_wakes_on_doorbell(self, producer, make_reader):
+        """Should wake a blocked consumer as soon as the producer publishes."""
+        reader = make_reader()
+        result = {}
+
+        def wait_for_audio():
+            started = time.perf_counter()
+            result["ready"] = reader.wait(timeout=5.0)
+            result["elapsed"] = time.perf_counter() - started
+
+        waiter = threading.Thread(target=wait_for_audio)
+        waiter.start()
+        time.sleep(0.05)
+        producer.write(np.ones(10, dtype=np.int16))
+        waiter.join(timeout=5.0)
+
+        assert result["ready"] is True
+        assert result["elapsed"] < 1.0
+
+    @pytest.mark.asyncio
+    async def test_wait_async_returns_when_data_pending(self, producer, make_reader):
+        """Should return immediately when unread samples are already published."""
+        reader = make_reader()
+        producer.write(np.ones(10, dtype=np.int16))
+
+        assert await reader.wait_async(timeout=5.0) is True
+
+    def test_producer_close_is_visible_to_readers(self, producer, make_reader):
+        """Should flag the ring closed so consumers know to re-attach."""
+        reader = make_reader()
+        assert reader.producer_closed is False
+
+        producer.close()
+
+        assert reader.producer_closed is True
+
+    def test_closed_reader_frees_its_slot(self, producer, make_reader, ring_name, tmp_path):
+        """Should release the consumer slot when a reader detaches."""
+        reader = SharedAudioRingReader(ring_name, str(tmp_path))
+        slot = reader.slot
+        reader.close()
+
+        assert make_reader().slot == slot
+        assert len(producer.consumer_stats()) == 1
+
+    def test_attach_missing_ring_raises(self, tmp_path):
+        """Should raise FileNotFoundError when the producer has not created the ring."""
+        with pytest.raises(FileNotFoundError):
+            SharedAudioRingReader(f"birdnetpi_missing_{uuid.uuid4().hex[:12]}", str(tmp_path))
+
+    @pytest.mark.asyncio
+    async def test_attach_reader_stops_on_shutdown(self, tmp_path):
+        """Should give up waiting for the producer once shutdown is requested."""
+        calls = []
+
+        def should_stop():
+            calls.append(True)
+            return len(calls) > 2
+
+        reader = await attach_reader(
+            f"birdnetpi_missing_{uuid.uuid4().hex[:12]}",
+            str(tmp_path),
+            should_stop,
+            retry_interval=0.001,
+        )
+
+        assert reader is None
+
+
+class TestSharedAudioRingView:
+    """Test SharedAudioRingView."""
+
+    def test_reads_held_samples_by_sequence(self, producer, ring_name):
+        """Should copy held samples by sequence number and refuse overwritten ones."""
+        producer.write(np.arange(150, dtype=np.int16))
+        view = SharedAudioRingView(ring_name)
+        try:
+            assert (view.capacity, view.sample_rate, view.write_seq) == (100, 48000, 150)
+            np.testing.assert_array_equal(view.read_range(60, 140), np.arange(60, 140))
+            assert view.read_range(40, 60) is None
+            assert view.read_range(140, 160) is None
+            np.testing.assert_array_equal(view.read_latest(20), np.arange(130, 150))
+            np.testing.assert_array_equal(producer.read_range(100, 110), np.arange(100, 110))
+        finally:
+            view.close()
+
+    def test_latest_read_keeps_clear_of_the_write_position(self, producer, ring_name):
+        """Should cap reads short of the capacity so a concurrent write cannot tear them."""
+        producer.write(np.arange(300, dtype=np.int16))
+        view = SharedAudioRingView(ring_name)
+        try:
+            np.testing.assert_array_equal(view.read_latest(1000), np.arange(212, 300))
+        finally:
+            view.close()
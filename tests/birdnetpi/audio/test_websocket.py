@@ -2,11 +2,13 @@ import asyncio
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 import websockets
 from websockets import Request
 from websockets.asyncio.server import Server, ServerConnection
 
+from birdnetpi.audio.shared_ring import SharedAudioRingReader
 from birdnetpi.audio.websocket import AudioWebSocketService
 from birdnetpi.config.models import BirdNETConfig
 
@@ -311,6 +313,26 @@ class TestAudioWebSocketService:
         # Verify audio was broadcast to the client
         assert mock_client.send.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_ring_reading_loop_broadcasts_ring_audio(self, audio_websocket_service):
+        """Should broadcast samples read from the shared-memory ring."""
+        mock_reader = MagicMock(spec=SharedAudioRingReader, producer_closed=False)
+        mock_reader.read.return_value = np.arange(4, dtype=np.int16)
+        audio_websocket_service._ring_reader = mock_reader
+        mock_client = AsyncMock(spec=ServerConnection)
+        audio_websocket_service._audio_clients.add(mock_client)
+
+        async def broadcast_once(audio_data_bytes):
+            audio_websocket_service._shutdown_flag = True
+            return await original_broadcast(audio_data_bytes)
+
+        original_broadcast = audio_websocket_service._broadcast_audio_data
+        audio_websocket_service._broadcast_audio_data = broadcast_once
+        await audio_websocket_service._ring_reading_loop()
+
+        packet = mock_client.send.call_args[0][0]
+        assert packet[4:] == np.arange(4, dtype=np.int16).tobytes()
+
     @pytest.mark.asyncio
     async def test_start_general_exception(self, audio_websocket_service):
         """Should handle general exceptions during start."""
@@ -0,0 +1,243 @@
+"""Tests for the offline file analysis CLI."""
+
+import datetime
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+import soundfile as sf
+from click.testing import CliRunner
+
+from birdnetpi.audio.detection_sender import DetectionSender
+from birdnetpi.cli import analyze_files as analyze_files_module
+from birdnetpi.cli.analyze_files import (
+    AnalysisCheckpoint,
+    FileResult,
+    analyze_file,
+    find_audio_files,
+    recording_start,
+)
+from birdnetpi.detections.birdnet import BirdDetectionService
+
+SPECIES = "Turdus migratorius_American Robin"
+
+
+def write_recording(path, seconds, sample_rate=48000, channels=1, date=None):
+    """Write a quiet noise recording and return its path."""
+    rng = np.random.default_rng(0)
+    audio = (rng.standard_normal((int(seconds * sample_rate), channels)) * 0.01).astype(np.float32)
+    with sf.SoundFile(path, "w", sample_rate, channels) as sound_file:
+        if date is not None:
+            sound_file.date = date
+        sound_file.write(audio)
+    return path
+
+
+@pytest.fixture
+def worker_service():
+    """Install a mock interpreter as this process's worker service."""
+    service = MagicMock(spec=BirdDetectionService)
+    service.get_analysis_results_batch.side_effect = lambda audio_chunks, **kwargs: [
+        [(SPECIES, 0.9), ("Corvus corax_Common Raven", 0.01)] for _ in audio_chunks
+    ]
+    with patch.object(analyze_files_module, "_worker_service", service):
+        yield service
+
+
+class TestFindAudioFiles:
+    """Test find_audio_files."""
+
+    def test_expands_directories_recursively(self, tmp_path):
+        """Should find WAV and FLAC files in nested directories, sorted and deduplicated."""
+        (tmp_path / "day2").mkdir()
+        for name in ("day2/b.flac", "a.WAV", "notes.txt"):
+            (tmp_path / name).touch()
+
+        files = find_audio_files([tmp_path, tmp_path / "a.WAV"])
+
+        assert files == [(tmp_path / "a.WAV").resolve(), (tmp_path / "day2/b.flac").resolve()]
+
+
+class TestRecordingStart:
+    """Test recording_start."""
+
+    def test_uses_tagged_date(self, tmp_path):
+        """Should take the start time from the recording's date tag."""
+        path = write_recording(tmp_path / "tagged.wav", 1, date="2025-05-01T06:30:00+02:00")
+
+        with sf.SoundFile(path) as sound_file:
+            start = recording_start(path, sound_file)
+
+        assert start == datetime.datetime(2025, 5, 1, 4, 30, tzinfo=UTC)
+
+    def test_falls_back_to_modification_time(self, tmp_path):
+        """Should assume the file was closed when a recording without a date ended."""
+        path = write_recording(tmp_path / "untagged.wav", 2, sample_rate=8000)
+        ended = datetime.datetime(2025, 5, 1, 5, 0, tzinfo=UTC).timestamp()
+        os.utime(path, (ended, ended))
+
+        with sf.SoundFile(path) as sound_file:
+            start = recording_start(path, sound_file)
+
+        assert start == datetime.datetime(2025, 5, 1, 4, 59, 58, tzinfo=UTC)
+
+
+class TestAnalyzeFile:
+    """Test analyze_file."""
+
+    def test_windows_match_the_daemon(self, tmp_path, test_config, worker_service):
+        """Should cut 3 s windows at the configured overlap and keep confident results."""
+        path = write_recording(tmp_path / "dawn.wav", 6, date="2025-05-01T04:00:00+00:00")
+
+        result = analyze_file(str(path), test_config, 43.6, -79.4, batch_size=2)
+
+        hop = 3.0 - test_config.audio_overlap
+        expected_windows = int((6 - 3.0) // hop) + 1
+        assert result.windows == expected_windows
+        assert result.audio_seconds == pytest.approx(6.0)
+        assert [detection.species_tensor for detection in result.detections] == [
+            SPECIES
+        ] * expected_windows
+        assert result.detections[1].timestamp == datetime.datetime(
+            2025, 5, 1, 4, 0, tzinfo=UTC
+        ) + datetime.timedelta(seconds=hop)
+        assert len(result.detections[0].clip) == 3 * test_config.sample_rate * 2
+        call = worker_service.get_analysis_results_batch.call_args_list[0]
+        assert call.kwargs["audio_chunks"].shape == (2, 3 * test_config.sample_rate)
+        assert call.kwargs["week"] == 18
+
+    def test_resamples_and_splits_channels(self, tmp_path, test_config, worker_service):
+        """Should resample to the model rate and analyze each channel on its own."""
+        path = write_recording(tmp_path / "stereo.flac", 3, sample_rate=16000, channels=2)
+
+        result = analyze_file(str(path), test_config, 43.6, -79.4, batch_size=8)
+
+        assert result.windows == 2
+        assert [detection.channel for detection in result.detections] == [0, 1]
+        call = worker_service.get_analysis_results_batch.call_args
+        assert call.kwargs["audio_chunks"].shape == (2, 3 * test_config.sample_rate)
+
+
+class TestAnalysisCheckpoint:
+    """Test AnalysisCheckpoint."""
+
+    def test_resumes_finished_files(self, tmp_path):
+        """Should skip finished files across runs unless they have changed since."""
+        recording = tmp_path / "a.wav"
+        recording.write_bytes(b"RIFF")
+        checkpoint = AnalysisCheckpoint(tmp_path / "state" / "checkpoint.jsonl")
+        checkpoint.mark_done(recording, FileResult(str(recording), 60.0, 39))
+        with checkpoint.path.open("a") as partial:
+            partial.write('{"path": "b.wav", "si')
+
+        resumed = AnalysisCheckpoint(checkpoint.path)
+        assert resumed.is_done(recording)
+        assert len(resumed) == 1
+
+        recording.write_bytes(b"RIFF, edited")
+        assert not resumed.is_done(recording)
+
+    def test_clear_forgets_finished_files(self, tmp_path):
+        """Should delete the checkpoint so every file is analyzed again."""
+        recording = tmp_path / "a.wav"
+        recording.write_bytes(b"RIFF")
+        checkpoint = AnalysisCheckpoint(tmp_path / "checkpoint.jsonl")
+        checkpoint.mark_done(recording, FileResult(str(recording), 60.0, 39))
+
+        checkpoint.clear()
+
+        assert not checkpoint.is_done(recording)
+        assert not checkpoint.path.exists()
+
+
+class TestAnalyzeFilesCommand:
+    """Test the analyze-files command."""
+
+    @pytest.fixture
+    def run_command(self, path_resolver, test_config):
+        """Run the command with in-process workers and a mock interpreter and sender."""
+
+        def thread_pool(max_workers, mp_context, initializer, initargs):
+            return ThreadPoolExecutor(max_workers, initializer=initializer, initargs=initargs)
+
+        with (
+            patch.object(analyze_files_module, "_worker_service", None),
+            patch.object(analyze_files_module, "PathResolver", return_value=path_resolver),
+            patch.object(analyze_files_module.ConfigManager, "load", return_value=test_config),
+            patch.object(analyze_files_module, "ProcessPoolExecutor", side_effect=thread_pool),
+            patch.object(
+                analyze_files_module, "BirdDetectionService", autospec=True
+            ) as mock_service_class,
+            patch.object(analyze_files_module, "DetectionSender", autospec=True) as sender_class,
+        ):
+            mock_service_class.return_value.get_analysis_results_batch.side_effect = (
+                lambda audio_chunks, **kwargs: [[(SPECIES, 0.9)] for _ in audio_chunks]
+            )
+
+            def run(*args):
+                result = CliRunner().invoke(
+                    analyze_files_module.analyze_files, [*args, "--workers", "2"]
+                )
+                return result, sender_class.return_value
+
+            yield run
+
+    def test_posts_detections_and_reports_throughput(self, tmp_path, run_command):
+        """Should deliver every file's detections to the batch endpoint and summarize."""
+        archive = tmp_path / "archive"
+        archive.mkdir()
+        write_recording(archive / "a.wav", 3, date="2025-05-01T04:00:00+00:00")
+        write_recording(archive / "b.flac", 3, date="2025-05-01T05:00:00+00:00")
+
+        result, sender = run_command(str(archive), "--json")
+
+        assert result.exit_code == 0, result.output
+        summary = json.loads(result.output[result.output.index("{") :])
+        assert summary["files"] == 2
+        assert summary["detections"] == 2
+        assert summary["realtime_factor"] > 0
+        assert isinstance(sender, DetectionSender)
+        posted = [item for call in sender.post_batch.await_args_list for item in call.args[0]]
+        metadata = sorted((item[0] for item in posted), key=lambda m: m["timestamp"])
+        assert metadata[0]["timestamp"] == "2025-05-01T04:00:00+00:00"
+        assert metadata[0]["common_name"] == "American Robin"
+        assert metadata[0]["channel"] == 0
+        sender.aclose.assert_awaited_once()
+
+    def test_failed_file_is_counted_and_not_checkpointed(self, tmp_path, run_command):
+        """Should analyze the other files, count the failure and retry it next run."""
+        archive = tmp_path / "archive"
+        archive.mkdir()
+        write_recording(archive / "a.wav", 3)
+        (archive / "b.wav").write_bytes(b"not a recording")
+        checkpoint_path = tmp_path / "checkpoint.jsonl"
+
+        result, sender = run_command(str(archive), "--checkpoint", str(checkpoint_path), "--json")
+
+        assert result.exit_code == 1
+        summary = json.loads(result.output[result.output.index("{") :])
+        assert (summary["files"], summary["errors"], summary["detections"]) == (1, 1, 1)
+        sender.post_batch.assert_awaited_once()
+        checkpoint = AnalysisCheckpoint(checkpoint_path)
+        assert checkpoint.is_done((archive / "a.wav").resolve())
+        assert not checkpoint.is_done((archive / "b.wav").resolve())
+
+    def test_resumes_from_the_checkpoint(self, tmp_path, run_command):
+        """Should skip files finished by an earlier run and redo them with --restart."""
+        recording = write_recording(tmp_path / "a.wav", 3)
+        checkpoint = tmp_path / "checkpoint.jsonl"
+
+        run_command(str(recording), "--checkpoint", str(checkpoint))
+        result, _ = run_command(str(recording), "--checkpoint", str(checkpoint), "--json")
+        summary = json.loads(result.output[result.output.index("{") :])
+        assert (summary["files"], summary["skipped"]) == (0, 1)
+
+        result, _ = run_command(
+            str(recording), "--checkpoint", str(checkpoint), "--restart", "--json"
+        )
+        summary = json.loads(result.output[result.output.index("{") :])
+        assert (summary["files"], summary["skipped"]) == (1, 0)
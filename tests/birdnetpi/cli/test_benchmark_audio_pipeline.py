@@ -0,0 +1,250 @@
+"""Tests for the audio pipeline benchmark CLI."""
+
+import json
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from birdnetpi.cli.benchmark_audio_pipeline import (
+    benchmark_detection_ingest,
+    benchmark_filter_chain,
+    benchmark_inference_batch,
+    benchmark_model_inference,
+    benchmark_postprocessing,
+    benchmark_resample,
+    benchmark_window_assembly,
+    cli,
+    find_model_variants,
+)
+from birdnetpi.detections.birdnet import BirdDetectionService
+
+
+@pytest.fixture
+def runner():
+    """Create a Click test runner."""
+    return CliRunner()
+
+
+class TestWindowAssemblyBenchmark:
+    """Test the window assembly benchmark."""
+
+    def test_strategies_produce_same_window_count(self):
+        """Should assemble the same number of windows with both strategies."""
+        results = benchmark_window_assembly(seconds=12.0, sample_rate=16000, overlap=0.5)
+
+        concatenate = results["strategies"]["concatenate"]
+        ring_buffer = results["strategies"]["ring_buffer"]
+        assert concatenate["windows"] == ring_buffer["windows"] == 4
+        assert concatenate["allocations_per_hour"] > 0
+        assert ring_buffer["allocations_per_hour"] == 0
+        assert ring_buffer["preallocated_mb"] > 0
+
+    def test_cli_table_output(self, runner):
+        """Should print a comparison table."""
+        result = runner.invoke(
+            cli, ["window-assembly", "--seconds", "6", "--sample-rate", "8000"], obj={}
+        )
+
+        assert result.exit_code == 0
+        assert "WINDOW ASSEMBLY" in result.output
+        assert "ring_buffer" in result.output
+
+    def test_cli_json_output(self, runner):
+        """Should emit machine-readable JSON with --json."""
+        result = runner.invoke(
+            cli, ["--json", "window-assembly", "--seconds", "6", "--sample-rate", "8000"], obj={}
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert set(data["strategies"]) == {"concatenate", "ring_buffer"}
+
+
+class TestFilterChainBenchmark:
+    """Test the filter chain benchmark."""
+
+    def test_reports_each_chain_length(self):
+        """Should report sequential and compiled cost for every chain length."""
+        results = benchmark_filter_chain(max_filters=3, sample_rate=16000, seconds=0.5)
+
+        assert set(results["strategies"]) == {"1_filters", "2_filters", "3_filters"}
+        row = results["strategies"]["3_filters"]
+        assert row["sequential_us_per_block"] >= 0
+        assert row["compiled_us_per_block"] >= 0
+        assert results["blocks"] == 8
+
+    def test_cli_json_output(self, runner):
+        """Should emit machine-readable JSON with --json."""
+        result = runner.invoke(
+            cli,
+            ["--json", "filter-chain", "--max-filters", "2", "--seconds", "0.2"],
+            obj={},
+        )
+
+        assert result.exit_code == 0
+        assert set(json.loads(result.output)["strategies"]) == {"1_filters", "2_filters"}
+
+
+class TestResampleBenchmark:
+    """Test the resampling benchmark."""
+
+    def test_reports_each_source_rate(self):
+        """Should report librosa and polyphase cost for every source rate."""
+        results = benchmark_resample(source_rates=(16000, 44100), seconds=0.2)
+
+        assert set(results["strategies"]) == {"16000_hz", "44100_hz"}
+        row = results["strategies"]["44100_hz"]
+        assert row["librosa_ms_per_second"] >= 0
+        assert row["polyphase_ms_per_second"] >= 0
+
+    def test_cli_json_output(self, runner):
+        """Should emit machine-readable JSON with --json."""
+        result = runner.invoke(
+            cli,
+            ["--json", "resample", "--source-rate", "96000", "--seconds", "0.1"],
+            obj={},
+        )
+
+        assert result.exit_code == 0
+        assert set(json.loads(result.output)["strategies"]) == {"96000_hz"}
+
+
+class TestDetectionIngestBenchmark:
+    """Test the detection ingest benchmark."""
+
+    def test_reports_both_formats(self):
+        """Should report CPU and peak memory for JSON and binary-frame ingest."""
+        results = benchmark_detection_ingest(detections=2, clip_seconds=0.5)
+
+        assert set(results["strategies"]) == {"json_base64", "binary_frame"}
+        json_row = results["strategies"]["json_base64"]
+        frame_row = results["strategies"]["binary_frame"]
+        assert frame_row["peak_kib_per_detection"] < json_row["peak_kib_per_detection"]
+        assert frame_row["cpu_us_per_detection"] >= 0
+
+    def test_cli_json_output(self, runner):
+        """Should emit machine-readable JSON with --json."""
+        result = runner.invoke(
+            cli,
+            ["--json", "detection-ingest", "--detections", "1", "--clip-seconds", "0.1"],
+            obj={},
+        )
+
+        assert result.exit_code == 0
+        assert json.loads(result.output)["detections"] == 1
+
+
+class TestInferenceBatchBenchmark:
+    """Test the inference batching benchmark."""
+
+    def test_reports_each_batch_size(self, mocker):
+        """Should report throughput for every requested batch size."""
+        service = mocker.create_autospec(BirdDetectionService, instance=True)
+        service.input_length = 16
+
+        results = benchmark_inference_batch(service, batch_sizes=(1, 4), windows=8)
+
+        assert set(results["strategies"]) == {"batch_1", "batch_4"}
+        assert results["strategies"]["batch_4"]["windows_per_second"] > 0
+        # One warm-up call per batch size plus 8 single and 2 batched invokes
+        assert service.get_raw_predictions.call_count == 2 + 8 + 2
+
+
+class TestModelInferenceBenchmark:
+    """Test the model inference benchmark."""
+
+    def test_finds_detection_models_only(self, tmp_path):
+        """Should list installed detection models and skip the metadata models."""
+        for name in (
+            "BirdNET_GLOBAL_6K_V2.4_Model_FP16.tflite",
+            "BirdNET_GLOBAL_6K_V2.4_Model_INT8.tflite",
+            "BirdNET_GLOBAL_6K_V2.4_MData_Model_FP16.tflite",
+            "labels.txt",
+        ):
+            (tmp_path / name).touch()
+
+        assert find_model_variants(tmp_path) == [
+            "BirdNET_GLOBAL_6K_V2.4_Model_FP16",
+            "BirdNET_GLOBAL_6K_V2.4_Model_INT8",
+        ]
+
+    def test_reports_each_thread_count(self, test_config, mocker):
+        """Should load the model once per thread count and time single-window invokes."""
+        service_class = mocker.patch(
+            "birdnetpi.cli.benchmark_audio_pipeline.BirdDetectionService", autospec=True
+        )
+        service_class.return_value.input_length = 16
+
+        results = benchmark_model_inference(
+            test_config, "Model_INT8", thread_counts=(1, 2), windows=8, audio=np.ones(20)
+        )
+
+        assert set(results["strategies"]) == {"Model_INT8/threads_1", "Model_INT8/threads_2"}
+        row = results["strategies"]["Model_INT8/threads_2"]
+        assert row["latency_p50_ms"] <= row["latency_p99_ms"] <= row["latency_max_ms"]
+        assert row["windows_per_second"] > 0
+        assert row["peak_rss_mb"] > 0
+        assert [call.kwargs["num_threads"] for call in service_class.call_args_list] == [1, 2]
+        assert service_class.call_args.args[0].model == "Model_INT8"
+        # One warm-up call plus 8 single-window invokes per thread count
+        invokes = service_class.return_value.get_raw_predictions.call_args_list
+        assert len(invokes) == 2 * (1 + 8)
+        assert invokes[-1].args[0].shape == (1, 16)
+
+    def test_cli_json_output(self, runner, path_resolver, test_config, mocker):
+        """Should emit one row per model and thread count, tagged with the board and release."""
+        mocker.patch(
+            "birdnetpi.cli.benchmark_audio_pipeline.PathResolver", return_value=path_resolver
+        )
+        mocker.patch(
+            "birdnetpi.cli.benchmark_audio_pipeline.ConfigManager.load", return_value=test_config
+        )
+        service_class = mocker.patch(
+            "birdnetpi.cli.benchmark_audio_pipeline.BirdDetectionService", autospec=True
+        )
+        service_class.return_value.input_length = 16
+
+        result = runner.invoke(
+            cli,
+            [
+                "--json",
+                "inference",
+                "--model",
+                "Model_FP16",
+                "--model",
+                "Model_INT8",
+                "--threads",
+                "1",
+                "--windows",
+                "4",
+                "--no-isolate",
+            ],
+            obj={},
+        )
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert set(data["strategies"]) == {"Model_FP16/threads_1", "Model_INT8/threads_1"}
+        assert data["audio"] == "synthetic"
+        assert {"version", "machine", "cpu_count"} <= set(data)
+
+
+class TestPostprocessingBenchmark:
+    """Test the post-processing benchmark."""
+
+    def test_strategies_agree_on_detections(self, test_config, mocker):
+        """Should find the same detections with the legacy and vectorized strategies."""
+        mocker.patch.object(BirdDetectionService, "_load_global_model", autospec=True)
+        service = BirdDetectionService(test_config)
+        service.classes = [f"Species {i}_Common {i}" for i in range(500)] + ["Dog_Dog"]
+        service.privacy_threshold = 10.0
+        service.species_frequency_threshold = 0.03
+
+        results = benchmark_postprocessing(service, windows=20)
+
+        python_sort = results["strategies"]["python_sort"]
+        vectorized = results["strategies"]["vectorized"]
+        assert python_sort["detections"] == vectorized["detections"] > 0
+        assert vectorized["wall_us_per_window"] > 0
+        assert results["classes"] == 501
@@ -1,14 +1,20 @@
 import asyncio
 import logging
+import os
 import signal
+import time
+import uuid
 from types import FrameType
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import birdnetpi.daemons.audio_analysis_daemon as daemon
 from birdnetpi.audio.analysis import AudioAnalysisManager
+from birdnetpi.audio.fifo_reader import FifoReader
+from birdnetpi.audio.shared_ring import SharedAudioRing
 from birdnetpi.config import BirdNETConfig
 from birdnetpi.database.species import SpeciesDatabaseService
 
@@ -64,8 +70,8 @@ class TestAudioAnalysisDaemon:
 
     def test_cleanup_fifo(self, mocker, caplog):
         """Should close the FIFO file descriptor and event loop."""
-        mock_os = mocker.patch("birdnetpi.daemons.audio_analysis_daemon.os")
-        mocker.patch("birdnetpi.daemons.audio_analysis_daemon.DaemonState.fifo_analysis_fd", 456)
+        mock_reader = MagicMock(spec=FifoReader)
+        mocker.patch("birdnetpi.daemons.audio_analysis_daemon.DaemonState.fifo_reader", mock_reader)
         mocker.patch(
             "birdnetpi.daemons.audio_analysis_daemon.DaemonState.fifo_analysis_path",
             "/tmp/test_fifo.fifo",
@@ -75,7 +81,8 @@ class TestAudioAnalysisDaemon:
         mocker.patch("birdnetpi.daemons.audio_analysis_daemon.DaemonState.event_loop", mock_loop)
         mocker.patch("birdnetpi.daemons.audio_analysis_daemon.DaemonState.session", None)
         daemon._cleanup_fifo()
-        mock_os.close.assert_called_once_with(456)
+        mock_reader.close.assert_called_once()
+        assert daemon.DaemonState.fifo_reader is None
         mock_loop.close.assert_called_once()
         assert "Closed FIFO: /tmp/test_fifo.fifo" in caplog.text
 
@@ -101,6 +108,87 @@ class TestAudioAnalysisDaemon:
             assert service is not None
             mock_init.assert_called_once_with(path_resolver, config)
 
+    @pytest.mark.asyncio
+    async def test_read_fifo(self, mocker, tmp_path):
+        """Should analyze FIFO audio in large reads and publish the reader's counters."""
+        fifo_path = str(tmp_path / "birdnet_audio_analysis.fifo")
+        os.mkfifo(fifo_path)
+        mocker.patch("birdnetpi.daemons.audio_analysis_daemon.DaemonState.shutdown_flag", False)
+        mocker.patch("birdnetpi.daemons.audio_analysis_daemon.DaemonState.fifo_reader", None)
+        service = MagicMock(spec=AudioAnalysisManager, buffer_size_samples=144000)
+        service.config = BirdNETConfig()
+        service.sample_dtype = np.int16
+        service.channels = 2
+        received = []
+        capture_times = []
+
+        async def process_audio_chunk(audio_data_bytes, captured_ns):
+            received.append(audio_data_bytes)
+            capture_times.append(captured_ns)
+            daemon.DaemonState.shutdown_flag = True
+
+        service.process_audio_chunk = AsyncMock(
+            spec=AudioAnalysisManager.process_audio_chunk, side_effect=process_audio_chunk
+        )
+        try:
+            task = asyncio.create_task(daemon._read_fifo(service, fifo_path))
+            while daemon.DaemonState.fifo_reader is None:
+                await asyncio.sleep(0.01)
+            writer = os.open(fifo_path, os.O_WRONLY)
+            # Several producer-sized writes arrive before the reader wakes
+            os.write(writer, b"\x01" * 4096 * 4)
+            os.close(writer)
+            read_ns = time.monotonic_ns()
+            await asyncio.wait_for(task, timeout=5.0)
+            assert service.transport_stats == daemon.DaemonState.fifo_reader.stats
+            # One stereo int16 window per read at most
+            assert daemon.DaemonState.fifo_reader.max_read_bytes == 144000 * 2 * 2
+        finally:
+            daemon._cleanup_fifo()
+
+        assert received == [b"\x01" * 4096 * 4]
+        # Nothing was queued behind the read, so its last sample is as old as the read
+        assert read_ns <= capture_times[0] <= time.monotonic_ns()
+
+    @pytest.mark.asyncio
+    async def test_read_shared_memory(self, mocker, tmp_path):
+        """Should attach to the analysis ring and analyze published samples."""
+        ring_name = f"birdnetpi_test_{uuid.uuid4().hex[:12]}"
+        mocker.patch("birdnetpi.daemons.audio_analysis_daemon.ANALYSIS_RING_NAME", ring_name)
+        mocker.patch("birdnetpi.daemons.audio_analysis_daemon.DaemonState.shutdown_flag", False)
+        mocker.patch(
+            "birdnetpi.daemons.audio_analysis_daemon.DaemonState.analysis_ring_reader", None
+        )
+        service = MagicMock(spec=AudioAnalysisManager)
+        received = []
+        capture_times = []
+
+        async def process_audio_samples(samples, captured_ns):
+            received.append(samples.copy())
+            capture_times.append(captured_ns)
+            daemon.DaemonState.shutdown_flag = True
+
+        service.process_audio_samples = AsyncMock(
+            spec=AudioAnalysisManager.process_audio_samples, side_effect=process_audio_samples
+        )
+        producer = SharedAudioRing(ring_name, 1000, str(tmp_path))
+        try:
+            task = asyncio.create_task(daemon._read_shared_memory(service, str(tmp_path)))
+            while daemon.DaemonState.analysis_ring_reader is None:
+                await asyncio.sleep(0.01)
+            assert service.transport_stats == daemon.DaemonState.analysis_ring_reader.stats
+            written_ns = time.monotonic_ns()
+            producer.write(np.arange(100, dtype=np.int16))
+            await asyncio.wait_for(task, timeout=5.0)
+        finally:
+            daemon._cleanup_fifo()
+            producer.close()
+
+        np.testing.assert_array_equal(received[0], np.arange(100))
+        # The producer's write time travels with the samples
+        assert written_ns <= capture_times[0] <= time.monotonic_ns()
+        assert daemon.DaemonState.analysis_ring_reader is None
+
     def test_main_entry_point_condition(self, mocker):
         """Should execute main entry point code when module name is __main__."""
         mock_main = mocker.patch("birdnetpi.daemons.audio_analysis_daemon.main")
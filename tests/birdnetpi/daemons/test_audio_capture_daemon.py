@@ -10,6 +10,8 @@ import pytest
 
 import birdnetpi.daemons.audio_capture_daemon as daemon
 from birdnetpi.audio.capture import AudioCaptureService
+from birdnetpi.config import BirdNETConfig
+from birdnetpi.system.pipeline_stats import PipelineStatsStore
 
 
 @pytest.fixture(autouse=True)
@@ -22,7 +24,7 @@ def mock_daemon_setup(mocker, path_resolver):
 @pytest.fixture
 def test_config():
     """Should provide test configuration data."""
-    return {"some_config": "value", "audio": {"sample_rate": 48000}}
+    return BirdNETConfig(sample_rate=48000)
 
 
 @pytest.fixture
@@ -98,6 +100,7 @@ class TestAudioCaptureDaemon:
         fifo_paths,
         file_descriptors,
         test_config,
+        path_resolver,
         caplog,
     ):
         """Should create FIFOs, open them, start service, and clean up on shutdown."""
@@ -108,12 +111,15 @@ class TestAudioCaptureDaemon:
         mock_signal = mocker.patch("birdnetpi.daemons.audio_capture_daemon.signal")
         mock_atexit = mocker.patch("birdnetpi.daemons.audio_capture_daemon.atexit")
         mock_time = mocker.patch("birdnetpi.daemons.audio_capture_daemon.time")
+        # Started at 0s; the first loop iteration is past the stats publishing interval
+        mock_time.monotonic.side_effect = [0.0, 10.0, 10.0]
         mock_shutdown_flag = mocker.patch(
             "birdnetpi.daemons.audio_capture_daemon.DaemonState.shutdown_flag",
             new_callable=MagicMock,
         )
         # Ensure the loop runs once and then exits
         mock_shutdown_flag.__bool__.side_effect = [False, True]
+        mock_dependencies["AudioCaptureService"].return_value.stats.return_value = {"callbacks": 3}
 
         # Run the main function
         daemon.main()
@@ -138,6 +144,10 @@ class TestAudioCaptureDaemon:
         mock_signal.signal.assert_any_call(mock_signal.SIGINT, daemon._signal_handler)
         mock_time.sleep.assert_called_with(0.1)  # Changed to more responsive polling interval
 
+        # Capture counters are published for the health API
+        published = PipelineStatsStore(path_resolver).read_all()
+        assert published["capture"]["callbacks"] == 3
+
         # Assertions for log messages
         expected_logs = [
             "Starting audio capture wrapper.",
@@ -228,6 +238,41 @@ class TestAudioCaptureDaemon:
         else:
             mock_dependencies["AudioCaptureService"].return_value.start_capture.assert_not_called()
 
+    def test_run_audio_capture_daemon__shared_memory(
+        self, mocker, mock_dependencies, mock_os_operations, test_config, fifo_paths
+    ):
+        """Should publish into shared-memory rings instead of creating FIFOs."""
+        test_config.audio_pipeline.transport = "shared_memory"
+        mock_ring_class = mocker.patch(
+            "birdnetpi.daemons.audio_capture_daemon.SharedAudioRing", autospec=True
+        )
+        mocker.patch("birdnetpi.daemons.audio_capture_daemon.signal")
+        mocker.patch("birdnetpi.daemons.audio_capture_daemon.atexit")
+        mocker.patch("birdnetpi.daemons.audio_capture_daemon.time")
+        mock_shutdown_flag = mocker.patch(
+            "birdnetpi.daemons.audio_capture_daemon.DaemonState.shutdown_flag",
+            new_callable=MagicMock,
+        )
+        mock_shutdown_flag.__bool__.side_effect = [False, True]
+
+        daemon.main()
+
+        mock_os_operations["mkfifo"].assert_not_called()
+        mock_os_operations["open"].assert_not_called()
+        assert mock_ring_class.call_count == 2
+        expected_capacity = 10 * 48000 * test_config.audio_channels
+        assert mock_ring_class.call_args_list[0][0][1] == expected_capacity
+        mock_dependencies["AudioCaptureService"].assert_called_once_with(
+            test_config,
+            None,
+            None,
+            analysis_ring=mock_ring_class.return_value,
+            livestream_ring=mock_ring_class.return_value,
+        )
+        mock_dependencies["AudioCaptureService"].return_value.start_capture.assert_called_once()
+        # Rings are closed (and unlinked) during cleanup
+        assert mock_ring_class.return_value.close.call_count == 2
+
     @pytest.mark.parametrize(
         "signal_type",
         [pytest.param(signal.SIGTERM, id="sigterm"), pytest.param(signal.SIGINT, id="sigint")],
@@ -2,6 +2,7 @@ import logging
 
 import numpy as np
 import pytest
+from ai_edge_litert.interpreter import Interpreter
 
 from birdnetpi.detections.birdnet import BirdDetectionService
 
@@ -50,3 +51,208 @@ def test_get_filtered_species_list(bird_detection_service):
     # any species for the given location/week, which is valid behavior
     if len(species_list) > 0:
         assert isinstance(species_list[0], str)
+
+
+@pytest.fixture
+def predict_filter_raw(mocker):
+    """Mock the metadata model so every species is expected at every location."""
+    return mocker.patch.object(
+        BirdDetectionService,
+        "_predict_filter_raw",
+        autospec=True,
+        side_effect=lambda self, latitude, longitude, week: np.ones(len(self.classes)),
+    )
+
+
+@pytest.fixture
+def batch_detection_service(test_config, path_resolver, predict_filter_raw, mocker):
+    """Provide a BirdDetectionService backed by a mocked interpreter for batching tests."""
+    mocker.patch.object(BirdDetectionService, "_load_global_model", autospec=True)
+    mocker.patch(
+        "birdnetpi.system.path_resolver.PathResolver",
+        return_value=path_resolver,
+    )
+    service = BirdDetectionService(test_config)
+    service.classes = [f"Species {i}_Common {i}" for i in range(20)]
+    service.input_length = 8
+    service.input_layer_index = 0
+    service.output_layer_index = 1
+    service.privacy_threshold = 100.0
+    service.species_frequency_threshold = 0.5
+
+    interpreter = mocker.create_autospec(Interpreter, instance=True)
+    tensors = {}
+
+    def set_tensor(index, value):
+        tensors[index] = value
+
+    def get_tensor(index):
+        # Each window's logits peak at the class given by its first sample
+        audio = tensors[service.input_layer_index]
+        logits = np.full((len(audio), len(service.classes)), -10.0, dtype=np.float32)
+        logits[np.arange(len(audio)), audio[:, 0].astype(int)] = 10.0
+        return logits
+
+    interpreter.set_tensor.side_effect = set_tensor
+    interpreter.get_tensor.side_effect = get_tensor
+    service.interpreter = interpreter
+    return service
+
+
+def test_get_raw_predictions__batch_matches_single(batch_detection_service):
+    """Should return the same ranking for a window whether batched or analyzed alone."""
+    windows = np.zeros((3, 8), dtype=np.float32)
+    windows[:, 0] = [2, 5, 7]
+
+    batched = batch_detection_service.get_raw_predictions(windows, 0.0, 0.0, 1, 1.0)
+    single = [
+        batch_detection_service.get_raw_prediction(window, 0.0, 0.0, 1, 1.0) for window in windows
+    ]
+
+    assert batched == single
+    assert [ranked[0][0] for ranked in batched] == [
+        "Species 2_Common 2",
+        "Species 5_Common 5",
+        "Species 7_Common 7",
+    ]
+
+
+def test_get_raw_predictions__pads_to_fixed_batch_size(batch_detection_service):
+    """Should size the input tensor once and pad partial batches instead of resizing."""
+    service = batch_detection_service
+    service.set_batch_size(4)
+    interpreter = service.interpreter
+    windows = np.zeros((6, 8), dtype=np.float32)
+    windows[:, 0] = [1, 2, 3, 4, 5, 6]
+
+    single = service.get_raw_predictions(windows[:1], 0.0, 0.0, 1, 1.0)
+    batched = service.get_raw_predictions(windows, 0.0, 0.0, 1, 1.0)
+
+    interpreter.resize_tensor_input.assert_called_once_with(0, [4, 8])
+    interpreter.allocate_tensors.assert_called_once()
+    assert interpreter.invoke.call_count == 1 + 2
+    assert len(single) == 1
+    assert [ranked[0][0] for ranked in batched] == [f"Species {i}_Common {i}" for i in range(1, 7)]
+
+
+def test_get_analysis_results_batch__filters_each_window(batch_detection_service):
+    """Should apply the confidence threshold to every window independently."""
+    windows = np.zeros((2, 8), dtype=np.float32)
+    windows[:, 0] = [3, 11]
+
+    results = batch_detection_service.get_analysis_results_batch(windows, 0.0, 0.0, 1, 1.0)
+
+    assert [[species for species, _ in window] for window in results] == [
+        ["Species 3_Common 3"],
+        ["Species 11_Common 11"],
+    ]
+
+
+def test_get_analysis_results__matches_filtered_ranking(batch_detection_service):
+    """Should return exactly the bird species of the full ranking that pass the threshold."""
+    service = batch_detection_service
+    service.classes = [*service.classes[:18], "Dog_Dog", "Noise_Noise"]
+    service.species_frequency_threshold = 0.2
+    rng = np.random.default_rng(7)
+    prediction = rng.normal(-1.0, 2.0, size=len(service.classes)).astype(np.float32)
+    prediction[18:] = 5.0  # Non-bird labels score highest
+
+    ranked = service._rank_prediction(prediction, 1.25)
+    detected = service._detect_species(prediction, 1.25, service._non_bird_mask)
+
+    expected = [
+        (species, confidence)
+        for species, confidence in ranked
+        if confidence >= 0.2 and species not in {"Dog_Dog", "Noise_Noise"}
+    ]
+    assert detected == expected
+    assert len(detected) > 0
+    assert all(isinstance(confidence, float) for _, confidence in detected)
+
+
+def test_rank_prediction__respects_privacy_cutoff(batch_detection_service):
+    """Should return only the top-ranked classes allowed by the privacy threshold."""
+    service = batch_detection_service
+    service.classes = [f"Species {i}_Common {i}" for i in range(200)]
+    service.privacy_threshold = 10.0
+    prediction = np.linspace(-5.0, 5.0, 200, dtype=np.float32)
+
+    ranked = service._rank_prediction(prediction, 1.0)
+    detected = service._detect_species(prediction, 1.0, service._non_bird_mask)
+
+    assert [species for species, _ in ranked] == [
+        f"Species {i}_Common {i}" for i in range(199, 179, -1)
+    ]
+    # Every class passes the 0.5 threshold above 0, but only the top 20 may be reported
+    assert [species for species, _ in detected] == [species for species, _ in ranked]
+
+
+def test_get_analysis_results__applies_location_mask(batch_detection_service, predict_filter_raw):
+    """Should drop species the metadata model does not expect at the location and week."""
+    service = batch_detection_service
+    occurrence = np.ones(len(service.classes), dtype=np.float32)
+    occurrence[5] = 0.01
+    predict_filter_raw.side_effect = None
+    predict_filter_raw.return_value = occurrence
+    windows = np.zeros((2, 8), dtype=np.float32)
+    windows[:, 0] = [5, 6]
+
+    results = service.get_analysis_results_batch(windows, 45.0, -75.0, 20, 1.0)
+
+    assert results == [[], [("Species 6_Common 6", pytest.approx(1.0, abs=1e-4))]]
+    assert "Species 5_Common 5" not in service.get_filtered_species_list(45.0, -75.0, 20)
+    predict_filter_raw.assert_called_once_with(service, 45.0, -75.0, 20)
+
+
+def test_get_analysis_results__location_filter_independent_of_confidence(
+    batch_detection_service, predict_filter_raw
+):
+    """Should keep a confident detection of an uncommon species under a strict confidence cutoff."""
+    service = batch_detection_service
+    service.species_frequency_threshold = 0.7
+    occurrence = np.ones(len(service.classes), dtype=np.float32)
+    occurrence[5] = 0.1
+    predict_filter_raw.side_effect = None
+    predict_filter_raw.return_value = occurrence
+    windows = np.zeros((1, 8), dtype=np.float32)
+    windows[:, 0] = 5
+
+    results = service.get_analysis_results_batch(windows, 45.0, -75.0, 20, 1.0)
+
+    assert results == [[("Species 5_Common 5", pytest.approx(1.0, abs=1e-4))]]
+    assert "Species 5_Common 5" in service.get_filtered_species_list(45.0, -75.0, 20)
+
+    service.species_occurrence_threshold = 0.2
+    results = service.get_analysis_results_batch(windows, 45.0, -75.0, 20, 1.0)
+
+    assert results == [[]]
+
+
+def test_location_occurrence__cached_on_disk(
+    batch_detection_service, predict_filter_raw, path_resolver
+):
+    """Should reuse persisted occurrence scores instead of re-running the metadata model."""
+    service = batch_detection_service
+    first = service._location_occurrence(45.001, -75.004, 20)
+    service._occurrence_key = None  # Simulate a restart
+
+    second = service._location_occurrence(44.998, -74.996, 20)
+
+    assert predict_filter_raw.call_count == 1
+    np.testing.assert_array_equal(first, second)
+    cache_files = list(path_resolver.get_species_occurrence_cache_dir().glob("*.npy"))
+    assert [path.name for path in cache_files] == [
+        f"{service.config.metadata_model}_45.00_-75.00_w20.npy"
+    ]
+
+
+def test_location_occurrence__metadata_model_failure(batch_detection_service, predict_filter_raw):
+    """Should report every bird species when the metadata model cannot be run."""
+    service = batch_detection_service
+    predict_filter_raw.side_effect = ValueError("model missing")
+
+    excluded = service._excluded_classes(45.0, -75.0, 20)
+    service._excluded_classes(45.0, -75.0, 20)
+
+    assert not excluded.any()
+    assert predict_filter_raw.call_count == 1
@@ -0,0 +1,137 @@
+"""Tests for the background detection clip writer."""
+
+import dataclasses
+import uuid
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from birdnetpi.detections.clip_writer import ClipWrite, ClipWriter
+from birdnetpi.detections.models import ClipStatus
+
+
+@pytest.fixture
+def clip_writer(path_resolver, db_service_factory):
+    """Provide a writer with a mock database, its status updates recorded."""
+    database_service, _session, result = db_service_factory()
+    result.rowcount = 0  # No clips were abandoned by a previous run
+    writer = ClipWriter(database_service, path_resolver, max_queued=4, fsync_interval=0.2)
+    with patch.object(ClipWriter, "_mark", autospec=True) as mock_mark:
+        writer.mock_mark = mock_mark  # type: ignore[attr-defined]
+        yield writer
+
+
+def clip(relative_path, channels=1):
+    """Return a clip of a quiet ramp for a new AudioFile."""
+    audio = np.arange(-300, 300, dtype=np.int16)
+    return ClipWrite(uuid.uuid4(), Path(relative_path), audio.tobytes(), 8000, channels)
+
+
+class TestClipWriter:
+    """Test ClipWriter."""
+
+    @pytest.mark.asyncio
+    async def test_writes_clips_in_one_fsync_round(self, clip_writer, path_resolver):
+        """Should write clips queued together, sync them once and mark them ready."""
+        clips = [clip("robin/a.wav"), clip("robin/b.wav"), clip("crow/c.wav", channels=2)]
+        await clip_writer.start()
+
+        for write in clips:
+            await clip_writer.submit(write)
+        await clip_writer.stop()
+
+        recordings_dir = path_resolver.get_recordings_dir()
+        audio, sample_rate = sf.read(recordings_dir / "robin/a.wav", dtype="int16")
+        assert sample_rate == 8000
+        np.testing.assert_array_equal(audio, np.arange(-300, 300))
+        assert sf.info(str(recordings_dir / "crow/c.wav")).channels == 2
+        assert clip_writer.fsync_rounds == 1
+        assert clip_writer.clips_written == 3
+        assert clip_writer._directories == {recordings_dir / "robin", recordings_dir / "crow"}
+        clip_writer.mock_mark.assert_awaited_once_with(
+            clip_writer, [write.audio_file_id for write in clips], ClipStatus.READY
+        )
+
+    @pytest.mark.asyncio
+    async def test_marks_unwritable_clips_failed(self, clip_writer, path_resolver):
+        """Should mark a clip that cannot be written as failed without losing the others."""
+        blocker = path_resolver.get_recordings_dir() / "blocked"
+        blocker.parent.mkdir(parents=True, exist_ok=True)
+        blocker.write_text("a file where a directory should be")
+        good, bad = clip("robin/a.wav"), clip("blocked/b.wav")
+        await clip_writer.start()
+
+        await clip_writer.submit(good)
+        await clip_writer.submit(bad)
+        await clip_writer.stop()
+
+        assert (clip_writer.clips_written, clip_writer.clips_failed) == (1, 1)
+        clip_writer.mock_mark.assert_any_await(clip_writer, [good.audio_file_id], ClipStatus.READY)
+        clip_writer.mock_mark.assert_any_await(clip_writer, [bad.audio_file_id], ClipStatus.FAILED)
+
+    @pytest.mark.asyncio
+    async def test_signals_detections_once_clips_are_marked(self, clip_writer, model_factory):
+        """Should send the held detection signal only after the clip's status is recorded."""
+        detection = model_factory.create_detection()
+        write = dataclasses.replace(clip("robin/a.wav"), detection=detection)
+        with patch(
+            "birdnetpi.detections.clip_writer.detection_signal", autospec=True
+        ) as mock_signal:
+            mock_signal.send.side_effect = lambda *args, **kwargs: (
+                clip_writer.mock_mark.assert_awaited_once()
+            )
+            await clip_writer.start()
+
+            await clip_writer.submit(write)
+            await clip_writer.submit(clip("robin/b.wav"))
+            await clip_writer.stop()
+
+        mock_signal.send.assert_called_once_with(clip_writer, detection=detection)
+
+    @pytest.mark.asyncio
+    async def test_recreates_removed_directory(self, clip_writer, path_resolver):
+        """Should recreate a cached directory that was removed between clips."""
+        await clip_writer.start()
+        await clip_writer.submit(clip("robin/a.wav"))
+        await clip_writer.stop()
+        directory = path_resolver.get_recordings_dir() / "robin"
+        (directory / "a.wav").unlink()
+        directory.rmdir()
+
+        await clip_writer.start()
+        await clip_writer.submit(clip("robin/b.wav"))
+        await clip_writer.stop()
+
+        assert (directory / "b.wav").is_file()
+
+    @pytest.mark.asyncio
+    async def test_start_fails_abandoned_clips(self, path_resolver, db_service_factory):
+        """Should mark clips left pending by a previous run as failed before writing."""
+        database_service, session, result = db_service_factory()
+        result.rowcount = 2
+        writer = ClipWriter(database_service, path_resolver, max_queued=1)
+
+        await writer.start()
+        await writer.stop()
+
+        statement = session.execute.await_args.args[0]
+        assert statement.compile().params == {
+            "clip_status": ClipStatus.FAILED.value,
+            "clip_status_1": ClipStatus.PENDING.value,
+        }
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_submit_waits_while_the_queue_is_full(self, clip_writer):
+        """Should wait off the event loop for room rather than drop a clip."""
+        clip_writer._queue.maxsize = 1
+        clip_writer._queue.put_nowait(clip("robin/a.wav"))
+
+        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_to_thread:
+            await clip_writer.submit(clip("robin/b.wav"))
+
+        mock_to_thread.assert_awaited_once()
+        assert mock_to_thread.call_args.args[0] == clip_writer._queue.put
@@ -1,15 +1,19 @@
 """Tests for the DataManager - single source of truth for detection data access."""
 
 import base64
+import time
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import MagicMock, create_autospec
+from uuid import UUID
 
 import pytest
 from sqlalchemy.engine import ScalarResult
 from sqlalchemy.exc import SQLAlchemyError
 
+from birdnetpi.detections.clip_writer import ClipWrite, ClipWriter
 from birdnetpi.detections.manager import DataManager
-from birdnetpi.detections.models import AudioFile, Detection
+from birdnetpi.detections.models import AudioFile, ClipStatus, Detection
 from birdnetpi.system.file_manager import FileManager
 
 
@@ -103,6 +107,219 @@ class TestCoreOperations:
         assert isinstance(detection_call[0][0], Detection)
         session.commit.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_create_detection__raw_audio_bytes(
+        self, data_manager, mock_services, detection_event_factory, db_service_factory
+    ):
+        """Should save raw PCM from the binary ingest path without base64 decoding."""
+        mock_db_service, session, _result = db_service_factory()
+        mock_services["database_service"].get_async_db = mock_db_service.get_async_db
+        mock_services["file_manager"].save_detection_audio.return_value = AudioFile(
+            file_path=Path("clip.wav"), duration=3.0, size_bytes=15
+        )
+        detection_event = detection_event_factory(
+            scientific_name="Turdus migratorius",
+            timestamp=datetime(2023, 1, 1, 12, 0, 0),
+            audio_data="",
+        )
+
+        await data_manager.create_detection(detection_event, b"test audio data")
+
+        saved_bytes = mock_services["file_manager"].save_detection_audio.call_args.args[1]
+        assert saved_bytes == b"test audio data"
+        assert isinstance(session.add.call_args_list[0][0][0], AudioFile)
+
+    @pytest.mark.asyncio
+    async def test_create_detection__queues_clip_for_writer(
+        self, data_manager, mock_services, detection_event_factory, db_service_factory, mocker
+    ):
+        """Should commit a pending AudioFile and leave the clip and its signal to the writer."""
+        mock_signal = mocker.patch("birdnetpi.detections.manager.detection_signal", autospec=True)
+        mock_db_service, session, _result = db_service_factory()
+        mock_services["database_service"].get_async_db = mock_db_service.get_async_db
+        clip_writer = create_autospec(ClipWriter, instance=True)
+        clip_writer.submit.side_effect = lambda write: session.commit.assert_awaited_once()
+        data_manager.clip_writer = clip_writer
+        detection_event = detection_event_factory(
+            scientific_name="Turdus migratorius",
+            timestamp=datetime(2023, 1, 1, 12, 0, 0),
+            audio_data="",
+            sample_rate=48000,
+            channels=1,
+        )
+
+        detection = await data_manager.create_detection(detection_event, b"\x00\x01" * 48000)
+
+        mock_services["file_manager"].save_detection_audio.assert_not_called()
+        audio_file = session.add.call_args_list[0].args[0]
+        assert audio_file.clip_status == ClipStatus.PENDING
+        assert audio_file.duration == 1.0
+        assert detection.audio_file_id == audio_file.id
+        clip_writer.submit.assert_awaited_once_with(
+            ClipWrite(audio_file.id, audio_file.file_path, b"\x00\x01" * 48000, 48000, 1, detection)
+        )
+        mock_signal.send.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_detection__channels_get_separate_clips(
+        self, data_manager, mock_services, detection_event_factory, db_service_factory
+    ):
+        """Should not let one bird heard on two channels at once share a clip path."""
+        mock_db_service, _session, _result = db_service_factory()
+        mock_services["database_service"].get_async_db = mock_db_service.get_async_db
+        timestamp = datetime(2023, 1, 1, 12, 0, 0)
+
+        for channel in (0, 1):
+            await data_manager.create_detection(
+                detection_event_factory(
+                    scientific_name="Turdus migratorius",
+                    timestamp=timestamp,
+                    audio_data="",
+                    channel=channel,
+                ),
+                b"audio",
+            )
+
+        save = mock_services["file_manager"].save_detection_audio
+        paths = [call.args[0] for call in save.call_args_list]
+        assert len(set(paths)) == 2
+
+    @pytest.mark.asyncio
+    async def test_create_detections__channels_get_separate_clips(
+        self, data_manager, mock_services, detection_event_factory, db_service_factory
+    ):
+        """Should give each channel's detection of a batch its own clip path."""
+        mock_db_service, session, result = db_service_factory()
+        mock_services["database_service"].get_async_db = mock_db_service.get_async_db
+        mock_services["file_manager"].save_detection_audio.side_effect = (
+            lambda path, *args: AudioFile(file_path=path, duration=3.0, size_bytes=5)
+        )
+        result.scalars.side_effect = lambda: iter(session.add_all.call_args_list[1].args[0])
+        timestamp = datetime(2023, 1, 1, 12, 0, 0)
+        events = [
+            detection_event_factory(
+                scientific_name="Turdus migratorius",
+                timestamp=timestamp,
+                audio_data="",
+                channel=channel,
+            )
+            for channel in (0, 1)
+        ]
+
+        await data_manager.create_detections([(event, b"audio") for event in events])
+
+        audio_files = session.add_all.call_args_list[0].args[0]
+        assert len({audio_file.file_path for audio_file in audio_files}) == 2
+
+    @pytest.mark.asyncio
+    async def test_create_detection__keeps_client_id(
+        self, data_manager, mock_services, detection_event_factory, db_service_factory
+    ):
+        """Should store the detection under the ID its sender generated."""
+        mock_db_service, session, _result = db_service_factory()
+        mock_services["database_service"].get_async_db = mock_db_service.get_async_db
+        detection_id = UUID("12345678-1234-5678-1234-567812345678")
+        detection_event = detection_event_factory(id=detection_id)
+
+        await data_manager.create_detection(detection_event)
+
+        (detection,) = [call.args[0] for call in session.add.call_args_list]
+        assert detection.id == detection_id
+
+    @pytest.mark.asyncio
+    async def test_create_detections(
+        self, data_manager, mock_services, detection_event_factory, db_service_factory, mocker
+    ):
+        """Should save every clip, commit all rows at once and signal after the commit."""
+        mock_signal = mocker.patch("birdnetpi.detections.manager.detection_signal", autospec=True)
+        mock_db_service, session, result = db_service_factory()
+        mock_services["database_service"].get_async_db = mock_db_service.get_async_db
+        mock_services["file_manager"].save_detection_audio.return_value = AudioFile(
+            file_path=Path("clip.wav"), duration=3.0, size_bytes=15
+        )
+        # The reload after commit returns the rows that were added
+        result.scalars.side_effect = lambda: iter(session.add_all.call_args_list[1].args[0])
+        now_ns = time.monotonic_ns()
+        events = [
+            # Captured before a reboot: ahead of this boot's monotonic clock
+            detection_event_factory(
+                scientific_name="Turdus migratorius", audio_data="", captured_ns=now_ns * 2
+            ),
+            detection_event_factory(
+                scientific_name="Corvus brachyrhynchos",
+                audio_data="",
+                channel=1,
+                captured_ns=now_ns - 2_000_000_000,
+            ),
+        ]
+
+        created = await data_manager.create_detections(
+            [(events[0], b"robin audio"), (events[1], b"crow audio")]
+        )
+
+        assert [d.scientific_name for d in created] == [
+            "Turdus migratorius",
+            "Corvus brachyrhynchos",
+        ]
+        assert mock_services["file_manager"].save_detection_audio.call_count == 2
+        audio_files, detections = (call.args[0] for call in session.add_all.call_args_list)
+        assert len(audio_files) == 2
+        assert detections == created
+        session.commit.assert_called_once()
+        assert [call.kwargs["detection"] for call in mock_signal.send.call_args_list] == created
+        stages = data_manager.stage_latencies.snapshot()
+        assert stages["db_commit"]["count"] == 1
+        # End-to-end runs from each detection's capture to the commit
+        assert stages["end_to_end"]["count"] == 1
+        assert stages["end_to_end"]["max_ms"] >= 2000.0
+        assert [d.channel for d in created] == [None, 1]
+
+    @pytest.mark.asyncio
+    async def test_create_detections__commit_failure_sends_no_signals(
+        self,
+        data_manager,
+        mock_services,
+        detection_event_factory,
+        db_service_factory,
+        mocker,
+        tmp_path,
+    ):
+        """Should roll back the whole batch, delete its clips and emit nothing on failure."""
+        mock_signal = mocker.patch("birdnetpi.detections.manager.detection_signal", autospec=True)
+        mock_db_service, session, _result = db_service_factory()
+        mock_services["database_service"].get_async_db = mock_db_service.get_async_db
+        session.commit.side_effect = SQLAlchemyError("Commit failed")
+        mock_services["path_resolver"].get_recordings_dir = lambda: tmp_path
+        clip = tmp_path / "clip.wav"
+        clip.write_bytes(b"RIFF")
+        mock_services["file_manager"].save_detection_audio.return_value = AudioFile(
+            file_path=Path("clip.wav"), duration=3.0, size_bytes=4
+        )
+
+        with pytest.raises(SQLAlchemyError):
+            await data_manager.create_detections([(detection_event_factory(), b"audio")])
+
+        session.rollback.assert_called_once()
+        mock_signal.send.assert_not_called()
+        assert not clip.exists()
+
+    @pytest.mark.asyncio
+    async def test_get_existing_detection_ids(
+        self, data_manager, mock_services, db_service_factory
+    ):
+        """Should return the subset of IDs already stored, in one query."""
+        mock_db_service, session, result = db_service_factory()
+        mock_services["database_service"].get_async_db = mock_db_service.get_async_db
+        stored = UUID("12345678-1234-5678-1234-567812345678")
+        result.scalars.return_value = iter([stored])
+
+        existing = await data_manager.get_existing_detection_ids(
+            [stored, UUID("87654321-4321-8765-4321-876543218765")]
+        )
+
+        assert existing == {stored}
+        session.execute.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_update_detection(self, data_manager, mock_services, db_service_factory):
         """Should update a detection record."""
@@ -0,0 +1,40 @@
+"""Tests for the binary detection frame format."""
+
+import json
+
+import pytest
+
+from birdnetpi.detections.frame import decode_detection_frame, encode_detection_frame
+
+
+class TestDetectionFrame:
+    """Test encode_detection_frame and decode_detection_frame."""
+
+    def test_round_trip(self):
+        """Should recover the metadata and PCM bytes unchanged."""
+        metadata = {"scientific_name": "Turdus migratorius", "confidence": 0.85}
+        audio = bytes(range(256)) * 4
+
+        header, decoded = decode_detection_frame(encode_detection_frame(metadata, audio))
+
+        assert json.loads(header) == metadata
+        assert decoded == audio
+
+    def test_empty_audio(self):
+        """Should allow a frame without audio."""
+        header, decoded = decode_detection_frame(encode_detection_frame({}, b""))
+
+        assert json.loads(header) == {}
+        assert decoded == b""
+
+    @pytest.mark.parametrize(
+        "frame",
+        [
+            pytest.param(b"\x00\x00", id="short_length_prefix"),
+            pytest.param(b"\x00\x00\x00\x10{}", id="short_metadata"),
+        ],
+    )
+    def test_truncated_frame_raises(self, frame):
+        """Should raise ValueError when the frame ends before its declared parts."""
+        with pytest.raises(ValueError):
+            decode_detection_frame(frame)
@@ -0,0 +1,82 @@
+"""Tests for interpreter thread-count calibration."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from birdnetpi.detections.thread_calibration import InferenceThreadCalibrator, board_fingerprint
+
+
+@pytest.fixture
+def calibrator(test_config, path_resolver):
+    """Provide a calibrator on a four-CPU board."""
+    with patch("birdnetpi.detections.thread_calibration.available_cpu_count", return_value=4):
+        yield InferenceThreadCalibrator(test_config, path_resolver)
+
+
+class TestInferenceThreadCalibrator:
+    """Test InferenceThreadCalibrator."""
+
+    def test_measure_times_single_window_invokes(self, calibrator):
+        """Should load the model at the thread count and time one-window invokes."""
+        with patch(
+            "birdnetpi.detections.thread_calibration.BirdDetectionService", autospec=True
+        ) as service_class:
+            service_class.return_value.input_length = 16
+
+            latency = calibrator.measure(3, windows=4)
+
+        assert latency >= 0.0
+        service_class.assert_called_once_with(calibrator.config, num_threads=3, batch_size=1)
+        invokes = service_class.return_value.get_raw_predictions.call_args_list
+        assert len(invokes) == 1 + 4
+        assert invokes[-1].args[0].shape == (1, 16)
+
+    @pytest.mark.parametrize(
+        "latencies,expected",
+        [
+            pytest.param({1: 100.0, 2: 60.0, 3: 45.0, 4: 44.0}, 3, id="scales_to_three"),
+            pytest.param({1: 100.0, 2: 95.0, 3: 93.0, 4: 99.0}, 1, id="barely_scales"),
+        ],
+    )
+    def test_calibrate_prefers_fewer_threads_unless_clearly_faster(
+        self, calibrator, latencies, expected
+    ):
+        """Should only add threads while each choice cuts latency by at least 10%."""
+        with patch.object(calibrator, "measure", side_effect=lambda n: latencies[n]):
+            best, measured = calibrator.calibrate()
+
+        assert best == expected
+        assert measured == latencies
+
+    def test_num_threads_calibrates_once_per_model_and_board(self, calibrator):
+        """Should cache the choice and reuse it on the next startup."""
+        with patch.object(calibrator, "calibrate", return_value=(2, {1: 80.0, 2: 50.0})):
+            assert calibrator.num_threads() == 2
+        with patch.object(calibrator, "calibrate", autospec=True) as calibrate:
+            assert calibrator.num_threads() == 2
+
+        calibrate.assert_not_called()
+        cache = json.loads(calibrator.cache_path.read_text())
+        assert cache[calibrator.cache_key]["latency_ms"] == {"1": 80.0, "2": 50.0}
+        assert calibrator.cache_key.startswith(f"{calibrator.config.model}|")
+
+    def test_corrupt_cache_recalibrates(self, calibrator):
+        """Should treat an unreadable cache as empty."""
+        calibrator.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        calibrator.cache_path.write_text("{not json")
+
+        with patch.object(calibrator, "calibrate", return_value=(1, {1: 80.0})):
+            assert calibrator.num_threads() == 1
+
+
+def test_board_fingerprint_includes_usable_cpus():
+    """Should change when the process is pinned to fewer CPUs."""
+    with patch("birdnetpi.detections.thread_calibration.available_cpu_count", return_value=2):
+        pinned = board_fingerprint()
+    with patch("birdnetpi.detections.thread_calibration.available_cpu_count", return_value=4):
+        unpinned = board_fingerprint()
+
+    assert pinned != unpinned
+    assert pinned.endswith("|2cpu")
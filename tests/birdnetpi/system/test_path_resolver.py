@@ -53,12 +53,43 @@ class TestPathResolver:
         # Spaces should be replaced with underscores
         assert path == Path("Corvus_corax/20241225_081530_000000.wav")
 
+    def test_get_detection_audio_path_per_channel(self, resolver):
+        """Should give the same bird heard on two channels at once separate clips."""
+        timestamp = datetime.datetime(2024, 3, 15, 14, 30, 45)
+
+        paths = [
+            resolver.get_detection_audio_path("Turdus migratorius", timestamp, channel)
+            for channel in (0, 1)
+        ]
+
+        assert paths == [
+            Path("Turdus_migratorius/20240315_143045_000000_ch0.wav"),
+            Path("Turdus_migratorius/20240315_143045_000000_ch1.wav"),
+        ]
+
     @pytest.mark.parametrize(
         "method_name,expected_dir_name",
         [
             pytest.param("get_recordings_dir", "recordings", id="recordings"),
             pytest.param("get_database_dir", "database", id="database"),
             pytest.param("get_models_dir", "models", id="models"),
+            pytest.param(
+                "get_species_occurrence_cache_dir",
+                "species_occurrence",
+                id="species_occurrence",
+            ),
+            pytest.param("get_pipeline_stats_dir", "pipeline_stats", id="pipeline_stats"),
+            pytest.param("get_detection_spool_path", "detection_spool.db", id="detection_spool"),
+            pytest.param(
+                "get_analyze_files_checkpoint_path",
+                "analyze_files_checkpoint.jsonl",
+                id="analyze_files_checkpoint",
+            ),
+            pytest.param(
+                "get_inference_threads_cache_path",
+                "inference_threads.json",
+                id="inference_threads_cache",
+            ),
         ],
     )
     def test_data_subdirectories(self, resolver, method_name, expected_dir_name):
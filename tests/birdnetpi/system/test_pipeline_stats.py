@@ -0,0 +1,103 @@
+"""Tests for pipeline statistics snapshots."""
+
+import json
+import logging
+
+import pytest
+
+from birdnetpi.system.pipeline_stats import (
+    LATENCY_INTERVAL_SECONDS,
+    STALE_AFTER_SECONDS,
+    PipelineStatsStore,
+    StageLatencies,
+)
+
+
+class TestPipelineStatsStore:
+    """Test PipelineStatsStore publishing and reading."""
+
+    def test_write_then_read_round_trip(self, path_resolver):
+        """Should return the latest snapshot per component with its age."""
+        store = PipelineStatsStore(path_resolver)
+        store.write("capture", {"callbacks": 1})
+        store.write("capture", {"callbacks": 2})
+        store.write("analysis", {"windows": 5})
+
+        snapshots = store.read_all()
+
+        assert set(snapshots) == {"analysis", "capture"}
+        assert snapshots["capture"]["callbacks"] == 2
+        assert snapshots["capture"]["stale"] is False
+        assert snapshots["capture"]["age_seconds"] < STALE_AFTER_SECONDS
+        assert not list(store.stats_dir.glob("*.tmp"))
+
+    def test_read_without_snapshots(self, path_resolver):
+        """Should return nothing before any daemon has published."""
+        assert PipelineStatsStore(path_resolver).read_all() == {}
+
+    def test_unreadable_and_old_snapshots(self, path_resolver):
+        """Should skip corrupt files and flag snapshots from stopped daemons as stale."""
+        store = PipelineStatsStore(path_resolver)
+        store.stats_dir.mkdir(parents=True)
+        (store.stats_dir / "broken.json").write_text("{not json")
+        (store.stats_dir / "capture.json").write_text(json.dumps({"updated_at": 0.0}))
+
+        snapshots = store.read_all()
+
+        assert set(snapshots) == {"capture"}
+        assert snapshots["capture"]["stale"] is True
+
+    def test_write_failure_is_not_raised(self, path_resolver, tmp_path):
+        """Should log rather than raise when the stats directory cannot be created."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        store = PipelineStatsStore(path_resolver)
+        store.stats_dir = blocker / "pipeline_stats"
+
+        store.write("capture", {"callbacks": 1})
+
+        assert store.read_all() == {}
+
+
+class TestStageLatencies:
+    """Test StageLatencies histograms."""
+
+    def test_percentiles_are_within_one_bucket(self):
+        """Should report percentiles no lower than the true value and at most ~12% above it."""
+        latencies = StageLatencies()
+        for ms in range(1, 101):
+            latencies.record("inference", ms / 1000.0)
+
+        summary = latencies.snapshot()["inference"]
+
+        assert summary["count"] == 100
+        assert 50.0 <= summary["p50_ms"] <= 50.0 * 1.13
+        assert 95.0 <= summary["p95_ms"] <= 95.0 * 1.13
+        assert 99.0 <= summary["p99_ms"] <= 100.0
+        assert summary["max_ms"] == 100.0
+
+    @pytest.mark.parametrize("seconds", [0.0, 1e-9, 5000.0])
+    def test_out_of_range_timings_are_clamped(self, seconds):
+        """Should count timings below or above the bucket range in the edge buckets."""
+        latencies = StageLatencies()
+
+        latencies.record("transport", seconds)
+
+        assert latencies.snapshot()["transport"]["count"] == 1
+
+    def test_roll_logs_and_resets_once_the_interval_is_due(self, caplog):
+        """Should keep the interval open until it is due, then log it and start over."""
+        latencies = StageLatencies()
+        latencies.record("db_commit", 0.002)
+
+        latencies.roll("web")
+        assert latencies.snapshot()["db_commit"]["count"] == 1
+
+        latencies.interval_started -= LATENCY_INTERVAL_SECONDS
+        with caplog.at_level(logging.INFO, logger="birdnetpi.system.pipeline_stats"):
+            latencies.roll("web")
+
+        assert latencies.snapshot() == {}
+        record = next(r for r in caplog.records if r.message == "Pipeline stage latency")
+        assert record.component == "web"  # type: ignore[attr-defined]
+        assert record.stages["db_commit"]["count"] == 1  # type: ignore[attr-defined]
@@ -0,0 +1,86 @@
+"""Tests for per-process CPU affinity and niceness."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from birdnetpi.system.process_placement import (
+    apply_process_placement,
+    available_cpu_count,
+    parse_cpu_list,
+)
+
+
+class TestParseCpuList:
+    """Test parse_cpu_list."""
+
+    @pytest.mark.parametrize(
+        "spec,expected",
+        [
+            pytest.param("", set(), id="empty"),
+            pytest.param("2", {2}, id="single"),
+            pytest.param("0,2-3", {0, 2, 3}, id="list_and_range"),
+            pytest.param(" 1 , 3-3 ", {1, 3}, id="whitespace"),
+        ],
+    )
+    def test_parses_cpuset_format(self, spec, expected):
+        """Should expand CPUs and inclusive ranges."""
+        assert parse_cpu_list(spec) == expected
+
+    @pytest.mark.parametrize("spec", ["a", "3-1", "-1", "1-x"])
+    def test_rejects_malformed_specs(self, spec):
+        """Should raise ValueError for malformed CPU lists."""
+        with pytest.raises(ValueError):
+            parse_cpu_list(spec)
+
+
+class TestApplyProcessPlacement:
+    """Test apply_process_placement."""
+
+    def test_pins_and_renices(self):
+        """Should set the affinity and niceness of the calling process."""
+        with (
+            patch(
+                "birdnetpi.system.process_placement.os.sched_setaffinity", autospec=True
+            ) as setaffinity,
+            patch(
+                "birdnetpi.system.process_placement.os.setpriority", autospec=True
+            ) as setpriority,
+        ):
+            apply_process_placement("capture", "0,2", 5)
+
+        setaffinity.assert_called_once_with(0, {0, 2})
+        setpriority.assert_called_once_with(os.PRIO_PROCESS, 0, 5)
+
+    def test_defaults_leave_the_process_alone(self):
+        """Should not touch affinity or niceness when neither is configured."""
+        with (
+            patch(
+                "birdnetpi.system.process_placement.os.sched_setaffinity", autospec=True
+            ) as setaffinity,
+            patch(
+                "birdnetpi.system.process_placement.os.setpriority", autospec=True
+            ) as setpriority,
+        ):
+            apply_process_placement("web", "", 0)
+
+        setaffinity.assert_not_called()
+        setpriority.assert_not_called()
+
+    def test_failures_are_logged_not_raised(self, caplog):
+        """Should keep running unplaced when the CPU list is bad or priority is denied."""
+        with patch(
+            "birdnetpi.system.process_placement.os.setpriority",
+            side_effect=PermissionError("Operation not permitted"),
+        ):
+            apply_process_placement("analysis", "x", -5)
+
+        assert "Could not pin analysis" in caplog.text
+        assert "Could not set analysis niceness" in caplog.text
+
+
+def test_available_cpu_count_respects_affinity():
+    """Should count only the CPUs the process is allowed to run on."""
+    with patch("birdnetpi.system.process_placement.os.sched_getaffinity", return_value={1, 3}):
+        assert available_cpu_count() == 2
@@ -12,6 +12,7 @@ from dependency_injector import providers
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from birdnetpi.detections.frame import DETECTION_FRAME_CONTENT_TYPE, encode_detection_frame
 from birdnetpi.detections.manager import DataManager
 from birdnetpi.detections.models import AudioFile
 from birdnetpi.detections.queries import DetectionQueryService
@@ -80,6 +81,244 @@ class TestDetectionsAPIRoutes:
         assert data["message"] == "Detection received and dispatched"
         assert data["detection_id"] == str(test_uuid)
 
+    def test_create_detection__replayed_id_is_not_recorded_twice(self, client, model_factory):
+        """Should acknowledge a detection whose client ID is already stored without re-saving."""
+        existing = model_factory.create_detection()
+        existing.id = UUID("12345678-1234-5678-1234-567812345678")
+        client.mock_data_manager.get_detection_by_id = AsyncMock(
+            spec=DataManager.get_detection_by_id, return_value=existing
+        )
+        client.mock_data_manager.create_detection = AsyncMock(spec=DataManager.create_detection)
+        detection_data = {
+            "id": str(existing.id),
+            "species_tensor": "Testus species_Test Bird",
+            "scientific_name": "Testus species",
+            "common_name": "Test Bird",
+            "confidence": 0.95,
+            "timestamp": "2025-01-15T10:30:00",
+            "audio_data": "",
+            "sample_rate": 48000,
+            "channels": 1,
+            "latitude": 63.4591,
+            "longitude": -19.3647,
+            "species_confidence_threshold": 0.0,
+            "week": 3,
+            "sensitivity_setting": 1.0,
+            "overlap": 0.0,
+        }
+
+        response = client.post("/api/detections/", json=detection_data)
+
+        assert response.status_code == 201
+        assert response.json()["detection_id"] == str(existing.id)
+        assert response.json()["message"] == "Detection already recorded"
+        client.mock_data_manager.create_detection.assert_not_called()
+
+    def test_create_detection_from_frame(self, client, model_factory):
+        """Should create a detection from a binary frame, passing the raw PCM through."""
+        mock_detection = model_factory.create_detection()
+        mock_detection.id = UUID("12345678-1234-5678-1234-567812345678")
+        client.mock_data_manager.create_detection = AsyncMock(
+            spec=DataManager.create_detection, return_value=mock_detection
+        )
+        metadata = {
+            "species_tensor": "Testus species_Test Bird",
+            "scientific_name": "Testus species",
+            "common_name": "Test Bird",
+            "confidence": 0.95,
+            "timestamp": "2025-01-15T10:30:00",
+            "sample_rate": 48000,
+            "channels": 1,
+            "latitude": 63.4591,
+            "longitude": -19.3647,
+            "species_confidence_threshold": 0.0,
+            "week": 3,
+            "sensitivity_setting": 1.0,
+            "overlap": 0.0,
+        }
+
+        response = client.post(
+            "/api/detections/binary",
+            content=encode_detection_frame(metadata, b"test audio data"),
+            headers={"content-type": DETECTION_FRAME_CONTENT_TYPE},
+        )
+
+        assert response.status_code == 201
+        event, audio_bytes = client.mock_data_manager.create_detection.call_args.args
+        assert event.scientific_name == "Testus species"
+        assert event.audio_data == ""
+        assert audio_bytes == b"test audio data"
+
+    @pytest.mark.parametrize(
+        "content,content_type,expected_status",
+        [
+            pytest.param(b"\x00\x00", DETECTION_FRAME_CONTENT_TYPE, 422, id="truncated_frame"),
+            pytest.param(
+                encode_detection_frame({"scientific_name": "Testus species"}, b""),
+                DETECTION_FRAME_CONTENT_TYPE,
+                422,
+                id="missing_fields",
+            ),
+            pytest.param(b"{}", "application/json", 415, id="wrong_content_type"),
+        ],
+    )
+    def test_create_detection_from_frame__rejects_bad_frames(
+        self, client, content, content_type, expected_status
+    ):
+        """Should reject malformed frames and other content types."""
+        response = client.post(
+            "/api/detections/binary", content=content, headers={"content-type": content_type}
+        )
+
+        assert response.status_code == expected_status
+
+    def test_create_detections_batch(self, client, model_factory):
+        """Should report created, duplicate and filtered events and commit the rest together."""
+        recorded_id = UUID("12345678-1234-5678-1234-567812345678")
+        new_id = UUID("87654321-4321-8765-4321-876543218765")
+        created = model_factory.create_detection()
+        created.id = new_id
+        client.mock_data_manager.get_existing_detection_ids = AsyncMock(
+            spec=DataManager.get_existing_detection_ids, return_value={recorded_id}
+        )
+        client.mock_data_manager.create_detections = AsyncMock(
+            spec=DataManager.create_detections, return_value=[created]
+        )
+        event = {
+            "species_tensor": "Testus species_Test Bird",
+            "scientific_name": "Testus species",
+            "common_name": "Test Bird",
+            "confidence": 0.95,
+            "timestamp": "2025-01-15T10:30:00",
+            "sample_rate": 48000,
+            "channels": 1,
+            "latitude": 63.4591,
+            "longitude": -19.3647,
+            "species_confidence_threshold": 0.0,
+            "week": 3,
+            "sensitivity_setting": 1.0,
+            "overlap": 0.0,
+        }
+        events = [
+            {**event, "id": str(recorded_id)},
+            {**event, "id": str(new_id)},
+            {**event, "id": str(new_id)},  # Repeated within the batch
+        ]
+
+        response = client.post("/api/detections/batch", json=events)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert (data["created"], data["duplicates"], data["filtered"]) == (1, 2, 0)
+        assert [(r["status"], r["detection_id"]) for r in data["results"]] == [
+            ("duplicate", str(recorded_id)),
+            ("created", str(new_id)),
+            ("duplicate", str(new_id)),
+        ]
+        (items,) = client.mock_data_manager.create_detections.call_args.args
+        assert [(e.id, audio) for e, audio in items] == [(new_id, None)]
+
+    def test_create_detections_batch__ebird_filtered(self, client, mocker):
+        """Should leave filtered events out of the transaction and give the reason."""
+        client.test_config.ebird_filtering.enabled = True
+        client.test_config.ebird_filtering.detection_mode = "filter"
+        mock_filter = mocker.patch(
+            "birdnetpi.web.routers.detections_api_routes._apply_ebird_filter",
+            autospec=True,
+            return_value=(True, "Species not in eBird data"),
+        )
+        client.mock_data_manager.get_existing_detection_ids = AsyncMock(
+            spec=DataManager.get_existing_detection_ids, return_value=set()
+        )
+        client.mock_data_manager.create_detections = AsyncMock(
+            spec=DataManager.create_detections, return_value=[]
+        )
+        event = {
+            "species_tensor": "Testus species_Test Bird",
+            "scientific_name": "Testus species",
+            "common_name": "Test Bird",
+            "confidence": 0.95,
+            "timestamp": "2025-01-15T10:30:00",
+            "sample_rate": 48000,
+            "channels": 1,
+            "latitude": 63.4591,
+            "longitude": -19.3647,
+            "species_confidence_threshold": 0.0,
+            "week": 3,
+            "sensitivity_setting": 1.0,
+            "overlap": 0.0,
+        }
+
+        response = client.post("/api/detections/batch", json=[event, event])
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["filtered"] == 2
+        assert data["results"][0]["message"] == "Species not in eBird data"
+        mock_filter.assert_called_once()  # Same species and site are checked once
+        client.mock_data_manager.create_detections.assert_not_called()
+
+    def test_create_detections_batch__invalid_events_reported_per_item(self, client, model_factory):
+        """Should record the valid events and report each malformed one as invalid."""
+        created = model_factory.create_detection()
+        client.mock_data_manager.get_existing_detection_ids = AsyncMock(
+            spec=DataManager.get_existing_detection_ids, return_value=set()
+        )
+        client.mock_data_manager.create_detections = AsyncMock(
+            spec=DataManager.create_detections, return_value=[created]
+        )
+        event = {
+            "species_tensor": "Testus species_Test Bird",
+            "scientific_name": "Testus species",
+            "common_name": "Test Bird",
+            "confidence": 0.95,
+            "timestamp": "2025-01-15T10:30:00",
+            "sample_rate": 48000,
+            "channels": 1,
+            "latitude": 63.4591,
+            "longitude": -19.3647,
+            "species_confidence_threshold": 0.0,
+            "week": 3,
+            "sensitivity_setting": 1.0,
+            "overlap": 0.0,
+        }
+
+        response = client.post(
+            "/api/detections/batch",
+            json=[{"scientific_name": "Testus species"}, event, "not an event"],
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert (data["created"], data["invalid"]) == (1, 2)
+        assert [r["status"] for r in data["results"]] == ["invalid", "created", "invalid"]
+        assert "confidence" in data["results"][0]["message"]
+        (items,) = client.mock_data_manager.create_detections.call_args.args
+        assert [e.scientific_name for e, _ in items] == ["Testus species"]
+
+    def test_create_detections_batch__too_large(self, client, mocker):
+        """Should reject batches over the size limit before touching the database."""
+        mocker.patch("birdnetpi.web.routers.detections_api_routes.MAX_DETECTION_BATCH", 1)
+        event = {
+            "species_tensor": "Testus species_Test Bird",
+            "scientific_name": "Testus species",
+            "common_name": "Test Bird",
+            "confidence": 0.95,
+            "timestamp": "2025-01-15T10:30:00",
+            "sample_rate": 48000,
+            "channels": 1,
+            "latitude": 63.4591,
+            "longitude": -19.3647,
+            "species_confidence_threshold": 0.0,
+            "week": 3,
+            "sensitivity_setting": 1.0,
+            "overlap": 0.0,
+        }
+
+        response = client.post("/api/detections/batch", json=[event, event])
+
+        assert response.status_code == 413
+
     def test_create_detection_validation_error(self, client):
         """Should handle validation errors when creating detection."""
         detection_data = {
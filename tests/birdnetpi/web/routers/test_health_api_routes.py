@@ -1,8 +1,16 @@
 """Tests for health check API endpoints."""
 
+import json
+from unittest.mock import MagicMock
+
 import pytest
+from fastapi import Response
 from fastapi.testclient import TestClient
 
+from birdnetpi.detections.manager import DataManager
+from birdnetpi.system.pipeline_stats import PipelineStatsStore, StageLatencies
+from birdnetpi.web.routers.health_api_routes import pipeline_health_check
+
 
 @pytest.fixture
 def client(app_with_temp_data):
@@ -130,6 +138,60 @@ class TestDetailedHealthEndpoint:
         assert isinstance(data["timestamp"], str)
 
 
+class TestPipelineHealthEndpoint:
+    """Test /health/pipeline endpoint."""
+
+    def test_unknown_before_daemons_publish(self, client):
+        """Should report unknown status when no daemon has published counters."""
+        response = client.get("/api/health/pipeline")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "unknown"
+        assert response.json()["components"] == {}
+
+    def test_reports_capture_counters(self, client, path_resolver):
+        """Should expose the latest capture counters."""
+        PipelineStatsStore(path_resolver).write(
+            "capture", {"callback_max_us": 85.0, "input_overflows": 2, "worker_lag_frames": 0}
+        )
+
+        response = client.get("/api/health/pipeline")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert data["components"]["capture"]["input_overflows"] == 2
+        assert data["components"]["capture"]["stale"] is False
+
+    def test_stale_snapshot_is_degraded(self, client, path_resolver):
+        """Should report degraded when a daemon stopped publishing."""
+        stats_dir = path_resolver.get_pipeline_stats_dir()
+        stats_dir.mkdir(parents=True)
+        (stats_dir / "capture.json").write_text(json.dumps({"updated_at": 0.0}))
+
+        response = client.get("/api/health/pipeline")
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "degraded"
+        assert response.json()["components"]["capture"]["stale"] is True
+
+    @pytest.mark.asyncio
+    async def test_reports_ingest_commit_latency(self, path_resolver):
+        """Should add the web process's own commit timings as the ingest component."""
+        data_manager = MagicMock(spec=DataManager)
+        data_manager.stage_latencies = StageLatencies()
+        data_manager.stage_latencies.record("db_commit", 0.004)
+
+        health = await pipeline_health_check(
+            path_resolver=path_resolver, data_manager=data_manager, response=Response()
+        )
+
+        assert health.status == "unknown"
+        ingest = health.components["ingest"]
+        assert ingest["latency"]["db_commit"]["count"] == 1
+        assert 0.0 < ingest["latency"]["db_commit"]["p99_ms"] <= 4.0
+
+
 class TestHealthCheckEndpoints:
     """Test various health check endpoints."""
 
@@ -140,6 +202,7 @@ class TestHealthCheckEndpoints:
             "/api/health/live",
             "/api/health/ready",
             "/api/health/detailed",
+            "/api/health/pipeline",
         ]
 
         for endpoint in endpoints:
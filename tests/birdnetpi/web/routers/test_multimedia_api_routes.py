@@ -1,15 +1,19 @@
 """Tests for multimedia API routes."""
 
+import io
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID
 
+import numpy as np
 import pytest
+import soundfile as sf
 from dependency_injector import providers
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from sqlalchemy.engine import Result
 
+from birdnetpi.detections.models import ClipStatus
 from birdnetpi.web.core.container import Container
 from birdnetpi.web.routers.multimedia_api_routes import router
 
@@ -26,7 +30,7 @@ def mock_audio_file(model_factory):
 
 
 @pytest.fixture
-def client(path_resolver, mock_audio_file, tmp_path, db_service_factory):
+def client(path_resolver, mock_audio_file, tmp_path, db_service_factory, test_config):
     """Create test client with multimedia API routes and mocked dependencies."""
     # Create the app
     app = FastAPI()
@@ -55,6 +59,8 @@ def client(path_resolver, mock_audio_file, tmp_path, db_service_factory):
 
     # Override services
     container.core_database.override(mock_core_database)
+    test_config.audio_pipeline.audio_history_seconds = 120.0
+    container.config.override(test_config)
 
     # Wire the container
     container.wire(modules=["birdnetpi.web.routers.multimedia_api_routes"])
@@ -71,6 +77,7 @@ def client(path_resolver, mock_audio_file, tmp_path, db_service_factory):
     client.path_resolver = path_resolver  # type: ignore[attr-defined]
     client.mock_audio_file = mock_audio_file  # type: ignore[attr-defined]
     client.test_audio_path = test_audio_path  # type: ignore[attr-defined]
+    client.test_config = test_config  # type: ignore[attr-defined]
 
     yield client
 
@@ -79,6 +86,75 @@ def client(path_resolver, mock_audio_file, tmp_path, db_service_factory):
         test_audio_path.unlink()
 
 
+class TestGetRecentAudio:
+    """Test the recent audio endpoint."""
+
+    def test_serves_history_as_wav(self, client):
+        """Should return the requested channel of the rolling history as uncached WAV."""
+        samples = np.arange(-50, 50, dtype=np.int16)
+        with patch(
+            "birdnetpi.web.routers.multimedia_api_routes.read_recent_audio",
+            autospec=True,
+            return_value=(samples, 8000),
+        ) as mock_read:
+            response = client.get("/api/audio/recent?seconds=30&channel=1")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "audio/wav"
+        assert response.headers["Cache-Control"] == "no-store"
+        mock_read.assert_called_once_with(30.0, 1)
+        audio, sample_rate = sf.read(io.BytesIO(response.content), dtype="int16")
+        assert sample_rate == 8000
+        np.testing.assert_array_equal(audio, samples)
+
+    @pytest.mark.parametrize(
+        "error,expected_status",
+        [
+            pytest.param(FileNotFoundError("no ring"), 503, id="history_disabled"),
+            pytest.param(ValueError("Channel 3 is not captured"), 400, id="bad_channel"),
+        ],
+    )
+    def test_reports_unavailable_audio(self, client, error, expected_status):
+        """Should map a missing history and an uncaptured channel to HTTP errors."""
+        with patch(
+            "birdnetpi.web.routers.multimedia_api_routes.read_recent_audio",
+            autospec=True,
+            side_effect=error,
+        ):
+            response = client.get("/api/audio/recent?channel=3")
+
+        assert response.status_code == expected_status
+
+    def test_caps_duration_at_configured_history(self, client):
+        """Should never ask the history for more audio than it is configured to keep."""
+        with patch(
+            "birdnetpi.web.routers.multimedia_api_routes.read_recent_audio",
+            autospec=True,
+            return_value=(np.zeros(10, dtype=np.int16), 8000),
+        ) as mock_read:
+            response = client.get("/api/audio/recent?seconds=600")
+
+        assert response.status_code == 200
+        mock_read.assert_called_once_with(120.0, 0)
+
+    def test_reports_history_disabled_in_config(self, client):
+        """Should answer 503 without touching shared memory when no history is kept."""
+        client.test_config.audio_pipeline.audio_history_seconds = 0.0
+        with patch(
+            "birdnetpi.web.routers.multimedia_api_routes.read_recent_audio", autospec=True
+        ) as mock_read:
+            response = client.get("/api/audio/recent")
+
+        assert response.status_code == 503
+        mock_read.assert_not_called()
+
+    def test_rejects_excessive_duration(self, client):
+        """Should refuse requests for more than an hour of audio."""
+        response = client.get("/api/audio/recent?seconds=7200")
+
+        assert response.status_code == 422
+
+
 class TestGetAudioFile:
     """Test audio file retrieval endpoint."""
 
@@ -114,6 +190,16 @@ class TestGetAudioFile:
         assert response.status_code == 404
         assert "not found on disk" in response.json()["detail"].lower()
 
+    def test_get_audio_file_still_being_written(self, client):
+        """Should ask the client to retry while the clip writer has not written the file."""
+        client.test_audio_path.unlink()
+        client.mock_audio_file.clip_status = ClipStatus.PENDING.value
+
+        response = client.get("/api/audio/550e8400-e29b-41d4-a716-446655440000")
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
     def test_get_audio_file_invalid_uuid(self, client):
         """Should return 422 validation error for invalid UUID format."""
         response = client.get("/api/audio/not-a-valid-uuid")
@@ -45,8 +45,8 @@ def mock_file_manager():
 def mock_path_resolver(tmp_path, path_resolver):
     """Return a PathResolver instance for integration tests."""
     # Use the global path_resolver fixture and customize it
-    # get_detection_audio_path expects scientific_name and timestamp parameters
-    path_resolver.get_detection_audio_path = lambda scientific_name, timestamp: Path(
+    # get_detection_audio_path expects scientific_name, timestamp and channel parameters
+    path_resolver.get_detection_audio_path = lambda scientific_name, timestamp, channel=None: Path(
         "Test_bird/20240101_120000.wav"
     )
     return path_resolver
@@ -58,7 +58,11 @@ def audio_analysis_service_integration(
     mock_path_resolver,
     test_config,
 ):
-    """Yield an AudioAnalysisManager instance for integration testing with proper cleanup."""
+    """Yield an AudioAnalysisManager instance for integration testing with proper cleanup.
+
+    The spool replay thread is not started; tests that rely on background replay
+    start it themselves.
+    """
     with patch(
         "birdnetpi.audio.analysis.BirdDetectionService", autospec=True
     ) as mock_analysis_client_class:
@@ -85,16 +89,15 @@ def audio_analysis_service_integration(
             test_config,
             mock_species_database,
             mock_session,
-            detection_buffer_max_size=50,  # Reasonable size for integration tests
+            spool_max_detections=50,  # Reasonable size for integration tests
             buffer_flush_interval=0.1,  # Fast interval for testing
         )
         service.analysis_client = mock_analysis_client
-        # Start the buffer flush task for automatic flushing
-        service.start_buffer_flush_task()
 
-        # Ensure the task is stopped after the test
+        # Ensure the replay thread is stopped and the spool closed after the test
         yield service
         service.stop_buffer_flush_task()
+        service.detection_spool.close()
 
 
 @pytest.fixture(autouse=True)
@@ -105,6 +108,32 @@ def caplog_integration(caplog):
     yield
 
 
+def spooled_species(caplog) -> list[str]:
+    """Return the species of each "Spooled detection event" log record, in order."""
+    records = [r for r in caplog.records if r.message == "Spooled detection event"]
+    return [r.species for r in records]  # type: ignore[attr-defined]
+
+
+def connection_error(message="Connection failed"):
+    """Return the error the sender raises when FastAPI cannot be reached."""
+    return httpx.RequestError(message, request=MagicMock(spec=httpx.Request))
+
+
+def delivered():
+    """Return a successful FastAPI response."""
+    response = MagicMock(spec=httpx.Response)
+    response.raise_for_status.return_value = None
+    return response
+
+
+async def analyze_chunks(service, count=1):
+    """Analyze audio chunks and wait for their detection sends to settle."""
+    for _ in range(count):
+        audio_chunk = np.ones(48000 * 3, dtype=np.float32) * 0.1
+        await service._analyze_audio_chunk(audio_chunk)
+    await asyncio.gather(*service._send_tasks)
+
+
 class TestDetectionBufferingEndToEnd:
     """End-to-end integration tests for detection buffering system."""
 
@@ -119,7 +148,7 @@ class TestDetectionBufferingEndToEnd:
             ("Turdus migratorius_American Robin", 0.85),
         ]
 
-        detection_results = {"detections_processed": 0, "detections_buffered": 0}
+        detection_results = {"detections_processed": 0}
         admin_operation_complete = {"value": False}
 
         async def simulate_continuous_detections():
@@ -127,8 +156,7 @@ class TestDetectionBufferingEndToEnd:
             try:
                 # Process multiple audio chunks while admin operation runs
                 for _i in range(5):
-                    audio_chunk = np.ones(48000 * 3, dtype=np.float32) * 0.1
-                    await service._analyze_audio_chunk(audio_chunk)
+                    await analyze_chunks(service)
                     detection_results["detections_processed"] += 1
                     await asyncio.sleep(0.05)  # Small delay between detections
             except Exception as e:
@@ -140,16 +168,10 @@ class TestDetectionBufferingEndToEnd:
             time.sleep(0.5)  # Admin operation in progress
             admin_operation_complete["value"] = True
 
-        # Clear buffer
-        with service.buffer_lock:
-            service.detection_buffer.clear()
-
-        # Patch HTTP client for the entire test duration to simulate FastAPI being down
-        with patch("birdnetpi.audio.analysis.httpx.AsyncClient", autospec=True) as mock_client:
-            mock_client.return_value.__aenter__.return_value.post.side_effect = httpx.RequestError(
-                "Connection failed", request=MagicMock(spec=httpx.Request)
-            )
-
+        # Simulate FastAPI being down for the entire test duration
+        with patch.object(
+            service.detection_sender, "post", autospec=True, side_effect=connection_error()
+        ):
             # Start concurrent operations
             admin_thread = threading.Thread(target=simulate_admin_operation)
             admin_thread.start()
@@ -161,23 +183,20 @@ class TestDetectionBufferingEndToEnd:
             admin_thread.join(timeout=1.0)
             assert admin_operation_complete["value"], "Admin operation should complete"
 
-            # Verify some detections were processed
+            # Verify all detections were processed and none lost during the outage
             assert detection_results["detections_processed"] == 5
-
-            # Verify some detections were buffered during outage
-            with service.buffer_lock:
-                buffer_size = len(service.detection_buffer)
-
-            assert buffer_size > 0, "Some detections should be buffered during admin operation"
-        assert "Buffered detection event for Turdus migratorius" in caplog.text
+            assert len(service.detection_spool) == 5
+        assert "Turdus migratorius" in spooled_species(caplog)
 
     @pytest.mark.ci_issue
     async def test_buffer_overflow_handling_during_extended_outage(
         self,
         audio_analysis_service_integration,
+        mock_path_resolver,
+        tmp_path,
         caplog,
     ):
-        """Should handle buffer overflow gracefully during extended FastAPI outages."""
+        """Should handle spool overflow gracefully during extended FastAPI outages."""
         # Mock SpeciesDatabaseService and AsyncSession
         mock_species_database = MagicMock(spec=SpeciesDatabaseService)
         # Make get_best_common_name async and return a dict with common_name
@@ -191,14 +210,15 @@ class TestDetectionBufferingEndToEnd:
         SpeciesParser._instance = None  # Reset singleton
         SpeciesParser(mock_species_database)  # Initialize with mock
 
-        # Create service with small buffer for testing overflow
+        # Create service with a small spool of its own for testing overflow
+        mock_path_resolver.get_detection_spool_path = lambda: tmp_path / "overflow_spool.db"
         service = AudioAnalysisManager(
             audio_analysis_service_integration.file_manager,
-            audio_analysis_service_integration.path_resolver,
+            mock_path_resolver,
             audio_analysis_service_integration.config,
             mock_species_database,
             mock_session,
-            detection_buffer_max_size=3,  # Small buffer to trigger overflow
+            spool_max_detections=3,  # Small spool to trigger overflow
             buffer_flush_interval=0.1,
         )
 
@@ -209,35 +229,28 @@ class TestDetectionBufferingEndToEnd:
         ]
 
         try:
-            with patch("birdnetpi.audio.analysis.httpx.AsyncClient", autospec=True) as mock_client:
-                # Mock persistent HTTP failure
-                mock_client.return_value.__aenter__.return_value.post.side_effect = (
-                    httpx.RequestError("Connection failed", request=MagicMock(spec=httpx.Request))
-                )
-
-                # Clear buffer
-                with service.buffer_lock:
-                    service.detection_buffer.clear()
-
+            # Mock persistent HTTP failure
+            with patch.object(
+                service.detection_sender, "post", autospec=True, side_effect=connection_error()
+            ):
                 # Process many detections to trigger overflow
-                for _i in range(10):
-                    audio_chunk = np.ones(48000 * 3, dtype=np.float32) * 0.1
-                    await service._analyze_audio_chunk(audio_chunk)
+                await analyze_chunks(service, 10)
 
-                # Verify buffer respects max size (oldest detections evicted)
-                with service.buffer_lock:
-                    assert len(service.detection_buffer) == 3  # Max buffer size
+                # Verify spool respects max size (oldest detections discarded)
+                assert len(service.detection_spool) == 3
+                assert service.detection_spool.discarded == 7
 
-                # Verify logging indicates buffering is happening
-                assert "Buffered detection event for Turdus migratorius" in caplog.text
+                # Verify logging indicates spooling is happening
+                assert "Turdus migratorius" in spooled_species(caplog)
 
         finally:
             service.stop_buffer_flush_task()
+            service.detection_spool.close()
 
     async def test_detection_recovery_after_service_restart(
         self, audio_analysis_service_integration, caplog
     ):
-        """Should flush buffered detections when service recovers after restart simulation."""
+        """Should replay spooled detections when service recovers after restart simulation."""
         service = audio_analysis_service_integration
 
         # Mock analysis
@@ -245,43 +258,38 @@ class TestDetectionBufferingEndToEnd:
             ("Turdus migratorius_American Robin", 0.85)
         ]
 
-        # Phase 1: Service unavailable, buffer detections
-        with patch("birdnetpi.audio.analysis.httpx.AsyncClient", autospec=True) as mock_client:
-            mock_client.return_value.__aenter__.return_value.post.side_effect = httpx.RequestError(
-                "Connection failed", request=MagicMock(spec=httpx.Request)
-            )
-
-            # Clear buffer and add detections
-            with service.buffer_lock:
-                service.detection_buffer.clear()
+        # Phase 1: Service unavailable, spool detections
+        with (
+            patch.object(
+                service.detection_sender, "post", autospec=True, side_effect=connection_error()
+            ),
+            patch.object(
+                service.detection_sender,
+                "post_batch",
+                autospec=True,
+                side_effect=connection_error(),
+            ),
+        ):
+            service.start_buffer_flush_task()
 
             # Process detections during outage
-            for _ in range(3):
-                audio_chunk = np.ones(48000 * 3, dtype=np.float32) * 0.1
-                await service._analyze_audio_chunk(audio_chunk)
+            await analyze_chunks(service, 3)
 
-            # Verify detections are buffered
-            with service.buffer_lock:
-                assert len(service.detection_buffer) == 3
+            # Verify detections are spooled
+            assert len(service.detection_spool) == 3
 
         # Phase 2: Simulate service recovery
-        with patch("birdnetpi.audio.analysis.httpx.AsyncClient", autospec=True) as mock_client:
-            # Mock successful responses
-            mock_response = MagicMock(spec=httpx.Response)
-            mock_response.raise_for_status.return_value = None
-            # Use AsyncMock for post to ensure it works in background thread's event loop
-            # autospec=True already makes post an AsyncMock
-            mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
-
-            # Wait for background flush to process buffered detections
-            await asyncio.sleep(0.3)
-
-            # Buffer should be empty after successful flush
-            with service.buffer_lock:
-                buffer_size = len(service.detection_buffer)
-
-            assert buffer_size == 0
-            assert "Successfully flushed buffered detections" in caplog.text
+        with patch.object(
+            service.detection_sender, "post_batch", autospec=True, return_value=delivered()
+        ) as mock_post_batch:
+            # Wait for background replay to deliver spooled detections
+            await asyncio.sleep(0.5)
+
+            # Spool should be empty after successful replay
+            assert len(service.detection_spool) == 0
+            replayed = [item for call in mock_post_batch.call_args_list for item in call.args[0]]
+            assert len(replayed) == 3
+            assert "Successfully flushed spooled detections" in caplog.text
 
     async def test_mixed_success__failure_during_partial_recovery(
         self, audio_analysis_service_integration, caplog
@@ -297,56 +305,28 @@ class TestDetectionBufferingEndToEnd:
             ("Cardinalis cardinalis_Northern Cardinal", 0.90),
         ]
 
-        with patch("birdnetpi.audio.analysis.httpx.AsyncClient", autospec=True) as mock_client:
-            post_mock = mock_client.return_value.__aenter__.return_value.post
-
-            # Mock intermittent failures: success, fail, success, fail
-            responses = []
-            for i in range(4):
-                if i % 2 == 0:  # Even indices succeed
-                    success_response = MagicMock(spec=httpx.Response)
-                    success_response.raise_for_status.return_value = None
-                    responses.append(success_response)
-                else:  # Odd indices fail
-                    responses.append(
-                        httpx.RequestError(
-                            "Intermittent failure", request=MagicMock(spec=httpx.Request)
-                        )
-                    )
-
-            post_mock.side_effect = responses
-
-            # Clear buffer
-            with service.buffer_lock:
-                service.detection_buffer.clear()
-
+        # Mock intermittent failures: success, fail, success, fail
+        responses = [delivered(), connection_error("Intermittent failure")] * 2
+        with patch.object(service.detection_sender, "post", autospec=True, side_effect=responses):
             # Process audio that triggers all detections
-            audio_chunk = np.ones(48000 * 3, dtype=np.float32) * 0.1
-            await service._analyze_audio_chunk(audio_chunk)
-
-            # Verify only failed detections were buffered
-            with service.buffer_lock:
-                buffer_size = len(service.detection_buffer)
-                if buffer_size > 0:
-                    buffered_scientific_names = [
-                        d["scientific_name"] for d in service.detection_buffer
-                    ]
-                else:
-                    buffered_scientific_names = []
-
-            # Should have 2 failed detections buffered (Crow and Cardinal)
-            assert buffer_size == 2
-            assert "Corvus brachyrhynchos" in buffered_scientific_names
-            assert "Cardinalis cardinalis" in buffered_scientific_names
-
-            # Verify successful sends were logged
-            assert "Detection event sent" in caplog.text
-            assert "Bird detected: Turdus migratorius" in caplog.text
-            assert "Bird detected: Passer domesticus" in caplog.text
+            await analyze_chunks(service)
+
+        # Verify only failed detections were spooled
+        spooled_scientific_names = [
+            spooled.metadata["scientific_name"] for spooled in service.detection_spool.peek(10)
+        ]
 
-            # Verify failed detections were buffered
-            assert "Buffered detection event for Corvus brachyrhynchos" in caplog.text
-            assert "Buffered detection event for Cardinalis cardinalis" in caplog.text
+        # Should have 2 failed detections spooled (Crow and Cardinal)
+        assert spooled_scientific_names == ["Corvus brachyrhynchos", "Cardinalis cardinalis"]
+
+        # Verify successful sends were logged
+        assert "Detection event sent" in caplog.text
+        assert "Bird detected: Turdus migratorius" in caplog.text
+        assert "Bird detected: Passer domesticus" in caplog.text
+
+        # Verify failed detections were spooled
+        assert "Corvus brachyrhynchos" in spooled_species(caplog)
+        assert "Cardinalis cardinalis" in spooled_species(caplog)
 
 
 class TestDetectionBufferingWithAdminOperations:
@@ -355,7 +335,7 @@ class TestDetectionBufferingWithAdminOperations:
     async def test_generate_dummy_data__active_detection_service(
         self, audio_analysis_service_integration, caplog
     ):
-        """Should coordinate detection buffering during generate_dummy_data execution."""
+        """Should coordinate detection spooling during generate_dummy_data execution."""
         service = audio_analysis_service_integration
 
         # Mock analysis
@@ -363,123 +343,97 @@ class TestDetectionBufferingWithAdminOperations:
             ("Turdus migratorius_American Robin", 0.85)
         ]
 
-        try:
-            # Start with working FastAPI
-            with patch("birdnetpi.audio.analysis.httpx.AsyncClient", autospec=True) as mock_client:
-                mock_response = MagicMock(spec=httpx.Response)
-                mock_response.raise_for_status.return_value = None
-                # Use AsyncMock for post to ensure it works correctly
-                # autospec=True already makes post an AsyncMock
-                mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
-
-                # Clear buffer
-                with service.buffer_lock:
-                    service.detection_buffer.clear()
-
-                # Process some initial detections (should succeed)
-                audio_chunk = np.ones(48000 * 3, dtype=np.float32) * 0.1
-                await service._analyze_audio_chunk(audio_chunk)
-
-                # Buffer should be empty (successful sends)
-                with service.buffer_lock:
-                    initial_buffer_size = len(service.detection_buffer)
-                assert initial_buffer_size == 0
-                assert "Detection event sent" in caplog.text
-                assert "Bird detected: Turdus migratorius" in caplog.text
-
-            # Simulate admin operation affecting FastAPI
-            with (
-                patch(
-                    "birdnetpi.cli.generate_dummy_data.PathResolver", autospec=True
-                ) as mock_path_resolver,
-                patch(
-                    "birdnetpi.cli.generate_dummy_data.CoreDatabaseService", autospec=True
-                ) as _mock_database_service,
-                patch(
-                    "birdnetpi.cli.generate_dummy_data.DataManager", autospec=True
-                ) as mock_data_manager,
-                patch(
-                    "birdnetpi.cli.generate_dummy_data.SystemControlService", autospec=True
-                ) as mock_system_control_service,
-                patch(
-                    "birdnetpi.cli.generate_dummy_data.generate_dummy_detections", autospec=True
-                ) as _mock_generate_dummy_detections,
-                patch("birdnetpi.cli.generate_dummy_data.time", autospec=True) as _mock_time,
-                patch("birdnetpi.cli.generate_dummy_data.os", autospec=True) as mock_os,
-                patch(
-                    "birdnetpi.cli.generate_dummy_data.ConfigManager", autospec=True
-                ) as mock_config_parser,
+        # Start with working FastAPI
+        with patch.object(
+            service.detection_sender, "post", autospec=True, return_value=delivered()
+        ):
+            # Process some initial detections (should succeed)
+            await analyze_chunks(service)
+
+            # Spool should be empty (successful sends)
+            assert len(service.detection_spool) == 0
+            assert "Detection event sent" in caplog.text
+            assert "Bird detected: Turdus migratorius" in caplog.text
+
+        # Simulate admin operation affecting FastAPI
+        with (
+            patch(
+                "birdnetpi.cli.generate_dummy_data.PathResolver", autospec=True
+            ) as mock_path_resolver,
+            patch(
+                "birdnetpi.cli.generate_dummy_data.CoreDatabaseService", autospec=True
+            ) as _mock_database_service,
+            patch(
+                "birdnetpi.cli.generate_dummy_data.DataManager", autospec=True
+            ) as mock_data_manager,
+            patch(
+                "birdnetpi.cli.generate_dummy_data.SystemControlService", autospec=True
+            ) as mock_system_control_service,
+            patch(
+                "birdnetpi.cli.generate_dummy_data.generate_dummy_detections", autospec=True
+            ) as _mock_generate_dummy_detections,
+            patch("birdnetpi.cli.generate_dummy_data.time", autospec=True) as _mock_time,
+            patch("birdnetpi.cli.generate_dummy_data.os", autospec=True) as mock_os,
+            patch(
+                "birdnetpi.cli.generate_dummy_data.ConfigManager", autospec=True
+            ) as mock_config_parser,
+        ):
+            # Configure mocks for generate_dummy_data
+
+            mock_db_path = MagicMock(spec=Path)
+            mock_db_path.exists.return_value = False
+            mock_db_path.stat.return_value.st_size = 0
+            mock_path_resolver.return_value.get_database_path.return_value = mock_db_path
+
+            # Create a proper temp config path to avoid MagicMock file creation
+
+            with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as config_file:
+                config_file.write("site_name: Test\nlatitude: 0.0\nlongitude: 0.0\n")
+                config_path = Path(config_file.name)
+
+            mock_path_resolver.return_value.get_birdnetpi_config_path.return_value = config_path
+            mock_config_parser.return_value.load.return_value = MagicMock(spec=BirdNETConfig)
+
+            mock_os.path.exists.return_value = False
+            mock_os.getenv.return_value = "false"  # SBC environment
+            mock_system_control_service.return_value.get_service_status.return_value = "active"
+            mock_data_manager.return_value.get_all_detections.return_value = []
+
+            # During admin operation, simulate FastAPI being down
+            with patch.object(
+                service.detection_sender,
+                "post",
+                autospec=True,
+                side_effect=connection_error("Service temporarily unavailable"),
             ):
-                # Configure mocks for generate_dummy_data
-
-                mock_db_path = MagicMock(spec=Path)
-                mock_db_path.exists.return_value = False
-                mock_db_path.stat.return_value.st_size = 0
-                mock_path_resolver.return_value.get_database_path.return_value = mock_db_path
-
-                # Create a proper temp config path to avoid MagicMock file creation
-
-                with tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".yaml", delete=False
-                ) as config_file:
-                    config_file.write("site_name: Test\nlatitude: 0.0\nlongitude: 0.0\n")
-                    config_path = Path(config_file.name)
-
-                mock_path_resolver.return_value.get_birdnetpi_config_path.return_value = config_path
-                mock_config_parser.return_value.load.return_value = MagicMock(spec=BirdNETConfig)
-
-                mock_os.path.exists.return_value = False
-                mock_os.getenv.return_value = "false"  # SBC environment
-                mock_system_control_service.return_value.get_service_status.return_value = "active"
-                mock_data_manager.return_value.get_all_detections.return_value = []
-
-                # During admin operation, simulate FastAPI being down
-                with patch(
-                    "birdnetpi.audio.analysis.httpx.AsyncClient", autospec=True
-                ) as mock_client:
-                    mock_client.return_value.__aenter__.return_value.post.side_effect = (
-                        httpx.RequestError(
-                            "Service temporarily unavailable", request=MagicMock(spec=httpx.Request)
-                        )
-                    )
-
-                    # Process detections during admin operation
-                    await service._analyze_audio_chunk(audio_chunk)
-
-                    # Verify detection was buffered during admin operation
-                    with service.buffer_lock:
-                        admin_buffer_size = len(service.detection_buffer)
-                    assert admin_buffer_size == 1
-                    assert "Buffered detection event for Turdus migratorius" in caplog.text
-
-                    # Run the admin operation
-                    await gdd.run()
-
-            # After admin operation, FastAPI should be available again
-            with patch("birdnetpi.audio.analysis.httpx.AsyncClient", autospec=True) as mock_client:
-                mock_response = MagicMock(spec=httpx.Response)
-                mock_response.raise_for_status.return_value = None
-                # Use AsyncMock for post to ensure it works in background thread's event loop
-                # autospec=True already makes post an AsyncMock
-                mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
-
-                # Wait for background flush to process buffered detection
-                # Flush interval is 0.1s, so 0.5s should be more than enough
-                await asyncio.sleep(0.5)
-
-                # Buffer should be empty after admin operation completes
-                with service.buffer_lock:
-                    final_buffer_size = len(service.detection_buffer)
-                assert final_buffer_size == 0
-                assert "Successfully flushed buffered detections" in caplog.text
+                # Process detections during admin operation
+                await analyze_chunks(service)
 
-        finally:
-            service.stop_buffer_flush_task()
+                # Verify detection was spooled during admin operation
+                assert len(service.detection_spool) == 1
+                assert "Turdus migratorius" in spooled_species(caplog)
+
+                # Run the admin operation
+                await gdd.run()
+
+        # After admin operation, FastAPI should be available again
+        with patch.object(
+            service.detection_sender, "post_batch", autospec=True, return_value=delivered()
+        ):
+            service.start_buffer_flush_task()
+
+            # Wait for background replay to deliver the spooled detection
+            # Flush interval is 0.1s, so 0.5s should be more than enough
+            await asyncio.sleep(0.5)
+
+            # Spool should be empty after admin operation completes
+            assert len(service.detection_spool) == 0
+            assert "Successfully flushed spooled detections" in caplog.text
 
     async def test_buffer_persistence_across_multiple_admin_cycles(
         self, audio_analysis_service_integration, caplog
     ):
-        """Should maintain buffer integrity across multiple admin operation cycles."""
+        """Should keep spooled detections in order across multiple admin operation cycles."""
         service = audio_analysis_service_integration
 
         # Mock analysis
@@ -487,95 +441,44 @@ class TestDetectionBufferingWithAdminOperations:
             ("Turdus migratorius_American Robin", 0.85)
         ]
 
-        try:
-            # Stop background flush task to prevent race conditions with manual flushes
-            service.stop_buffer_flush_task()
-
-            # Clear buffer
-            with service.buffer_lock:
-                service.detection_buffer.clear()
-
-            # Cycle 1: Build up buffer during first admin operation
-            with patch("birdnetpi.audio.analysis.httpx.AsyncClient", autospec=True) as mock_client:
-                mock_client.return_value.__aenter__.return_value.post.side_effect = (
-                    httpx.RequestError("Service down", request=MagicMock(spec=httpx.Request))
-                )
-
-                # Add detections to buffer
-                for _ in range(3):
-                    audio_chunk = np.ones(48000 * 3, dtype=np.float32) * 0.1
-                    await service._analyze_audio_chunk(audio_chunk)
-
-                # Wait for all async operations to complete before checking buffer
-                await asyncio.sleep(0.05)
-
-                with service.buffer_lock:
-                    cycle1_buffer_size = len(service.detection_buffer)
-                assert cycle1_buffer_size == 3
-
-            # Cycle 2: Partial flush, then more failures
-            # Stop background flush to avoid interference
-            service.stop_buffer_flush_task()
-
-            with patch("birdnetpi.audio.analysis.httpx.AsyncClient", autospec=True) as mock_client:
-                post_mock = mock_client.return_value.__aenter__.return_value.post
-
-                # First flush attempt: partial success
-                responses = [
-                    MagicMock(spec=httpx.Response),  # Success
-                    httpx.RequestError(
-                        "Still failing", request=MagicMock(spec=httpx.Request)
-                    ),  # Failure
-                    MagicMock(spec=httpx.Response),  # Success
-                ]
-                for response in responses:
-                    if hasattr(response, "raise_for_status"):
-                        response.raise_for_status.return_value = None
-
-                post_mock.side_effect = responses
-
-                # Manually trigger flush
-                await service._flush_detection_buffer()
-
-                # Should have 1 detection re-buffered (the failed one)
-                with service.buffer_lock:
-                    cycle2_buffer_size = len(service.detection_buffer)
-                assert cycle2_buffer_size == 1
-
-                # Add more detections during continued issues
-                mock_client.return_value.__aenter__.return_value.post.side_effect = (
-                    httpx.RequestError("Still down", request=MagicMock(spec=httpx.Request))
-                )
-
-                for _ in range(2):
-                    audio_chunk = np.ones(48000 * 3, dtype=np.float32) * 0.1
-                    await service._analyze_audio_chunk(audio_chunk)
-
-                # Wait for all async operations to complete before checking buffer
-                await asyncio.sleep(0.05)
-
-                with service.buffer_lock:
-                    cycle2_final_buffer_size = len(service.detection_buffer)
-                assert cycle2_final_buffer_size == 3  # 1 from partial flush + 2 new
-
-            # Cycle 3: Full recovery and complete flush
-            with patch("birdnetpi.audio.analysis.httpx.AsyncClient", autospec=True) as mock_client:
-                mock_response = MagicMock(spec=httpx.Response)
-                mock_response.raise_for_status.return_value = None
-                # Use AsyncMock for post to ensure it works correctly
-                # autospec=True already makes post an AsyncMock
-                mock_client.return_value.__aenter__.return_value.post.return_value = mock_response
-
-                # Manually trigger final flush
-                await service._flush_detection_buffer()
-
-                # All detections should be flushed
-                with service.buffer_lock:
-                    final_buffer_size = len(service.detection_buffer)
-                assert final_buffer_size == 0
-
-                assert "Successfully flushed" in caplog.text
-
-        finally:
-            # Restart background flush task for other tests
-            service.start_buffer_flush_task()
+        # Cycle 1: Build up the spool during first admin operation
+        with patch.object(
+            service.detection_sender, "post", autospec=True, side_effect=connection_error()
+        ):
+            await analyze_chunks(service, 3)
+        assert len(service.detection_spool) == 3
+        first_ids = [spooled.detection_id for spooled in service.detection_spool.peek(10)]
+
+        # Cycle 2: Replay fails, then more detections arrive during continued issues
+        with (
+            patch.object(
+                service.detection_sender,
+                "post_batch",
+                autospec=True,
+                side_effect=connection_error("Still failing"),
+            ),
+            patch.object(
+                service.detection_sender,
+                "post",
+                autospec=True,
+                side_effect=connection_error("Still down"),
+            ),
+        ):
+            # Manually trigger replay
+            await service._flush_detection_buffer()
+            assert [spooled.attempts for spooled in service.detection_spool.peek(10)] == [1] * 3
+
+            await analyze_chunks(service, 2)
+        assert len(service.detection_spool) == 5  # 3 still spooled + 2 new
+
+        # Cycle 3: Full recovery and complete replay, oldest first
+        with patch.object(
+            service.detection_sender, "post_batch", autospec=True, return_value=delivered()
+        ) as mock_post_batch:
+            await service._flush_detection_buffer()
+
+        assert len(service.detection_spool) == 0
+        replayed_ids = [metadata["id"] for metadata, _ in mock_post_batch.call_args.args[0]]
+        assert replayed_ids[:3] == first_ids
+        assert len(replayed_ids) == 5
+        assert "Successfully flushed" in caplog.text